@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Import 시간 벤치마크 (`python -X importtime` 예산 검사)
+공유 패키지/감사 엔진을 새 인터프리터에서 import 하여 누적 시간과
+PDF 스택(rdflib/pdfplumber/PyPDF2/requests) 로드 여부를 확인. 예산 초과 시 종료 코드 1.
+
+사용:
+    python benchmark_import_time.py
+    python benchmark_import_time.py --budget-scale 2.0
+
+Version: 1.0.0
+Created: 2026-10-19
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SHARED_DIR = Path(__file__).resolve().parent
+SHPT_CORE_DIR = SHARED_DIR.parent / "01_DSV_SHPT" / "Core_Systems"
+
+# 모듈 → (import 실행 폴더, 누적 import 예산 ms)
+# 감사 엔진 예산은 pandas import(~0.5s)를 포함
+IMPORT_BUDGETS_MS: Dict[str, Tuple[Path, float]] = {
+    "pdf_integration": (SHARED_DIR, 20.0),
+    "hybrid_integration": (SHARED_DIR, 20.0),
+    "shipment_audit_engine": (SHPT_CORE_DIR, 900.0),
+    "masterdata_validator": (SHPT_CORE_DIR, 900.0),
+}
+# PDF 통합 비활성 실행에서 로드되면 안 되는 모듈
+PDF_STACK_MODULES = ("rdflib", "pdfplumber", "PyPDF2", "requests")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import(module: str, cwd: Path = SHARED_DIR) -> Tuple[float, List[str]]:
+    """새 인터프리터에서 module을 import 하여 (누적 ms, 로드된 PDF 스택 모듈) 반환"""
+    probe = (
+        f"import sys; sys.path.insert(0, {str(SHARED_DIR)!r}); import {module}; "
+        f"print(','.join(m for m in {PDF_STACK_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(4) == module and len(match.group(3)) == 1:
+            cumulative_us = int(match.group(2))
+    # 모듈 import 중 출력이 있을 수 있으므로 마지막 줄만 사용
+    last_line = (proc.stdout.strip().splitlines() or [""])[-1]
+    loaded = [m for m in last_line.split(",") if m]
+    return cumulative_us / 1000.0, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time budget check")
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="느린 머신에서 예산 배율 (기본 1.0)",
+    )
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'target':<24} {'ms':>8} {'budget':>8}  PDF stack")
+    for module, (cwd, budget) in IMPORT_BUDGETS_MS.items():
+        elapsed, loaded = measure_import(module, cwd)
+        limit = budget * args.budget_scale
+        ok = elapsed <= limit and not loaded
+        failures += not ok
+        print(
+            f"{module:<24} {elapsed:8.1f} {limit:8.1f}  "
+            f"{', '.join(loaded) or '-'}{'' if ok else '  << FAIL'}"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
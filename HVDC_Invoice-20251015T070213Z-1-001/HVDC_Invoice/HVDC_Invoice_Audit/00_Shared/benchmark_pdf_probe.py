@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+PDF Probe 벤치마크 (HybridPDFRouter 문서 특성 추출 예산 검사)
+폴더의 PDF를 PDFProbe로 직접 분석(cold)한 시간과 특성 저장소 조회(cached) 시간을
+파일당 median/p90 ms로 출력. p90이 예산을 넘으면 종료 코드 1.
+
+사용:
+    python benchmark_pdf_probe.py
+    python benchmark_pdf_probe.py <PDF 폴더> --budget-ms 5.0 --budget-scale 2.0
+
+Version: 1.0.0
+Created: 2026-10-19
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+SHARED_DIR = Path(__file__).resolve().parent
+# Sept 2025 증빙 폴더의 파일은 DRM(NASCA) 래핑이라 모두 scan fallback → 실제 PDF인 Aug2025 폴더 사용
+DEFAULT_PDF_DIR = (
+    SHARED_DIR.parents[3]
+    / "Samsung C&T (HVDC) Shippments (Aug2025) - Supporting Documents"
+)
+
+sys.path.insert(0, str(SHARED_DIR))
+
+from hybrid_integration.pdf_probe import PDFCharacteristicsStore, probe_pdf  # noqa: E402
+
+# 파일당 p90 예산 (ms)
+PROBE_BUDGET_MS = 5.0
+CACHED_BUDGET_MS = 1.0
+
+
+def _p90(samples: List[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+
+
+def collect_pdfs(paths: List[Path]) -> List[Path]:
+    """경로 목록 → PDF 파일 목록 (폴더는 재귀 검색)"""
+    files: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.pdf")))
+        elif path.is_file():
+            files.append(path)
+    return files
+
+
+def measure(files: List[Path]):
+    """(cold ms 목록, cached ms 목록, xref 방식으로 분석된 파일 수)"""
+    cold, cached = [], []
+    xref_count = 0
+    store = PDFCharacteristicsStore("")  # 인메모리 저장소
+    for file_path in files:
+        start = time.perf_counter()
+        result = probe_pdf(str(file_path))
+        cold.append((time.perf_counter() - start) * 1000)
+        xref_count += result["probe_method"] == "xref"
+
+        store.get_or_probe(str(file_path))
+        start = time.perf_counter()
+        store.get_or_probe(str(file_path))
+        cached.append((time.perf_counter() - start) * 1000)
+    return cold, cached, xref_count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PDF probe latency budget check")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[DEFAULT_PDF_DIR],
+        help=f"PDF 파일/폴더 (기본 {DEFAULT_PDF_DIR})",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=PROBE_BUDGET_MS,
+        help=f"cold probe 파일당 p90 예산 ms (기본 {PROBE_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="느린 머신에서 예산 배율 (기본 1.0)",
+    )
+    args = parser.parse_args()
+
+    files = collect_pdfs(args.paths)
+    if not files:
+        print("PDF 파일 없음")
+        return 1
+
+    cold, cached, xref_count = measure(files)
+    print(f"files: {len(files)} (xref: {xref_count}, scan fallback: {len(files) - xref_count})")
+
+    failures = 0
+    print(f"{'phase':<8} {'median':>8} {'p90':>8} {'max':>8} {'budget':>8}")
+    for phase, samples, budget in (
+        ("cold", cold, args.budget_ms),
+        ("cached", cached, CACHED_BUDGET_MS),
+    ):
+        limit = budget * args.budget_scale
+        p90 = _p90(samples)
+        ok = p90 <= limit
+        failures += not ok
+        print(
+            f"{phase:<8} {statistics.median(samples):8.2f} {p90:8.2f} "
+            f"{max(samples):8.2f} {limit:8.2f}{'' if ok else '  << FAIL'}"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,22 @@
 Configuration Manager for HVDC Invoice Audit System
 외부 JSON 설정 파일 로드 및 관리
 
-Version: 1.0.0
+- 로드 시 불변 스냅샷(ConfigSnapshot)으로 1회 인덱싱 (Lane Map/별칭/키워드)
+- 설정 파일 변경 시 스냅샷 참조 교체 (mtime 폴링, 실행 중 서비스 재시작 불필요)
+
+Version: 1.1.0
 Created: 2025-10-14
+Updated: 2026-10-19 - ConfigSnapshot + hot-reload
 Author: MACHO-GPT v3.4-mini HVDC Project Enhancement
 """
 
 import json
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 import logging
 from datetime import datetime
 
@@ -20,47 +28,297 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 스냅샷 필드 → 설정 파일
+CONFIG_FILES: Dict[str, str] = {
+    "lane_config": "config_shpt_lanes.json",
+    "cost_guard_config": "config_cost_guard_bands.json",
+    "contract_rates_config": "config_contract_rates.json",
+    "validation_rules_config": "config_validation_rules.json",
+}
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(value: Any) -> Any:
+    """중첩 dict/list → MappingProxyType/tuple (스냅샷 전체 읽기 전용)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    불변 설정 스냅샷 (로드 시점에 조회 테이블 사전 계산)
+
+    ConfigurationManager는 스냅샷 참조만 교체하므로, 조회 도중 재로드가
+    일어나도 한 번의 조회는 항상 같은 버전의 설정을 본다.
+    설정 dict/list는 중첩 단계까지 MappingProxyType/tuple로 고정된다.
+    """
+
+    lane_config: Mapping[str, Any]
+    cost_guard_config: Mapping[str, Any]
+    contract_rates_config: Mapping[str, Any]
+    validation_rules_config: Mapping[str, Any]
+    mtimes: Tuple[Tuple[str, Optional[int]], ...]
+    version: int
+    # 사전 계산 조회 테이블
+    lane_map: Mapping[str, Mapping[str, Any]]
+    lanes: Tuple[Tuple[str, str, Optional[str], Optional[float]], ...]
+    normalization_aliases: Mapping[str, Mapping[str, str]]
+    port_aliases: Tuple[Tuple[str, str], ...]
+    dest_aliases: Tuple[Tuple[str, str], ...]
+    cost_guard_bands: Mapping[str, Mapping[str, Any]]
+    fixed_fees: Mapping[str, Mapping[str, Any]]
+    fixed_fee_rates: Tuple[Tuple[str, Optional[float]], ...]
+    fixed_fee_keywords: Tuple[Tuple[str, Tuple[str, ...], Mapping[str, Any]], ...]
+    portal_fees: Mapping[str, Mapping[str, Any]]
+    inland_routes: Tuple[Tuple[Mapping[str, Any], str, str, Tuple[str, ...]], ...]
+
+    @classmethod
+    def build(
+        cls,
+        configs: Dict[str, Dict[str, Any]],
+        mtimes: Tuple[Tuple[str, Optional[int]], ...] = (),
+        version: int = 1,
+    ) -> "ConfigSnapshot":
+        """설정 dict → 스냅샷 (중첩 고정 + lane/alias/keyword 테이블 1회 계산)"""
+        frozen = {name: _freeze(configs.get(name, {})) for name in CONFIG_FILES}
+        lane_config = frozen["lane_config"]
+        contract_rates = frozen["contract_rates_config"]
+
+        # Lane Map (해상 + 항공 통합, 항공이 같은 키 덮어씀)
+        lane_map: Dict[str, Mapping[str, Any]] = {}
+        lane_map.update(lane_config.get("sea_transport", _EMPTY))
+        lane_map.update(lane_config.get("air_transport", _EMPTY))
+
+        aliases = lane_config.get(
+            "normalization_aliases", _freeze({"ports": {}, "destinations": {}})
+        )
+        fixed_fees = contract_rates.get("fixed_fees", _EMPTY)
+
+        return cls(
+            lane_config=lane_config,
+            cost_guard_config=frozen["cost_guard_config"],
+            contract_rates_config=contract_rates,
+            validation_rules_config=frozen["validation_rules_config"],
+            mtimes=mtimes,
+            version=version,
+            lane_map=MappingProxyType(lane_map),
+            lanes=tuple(
+                (
+                    info.get("port", "").upper(),
+                    info.get("destination", "").upper(),
+                    info.get("unit"),
+                    info.get("rate"),
+                )
+                for info in lane_map.values()
+            ),
+            normalization_aliases=aliases,
+            port_aliases=tuple(
+                (alias.upper(), canonical)
+                for alias, canonical in aliases.get("ports", {}).items()
+            ),
+            dest_aliases=tuple(
+                (alias.upper(), canonical)
+                for alias, canonical in aliases.get("destinations", {}).items()
+            ),
+            cost_guard_bands=frozen["cost_guard_config"].get(
+                "cost_guard_bands", _EMPTY
+            ),
+            fixed_fees=fixed_fees,
+            fixed_fee_rates=tuple(
+                (key, info.get("rate")) for key, info in fixed_fees.items()
+            ),
+            fixed_fee_keywords=tuple(
+                (
+                    name,
+                    tuple(str(kw).upper() for kw in info.get("keywords", [])),
+                    info,
+                )
+                for name, info in fixed_fees.items()
+                if info.get("keywords", [])
+            ),
+            portal_fees=contract_rates.get("portal_fees_aed", _EMPTY),
+            inland_routes=tuple(
+                (
+                    info,
+                    info.get("origin", "").upper().replace(" ", ""),
+                    info.get("destination", "").upper().replace(" ", ""),
+                    tuple(kw.upper() for kw in info.get("keywords", [])),
+                )
+                for info in contract_rates.get("inland_transportation", _EMPTY).values()
+            ),
+        )
+
 
 class ConfigurationManager:
     """통합 설정 관리자"""
 
-    def __init__(self, config_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        config_dir: Optional[Path] = None,
+        auto_reload: bool = False,
+        poll_interval: float = 2.0,
+    ):
         """
         초기화
 
         Args:
             config_dir: 설정 파일 디렉토리 (기본: Rate 폴더)
+            auto_reload: True면 조회 시 poll_interval마다 파일 mtime 확인 후 재로드
+            poll_interval: mtime 확인 최소 간격 (초)
         """
         if config_dir is None:
             self.config_dir = Path(__file__).parent.parent / "Rate"
         else:
             self.config_dir = Path(config_dir)
 
-        # 설정 데이터 캐시
-        self.lane_config = {}
-        self.cost_guard_config = {}
-        self.contract_rates_config = {}
-        self.validation_rules_config = {}
+        self.auto_reload = auto_reload
+        self.poll_interval = poll_interval
+
+        # 현재 스냅샷 (None = 미로드), 교체는 참조 대입 1회
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._reload_lock = threading.Lock()
+        self._next_poll = 0.0
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+
+    # ==================== 스냅샷 ====================
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """현재 설정 스냅샷 (미로드 시 로드, auto_reload 시 변경 확인)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.load_all_configs()
+            return self._snapshot
+        if self.auto_reload and time.monotonic() >= self._next_poll:
+            self.refresh_if_changed()
+            return self._snapshot
+        return snapshot
+
+    @property
+    def is_loaded(self) -> bool:
+        """설정 로드 여부"""
+        return self._snapshot is not None
 
-        # 로드 상태
-        self.is_loaded = False
+    @property
+    def lane_config(self) -> Mapping[str, Any]:
+        return self._snapshot.lane_config if self._snapshot else _EMPTY
+
+    @property
+    def cost_guard_config(self) -> Mapping[str, Any]:
+        return self._snapshot.cost_guard_config if self._snapshot else _EMPTY
+
+    @property
+    def contract_rates_config(self) -> Mapping[str, Any]:
+        return self._snapshot.contract_rates_config if self._snapshot else _EMPTY
+
+    @property
+    def validation_rules_config(self) -> Mapping[str, Any]:
+        return self._snapshot.validation_rules_config if self._snapshot else _EMPTY
 
     def load_all_configs(self):
         """모든 설정 파일 로드"""
         logger.info(f"Loading configurations from: {self.config_dir}")
 
-        self.lane_config = self._load_json_config("config_shpt_lanes.json")
-        self.cost_guard_config = self._load_json_config("config_cost_guard_bands.json")
-        self.contract_rates_config = self._load_json_config(
-            "config_contract_rates.json"
-        )
-        self.validation_rules_config = self._load_json_config(
-            "config_validation_rules.json"
-        )
+        with self._reload_lock:
+            mtimes = self._file_mtimes()
+            configs = {
+                field: self._load_json_config(filename)
+                for field, filename in CONFIG_FILES.items()
+            }
+            self._swap(configs, mtimes)
 
-        self.is_loaded = True
         logger.info("All configurations loaded successfully")
 
+    def refresh_if_changed(self) -> bool:
+        """
+        설정 파일 mtime 변경 시 새 스냅샷으로 교체
+
+        변경된 파일이 JSON 파싱에 실패하면(쓰기 도중 등) 기존 스냅샷을
+        유지하고 다음 확인 때 다시 시도한다.
+
+        Returns:
+            True if 스냅샷 교체됨
+        """
+        self._next_poll = time.monotonic() + self.poll_interval
+        current = self._snapshot
+        mtimes = self._file_mtimes()
+        if current is not None and mtimes == current.mtimes:
+            return False
+
+        with self._reload_lock:
+            current = self._snapshot
+            if current is not None and mtimes == current.mtimes:
+                return False  # 다른 스레드가 이미 교체
+
+            configs = {}
+            for field, filename in CONFIG_FILES.items():
+                try:
+                    configs[field] = self._read_json(filename)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Config reload skipped ({filename}): {e}")
+                    return False
+
+            self._swap(configs, mtimes)
+
+        logger.info(f"Configurations reloaded (version {self._snapshot.version})")
+        return True
+
+    def _swap(self, configs: Dict[str, Dict[str, Any]], mtimes) -> None:
+        """새 스냅샷 생성 후 참조 교체 (_reload_lock 보유 상태에서 호출)"""
+        version = self._snapshot.version + 1 if self._snapshot else 1
+        self._snapshot = ConfigSnapshot.build(configs, mtimes, version)
+        self._next_poll = time.monotonic() + self.poll_interval
+
+    def _file_mtimes(self) -> Tuple[Tuple[str, Optional[int]], ...]:
+        """설정 파일별 (파일명, mtime_ns) - 없는 파일은 None"""
+        mtimes = []
+        for filename in CONFIG_FILES.values():
+            try:
+                mtimes.append((filename, (self.config_dir / filename).stat().st_mtime_ns))
+            except OSError:
+                mtimes.append((filename, None))
+        return tuple(mtimes)
+
+    def start_watching(self, interval: Optional[float] = None) -> None:
+        """백그라운드 스레드에서 주기적으로 refresh_if_changed 실행 (daemon)"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        interval = self.poll_interval if interval is None else interval
+        self._stop_watching.clear()
+
+        def watch():
+            while not self._stop_watching.wait(interval):
+                try:
+                    self.refresh_if_changed()
+                except Exception as e:  # 감시 스레드는 종료되지 않도록
+                    logger.error(f"Config watch error: {e}")
+
+        self._watcher = threading.Thread(
+            target=watch, name="config-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """감시 스레드 종료"""
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _read_json(self, filename: str) -> Dict[str, Any]:
+        """JSON 설정 파일 읽기 (없으면 빈 dict, 파싱 오류는 예외)"""
+        file_path = self.config_dir / filename
+        if not file_path.exists():
+            return {}
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
     def _load_json_config(self, filename: str) -> Dict[str, Any]:
         """JSON 설정 파일 로드"""
         file_path = self.config_dir / filename
@@ -70,84 +328,55 @@ class ConfigurationManager:
             return {}
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = self._read_json(filename)
             logger.info(f"Loaded: {filename}")
             return config
         except Exception as e:
             logger.error(f"Error loading {filename}: {e}")
             return {}
 
-    def get_lane_map(self) -> Dict[str, Dict[str, Any]]:
-        """Lane Map 조회 (해상 + 항공 통합)"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        lane_map = {}
-
-        # 해상 운송
-        if "sea_transport" in self.lane_config:
-            lane_map.update(self.lane_config["sea_transport"])
-
-        # 항공 운송
-        if "air_transport" in self.lane_config:
-            lane_map.update(self.lane_config["air_transport"])
-
-        return lane_map
-
-    def get_normalization_aliases(self) -> Dict[str, Dict[str, str]]:
-        """정규화 별칭 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
+    # ==================== 조회 ====================
 
-        return self.lane_config.get(
-            "normalization_aliases", {"ports": {}, "destinations": {}}
-        )
+    def get_lane_map(self) -> Dict[str, Mapping[str, Any]]:
+        """Lane Map 조회 (해상 + 항공 통합, 각 Lane은 읽기 전용)"""
+        return dict(self.snapshot.lane_map)
 
-    def get_cost_guard_bands(self) -> Dict[str, Dict[str, Any]]:
-        """COST-GUARD 밴드 설정 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
+    def get_normalization_aliases(self) -> Mapping[str, Mapping[str, str]]:
+        """정규화 별칭 조회 (읽기 전용)"""
+        return self.snapshot.normalization_aliases
 
-        return self.cost_guard_config.get("cost_guard_bands", {})
+    def get_cost_guard_bands(self) -> Mapping[str, Mapping[str, Any]]:
+        """COST-GUARD 밴드 설정 조회 (읽기 전용)"""
+        return self.snapshot.cost_guard_bands
 
     def get_special_tolerance(self, charge_type: str) -> Optional[float]:
         """특별 허용 오차 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        special_tolerances = self.cost_guard_config.get("special_tolerances", {})
+        snapshot = self.snapshot
+        special_tolerances = snapshot.cost_guard_config.get("special_tolerances", {})
 
         if charge_type in special_tolerances:
             return special_tolerances[charge_type].get("max_delta")
 
         # 기본 허용 오차
-        validation_rules = self.validation_rules_config.get("tolerance_rules", {})
+        validation_rules = snapshot.validation_rules_config.get("tolerance_rules", {})
         return validation_rules.get("default", {}).get("percent", 3.0)
 
     def get_contract_rate(self, charge_name: str) -> Optional[float]:
         """계약 요율 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        fixed_fees = self.contract_rates_config.get("fixed_fees", {})
-
         # 정규화된 키 생성
-        normalized_key = charge_name.upper().replace(" ", "_")
+        charge_upper = charge_name.upper()
+        normalized_key = charge_upper.replace(" ", "_")
 
-        for key, fee_info in fixed_fees.items():
-            if key == normalized_key or charge_name.upper() in key:
-                return fee_info.get("rate")
+        for key, rate in self.snapshot.fixed_fee_rates:
+            if key == normalized_key or charge_upper in key:
+                return rate
 
         return None
 
     def get_do_fee(self, transport_mode: str) -> Optional[float]:
         """DO FEE 조회 (AIR/CONTAINER 구분)"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
         mode_upper = str(transport_mode).upper()
-        fixed_fees = self.contract_rates_config.get("fixed_fees", {})
+        fixed_fees = self.snapshot.fixed_fees
 
         if "AIR" in mode_upper or "HE" in mode_upper:
             fee_config = fixed_fees.get("DO_FEE_AIR", {})
@@ -158,24 +387,15 @@ class ConfigurationManager:
 
     def get_customs_clearance_fee(self) -> float:
         """CUSTOMS CLEARANCE FEE 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        fixed_fees = self.contract_rates_config.get("fixed_fees", {})
-        fee_config = fixed_fees.get("CUSTOMS_CLEARANCE_FEE", {})
+        fee_config = self.snapshot.fixed_fees.get("CUSTOMS_CLEARANCE_FEE", {})
         return fee_config.get("rate", 150.00)
 
     def get_fixed_fee_by_keywords(self, description: str) -> Optional[Dict]:
         """키워드 기반 고정 요율 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
         desc_upper = str(description).upper()
-        fixed_fees = self.contract_rates_config.get("fixed_fees", {})
 
-        for fee_name, fee_config in fixed_fees.items():
-            keywords = fee_config.get("keywords", [])
-            if keywords and any(str(kw).upper() in desc_upper for kw in keywords):
+        for fee_name, keywords, fee_config in self.snapshot.fixed_fee_keywords:
+            if any(kw in desc_upper for kw in keywords):
                 return {
                     "name": fee_name,
                     "rate": fee_config.get("rate"),
@@ -189,16 +409,12 @@ class ConfigurationManager:
         self, fee_name: str, currency: str = "USD"
     ) -> Optional[float]:
         """Portal Fee 요율 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        portal_fees = self.contract_rates_config.get("portal_fees_aed", {})
-
         # 정규화된 키 생성
-        normalized_key = fee_name.upper().replace(" ", "_")
+        fee_upper = fee_name.upper()
+        normalized_key = fee_upper.replace(" ", "_")
 
-        for key, fee_info in portal_fees.items():
-            if normalized_key in key or fee_name.upper() in key:
+        for key, fee_info in self.snapshot.portal_fees.items():
+            if normalized_key in key or fee_upper in key:
                 if currency == "USD":
                     return fee_info.get("rate_usd")
                 elif currency == "AED":
@@ -210,10 +426,7 @@ class ConfigurationManager:
         self, from_currency: str = "USD", to_currency: str = "AED"
     ) -> float:
         """환율 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        fx_rates = self.cost_guard_config.get("fx_rates", {})
+        fx_rates = self.snapshot.cost_guard_config.get("fx_rates", {})
 
         if from_currency == "USD" and to_currency == "AED":
             return fx_rates.get("USD_AED", 3.6725)
@@ -226,10 +439,8 @@ class ConfigurationManager:
         self, port: str, destination: str, unit: str = "per truck"
     ) -> Optional[float]:
         """Lane 요율 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        lane_map = self.get_lane_map()
+        snapshot = self.snapshot
+        lane_map = snapshot.lane_map
 
         # 직접 매칭
         lane_key = f"{port}_{destination}".replace(" ", "_").upper()
@@ -238,17 +449,18 @@ class ConfigurationManager:
             return lane_map[lane_key].get("rate")
 
         # 정규화 후 재시도
-        aliases = self.get_normalization_aliases()
+        port_upper = port.upper()
+        dest_upper = destination.upper()
 
         normalized_port = port
-        for alias, canonical in aliases.get("ports", {}).items():
-            if alias.upper() in port.upper():
+        for alias, canonical in snapshot.port_aliases:
+            if alias in port_upper:
                 normalized_port = canonical
                 break
 
         normalized_dest = destination
-        for alias, canonical in aliases.get("destinations", {}).items():
-            if alias.upper() in destination.upper():
+        for alias, canonical in snapshot.dest_aliases:
+            if alias in dest_upper:
                 normalized_dest = canonical
                 break
 
@@ -258,16 +470,12 @@ class ConfigurationManager:
             return lane_map[lane_key].get("rate")
 
         # Lane Map 순회하며 매칭
-        for lane_id, lane_info in lane_map.items():
-            if (
-                lane_info.get("port", "").upper() in port.upper()
-                or port.upper() in lane_info.get("port", "").upper()
-            ) and (
-                lane_info.get("destination", "").upper() in destination.upper()
-                or destination.upper() in lane_info.get("destination", "").upper()
+        for lane_port, lane_dest, lane_unit, lane_rate in snapshot.lanes:
+            if (lane_port in port_upper or port_upper in lane_port) and (
+                lane_dest in dest_upper or dest_upper in lane_dest
             ):
-                if lane_info.get("unit") == unit:
-                    return lane_info.get("rate")
+                if lane_unit == unit:
+                    return lane_rate
 
         return None
 
@@ -284,20 +492,14 @@ class ConfigurationManager:
         Returns:
             rate_usd (float) or None
         """
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        inland_transport = self.contract_rates_config.get("inland_transportation", {})
+        inland_routes = self.snapshot.inland_routes
 
         # Normalize inputs
         origin_norm = origin.upper().strip()
         dest_norm = destination.upper().strip().replace(" ", "")
 
         # Exact match first
-        for route_key, route_info in inland_transport.items():
-            route_origin = route_info.get("origin", "").upper().replace(" ", "")
-            route_dest = route_info.get("destination", "").upper().replace(" ", "")
-
+        for route_info, route_origin, route_dest, _ in inland_routes:
             if origin_norm in route_origin and dest_norm in route_dest:
                 logger.info(
                     f"[TRANSPORT] Found rate for {origin} → {destination}: ${route_info['rate_usd']}"
@@ -305,10 +507,7 @@ class ConfigurationManager:
                 return route_info.get("rate_usd")
 
         # Keyword matching
-        for route_key, route_info in inland_transport.items():
-            keywords = [kw.upper() for kw in route_info.get("keywords", [])]
-            desc = route_info.get("description", "").upper()
-
+        for route_info, _, _, keywords in inland_routes:
             # Check if all major keywords are present
             if any(
                 kw in origin_norm
@@ -329,47 +528,40 @@ class ConfigurationManager:
         return None
 
     def reload_configs(self):
-        """설정 파일 재로드"""
+        """설정 파일 재로드 (새 스냅샷으로 교체)"""
         logger.info("Reloading all configurations...")
-        self.is_loaded = False
         self.load_all_configs()
 
     def get_validation_rule(self, rule_name: str) -> Any:
         """검증 규칙 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
+        return self.snapshot.validation_rules_config.get(rule_name)
 
-        return self.validation_rules_config.get(rule_name)
-
-    def get_gate_rule(self, gate_name: str) -> Optional[Dict[str, Any]]:
+    def get_gate_rule(self, gate_name: str) -> Optional[Mapping[str, Any]]:
         """Gate 검증 규칙 조회"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        gate_rules = self.validation_rules_config.get("gate_validation_rules", {})
+        gate_rules = self.snapshot.validation_rules_config.get(
+            "gate_validation_rules", {}
+        )
         return gate_rules.get(gate_name)
 
     def get_config_summary(self) -> Dict[str, Any]:
         """설정 요약 정보"""
-        if not self.is_loaded:
-            self.load_all_configs()
-
-        lane_map = self.get_lane_map()
+        snapshot = self.snapshot
 
         return {
-            "lanes_loaded": len(lane_map),
-            "cost_guard_bands": len(self.get_cost_guard_bands()),
-            "contract_rates": len(self.contract_rates_config.get("fixed_fees", {})),
-            "portal_fees": len(self.contract_rates_config.get("portal_fees_aed", {})),
+            "lanes_loaded": len(snapshot.lane_map),
+            "cost_guard_bands": len(snapshot.cost_guard_bands),
+            "contract_rates": len(snapshot.fixed_fees),
+            "portal_fees": len(snapshot.portal_fees),
             "config_files_loaded": sum(
                 [
-                    bool(self.lane_config),
-                    bool(self.cost_guard_config),
-                    bool(self.contract_rates_config),
-                    bool(self.validation_rules_config),
+                    bool(snapshot.lane_config),
+                    bool(snapshot.cost_guard_config),
+                    bool(snapshot.contract_rates_config),
+                    bool(snapshot.validation_rules_config),
                 ]
             ),
             "config_directory": str(self.config_dir),
+            "config_version": snapshot.version,
         }
 
 
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Contract Rate Resolver
+Contract/Lane/정규화 별칭 설정을 1회 컴파일한 결정 테이블로 참조 요율 조회
+
+- 고정 요율(fixed_fees), Portal Fee, Lane Map, 정규화 별칭(ports/destinations)을
+  생성 시 대문자 키 목록/사전으로 변환
+- 설명(description)당 단일 패스로 결정, (정규화 설명, port) 단위 메모이제이션
+- DataFrame 컬럼 일괄 조회 (resolve_column)
+
+ShipmentAuditEngine._find_contract_ref_rate 와
+MasterDataValidator.find_contract_ref_rate 의 설정 기반 단계를 대체.
+결과는 기존 ConfigurationManager 조회 순서/규칙과 동일.
+
+Version: 1.0.0
+Created: 2026-10-19
+Author: MACHO-GPT v3.4-mini HVDC Project Enhancement
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# SHPT Standard Items 키워드 (순서 = 우선순위) → Rate Loader 조회명
+STANDARD_KEYWORDS: List[Tuple[str, str]] = [
+    ("DO FEE", "DO Fee"),
+    ("MASTER DO", "DO Fee"),
+    ("CUSTOMS CLEARANCE", "Custom Clearance"),
+    ("CUSTOM CLEARANCE", "Custom Clearance"),
+    ("TERMINAL HANDLING FEE", "Terminal Handling Charge"),
+    ("TERMINAL HANDLING CHARGE", "Terminal Handling Charge"),
+    ("TERMINAL HANDLING", "Terminal Handling Charge"),
+    ("PORT HANDLING", "Port Handling Charge"),
+    ("THC", "Terminal Handling Charge"),
+]
+
+# Port 별칭 미매칭 시 폴백 (SHPT 기존 로직)
+FALLBACK_PORTS: List[Tuple[Tuple[str, ...], str]] = [
+    (("KHALIFA", "KP"), "Khalifa Port"),
+    (("JEBEL ALI", "JAP"), "Jebel Ali Port"),
+    (("ABU DHABI AIRPORT", "AUH"), "Abu Dhabi Airport"),
+    (("DUBAI AIRPORT", "DXB"), "Dubai Airport"),
+    (("MUSSAFAH", "MOSB"), "Musaffah Port"),
+]
+
+# Destination 별칭 미매칭 시 폴백 (SHPT 기존 로직)
+FALLBACK_DESTINATIONS: List[Tuple[Tuple[str, ...], str]] = [
+    (("MIRFA",), "MIRFA SITE"),
+    (("SHUWEIHAT", "SHU"), "SHUWEIHAT Site"),
+    (("STORAGE", "YARD", "DSV"), "Storage Yard"),
+]
+
+SHPT_ROUTE_PATTERN = re.compile(r"FROM\s+(.+?)\s+TO\s+(.+)")
+MASTERDATA_ROUTE_PATTERN = re.compile(r"FROM\s+([A-Z\s]+)\s+TO\s+([A-Z\s]+)")
+TRANSPORT_KEYWORDS = ("TRANSPORTATION", "TRUCKING", "INLAND")
+MASTERDATA_TRANSPORT_KEYWORDS = ("TRANSPORTATION", "TRUCKING", "INLAND", "FROM", "TO")
+
+
+class FixedFeeRule(NamedTuple):
+    """MasterData 고정 요율 결정 (DO FEE는 transport mode에 따라 요율 결정)"""
+
+    kind: str  # "do_fee" | "rate"
+    rate: Optional[float] = None
+    transport_mode: Optional[str] = None  # 지정 시 mode 일치할 때만 적용
+
+
+class ContractRateResolver:
+    """Contract 참조 요율 결정 테이블 (설정 1회 컴파일 + 메모이제이션)"""
+
+    def __init__(self, config_manager, rate_loader=None):
+        """
+        Args:
+            config_manager: 설정이 로드된 ConfigurationManager
+            rate_loader: UnifiedRateLoader (SHPT Standard Items 조회용, 선택)
+        """
+        self.config_manager = config_manager
+        self.rate_loader = rate_loader
+        self.compile()
+
+    # ==================== 컴파일 ====================
+
+    def compile(self) -> None:
+        """설정 → 조회 테이블 변환 (설정 스냅샷 교체 시 자동 재실행)"""
+        cm = self.config_manager
+        self._snapshot = cm.snapshot
+        fixed_fees = self._snapshot.fixed_fees
+
+        # get_contract_rate: (KEY, rate) - 정의 순서 유지
+        self._fixed_fee_rates: List[Tuple[str, Optional[float]]] = [
+            (key, info.get("rate")) for key, info in fixed_fees.items()
+        ]
+        # get_fixed_fee_by_keywords: (대문자 키워드, rate, transport_mode)
+        self._keyword_fees: List[Tuple[Tuple[str, ...], Optional[float], Optional[str]]] = [
+            (
+                tuple(str(kw).upper() for kw in info.get("keywords", [])),
+                info.get("rate"),
+                info.get("transport_mode"),
+            )
+            for info in fixed_fees.values()
+            if info.get("keywords")
+        ]
+        self._do_fee_air = fixed_fees.get("DO_FEE_AIR", {}).get("rate")
+        self._do_fee_container = fixed_fees.get("DO_FEE_CONTAINER", {}).get("rate")
+        self._customs_fee = cm.get_customs_clearance_fee()
+        self._portal_rates = {
+            name: cm.get_portal_fee_rate(name, "USD")
+            for name in ("APPOINTMENT_FEE", "DPC_FEE", "DOCUMENT_PROCESSING_FEE")
+        }
+
+        # Lane Map + 정규화 별칭
+        self._lane_map = self._snapshot.lane_map
+        self._lanes: List[Tuple[str, str, Optional[str], Optional[float]]] = [
+            (
+                info.get("port", "").upper(),
+                info.get("destination", "").upper(),
+                info.get("unit"),
+                info.get("rate"),
+            )
+            for info in self._lane_map.values()
+        ]
+        aliases = self._snapshot.normalization_aliases
+        self._has_aliases = bool(aliases)
+        self._port_aliases = [
+            (alias.upper(), canonical)
+            for alias, canonical in aliases.get("ports", {}).items()
+        ]
+        self._dest_aliases = [
+            (alias.upper(), canonical)
+            for alias, canonical in aliases.get("destinations", {}).items()
+        ]
+        # 정확 일치 위치 별칭 (ports 우선, 먼저 정의된 별칭 우선)
+        self._exact_locations: Dict[str, str] = {}
+        for group in ("ports", "destinations"):
+            for alias, canonical in aliases.get(group, {}).items():
+                self._exact_locations.setdefault(str(alias).upper(), canonical)
+
+        # 메모이제이션 (스레드 간 공유: 경합 시 중복 계산만 발생)
+        self._shpt_cache: Dict[Tuple[str, Optional[str]], Optional[float]] = {}
+        self._fixed_rule_cache: Dict[str, Optional[FixedFeeRule]] = {}
+        self._config_rate_cache: Dict[str, Optional[float]] = {}
+        self._lane_cache: Dict[Tuple[str, str, str], Optional[float]] = {}
+        self._inland_cache: Dict[Tuple[str, str], Optional[float]] = {}
+        self._standard_cache: Dict[Tuple[str, str], Optional[float]] = {}
+
+    def _sync(self) -> None:
+        """ConfigurationManager 스냅샷이 교체되었으면 다시 컴파일"""
+        if self.config_manager.snapshot is not self._snapshot:
+            self.compile()
+
+    # ==================== 설정 조회 (ConfigurationManager 규칙 동일) ====================
+
+    def contract_rate(self, description: str) -> Optional[float]:
+        """fixed_fees 계약 요율 (ConfigurationManager.get_contract_rate)"""
+        desc_upper = description.upper()
+        normalized_key = desc_upper.replace(" ", "_")
+        for key, rate in self._fixed_fee_rates:
+            if key == normalized_key or desc_upper in key:
+                return rate
+        return None
+
+    def lane_rate(
+        self, port: str, destination: str, unit: str = "per truck"
+    ) -> Optional[float]:
+        """Lane 요율 (ConfigurationManager.get_lane_rate)"""
+        key = (port, destination, unit)
+        if key in self._lane_cache:
+            return self._lane_cache[key]
+
+        rate = self._lane_rate(port, destination, unit)
+        self._lane_cache[key] = rate
+        return rate
+
+    def _lane_rate(self, port: str, destination: str, unit: str) -> Optional[float]:
+        lane_key = f"{port}_{destination}".replace(" ", "_").upper()
+        if lane_key in self._lane_map:
+            return self._lane_map[lane_key].get("rate")
+
+        port_upper = port.upper()
+        dest_upper = destination.upper()
+        normalized_port = next(
+            (c for alias, c in self._port_aliases if alias in port_upper), port
+        )
+        normalized_dest = next(
+            (c for alias, c in self._dest_aliases if alias in dest_upper), destination
+        )
+        lane_key = f"{normalized_port}_{normalized_dest}".replace(" ", "_").upper()
+        if lane_key in self._lane_map:
+            return self._lane_map[lane_key].get("rate")
+
+        for lane_port, lane_dest, lane_unit, rate in self._lanes:
+            if (lane_port in port_upper or port_upper in lane_port) and (
+                lane_dest in dest_upper or dest_upper in lane_dest
+            ):
+                if lane_unit == unit:
+                    return rate
+        return None
+
+    def inland_rate(self, origin: str, destination: str) -> Optional[float]:
+        """Inland Transportation 요율 (조회 결과 메모이제이션)"""
+        key = (origin, destination)
+        if key not in self._inland_cache:
+            self._inland_cache[key] = self.config_manager.get_inland_transportation_rate(
+                origin, destination
+            )
+        return self._inland_cache[key]
+
+    def do_fee(self, transport_mode: str) -> Optional[float]:
+        """DO FEE (ConfigurationManager.get_do_fee)"""
+        mode_upper = str(transport_mode).upper()
+        if "AIR" in mode_upper or "HE" in mode_upper:
+            return self._do_fee_air
+        return self._do_fee_container
+
+    # ==================== 위치 정규화 ====================
+
+    def extract_port(self, text: str) -> Optional[str]:
+        """텍스트에서 Port 추출 (부분 문자열 별칭 → 폴백 키워드)"""
+        text_upper = text.upper()
+        if self._has_aliases:
+            for alias, canonical in self._port_aliases:
+                if alias in text_upper:
+                    return canonical
+        for keywords, port in FALLBACK_PORTS:
+            if any(kw in text_upper for kw in keywords):
+                return port
+        return None
+
+    def normalize_destination(self, destination: str) -> Optional[str]:
+        """Destination 정규화 (부분 문자열 별칭 → 폴백 키워드 → 원본)"""
+        dest_upper = destination.upper()
+        if self._has_aliases:
+            for alias, canonical in self._dest_aliases:
+                if alias in dest_upper:
+                    return canonical
+        for keywords, canonical in FALLBACK_DESTINATIONS:
+            if any(kw in dest_upper for kw in keywords):
+                return canonical
+        return destination
+
+    def normalize_location(self, location: str) -> str:
+        """위치명 정확 일치 별칭 정규화 (MasterData 방식)"""
+        return self._exact_locations.get(str(location).strip().upper(), location.strip())
+
+    # ==================== SHPT 결정 (ShipmentAuditEngine) ====================
+
+    def resolve(self, description: str, port: Optional[str] = None) -> Optional[float]:
+        """
+        Contract 항목 참조 요율 (SHPT 조회 순서)
+
+        1. fixed_fees 계약 요율
+        2. Standard Items 키워드 (THC는 컨테이너/항공 구분) → Rate Loader
+        3. Inland Trucking: FROM/TO 경로 → Lane 요율 → 키워드 폴백
+
+        Args:
+            description: 항목 설명
+            port: Port 지정 시 설명에서 추출한 Port 대신 사용
+
+        Returns:
+            참조 요율 (USD) 또는 None
+        """
+        self._sync()
+        desc_upper = description.strip().upper()
+        key = (desc_upper, port)
+        if key in self._shpt_cache:
+            return self._shpt_cache[key]
+
+        rate = self._resolve_shpt(desc_upper, port)
+        self._shpt_cache[key] = rate
+        return rate
+
+    def _resolve_shpt(self, desc_upper: str, port: Optional[str]) -> Optional[float]:
+        # 1. 고정 요율 (MASTER DO FEE, CUSTOMS CLEARANCE 등)
+        contract_rate = self.contract_rate(desc_upper)
+        if contract_rate is not None:
+            return contract_rate
+
+        # 2. Standard Items 키워드
+        for keyword_match, keyword_lookup in STANDARD_KEYWORDS:
+            if keyword_match not in desc_upper:
+                continue
+            item_port = port or self.extract_port(desc_upper) or "Khalifa Port"
+
+            # Terminal Handling: container type / 항공 KG 단가
+            if "TERMINAL HANDLING" in keyword_match or keyword_match == "THC":
+                if "20DC" in desc_upper or "20FT" in desc_upper:
+                    return 280.00  # THC_20FT from config
+                elif "40HC" in desc_upper or "40FT" in desc_upper:
+                    return 420.00  # THC_40FT from config
+                elif "KG" in desc_upper or "CW:" in desc_upper:
+                    return 0.55  # Abu Dhabi Airport per KG
+
+            ref_rate = self._standard_rate(keyword_lookup, item_port)
+            if ref_rate is not None:
+                return ref_rate
+
+        # 3. Inland Trucking (Transportation)
+        if any(kw in desc_upper for kw in TRANSPORT_KEYWORDS):
+            route_port, destination = self.parse_route(desc_upper)
+            if route_port and destination:
+                ref_rate = self.lane_rate(route_port, destination, "per truck")
+                if ref_rate is not None:
+                    return ref_rate
+
+            # 파싱 실패 시 Lane Map 폴백 (기존 로직 유지)
+            if "KHALIFA PORT" in desc_upper and (
+                "STORAGE" in desc_upper or "DSV" in desc_upper or "YARD" in desc_upper
+            ):
+                return 252.00
+            elif "DSV" in desc_upper and "KHALIFA" in desc_upper:
+                return 252.00  # DSV → KHALIFA (EMPTY RETURN)
+            elif "AUH AIRPORT" in desc_upper and "MOSB" in desc_upper:
+                if "3 TON PU" in desc_upper or "3T" in desc_upper:
+                    return 100.00  # AUH → MOSB (3T PU)
+                return 200.00  # AUH → MOSB (FB)
+            elif "MIRFA" in desc_upper:
+                return 420.00
+            elif "SHUWEIHAT" in desc_upper or "SHU" in desc_upper:
+                return 600.00
+
+        return None
+
+    def _standard_rate(self, lookup: str, port: str) -> Optional[float]:
+        if self.rate_loader is None:
+            return None
+        key = (lookup, port)
+        if key not in self._standard_cache:
+            self._standard_cache[key] = self.rate_loader.get_standard_rate(lookup, port)
+        return self._standard_cache[key]
+
+    def parse_route(self, description: str) -> Tuple[Optional[str], Optional[str]]:
+        """'FROM <port> TO <destination>' → (Port, Destination) - 부분 문자열 별칭"""
+        match = SHPT_ROUTE_PATTERN.search(description.upper())
+        if not match:
+            return (None, None)
+        port = self.extract_port(match.group(1).strip())
+        destination = self.normalize_destination(match.group(2).strip())
+        return (port, destination)
+
+    def resolve_column(
+        self, descriptions: pd.Series, ports: Optional[pd.Series] = None
+    ) -> pd.Series:
+        """
+        DESCRIPTION 컬럼 일괄 조회 (고유 (설명, port) 조합당 1회 결정)
+
+        Args:
+            descriptions: 항목 설명 컬럼
+            ports: Port 컬럼 (선택, descriptions와 같은 길이/순서)
+
+        Returns:
+            참조 요율 Series (float, 설명 결측/미결정은 NaN)
+        """
+        if ports is None:
+            port_values = [None] * len(descriptions)
+        else:
+            port_values = [p if isinstance(p, str) and p else None for p in ports]
+
+        values = [
+            None if pd.isna(desc) else self.resolve(str(desc), port)
+            for desc, port in zip(descriptions, port_values)
+        ]
+        return pd.Series(values, index=descriptions.index, dtype="float64")
+
+    # ==================== MasterData 결정 (MasterDataValidator) ====================
+
+    def fixed_rule(self, description: str) -> Optional[FixedFeeRule]:
+        """
+        고정 요율 결정 (MasterData Priority 1-2, 첫 번째 일치 규칙)
+
+        DO FEE → 고객 transport mode 필요, Customs/Portal Fee → 고정 요율,
+        fixed_fees 키워드 → 요율 (transport_mode 지정 시 mode 일치 조건)
+        """
+        self._sync()
+        desc_upper = str(description).upper()
+        if desc_upper in self._fixed_rule_cache:
+            return self._fixed_rule_cache[desc_upper]
+
+        rule = self._fixed_rule(desc_upper)
+        self._fixed_rule_cache[desc_upper] = rule
+        return rule
+
+    def _fixed_rule(self, desc_upper: str) -> Optional[FixedFeeRule]:
+        if "MASTER DO FEE" in desc_upper or "DO FEE" in desc_upper:
+            return FixedFeeRule("do_fee")
+        if any(
+            kw in desc_upper
+            for kw in ("CUSTOMS CLEARANCE", "CUSTOM CLEARANCE", "CLEARANCE FEE")
+        ):
+            return FixedFeeRule("rate", self._customs_fee)
+        if "APPOINTMENT FEE" in desc_upper or "TRUCK APPOINTMENT" in desc_upper:
+            return FixedFeeRule("rate", self._portal_rates["APPOINTMENT_FEE"])
+        if "DPC FEE" in desc_upper:
+            return FixedFeeRule("rate", self._portal_rates["DPC_FEE"])
+        if "DOCUMENT PROCESSING FEE" in desc_upper or "DOCS PROCESSING" in desc_upper:
+            return FixedFeeRule("rate", self._portal_rates["DOCUMENT_PROCESSING_FEE"])
+
+        for keywords, rate, transport_mode in self._keyword_fees:
+            if any(kw in desc_upper for kw in keywords):
+                return FixedFeeRule("rate", rate, transport_mode)
+        return None
+
+    def config_rate(self, description: str) -> Optional[float]:
+        """
+        설정 기반 Contract 요율 (MasterData: fixed_fees → Inland → Lane)
+
+        PDF 추출 전후 순서는 호출자(MasterDataValidator)가 결정.
+        """
+        self._sync()
+        desc_upper = str(description).upper()
+        if desc_upper in self._config_rate_cache:
+            return self._config_rate_cache[desc_upper]
+
+        rate = self.contract_rate(desc_upper)
+        if rate is None and any(
+            kw in desc_upper for kw in MASTERDATA_TRANSPORT_KEYWORDS
+        ):
+            port, destination = self.parse_route_exact(desc_upper)
+            if port and destination:
+                rate = self.inland_rate(port, destination)
+                if rate is None:
+                    rate = self.lane_rate(port, destination, "per truck")
+
+        self._config_rate_cache[desc_upper] = rate
+        return rate
+
+    def parse_route_exact(self, description: str) -> Tuple[Optional[str], Optional[str]]:
+        """'FROM <port> TO <destination>' → 정확 일치 별칭 정규화 (MasterData 방식)"""
+        match = MASTERDATA_ROUTE_PATTERN.search(str(description).upper())
+        if not match:
+            return (None, None)
+        port = self.normalize_location(match.group(1).strip())
+        destination = self.normalize_location(match.group(2).strip())
+        return (port, destination)
@@ -3,16 +3,23 @@
 COST-GUARD 밴드 공용 유틸리티
 Config 기반 밴드 판정 및 Auto-Fail 로직
 
-Version: 1.0.0
+Version: 1.1.0
 Created: 2025-10-15
+Updated: 2026-10-19 - 송장 단위 일괄 계산 (evaluate_cost_guard)
 Author: MACHO-GPT v3.4-mini HVDC Project Enhancement
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 import logging
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# 밴드 순서 (임계값 배열 인덱스 → 밴드명, 마지막은 상한 없음)
+BAND_NAMES = ("PASS", "WARN", "HIGH", "CRITICAL")
+
 
 def get_cost_guard_band(delta_pct: Optional[float], bands: Dict) -> str:
     """
@@ -29,11 +36,7 @@ def get_cost_guard_band(delta_pct: Optional[float], bands: Dict) -> str:
         return "N/A"
 
     abs_delta = abs(delta_pct)
-
-    # Config에서 임계값 읽기 (Fallback: 하드코딩 값)
-    pass_threshold = bands.get("PASS", {}).get("max_delta", 2.0)
-    warn_threshold = bands.get("WARN", {}).get("max_delta", 5.0)
-    high_threshold = bands.get("HIGH", {}).get("max_delta", 10.0)
+    pass_threshold, warn_threshold, high_threshold = get_band_thresholds(bands)
 
     # 밴드 판정 (순서대로)
     if abs_delta <= pass_threshold:
@@ -46,6 +49,15 @@ def get_cost_guard_band(delta_pct: Optional[float], bands: Dict) -> str:
         return "CRITICAL"
 
 
+def get_band_thresholds(bands: Dict) -> Tuple[float, float, float]:
+    """Config의 PASS/WARN/HIGH max_delta 임계값 (Fallback: 2/5/10%)"""
+    return (
+        bands.get("PASS", {}).get("max_delta", 2.0),
+        bands.get("WARN", {}).get("max_delta", 5.0),
+        bands.get("HIGH", {}).get("max_delta", 10.0),
+    )
+
+
 def check_auto_fail(delta_pct: Optional[float], auto_fail_threshold: float = 15.0) -> bool:
     """
     Auto-Fail 조건 확인 (Delta > 15%)
@@ -64,6 +76,146 @@ def check_auto_fail(delta_pct: Optional[float], auto_fail_threshold: float = 15.
     return abs_delta > auto_fail_threshold
 
 
+def calculate_delta_percents(
+    draft_rates: Sequence,
+    ref_rates: Sequence,
+    zero_ref: float = np.nan,
+    decimals: Optional[int] = 2,
+) -> np.ndarray:
+    """
+    Delta % 일괄 계산: round((Draft - Ref) / Ref * 100, 2)
+
+    Args:
+        draft_rates: Draft 요율 배열 (None/비숫자는 NaN)
+        ref_rates: 참조 요율 배열 (draft_rates와 같은 길이)
+        zero_ref: Ref = 0 행의 값 (기본 NaN, UnifiedRateLoader 호환은 0.0)
+        decimals: 반올림 자릿수 (None = 반올림 없음)
+
+    Returns:
+        float64 배열 (계산 불가 행은 NaN)
+    """
+    draft = pd.to_numeric(pd.Series(draft_rates, dtype=object), errors="coerce")
+    ref = pd.to_numeric(pd.Series(ref_rates, dtype=object), errors="coerce")
+    draft = draft.to_numpy(dtype=float)
+    ref = ref.to_numpy(dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = (draft - ref) / ref * 100
+    if decimals is not None:
+        delta = np.round(delta, decimals)
+    delta[ref == 0] = zero_ref
+    return delta
+
+
+def delta_percent(
+    draft_rate, ref_rate, zero_ref: Optional[float] = None
+) -> Optional[float]:
+    """
+    Delta % 1건 (calculate_delta_percents 1개 배치)
+
+    Args:
+        draft_rate: Draft 요율
+        ref_rate: 참조 요율
+        zero_ref: Ref = 0일 때 값 (기본 None)
+
+    Returns:
+        Delta % (소수점 2자리), 계산 불가 시 None
+    """
+    delta = calculate_delta_percents(
+        [draft_rate], [ref_rate], zero_ref=np.nan if zero_ref is None else zero_ref
+    )[0]
+    return delta_or_none(delta)
+
+
+def assign_bands(
+    delta_pcts: Sequence,
+    thresholds: Sequence[float],
+    names: Sequence[str] = BAND_NAMES,
+    na_band: str = "N/A",
+) -> np.ndarray:
+    """
+    |Delta| 배열 → 밴드명 배열
+
+    |Delta| <= thresholds[i] 인 첫 밴드 names[i] (경계값 포함 = 하위 밴드),
+    모든 임계값 초과 시 names[-1], NaN은 na_band.
+
+    Args:
+        delta_pcts: Delta 배열 (부호 무관)
+        thresholds: 오름차순 상한 (len(names) - 1개)
+        names: 밴드명 (마지막은 상한 없음)
+        na_band: NaN 행의 밴드명
+    """
+    abs_delta = np.abs(np.asarray(delta_pcts, dtype=float))
+    band_index = np.searchsorted(np.asarray(thresholds, dtype=float), abs_delta, side="left")
+    names = np.asarray(names, dtype=object)
+    return np.where(
+        np.isnan(abs_delta), na_band, names[np.minimum(band_index, len(names) - 1)]
+    )
+
+
+def get_cost_guard_bands_array(delta_pcts: np.ndarray, bands: Dict) -> np.ndarray:
+    """
+    Delta % 배열 → 밴드 배열 (get_cost_guard_band 일괄 버전)
+
+    |Delta| 를 PASS/WARN/HIGH 임계값에 searchsorted (경계값 포함 = 하위 밴드),
+    NaN은 "N/A".
+    """
+    return assign_bands(delta_pcts, get_band_thresholds(bands))
+
+
+def evaluate_cost_guard(
+    draft_rates: Sequence,
+    ref_rates: Sequence,
+    bands: Dict,
+    auto_fail_threshold: float = 15.0,
+    tolerance: float = 0.03,
+    zero_ref: float = np.nan,
+    index: Optional[pd.Index] = None,
+) -> pd.DataFrame:
+    """
+    COST-GUARD 일괄 판정 (송장 항목 전체를 한 번에)
+
+    Args:
+        draft_rates: Draft 요율 컬럼
+        ref_rates: 참조 요율 컬럼 (None = 참조 없음)
+        bands: Config의 cost_guard_bands 딕셔너리
+        auto_fail_threshold: Auto-Fail |Delta| 임계값 (%)
+        tolerance: 허용 범위 비율 (기본 3%)
+        zero_ref: Ref = 0 행의 Delta 값 (calculate_delta_percents 참조)
+        index: 결과 인덱스 (기본: draft_rates가 Series면 그 인덱스)
+
+    Returns:
+        DataFrame[delta_pct, cg_band, auto_fail, tolerance_low, tolerance_high]
+        - delta_pct: NaN = 계산 불가 (스칼라 API의 None)
+        - cg_band: "PASS" | "WARN" | "HIGH" | "CRITICAL" | "N/A"
+    """
+    if index is None and isinstance(draft_rates, pd.Series):
+        index = draft_rates.index
+
+    delta = calculate_delta_percents(draft_rates, ref_rates, zero_ref=zero_ref)
+    ref = pd.to_numeric(pd.Series(ref_rates, dtype=object), errors="coerce")
+    ref = ref.to_numpy(dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        auto_fail = np.abs(delta) > auto_fail_threshold
+
+    return pd.DataFrame(
+        {
+            "delta_pct": delta,
+            "cg_band": get_cost_guard_bands_array(delta, bands),
+            "auto_fail": auto_fail,
+            "tolerance_low": ref * (1 - tolerance),
+            "tolerance_high": ref * (1 + tolerance),
+        },
+        index=index,
+    )
+
+
+def delta_or_none(delta_pct: float) -> Optional[float]:
+    """일괄 결과 Delta → 스칼라 API 표현 (NaN → None)"""
+    return None if np.isnan(delta_pct) else float(delta_pct)
+
+
 def get_band_color(band: str) -> str:
     """
     밴드별 색상 코드 반환 (Excel 조건부 서식용)
@@ -18,12 +18,16 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from collections import OrderedDict
+from functools import lru_cache
 import unicodedata
 
-import openpyxl
 import pandas as pd
 
+from sheet_grid import SheetGrid, open_workbook_readonly
+
 try:
+    import numpy as np
     from rapidfuzz import fuzz, process
     _USE_FUZZ = True
 except Exception:
@@ -71,6 +75,11 @@ def _norm(s: str) -> str:
     s = re.sub(r"\s+", " ", s)
     return s
 
+@lru_cache(maxsize=8192, typed=True)
+def _norm_cached(value) -> str:
+    """_norm 메모 (헤더 셀 값은 시트마다 반복됨, 1 / 1.0 / True 구분)"""
+    return _norm(value)
+
 def _syn_map(token: str) -> str:
     """동의어 매핑"""
     t = token
@@ -87,6 +96,66 @@ def _syn_map(token: str) -> str:
         return _SYNONYMS[t2]
     return t
 
+# 토큰 → (최고 canonical, 점수, 퍼지 여부) 프로세스 공용 메모 (임계값 적용 전 값)
+# 같은 헤더 토큰("DESCRIPTION", "RATE", "Q'TY")이 모든 시트/워크북에서 반복됨
+# 장시간 실행 시 무한 증가하지 않도록 LRU 상한 적용
+_TOKEN_MATCH_CACHE_SIZE = 8192
+_TOKEN_MATCH_CACHE: "OrderedDict[str, Tuple[str, float, bool]]" = OrderedDict()
+
+
+def _remember_match(tok: str, match: Tuple[str, float, bool]) -> None:
+    """토큰 매칭 결과 저장 (상한 초과 시 가장 오래 안 쓴 토큰 제거)"""
+    _TOKEN_MATCH_CACHE[tok] = match
+    if len(_TOKEN_MATCH_CACHE) > _TOKEN_MATCH_CACHE_SIZE:
+        _TOKEN_MATCH_CACHE.popitem(last=False)
+
+
+def _token_match(tok: str) -> Tuple[str, float, bool]:
+    """토큰 매칭 결과 조회 (캐시에 없으면 점수화)"""
+    match = _TOKEN_MATCH_CACHE.get(tok)
+    if match is None:
+        _match_tokens([tok])
+        return _TOKEN_MATCH_CACHE[tok]
+    _TOKEN_MATCH_CACHE.move_to_end(tok)
+    return match
+
+
+def _match_tokens(tokens) -> None:
+    """
+    캐시에 없는 토큰들을 한 번에 점수화하여 _TOKEN_MATCH_CACHE에 저장
+
+    정확 동의어 매핑은 100점, 나머지는 process.cdist 한 번으로
+    process.extractOne(..., scorer=fuzz.token_set_ratio)와 같은 결과를 계산
+    (동점이면 _CANONICAL 앞쪽 우선).
+    """
+    pending = {t for t in tokens if t and t not in _TOKEN_MATCH_CACHE}
+    if not pending:
+        return
+
+    fuzzy_tokens, fuzzy_queries = [], []
+    for tok in pending:
+        tok_syn = _syn_map(tok)
+        # 정확 매핑되면 높은 점수
+        if tok_syn in _CANONICAL:
+            _remember_match(tok, (tok_syn, 100, False))
+        elif not _USE_FUZZ:
+            # 간단 유사도(부분 포함)
+            match = next((c for c in _CANONICAL if c in tok_syn or tok_syn in c), "")
+            _remember_match(tok, (match, 85 if match else 0, False))
+        else:
+            fuzzy_tokens.append(tok)
+            fuzzy_queries.append(tok_syn)
+
+    if fuzzy_queries:
+        # rapidfuzz: 모든 토큰 × canonical 점수 행렬 (extractOne과 같은 float64 점수)
+        matrix = process.cdist(
+            fuzzy_queries, _CANONICAL, scorer=fuzz.token_set_ratio, dtype=np.float64
+        )
+        best = matrix.argmax(axis=1)
+        for tok, idx, row in zip(fuzzy_tokens, best, matrix):
+            _remember_match(tok, (_CANONICAL[idx], float(row[idx]), True))
+
+
 @dataclass
 class HeaderDetectionResult:
     header_row_index: int
@@ -111,8 +180,12 @@ class HeaderDetector:
         best = None  # (score, details)
         reasons = []
 
+        # 후보 창(scan_rows) 행 정규화는 1회만 (행별 iloc 대신 창 전체를 한 번에 추출)
+        window = df.iloc[:n_rows].values
+        normalized_rows = [[_norm_cached(x) for x in window[r]] for r in range(n_rows)]
+
         def row_text(r: int) -> List[str]:
-            return [ _norm(x) for x in list(df.iloc[r].values) ]
+            return normalized_rows[r]
 
         def join_two_rows(r1: int, r2: int) -> List[str]:
             a = row_text(r1); b = row_text(r2)
@@ -126,19 +199,11 @@ class HeaderDetector:
             return out
 
         def fuzzy_match_token(tok: str) -> Tuple[str, int]:
-            tok_syn = _syn_map(tok)
-            # 정확 매핑되면 높은 점수
-            if tok_syn in _CANONICAL:
-                return tok_syn, 100
-            if not _USE_FUZZ:
-                # 간단 유사도(부분 포함)
-                for c in _CANONICAL:
-                    if c in tok_syn or tok_syn in c:
-                        return c, 85
-                return "", 0
-            # rapidfuzz
-            choice, score, _ = process.extractOne(tok_syn, _CANONICAL, scorer=fuzz.token_set_ratio)
-            return (choice if score >= self.fuzz_threshold else ""), score
+            choice, score, fuzzy = _token_match(tok)
+            # 퍼지 점수에만 임계값 적용
+            if fuzzy and score < self.fuzz_threshold:
+                return "", score
+            return choice, score
 
         def score_row(tokens: List[str]) -> Tuple[float, Dict[int, str], Dict[int, int]]:
             mapping, scores = {}, {}
@@ -158,6 +223,11 @@ class HeaderDetector:
             total_score = coverage * 1.0 - penalty
             return total_score, mapping, scores
 
+        # 후보 창의 모든 고유 토큰(단일행 + 2행 결합)을 한 번에 점수화
+        window_tokens = {t for r in range(n_rows) for t in row_text(r)}
+        window_tokens.update(t for r in range(n_rows - 1) for t in join_two_rows(r, r + 1))
+        _match_tokens(window_tokens)
+
         candidates: List[Tuple[float, int, bool, Dict[int,str], Dict[int,int]]] = []
 
         # 1) 단일행 후보
@@ -311,7 +381,7 @@ class InvoiceConsolidator:
     def consolidate(self) -> pd.DataFrame:
         """모든 인보이스 시트를 통합"""
         logger.info(f"Opening Excel file: {self.excel_path.name}")
-        self.wb = openpyxl.load_workbook(self.excel_path, data_only=True)
+        self.wb = open_workbook_readonly(self.excel_path)
         
         try:
             # 1. 인보이스 시트 목록
@@ -386,35 +456,36 @@ class InvoiceConsolidator:
 
     def _extract_sheet_data(self, sheet_name: str) -> Optional[pd.DataFrame]:
         """시트에서 데이터 추출 (S/No 없어도 처리)"""
-        ws = self.wb[sheet_name]
+        # 시트 값을 한 번에 2-D 배열로 읽음 (이후 조회는 메모리에서)
+        grid = SheetGrid.from_worksheet(self.wb[sheet_name])
         
         # 1. CWI Job Number 추출
-        cwi_job = self._get_value_from_label(ws, "CW1 Job Number")
+        cwi_job = self._get_value_from_label(grid, "CW1 Job Number")
         if not cwi_job:
-            cwi_job = self._get_value_from_label(ws, "CWI Job Number")
+            cwi_job = self._get_value_from_label(grid, "CWI Job Number")
         if not cwi_job:
-            cwi_job = self._find_bamf_number(ws)
+            cwi_job = self._find_bamf_number(grid)
         if not cwi_job:
             cwi_job = "UNKNOWN"
         
         # 2. Order Ref 추출
-        order_ref = self._get_value_from_label(ws, "Order Ref. Number")
+        order_ref = self._get_value_from_label(grid, "Order Ref. Number")
         if not order_ref:
-            order_ref = self._find_hvdc_adopt(ws)
+            order_ref = self._find_hvdc_adopt(grid)
         if not order_ref:
             order_ref = self._extract_order_ref_from_sheet_name(sheet_name)
         
         # 3. 헤더 행 찾기
         # 3-1. S/No 있는 경우 (기존 로직 우선)
-        header_info_with_sno = self._find_header_with_alternatives(ws)
+        header_info_with_sno = self._find_header_with_alternatives(grid)
         
         if header_info_with_sno:
             # S/No 있음 → 기존 로직
-            return self._extract_with_sno(ws, sheet_name, cwi_job, order_ref, header_info_with_sno)
+            return self._extract_with_sno(grid, sheet_name, cwi_job, order_ref, header_info_with_sno)
         
         # 3-2. Robust Header Detection (PATCH) - Fuzzy 매칭 기반
         try:
-            df_raw = pd.DataFrame(ws.values)
+            df_raw = pd.DataFrame(grid.rows)
             detector = HeaderDetector(min_hit=3, fuzz_threshold=78, scan_rows=25)
             hdr = detector.detect(df_raw)
             
@@ -456,16 +527,16 @@ class InvoiceConsolidator:
             logger.warning(f"[{sheet_name}] Robust detection failed: {e}")
         
         # 3-3. 폴백: 기존 로직 (DESCRIPTION/RATE로 헤더 행 찾기)
-        return self._extract_without_sno(ws, sheet_name, cwi_job, order_ref)
+        return self._extract_without_sno(grid, sheet_name, cwi_job, order_ref)
     
-    def _extract_with_sno(self, ws, sheet_name, cwi_job, order_ref, header_info) -> Optional[pd.DataFrame]:
+    def _extract_with_sno(self, grid, sheet_name, cwi_job, order_ref, header_info) -> Optional[pd.DataFrame]:
         """S/No 있는 경우 (기존 로직)"""
         header_row, sno_col = header_info
         
         # 마지막 컬럼 찾기
-        last_col = ws.max_column
-        for col in range(ws.max_column, 1, -1):  # Column 1부터 검사
-            if ws.cell(header_row, col).value:
+        last_col = grid.max_column
+        for col in range(grid.max_column, 1, -1):  # Column 1부터 검사
+            if grid.value(header_row, col):
                 last_col = col
                 break
         
@@ -473,7 +544,7 @@ class InvoiceConsolidator:
         headers = []
         header_cols = []
         for col in range(sno_col, last_col + 1):  # S/No부터 시작
-            value = ws.cell(header_row, col).value
+            value = grid.value(header_row, col)
             if value:
                 headers.append(str(value).strip())
                 header_cols.append(col)
@@ -483,8 +554,8 @@ class InvoiceConsolidator:
         
         # 데이터 행 추출 (IsNumeric(S/No))
         data_rows = []
-        for row_num in range(header_row + 1, ws.max_row + 1):
-            sno_value = ws.cell(row_num, sno_col).value
+        for row_num in range(header_row + 1, grid.max_row + 1):
+            sno_value = grid.value(row_num, sno_col)
             
             if sno_value is not None and self._is_numeric(sno_value):
                 row_data = {
@@ -494,7 +565,7 @@ class InvoiceConsolidator:
                 
                 for idx, header in enumerate(headers):
                     col = header_cols[idx]  # 실제 컬럼 번호 사용
-                    cell_value = ws.cell(row_num, col).value
+                    cell_value = grid.value(row_num, col)
                     row_data[header] = cell_value
                 
                 data_rows.append(row_data)
@@ -506,10 +577,10 @@ class InvoiceConsolidator:
         logger.info(f"[{sheet_name}] Extracted {len(df)} rows (WITH S/No)")
         return df
     
-    def _extract_without_sno(self, ws, sheet_name, cwi_job, order_ref) -> Optional[pd.DataFrame]:
+    def _extract_without_sno(self, grid, sheet_name, cwi_job, order_ref) -> Optional[pd.DataFrame]:
         """S/No 없는 경우 (자동 번호 부여)"""
         # 헤더 행 찾기 (DESCRIPTION/RATE/TOTAL 기준)
-        header_result = self._find_header_by_required_columns(ws)
+        header_result = self._find_header_by_required_columns(grid)
         if not header_result:
             logger.warning(f"[{sheet_name}] No valid header found")
             return None
@@ -523,11 +594,11 @@ class InvoiceConsolidator:
         
         # column_map의 최소 컬럼부터 시작 (빈 컬럼 건너뛰기)
         min_col = min(column_map.values()) if column_map else 1
-        max_col = ws.max_column
+        max_col = grid.max_column
         
         # 실제 헤더가 있는 컬럼만 읽기
         for col in range(min_col, max_col + 1):
-            value = ws.cell(header_row, col).value
+            value = grid.value(header_row, col)
             if value and str(value).strip():
                 headers.append(str(value).strip())
                 header_cols.append(col)
@@ -543,9 +614,9 @@ class InvoiceConsolidator:
         data_rows = []
         auto_sno = 1
         
-        for row_num in range(header_row + 1, ws.max_row + 1):
-            desc_value = ws.cell(row_num, desc_col).value
-            rate_value = ws.cell(row_num, rate_col).value
+        for row_num in range(header_row + 1, grid.max_row + 1):
+            desc_value = grid.value(row_num, desc_col)
+            rate_value = grid.value(row_num, rate_col)
             
             # DESCRIPTION 있고 RATE가 숫자면 데이터 행
             if desc_value and str(desc_value).strip() and self._is_numeric(rate_value):
@@ -558,7 +629,7 @@ class InvoiceConsolidator:
                 # 모든 헤더 컬럼 복사
                 for idx, col in enumerate(header_cols):
                     header = headers[idx]
-                    cell_value = ws.cell(row_num, col).value
+                    cell_value = grid.value(row_num, col)
                     row_data[header] = cell_value
                 
                 data_rows.append(row_data)
@@ -571,27 +642,27 @@ class InvoiceConsolidator:
         logger.info(f"[{sheet_name}] Extracted {len(df)} rows (AUTO S/No: 1~{auto_sno-1})")
         return df
 
-    def _find_header_with_alternatives(self, ws) -> Optional[Tuple[int, int]]:
+    def _find_header_with_alternatives(self, grid) -> Optional[Tuple[int, int]]:
         """다중 S/No 키워드로 헤더 찾기"""
         for keyword in self.sno_keywords:
-            result = self._find_header_row_and_columns(ws, keyword)
+            result = self._find_header_row_and_columns(grid, keyword)
             if result:
                 logger.debug(f"Found S/No variant '{keyword}' at row={result[0]}, col={result[1]}")
                 return result
         return None
     
-    def _find_header_by_required_columns(self, ws) -> Optional[Tuple[int, Dict[str, int]]]:
+    def _find_header_by_required_columns(self, grid) -> Optional[Tuple[int, Dict[str, int]]]:
         """
         DESCRIPTION, RATE, TOTAL로 헤더 행 찾기
         
         Returns:
             (header_row, {'DESCRIPTION': col, 'RATE': col, ...})
         """
-        for row in range(1, min(50, ws.max_row + 1)):
+        for row in range(1, min(50, grid.max_row + 1)):
             found_headers = {}
             
-            for col in range(1, min(30, ws.max_column + 1)):
-                cell_value = ws.cell(row, col).value
+            for col in range(1, min(30, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
                 if not cell_value:
                     continue
                 
@@ -616,40 +687,40 @@ class InvoiceConsolidator:
         
         return None
 
-    def _find_bamf_number(self, ws) -> str:
+    def _find_bamf_number(self, grid) -> str:
         """시트 상단에서 BAMF 번호 찾기"""
-        for row in range(1, min(20, ws.max_row + 1)):
-            for col in range(1, min(10, ws.max_column + 1)):
-                cell_value = ws.cell(row, col).value
+        for row in range(1, min(20, grid.max_row + 1)):
+            for col in range(1, min(10, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
                 if cell_value and 'BAMF' in str(cell_value).upper():
                     return str(cell_value).strip()
         return ""
     
-    def _find_hvdc_adopt(self, ws) -> str:
+    def _find_hvdc_adopt(self, grid) -> str:
         """시트 상단에서 HVDC-ADOPT 번호 찾기"""
-        for row in range(1, min(20, ws.max_row + 1)):
-            for col in range(1, min(10, ws.max_column + 1)):
-                cell_value = ws.cell(row, col).value
+        for row in range(1, min(20, grid.max_row + 1)):
+            for col in range(1, min(10, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
                 if cell_value and 'HVDC-ADOPT' in str(cell_value).upper():
                     return str(cell_value).strip()
         return ""
 
-    def _get_value_from_label(self, ws, label_text: str) -> str:
+    def _get_value_from_label(self, grid, label_text: str) -> str:
         """VBA GetValueFromLabel 재현"""
-        for row in range(1, min(20, ws.max_row + 1)):
-            for col in range(1, min(10, ws.max_column + 1)):
-                cell_value = ws.cell(row, col).value
+        for row in range(1, min(20, grid.max_row + 1)):
+            for col in range(1, min(10, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
                 if cell_value and label_text.lower() in str(cell_value).lower():
-                    right_value = ws.cell(row, col + 1).value
+                    right_value = grid.value(row, col + 1)
                     if right_value:
                         return str(right_value).strip()
         return ""
 
-    def _find_header_row_and_columns(self, ws, header_keyword: str) -> Optional[Tuple[int, int]]:
+    def _find_header_row_and_columns(self, grid, header_keyword: str) -> Optional[Tuple[int, int]]:
         """VBA FindHeaderRow + FindCol 재현"""
-        for row in range(1, min(50, ws.max_row + 1)):
-            for col in range(1, min(30, ws.max_column + 1)):
-                cell_value = ws.cell(row, col).value
+        for row in range(1, min(50, grid.max_row + 1)):
+            for col in range(1, min(30, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
                 if cell_value:
                     normalized = str(cell_value).strip().replace(" ", "").replace("/", "").upper()
                     keyword_norm = header_keyword.strip().replace(" ", "").replace("/", "").upper()
@@ -9,12 +9,13 @@
 """
 
 import pandas as pd
-import openpyxl
 from pathlib import Path
 import logging
 from dataclasses import dataclass
 from typing import Optional, List, Dict
 
+from sheet_grid import SheetGrid, open_workbook_readonly
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -170,18 +171,21 @@ class MonthSheetConsolidator:
         logger.info(f"파일 열기: {info.filename}")
         
         try:
-            wb = openpyxl.load_workbook(file_path, data_only=True)
-            
-            if info.sheet_name not in wb.sheetnames:
-                logger.error(f"시트 없음: {info.sheet_name}")
-                logger.info(f"전체 시트: {', '.join(wb.sheetnames[:10])}...")
-                return None
-            
-            ws = wb[info.sheet_name]
-            logger.info(f"시트 크기: {ws.max_row} rows × {ws.max_column} cols")
+            # read_only: 필요한 시트만 스트리밍으로 읽음
+            wb = open_workbook_readonly(file_path)
+            try:
+                if info.sheet_name not in wb.sheetnames:
+                    logger.error(f"시트 없음: {info.sheet_name}")
+                    logger.info(f"전체 시트: {', '.join(wb.sheetnames[:10])}...")
+                    return None
+
+                grid = SheetGrid.from_worksheet(wb[info.sheet_name])
+            finally:
+                wb.close()
+            logger.info(f"시트 크기: {grid.max_row} rows × {grid.max_column} cols")
             
             # 1. 헤더 행 동적 감지
-            header_row = self._find_header_row(ws)
+            header_row = self._find_header_row(grid)
             
             if header_row is None:
                 logger.error(f"헤더를 찾을 수 없음")
@@ -191,9 +195,7 @@ class MonthSheetConsolidator:
             
             # 2. 헤더 읽기
             headers = []
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=header_row, column=col_idx)
-                value = cell.value
+            for col_idx, value in enumerate(grid.row(header_row), start=1):
                 if value:
                     # 여러 줄 텍스트를 한 줄로
                     header_text = str(value).replace('\n', ' / ').strip()
@@ -205,11 +207,13 @@ class MonthSheetConsolidator:
             
             # 3. 데이터 추출
             data_rows = []
-            for row_idx in range(header_row + 1, ws.max_row + 1):
+            for row_idx in range(header_row + 1, grid.max_row + 1):
+                row_values = list(grid.row(row_idx))
+
                 # S/No 컬럼 확인 (Col 1 또는 Col 2)
                 sno_val = None
                 for sno_col in [1, 2]:
-                    val = ws.cell(row=row_idx, column=sno_col).value
+                    val = grid.value(row_idx, sno_col)
                     if val and str(val).strip():
                         sno_val = val
                         break
@@ -220,17 +224,11 @@ class MonthSheetConsolidator:
                     break
                 
                 # 빈 행 체크
-                row_values = [ws.cell(row=row_idx, column=c).value for c in range(1, ws.max_column + 1)]
                 if not any(v for v in row_values if v is not None and str(v).strip()):
                     continue  # 빈 행 스킵
                 
                 # 행 데이터 추출
-                row_data = []
-                for col_idx in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    row_data.append(cell.value)
-                
-                data_rows.append(row_data)
+                data_rows.append(row_values)
             
             if not data_rows:
                 logger.warning(f"데이터 행 없음")
@@ -250,8 +248,6 @@ class MonthSheetConsolidator:
             # 7. 중복 컬럼 제거
             df = df.loc[:, ~df.columns.duplicated()]
             
-            wb.close()
-            
             return df
             
         except Exception as e:
@@ -260,7 +256,7 @@ class MonthSheetConsolidator:
             traceback.print_exc()
             return None
     
-    def _find_header_row(self, ws) -> Optional[int]:
+    def _find_header_row(self, grid) -> Optional[int]:
         """
         헤더 행 동적 감지 (하드코딩 없음)
         
@@ -271,11 +267,11 @@ class MonthSheetConsolidator:
         Returns:
             헤더 행 번호 (1-based) 또는 None
         """
-        for row_idx in range(1, min(16, ws.max_row + 1)):
+        for row_idx in range(1, min(16, grid.max_row + 1)):
             # Row 전체 텍스트 수집
             row_values = []
-            for col_idx in range(1, min(20, ws.max_column + 1)):
-                val = ws.cell(row=row_idx, column=col_idx).value
+            for col_idx in range(1, min(20, grid.max_column + 1)):
+                val = grid.value(row_idx, col_idx)
                 if val:
                     row_values.append(str(val).upper())
             
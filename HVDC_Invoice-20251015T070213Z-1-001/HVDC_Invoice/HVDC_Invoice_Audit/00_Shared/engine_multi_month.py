@@ -6,19 +6,27 @@ Multi-Month Invoice Consolidator
 - 14개월치 파일 처리 (2024.08 ~ 2025.09)
 - Source_File 컬럼 추가 (A열)
 - Month 컬럼 추가 (C열)
+- 파일 단위 프로세스 풀 병렬 처리 (workers > 1)
+- 파일 해시 기반 결과 캐시 (마감된 월은 재통합하지 않음)
 
-Version: 1.0.0
+Version: 1.1.0
 Created: 2024-10-16
 """
 
 import re
+import glob
+import hashlib
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
 import pandas as pd
 
+import engine_individual_sheets
+import sheet_grid
 from engine_individual_sheets import InvoiceConsolidator
 
 logging.basicConfig(
@@ -39,11 +47,65 @@ MONTH_MAP = {
 }
 
 
+# 캐시 포맷 버전 (캐시 구조 변경 시 증가)
+CACHE_VERSION = "1"
+# 기본 캐시 폴더 (입력 데이터 폴더가 아닌 출력 영역: HVDC_Invoice_Audit/out)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "out" / "consolidation_cache"
+_HASH_CHUNK = 1024 * 1024
+
+
+def file_digest(file_path: Path) -> str:
+    """워크북 내용 SHA-256 (파일명/mtime 무관)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _engine_version() -> str:
+    """추출 로직 버전: engine_individual_sheets + sheet_grid 소스 해시 (코드 변경 시 캐시 무효화)"""
+    digest = hashlib.sha256()
+    for module in (engine_individual_sheets, sheet_grid):
+        digest.update(file_digest(Path(module.__file__)).encode("ascii"))
+    return digest.hexdigest()[:12]
+
+
+def consolidate_workbook(file_path: Path) -> Optional[pd.DataFrame]:
+    """
+    워크북 1개 통합 (프로세스 풀 worker 진입점, pickle 가능한 모듈 함수)
+
+    Returns:
+        InvoiceConsolidator.consolidate() 결과 또는 None
+    """
+    df = InvoiceConsolidator(file_path).consolidate()
+    if df is None or len(df) == 0:
+        return None
+    return df
+
+
 class MultiMonthConsolidator:
     """여러 개월 인보이스 파일을 통합"""
     
-    def __init__(self, shpt_folder: Path):
+    def __init__(
+        self,
+        shpt_folder: Path,
+        workers: int = 1,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            shpt_folder: 월별 인보이스 폴더
+            workers: 1이면 순차 처리, 2 이상이면 파일당 1 프로세스로 병렬 처리
+            cache_dir: 파일별 결과 캐시 폴더 (기본: DEFAULT_CACHE_DIR)
+            use_cache: False면 캐시 조회/저장 안 함
+        """
         self.shpt_folder = Path(shpt_folder)
+        self.workers = max(1, int(workers or 1))
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
         
         # 파일명 패턴: "SCNT SHIPMENT DRAFT INVOICE (SEPT 2025).xlsm"
         self.invoice_pattern = re.compile(
@@ -64,23 +126,15 @@ class MultiMonthConsolidator:
         invoice_files = self._get_invoice_files()
         logger.info(f"Found {len(invoice_files)} invoice files")
         
-        # 2. 각 파일 처리
+        # 2. 각 파일 처리 (캐시 적중 파일 제외, 나머지는 순차/병렬 통합)
+        frames = self._consolidate_files([f for f, _, _ in invoice_files])
+
         all_month_data = []
-        
         for file_path, month, source_label in invoice_files:
-            logger.info(f"\n{'='*80}")
-            logger.info(f"Processing: {file_path.name}")
-            logger.info(f"Month: {month}, Label: {source_label}")
-            logger.info(f"{'='*80}")
-            
-            try:
-                df = self._process_single_file(file_path, month, source_label)
-                if df is not None and len(df) > 0:
-                    all_month_data.append(df)
-                    logger.info(f"✅ Extracted {len(df)} rows from {source_label}")
-            except Exception as e:
-                logger.error(f"❌ Failed to process {file_path.name}: {e}")
-                continue
+            df = frames.get(file_path)
+            if df is not None and len(df) > 0:
+                all_month_data.append(self._label_frame(df, month, source_label))
+                logger.info(f"✅ Extracted {len(df)} rows from {source_label}")
         
         # 3. 모든 월 데이터 병합
         if not all_month_data:
@@ -172,6 +226,96 @@ class MultiMonthConsolidator:
         
         return filename
     
+    # ==================== 파일 단위 통합 (캐시 + 병렬) ====================
+
+    def _cache_path(self, file_path: Path, digest: str) -> Path:
+        key = f"{digest[:24]}-{_engine_version()}-v{CACHE_VERSION}"
+        return self.cache_dir / f"{file_path.stem}.{key}.pkl"
+
+    def _load_cached(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        if not self.use_cache or not cache_path.exists():
+            return None
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception as e:
+            logger.warning(f"Cache unreadable, re-consolidating: {cache_path.name} ({e})")
+            return None
+
+    def _store_cached(self, file_path: Path, cache_path: Path, df: pd.DataFrame) -> None:
+        if not self.use_cache:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            df.to_pickle(tmp_path)
+            tmp_path.replace(cache_path)
+            # 같은 파일의 이전 버전 캐시 정리
+            for stale in self.cache_dir.glob(f"{glob.escape(file_path.stem)}.*.pkl"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not write cache {cache_path.name}: {e}")
+
+    def _consolidate_files(self, files: List[Path]) -> Dict[Path, Optional[pd.DataFrame]]:
+        """
+        파일별 InvoiceConsolidator 결과 반환
+
+        캐시(파일 내용 해시 + 추출 로직 버전)에 있으면 재사용하고,
+        나머지는 workers 설정에 따라 순차 또는 프로세스 풀로 통합한다.
+        """
+        results: Dict[Path, Optional[pd.DataFrame]] = {}
+        pending: List[Tuple[Path, Path]] = []
+
+        for file_path in files:
+            cache_path = self._cache_path(file_path, file_digest(file_path))
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                logger.info(f"[CACHE] {file_path.name}: {len(cached)} rows (unchanged)")
+                results[file_path] = cached
+            else:
+                pending.append((file_path, cache_path))
+
+        if not pending:
+            return results
+
+        logger.info(
+            f"Consolidating {len(pending)} file(s) "
+            f"({'sequential' if self.workers == 1 else f'{self.workers} workers'})"
+        )
+
+        if self.workers == 1 or len(pending) == 1:
+            outcomes = [self._run_one(file_path) for file_path, _ in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+                futures = [pool.submit(consolidate_workbook, f) for f, _ in pending]
+                outcomes = []
+                for (file_path, _), future in zip(pending, futures):
+                    try:
+                        outcomes.append(future.result())
+                    except Exception as e:
+                        logger.error(f"❌ Failed to process {file_path.name}: {e}")
+                        outcomes.append(None)
+
+        for (file_path, cache_path), df in zip(pending, outcomes):
+            if df is None:
+                logger.warning(f"No data extracted from {file_path.name}")
+            else:
+                self._store_cached(file_path, cache_path, df)
+            results[file_path] = df
+
+        return results
+
+    def _run_one(self, file_path: Path) -> Optional[pd.DataFrame]:
+        """순차 모드 단일 파일 통합 (실패 시 None)"""
+        logger.info(f"\n{'='*80}")
+        logger.info(f"Processing: {file_path.name}")
+        logger.info(f"{'='*80}")
+        try:
+            return consolidate_workbook(file_path)
+        except Exception as e:
+            logger.error(f"❌ Failed to process {file_path.name}: {e}")
+            return None
+
     def _process_single_file(self, file_path: Path, month: str, source_label: str) -> Optional[pd.DataFrame]:
         """
         단일 파일 처리
@@ -181,14 +325,18 @@ class MultiMonthConsolidator:
         3. Month 컬럼 추가
         4. DataFrame 반환
         """
-        # InvoiceConsolidator로 시트 통합
-        consolidator = InvoiceConsolidator(file_path)
-        df = consolidator.consolidate()
+        df = consolidate_workbook(file_path)
         
-        if df is None or len(df) == 0:
+        if df is None:
             logger.warning(f"No data extracted from {file_path.name}")
             return None
         
+        return self._label_frame(df, month, source_label)
+
+    def _label_frame(self, df: pd.DataFrame, month: str, source_label: str) -> pd.DataFrame:
+        """Source_File (A열) / Month 컬럼 추가"""
+        df = df.copy()
+
         # Source_File 컬럼 추가 (맨 앞에 삽입)
         df.insert(0, 'Source_File', source_label)
         
@@ -31,19 +31,47 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "HVDC Logistics AI Team"
 
-from .hybrid_pdf_router import HybridPDFRouter
-from .data_adapters import (
-    SHPTToUnifiedIRAdapter,
-    DOMESTICToUnifiedIRAdapter,
-    UnifiedIRToSHPTAdapter,
-    UnifiedIRToDOMESTICAdapter,
-    create_adapter,
-)
-from .schema_validator import SchemaValidator
+import importlib
+
+# Export name -> defining submodule (PEP 562 lazy loading)
+_LAZY_EXPORTS = {
+    # Router
+    "HybridPDFRouter": ".hybrid_pdf_router",
+    # PDF probe
+    "PDFProbe": ".pdf_probe",
+    "PDFCharacteristicsStore": ".pdf_probe",
+    "probe_pdf": ".pdf_probe",
+    # Adapters
+    "SHPTToUnifiedIRAdapter": ".data_adapters",
+    "DOMESTICToUnifiedIRAdapter": ".data_adapters",
+    "UnifiedIRToSHPTAdapter": ".data_adapters",
+    "UnifiedIRToDOMESTICAdapter": ".data_adapters",
+    "create_adapter": ".data_adapters",
+    # Validator
+    "SchemaValidator": ".schema_validator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Router
     "HybridPDFRouter",
+    # PDF probe
+    "PDFProbe",
+    "PDFCharacteristicsStore",
+    "probe_pdf",
     # Adapters
     "SHPTToUnifiedIRAdapter",
     "DOMESTICToUnifiedIRAdapter",
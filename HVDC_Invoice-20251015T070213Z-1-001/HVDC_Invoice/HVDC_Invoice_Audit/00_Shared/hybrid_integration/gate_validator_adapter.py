@@ -17,6 +17,9 @@ from datetime import datetime, timedelta
 import logging
 import re
 
+# Per-document gate fields: source label (BOE/DO/Invoice/...) → value
+GATE_FIELD_KEYS = ("mbl", "containers", "weights", "quantities", "dates")
+
 
 class GateValidatorAdapter:
     """
@@ -57,7 +60,10 @@ class GateValidatorAdapter:
         return logger
 
     def validate_all_gates(
-        self, primary_doc: Dict, related_docs: Optional[List[Dict]] = None
+        self,
+        primary_doc: Dict,
+        related_docs: Optional[List[Dict]] = None,
+        shipment_fields: Optional[Dict[str, Dict]] = None,
     ) -> Dict:
         """
         Run all Gate validations (Gate-11 through Gate-14)
@@ -65,6 +71,8 @@ class GateValidatorAdapter:
         Args:
             primary_doc: Primary document in Unified IR format
             related_docs: Related documents for cross-validation (BOE, DO, DN, etc.)
+            shipment_fields: Pre-collected fields of related_docs
+                (collect_shipment_fields); extracted here when omitted
 
         Returns:
             Complete gate validation results
@@ -72,6 +80,14 @@ class GateValidatorAdapter:
         if not related_docs:
             related_docs = []
 
+        if shipment_fields is None:
+            shipment_fields = self.collect_shipment_fields(related_docs)
+
+        # Primary fields first, related documents override per doc type
+        fields = self._merge_gate_fields(
+            [self._extract_gate_fields(primary_doc), shipment_fields]
+        )
+
         # Build document collection for validation
         all_docs = [primary_doc] + related_docs
 
@@ -79,19 +95,19 @@ class GateValidatorAdapter:
         gate_results = []
 
         # Gate-11: MBL Consistency
-        gate_11_result = self._validate_gate_11(all_docs)
+        gate_11_result = self._validate_gate_11(fields["mbl"])
         gate_results.append(gate_11_result)
 
         # Gate-12: Container Validation
-        gate_12_result = self._validate_gate_12(all_docs)
+        gate_12_result = self._validate_gate_12(fields["containers"])
         gate_results.append(gate_12_result)
 
         # Gate-13: Weight Tolerance
-        gate_13_result = self._validate_gate_13(all_docs)
+        gate_13_result = self._validate_gate_13(fields["weights"])
         gate_results.append(gate_13_result)
 
         # Gate-14: Quantity & Date Logic
-        gate_14_result = self._validate_gate_14(all_docs)
+        gate_14_result = self._validate_gate_14(fields["quantities"], fields["dates"])
         gate_results.append(gate_14_result)
 
         # Determine overall status
@@ -120,7 +136,124 @@ class GateValidatorAdapter:
         self.logger.info(f"Gate validation complete: {overall_status}")
         return validation_result
 
-    def _validate_gate_11(self, documents: List[Dict]) -> Dict:
+    def validate_shipment_gates(
+        self, primary_docs: List[Dict], related_docs: Optional[List[Dict]] = None
+    ) -> List[Dict]:
+        """
+        Run Gate-11~14 for every primary document of one shipment
+
+        The shipment documents are scanned once; each primary document only
+        adds its own fields before the gate rules are evaluated.
+
+        Args:
+            primary_docs: Primary documents (e.g. one per invoice) in Unified IR format
+            related_docs: Shared shipment documents (BOE, DO, DN, etc.)
+
+        Returns:
+            validate_all_gates result per primary document
+        """
+        related_docs = related_docs or []
+        shipment_fields = self.collect_shipment_fields(related_docs)
+        return [
+            self.validate_all_gates(doc, related_docs, shipment_fields=shipment_fields)
+            for doc in primary_docs
+        ]
+
+    def collect_shipment_fields(self, documents: List[Dict]) -> Dict[str, Dict]:
+        """
+        Extract the gate fields of shipment documents (document-only phase)
+
+        Args:
+            documents: Documents in Unified IR format
+
+        Returns:
+            {"mbl", "containers", "weights", "quantities", "dates"} → {source: value}
+        """
+        return self._merge_gate_fields(
+            [self._extract_gate_fields(doc) for doc in documents]
+        )
+
+    def _merge_gate_fields(self, field_sets: List[Dict[str, Dict]]) -> Dict[str, Dict]:
+        """Merge per-document fields in order (later documents win per source)"""
+        merged = {key: {} for key in GATE_FIELD_KEYS}
+        for fields in field_sets:
+            for key in GATE_FIELD_KEYS:
+                merged[key].update(fields[key])
+        return merged
+
+    def _extract_gate_fields(self, doc: Dict) -> Dict[str, Dict]:
+        """Extract MBL/container/weight/quantity/date fields of a single document"""
+        fields = {key: {} for key in GATE_FIELD_KEYS}
+
+        doc_type = doc.get("meta", {}).get("doc_type")
+        hvdc_fields = doc.get("hvdc_fields", {})
+
+        if doc_type == "BOE":
+            boe_fields = hvdc_fields.get("boe_fields", {})
+
+            mbl = boe_fields.get("mbl_no")
+            if mbl:
+                fields["mbl"]["BOE"] = mbl
+
+            containers = boe_fields.get("containers", [])
+            if containers:
+                fields["containers"]["BOE"] = set(containers)
+
+            weight = boe_fields.get("gross_weight")
+            if weight:
+                fields["weights"]["BOE"] = float(weight)
+
+            # Sum quantities from HS code classifications
+            hs_codes = boe_fields.get("hs_code_classifications", [])
+            total_qty = sum(item.get("quantity", 0) for item in hs_codes)
+            if total_qty > 0:
+                fields["quantities"]["BOE"] = total_qty
+
+        elif doc_type == "DO":
+            do_fields = hvdc_fields.get("do_fields", {})
+
+            # DO might reference MBL (not always present)
+            mbl = do_fields.get("mbl_reference")
+            if mbl:
+                fields["mbl"]["DO"] = mbl
+
+            # Extract container from DO if present
+            container = do_fields.get("container_no")
+            if container:
+                fields["containers"]["DO"] = {container}
+
+            # Extract DO validity date
+            validity_date = do_fields.get("do_validity_date")
+            if validity_date:
+                fields["dates"]["DO_validity"] = validity_date
+
+        elif doc_type == "Invoice" or doc_type == "CarrierInvoice":
+            # Extract MBL from blocks or fields
+            mbl = self._extract_mbl_from_invoice(doc)
+            if mbl:
+                fields["mbl"]["Invoice"] = mbl
+
+            containers = self._extract_containers_from_invoice(doc)
+            if containers:
+                fields["containers"]["Invoice"] = set(containers)
+
+            weight = self._extract_weight_from_invoice(doc)
+            if weight:
+                fields["weights"]["Invoice"] = float(weight)
+
+            invoice_date = hvdc_fields.get("carrier_invoice_fields", {}).get(
+                "invoice_date"
+            )
+            if invoice_date:
+                fields["dates"]["Invoice"] = invoice_date
+
+            qty = self._extract_quantity_from_invoice(doc)
+            if qty:
+                fields["quantities"]["Invoice"] = qty
+
+        return fields
+
+    def _validate_gate_11(self, mbl_numbers: Dict[str, str]) -> Dict:
         """
         Gate-11: MBL Consistency Check
 
@@ -134,30 +267,6 @@ class GateValidatorAdapter:
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Extract MBL numbers from all documents
-        mbl_numbers = {}
-
-        for doc in documents:
-            doc_type = doc.get("meta", {}).get("doc_type")
-            hvdc_fields = doc.get("hvdc_fields", {})
-
-            if doc_type == "BOE":
-                mbl = hvdc_fields.get("boe_fields", {}).get("mbl_no")
-                if mbl:
-                    mbl_numbers["BOE"] = mbl
-
-            elif doc_type == "DO":
-                # DO might reference MBL (not always present)
-                mbl = hvdc_fields.get("do_fields", {}).get("mbl_reference")
-                if mbl:
-                    mbl_numbers["DO"] = mbl
-
-            elif doc_type == "Invoice" or doc_type == "CarrierInvoice":
-                # Extract MBL from blocks or fields
-                mbl = self._extract_mbl_from_invoice(doc)
-                if mbl:
-                    mbl_numbers["Invoice"] = mbl
-
         # Check consistency
         if len(mbl_numbers) < 2:
             gate_result["status"] = "SKIP"
@@ -180,7 +289,7 @@ class GateValidatorAdapter:
         )
         return gate_result
 
-    def _validate_gate_12(self, documents: List[Dict]) -> Dict:
+    def _validate_gate_12(self, container_sets: Dict[str, set]) -> Dict:
         """
         Gate-12: Container Number Validation
 
@@ -194,30 +303,6 @@ class GateValidatorAdapter:
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Extract container numbers from all documents
-        container_sets = {}
-
-        for doc in documents:
-            doc_type = doc.get("meta", {}).get("doc_type")
-            hvdc_fields = doc.get("hvdc_fields", {})
-
-            if doc_type == "BOE":
-                containers = hvdc_fields.get("boe_fields", {}).get("containers", [])
-                if containers:
-                    container_sets["BOE"] = set(containers)
-
-            elif doc_type == "DO":
-                # Extract container from DO if present
-                container = hvdc_fields.get("do_fields", {}).get("container_no")
-                if container:
-                    container_sets["DO"] = {container}
-
-            elif doc_type == "Invoice" or doc_type == "CarrierInvoice":
-                # Extract containers from invoice
-                containers = self._extract_containers_from_invoice(doc)
-                if containers:
-                    container_sets["Invoice"] = set(containers)
-
         # Check consistency
         if len(container_sets) < 2:
             gate_result["status"] = "SKIP"
@@ -251,7 +336,7 @@ class GateValidatorAdapter:
         )
         return gate_result
 
-    def _validate_gate_13(self, documents: List[Dict]) -> Dict:
+    def _validate_gate_13(self, weights: Dict[str, float]) -> Dict:
         """
         Gate-13: Weight Tolerance Check (±3%)
 
@@ -265,24 +350,6 @@ class GateValidatorAdapter:
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Extract weights from documents
-        weights = {}
-
-        for doc in documents:
-            doc_type = doc.get("meta", {}).get("doc_type")
-            hvdc_fields = doc.get("hvdc_fields", {})
-
-            if doc_type == "BOE":
-                weight = hvdc_fields.get("boe_fields", {}).get("gross_weight")
-                if weight:
-                    weights["BOE"] = float(weight)
-
-            elif doc_type == "Invoice" or doc_type == "CarrierInvoice":
-                # Extract weight from invoice
-                weight = self._extract_weight_from_invoice(doc)
-                if weight:
-                    weights["Invoice"] = float(weight)
-
         # Check tolerance
         if len(weights) < 2:
             gate_result["status"] = "SKIP"
@@ -317,7 +384,7 @@ class GateValidatorAdapter:
         )
         return gate_result
 
-    def _validate_gate_14(self, documents: List[Dict]) -> Dict:
+    def _validate_gate_14(self, quantities: Dict, dates: Dict) -> Dict:
         """
         Gate-14: Quantity and Date Logic Validation
 
@@ -333,42 +400,6 @@ class GateValidatorAdapter:
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Extract quantities and dates
-        quantities = {}
-        dates = {}
-
-        for doc in documents:
-            doc_type = doc.get("meta", {}).get("doc_type")
-            hvdc_fields = doc.get("hvdc_fields", {})
-
-            if doc_type == "BOE":
-                # Sum quantities from HS code classifications
-                hs_codes = hvdc_fields.get("boe_fields", {}).get(
-                    "hs_code_classifications", []
-                )
-                total_qty = sum(item.get("quantity", 0) for item in hs_codes)
-                if total_qty > 0:
-                    quantities["BOE"] = total_qty
-
-            elif doc_type == "DO":
-                # Extract DO validity date
-                validity_date = hvdc_fields.get("do_fields", {}).get("do_validity_date")
-                if validity_date:
-                    dates["DO_validity"] = validity_date
-
-            elif doc_type == "Invoice" or doc_type == "CarrierInvoice":
-                # Extract invoice date
-                invoice_date = hvdc_fields.get("carrier_invoice_fields", {}).get(
-                    "invoice_date"
-                )
-                if invoice_date:
-                    dates["Invoice"] = invoice_date
-
-                # Extract quantity
-                qty = self._extract_quantity_from_invoice(doc)
-                if qty:
-                    quantities["Invoice"] = qty
-
         # Validate
         issues = []
 
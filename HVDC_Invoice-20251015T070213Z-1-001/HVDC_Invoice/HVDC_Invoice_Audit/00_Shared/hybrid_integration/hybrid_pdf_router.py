@@ -3,7 +3,8 @@
 Hybrid PDF Router for HVDC Integration
 
 Routes PDF documents to optimal parsing engine (Docling or ADE) based on:
-- Document characteristics (type, pages, tables, skew, etc.)
+- Document characteristics (type, pages, tables, skew, etc.) from a lightweight
+  PDF probe, cached per file fingerprint (pdf_probe.PDFCharacteristicsStore)
 - Budget constraints
 - Sensitivity requirements
 - Routing rules (routing_rules_hvdc.json)
@@ -15,6 +16,17 @@ import logging
 from pathlib import Path
 from datetime import datetime, date
 import hashlib
+import re
+
+from .pdf_probe import PDFCharacteristicsStore
+
+# Persistent probe results (HVDC_Invoice_Audit/hybrid_cache, shared with docker volumes)
+DEFAULT_CHARACTERISTICS_CACHE = (
+    Path(__file__).resolve().parents[2] / "hybrid_cache" / "pdf_characteristics.json"
+)
+
+# Doc type tokens in file names (token boundaries: "ADOPT" must not match "DO")
+_DOC_TYPE_TOKEN = re.compile(r"(?<![A-Z])(BOE|DO|DN)(?![A-Z])")
 
 
 class HybridPDFRouter:
@@ -29,13 +41,20 @@ class HybridPDFRouter:
     - Routing decision logging
     """
 
-    def __init__(self, config_path: Optional[str] = None, log_level: str = "INFO"):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        log_level: str = "INFO",
+        characteristics_cache: Optional[str] = None,
+    ):
         """
         Initialize router
 
         Args:
             config_path: Path to routing_rules_hvdc.json
             log_level: Logging level
+            characteristics_cache: JSON file for probed document characteristics
+                (default: hybrid_cache/pdf_characteristics.json, "" = in-memory only)
         """
         self.logger = self._setup_logger(log_level)
 
@@ -52,6 +71,11 @@ class HybridPDFRouter:
         self.budget_date = date.today()
         self.budget_used = 0.0
 
+        # Probed document characteristics (keyed by file fingerprint)
+        if characteristics_cache is None:
+            characteristics_cache = str(DEFAULT_CHARACTERISTICS_CACHE)
+        self.characteristics_store = PDFCharacteristicsStore(characteristics_cache)
+
         # Routing metrics
         self.routing_history = []
 
@@ -192,17 +216,19 @@ class HybridPDFRouter:
         Returns:
             Dict with:
                 - doc_type: Detected type (BOE/DO/DN/CarrierInvoice/Other)
-                - pages: Number of pages
-                - table_density: Estimated table density (0-1)
-                - skew_deg: Estimated skew in degrees
-                - dpi: Estimated DPI
+                - pages: Number of pages (PDF page tree)
+                - table_density: Table rules per shown word on page 1 (0-1)
+                - skew_deg: Estimated skew in degrees (not probed, 0.0)
+                - dpi: Scan DPI for image-only pages (300 otherwise)
                 - file_size_mb: File size in MB
                 - visual_relations: List of detected visual elements
+                - line_item_count / container_count: page 1 estimates
+                - word_count / text_lines / scanned: page 1 probe sample
         """
         characteristics = {
             "doc_type": self._detect_doc_type(file_path),
-            "pages": self._estimate_pages(file_path),
-            "table_density": 0.0,  # Would need actual analysis
+            "pages": 1,
+            "table_density": 0.0,
             "skew_deg": 0.0,
             "dpi": 300,  # Assume reasonable DPI
             "file_size_mb": self._get_file_size(file_path),
@@ -213,18 +239,36 @@ class HybridPDFRouter:
             "multi_stop_detected": False,
         }
 
+        probe = self._probe_document(file_path)
+        if probe:
+            dpi = probe.pop("dpi", None)
+            characteristics.update(probe)
+            if dpi:
+                characteristics["dpi"] = dpi
+        else:
+            characteristics["pages"] = self._estimate_pages(file_path)
+
         self.logger.debug(f"Analyzed {Path(file_path).name}: {characteristics}")
         return characteristics
 
+    def _probe_document(self, file_path: str) -> Optional[Dict]:
+        """Probed characteristics from the store (None if the file is unreadable)"""
+        try:
+            return self.characteristics_store.get_or_probe(file_path)
+        except OSError as e:
+            self.logger.debug(f"Probe skipped for {Path(file_path).name}: {e}")
+            return None
+
     def _detect_doc_type(self, file_path: str) -> str:
         """Detect document type from filename"""
         filename = Path(file_path).name.upper()
+        tokens = set(_DOC_TYPE_TOKEN.findall(filename))
 
-        if "BOE" in filename:
+        if "BOE" in tokens:
             return "BOE"
-        elif "DO" in filename and "DN" not in filename:
+        elif "DO" in tokens and "DN" not in tokens:
             return "DO"
-        elif "DN" in filename:
+        elif "DN" in tokens:
             return "DN"
         elif "CARRIER" in filename or "INVOICE" in filename:
             return "CarrierInvoice"
@@ -232,7 +276,7 @@ class HybridPDFRouter:
             return "Other"
 
     def _estimate_pages(self, file_path: str) -> int:
-        """Estimate page count (simplified - would need actual PDF reading)"""
+        """Estimate page count from file size (fallback when the file cannot be probed)"""
         try:
             # Rough estimate based on file size
             file_size_mb = self._get_file_size(file_path)
@@ -441,6 +485,11 @@ class HybridPDFRouter:
             "ade_percentage": (ade_count / total * 100) if total > 0 else 0,
             "total_ade_cost_usd": total_ade_cost,
             "budget_status": self.get_budget_status(),
+            "characteristics_cache": {
+                "entries": len(self.characteristics_store.entries),
+                "hits": self.characteristics_store.hits,
+                "misses": self.characteristics_store.misses,
+            },
         }
 
 
@@ -0,0 +1,668 @@
+#!/usr/bin/env python3
+"""
+Lightweight PDF Probe for HVDC Hybrid Routing
+
+Reads just enough of a PDF to feed HybridPDFRouter rules without a PDF library:
+- Page count from the trailer/xref (classic tables, xref streams, object streams)
+- First-page sample: words, text lines, ruling density, amount lines, containers
+- Image-only (scanned) detection with DPI from the first image XObject
+
+Results are cached in a JSON characteristics store keyed by file fingerprint,
+so unchanged documents are never probed twice. The store is written once per
+batch (save()) or at exit, and keeps at most max_entries fingerprints.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import zlib
+from pathlib import Path
+
+# Bump when probe output changes (invalidates cached characteristics)
+PROBE_VERSION = "1"
+
+_TAIL_BYTES = 2048
+_OBJECT_READ_BYTES = 8192
+_FINGERPRINT_BYTES = 64 * 1024
+# Characteristics store size limit (oldest-used fingerprints are evicted)
+MAX_STORE_ENTRIES = 5000
+
+logger = logging.getLogger("PDFProbe")
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)")
+_OBJ_HEADER = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_XREF_SUBSECTION = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*[\r\n]")
+_XREF_ENTRY = re.compile(rb"\s*(\d{10})\s+(\d{5})\s+([nf])")
+_LINEARIZED_PAGES = re.compile(rb"/Linearized\b[^>]*?/N\s+(\d+)")
+_PAGE_OBJECT = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+
+# Content stream operators (first page sample)
+_TEXT_SHOW_OPS = {b"Tj", b"TJ", b"'", b'"'}
+_CONTENT_OPS = _TEXT_SHOW_OPS | {
+    b"BT", b"Td", b"TD", b"Tm", b"TL", b"T*", b"cm", b"q", b"Q", b"re", b"l", b"Do"
+}
+_STROKE_OPS = {b"S", b"s"}
+# Rectangles thinner than this (pt) are drawn table rules
+_HAIRLINE_PT = 2.0
+# Longest run of tokens searched back for a string operand
+_STRING_LOOKBACK = 256
+_AMOUNT = re.compile(r"\d[\d,]*\.\d{2}\b")
+_CONTAINER_NO = re.compile(r"\b[A-Z]{4}\d{7}\b")
+
+
+class PDFProbeError(Exception):
+    """PDF structure could not be read by the probe"""
+
+
+def file_fingerprint(file_path: str) -> str:
+    """Cheap content fingerprint: size + first/last 64 KB (SHA-256)"""
+    path = Path(file_path)
+    size = path.stat().st_size
+    digest = hashlib.sha256(str(size).encode())
+    with open(path, "rb") as handle:
+        digest.update(handle.read(_FINGERPRINT_BYTES))
+        if size > _FINGERPRINT_BYTES:
+            handle.seek(max(_FINGERPRINT_BYTES, size - _FINGERPRINT_BYTES))
+            digest.update(handle.read(_FINGERPRINT_BYTES))
+    return digest.hexdigest()
+
+
+def _dict_ref(body: bytes, key: bytes) -> Optional[int]:
+    match = re.search(rb"/" + key + rb"\s+(\d+)\s+\d+\s+R", body)
+    return int(match.group(1)) if match else None
+
+
+def _dict_int(body: bytes, key: bytes) -> Optional[int]:
+    match = re.search(rb"/" + key + rb"\s+(\d+)(?!\d)(?!\s+\d+\s+R)", body)
+    return int(match.group(1)) if match else None
+
+
+def _dict_array(body: bytes, key: bytes) -> Optional[bytes]:
+    match = re.search(rb"/" + key + rb"\s*\[([^\]]*)\]", body)
+    return match.group(1) if match else None
+
+
+def _refs(array: bytes) -> List[int]:
+    return [int(num) for num in re.findall(rb"(\d+)\s+\d+\s+R", array)]
+
+
+def _png_unpredict(data: bytes, columns: int) -> bytes:
+    """Undo PNG predictors (xref/object streams use 1 byte per pixel)"""
+    row_len = columns + 1
+    out = bytearray()
+    prev = bytearray(columns)
+    for start in range(0, len(data) - row_len + 1, row_len):
+        kind = data[start]
+        row = bytearray(data[start + 1 : start + row_len])
+        for i in range(columns):
+            left = row[i - 1] if i else 0
+            up = prev[i]
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif kind == 2:
+                row[i] = (row[i] + up) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                up_left = prev[i - 1] if i else 0
+                p = left + up - up_left
+                pa, pb, pc = abs(p - left), abs(p - up), abs(p - up_left)
+                pred = left if pa <= pb and pa <= pc else (up if pb <= pc else up_left)
+                row[i] = (row[i] + pred) & 0xFF
+        out += row
+        prev = row
+    return bytes(out)
+
+
+class PDFProbe:
+    """
+    Minimal PDF object reader for routing characteristics
+
+    Only the trailer, xref sections and the objects on the path
+    Root → Pages → first Page (→ Contents, first image XObject) are read.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = str(file_path)
+        self._handle = None
+        self._size = 0
+        self._offsets: Dict[int, int] = {}
+        self._in_objstm: Dict[int, Tuple[int, int]] = {}
+        self._objstm_cache: Dict[int, Dict[int, bytes]] = {}
+        self._root: Optional[int] = None
+
+    def probe(self) -> Dict:
+        """
+        Probe the document
+
+        Returns:
+            Dict with pages, word_count, text_lines, table_density,
+            line_item_count, container_count, scanned, dpi, probe_method
+        """
+        with open(self.file_path, "rb") as handle:
+            self._handle = handle
+            self._size = handle.seek(0, 2)
+            try:
+                return self._probe_structure()
+            except (PDFProbeError, ValueError, zlib.error) as e:
+                logger.debug(f"Structured probe failed for {self.file_path}: {e}")
+                return self._probe_by_scan()
+            finally:
+                self._handle = None
+
+    # ==================== Probe strategies ====================
+
+    def _probe_structure(self) -> Dict:
+        self._load_xref()
+        if self._root is None:
+            raise PDFProbeError("trailer has no /Root")
+
+        pages_ref = _dict_ref(self._object(self._root), b"Pages")
+        if pages_ref is None:
+            raise PDFProbeError("catalog has no /Pages")
+        pages_body = self._object(pages_ref)
+        page_count = _dict_int(pages_body, b"Count")
+        if page_count is None:
+            raise PDFProbeError("page tree has no /Count")
+
+        result = {"pages": max(1, page_count), "probe_method": "xref"}
+        result.update(self._sample_first_page(pages_body))
+        return result
+
+    def _probe_by_scan(self) -> Dict:
+        """Fallback for damaged/unsupported files: count page objects in raw bytes"""
+        self._handle.seek(0)
+        head = self._handle.read(1024)
+        linearized = _LINEARIZED_PAGES.search(head)
+        if linearized:
+            pages = int(linearized.group(1))
+        else:
+            self._handle.seek(0)
+            pages = len(_PAGE_OBJECT.findall(self._handle.read()))
+        if not pages:
+            # Not a readable PDF (e.g. placeholder file) - legacy size estimate
+            pages = max(1, int(self._size / (1024 * 1024) * 10))
+        return {**_empty_sample(), "pages": pages, "probe_method": "scan"}
+
+    # ==================== Cross-reference ====================
+
+    def _read_at(self, offset: int, length: int) -> bytes:
+        self._handle.seek(offset)
+        return self._handle.read(length)
+
+    def _load_xref(self):
+        tail = self._read_at(max(0, self._size - _TAIL_BYTES), _TAIL_BYTES)
+        matches = list(_STARTXREF.finditer(tail))
+        if not matches:
+            raise PDFProbeError("startxref not found")
+
+        offset: Optional[int] = int(matches[-1].group(1))
+        seen = set()
+        # Newest section first; older (/Prev) entries never override newer ones
+        while offset is not None and offset not in seen and offset < self._size:
+            seen.add(offset)
+            chunk = self._read_at(offset, _OBJECT_READ_BYTES)
+            if chunk.lstrip().startswith(b"xref"):
+                trailer = self._read_xref_table(offset)
+                xref_stm = _dict_int(trailer, b"XRefStm")
+                if xref_stm is not None and xref_stm not in seen:
+                    seen.add(xref_stm)
+                    self._read_xref_stream(xref_stm)
+            else:
+                trailer = self._read_xref_stream(offset)
+
+            if self._root is None:
+                self._root = _dict_ref(trailer, b"Root")
+            offset = _dict_int(trailer, b"Prev")
+
+    def _read_xref_table(self, offset: int) -> bytes:
+        """Parse a classic xref table; returns the trailer dictionary bytes"""
+        data = b""
+        length = _OBJECT_READ_BYTES
+        while True:
+            data = self._read_at(offset, length)
+            trailer_pos = data.find(b"trailer")
+            if trailer_pos >= 0 and data.find(b">>", trailer_pos) >= 0:
+                break
+            if offset + length >= self._size:
+                raise PDFProbeError("xref trailer not found")
+            length *= 4
+
+        pos = data.find(b"xref") + 4
+        while True:
+            subsection = _XREF_SUBSECTION.match(data, pos)
+            if not subsection:
+                break
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            pos = subsection.end()
+            for num in range(first, first + count):
+                entry = _XREF_ENTRY.match(data, pos)
+                if not entry:
+                    raise PDFProbeError("malformed xref entry")
+                pos = entry.end()
+                if entry.group(3) == b"n":
+                    self._offsets.setdefault(num, int(entry.group(1)))
+
+        trailer_end = data.find(b"startxref", trailer_pos)
+        return data[trailer_pos : trailer_end if trailer_end >= 0 else len(data)]
+
+    def _read_xref_stream(self, offset: int) -> bytes:
+        """Parse a cross-reference stream; returns its dictionary bytes"""
+        body, stream = self._object_at(offset, with_stream=True)
+        widths = [int(w) for w in (_dict_array(body, b"W") or b"").split()]
+        if len(widths) != 3 or stream is None:
+            raise PDFProbeError("invalid xref stream")
+
+        index = [int(v) for v in (_dict_array(body, b"Index") or b"").split()]
+        if not index:
+            index = [0, _dict_int(body, b"Size") or 0]
+
+        pos = 0
+        for first, count in zip(index[::2], index[1::2]):
+            for num in range(first, first + count):
+                fields = []
+                for width in widths:
+                    fields.append(int.from_bytes(stream[pos : pos + width], "big"))
+                    pos += width
+                kind = fields[0] if widths[0] else 1
+                if kind == 1:
+                    self._offsets.setdefault(num, fields[1])
+                elif kind == 2:
+                    self._in_objstm.setdefault(num, (fields[1], fields[2]))
+        return body
+
+    # ==================== Objects ====================
+
+    def _object(self, num: int) -> bytes:
+        """Dictionary/body bytes of an indirect object"""
+        if num in self._offsets:
+            return self._object_at(self._offsets[num])[0]
+        if num in self._in_objstm:
+            stm_num, _ = self._in_objstm[num]
+            members = self._objstm_cache.get(stm_num)
+            if members is None:
+                members = self._objstm_cache[stm_num] = self._read_objstm(stm_num)
+            if num in members:
+                return members[num]
+        raise PDFProbeError(f"object {num} not in xref")
+
+    def _object_at(
+        self, offset: int, with_stream: bool = False
+    ) -> Tuple[bytes, Optional[bytes]]:
+        data = self._read_at(offset, _OBJECT_READ_BYTES)
+        header = _OBJ_HEADER.match(data)
+        if not header:
+            raise PDFProbeError(f"no object at offset {offset}")
+
+        start = header.end()
+        end = data.find(b"endobj", start)
+        stream_pos = data.find(b"stream", start)
+        while end < 0 and stream_pos < 0 and len(data) < self._size - offset:
+            data = self._read_at(offset, len(data) * 4)
+            end = data.find(b"endobj", start)
+            stream_pos = data.find(b"stream", start)
+
+        if stream_pos >= 0 and (end < 0 or stream_pos < end):
+            body = data[start:stream_pos]
+            if not with_stream:
+                return body, None
+            data_start = offset + stream_pos + 6
+            # "stream" is followed by CRLF or LF
+            lead = self._read_at(data_start, 2)
+            data_start += 2 if lead == b"\r\n" else 1
+            return body, self._read_stream(body, data_start)
+
+        return data[start : end if end >= 0 else len(data)], None
+
+    def _read_stream(self, body: bytes, data_start: int) -> Optional[bytes]:
+        length = _dict_int(body, b"Length")
+        if length is None:
+            length_ref = _dict_ref(body, b"Length")
+            if length_ref is None:
+                raise PDFProbeError("stream without /Length")
+            length = int(self._object(length_ref).split()[0])
+        raw = self._read_at(data_start, length)
+
+        filters = re.findall(rb"/(\w+Decode)", body)
+        if not filters:
+            return raw
+        if filters != [b"FlateDecode"]:
+            return None  # DCT/LZW/etc. not needed for routing
+        data = zlib.decompress(raw)
+
+        predictor = _dict_int(body, b"Predictor") or 1
+        if predictor >= 10:
+            data = _png_unpredict(data, _dict_int(body, b"Columns") or 1)
+        return data
+
+    def _read_objstm(self, stm_num: int) -> Dict[int, bytes]:
+        if stm_num not in self._offsets:
+            raise PDFProbeError(f"object stream {stm_num} not in xref")
+        body, stream = self._object_at(self._offsets[stm_num], with_stream=True)
+        if stream is None:
+            raise PDFProbeError("unsupported object stream filter")
+
+        count = _dict_int(body, b"N") or 0
+        first = _dict_int(body, b"First") or 0
+        header = [int(v) for v in stream[:first].split()[: count * 2]]
+        nums, starts = header[::2], header[1::2]
+        ends = starts[1:] + [len(stream) - first]
+        return {
+            num: stream[first + start : first + end]
+            for num, start, end in zip(nums, starts, ends)
+        }
+
+    # ==================== First page sample ====================
+
+    def _first_page(self, pages_body: bytes) -> Tuple[bytes, bytes]:
+        """(first leaf page dict, nearest /Resources-bearing dict)"""
+        node = pages_body
+        resources = node
+        for _ in range(32):  # guard against malformed cyclic trees
+            kids = _dict_array(node, b"Kids")
+            if kids is None:
+                return node, node if b"/Resources" in node else resources
+            if b"/Resources" in node:
+                resources = node
+            refs = _refs(kids)
+            if not refs:
+                raise PDFProbeError("empty /Kids")
+            node = self._object(refs[0])
+        raise PDFProbeError("page tree too deep")
+
+    def _sample_first_page(self, pages_body: bytes) -> Dict:
+        try:
+            page, resources_holder = self._first_page(pages_body)
+            content = self._page_content(page)
+        except (PDFProbeError, ValueError, zlib.error) as e:
+            logger.debug(f"First page sample skipped for {self.file_path}: {e}")
+            return _empty_sample()
+
+        sample = analyze_content_stream(content) if content else _empty_sample()
+        if sample["scanned"]:
+            sample["dpi"] = self._image_dpi(page, resources_holder)
+        return sample
+
+    def _page_content(self, page: bytes) -> bytes:
+        contents = _dict_array(page, b"Contents")
+        refs = _refs(contents) if contents is not None else []
+        if contents is None:
+            ref = _dict_ref(page, b"Contents")
+            refs = [ref] if ref is not None else []
+
+        parts = []
+        for ref in refs:
+            if ref not in self._offsets:
+                continue
+            _, stream = self._object_at(self._offsets[ref], with_stream=True)
+            if stream:
+                parts.append(stream)
+        return b"\n".join(parts)
+
+    def _image_dpi(self, page: bytes, resources_holder: bytes) -> Optional[int]:
+        """Horizontal DPI of the first image XObject relative to the page width"""
+        try:
+            resources = resources_holder
+            resources_ref = _dict_ref(resources_holder, b"Resources")
+            if resources_ref is not None:
+                resources = self._object(resources_ref)
+
+            xobject_ref = _dict_ref(resources, b"XObject")
+            xobjects = self._object(xobject_ref) if xobject_ref is not None else resources
+            match = re.search(rb"/XObject\s*<<(.*?)>>", xobjects, re.S)
+            if match:
+                xobjects = match.group(1)
+            image_refs = _refs(xobjects)
+
+            media_box = _dict_array(page, b"MediaBox") or _dict_array(
+                resources_holder, b"MediaBox"
+            )
+            if not image_refs or not media_box:
+                return None
+            x0, _, x1, _ = (float(v) for v in media_box.split()[:4])
+            for ref in image_refs:
+                image = self._object(ref)
+                if b"/Image" in image:
+                    width_px = _dict_int(image, b"Width")
+                    if width_px and x1 > x0:
+                        return int(round(width_px / ((x1 - x0) / 72.0)))
+        except (PDFProbeError, ValueError):
+            pass
+        return None
+
+
+def _empty_sample() -> Dict:
+    return {
+        "word_count": 0,
+        "text_lines": 0,
+        "table_density": 0.0,
+        "line_item_count": 0,
+        "container_count": 0,
+        "scanned": False,
+        "dpi": None,
+    }
+
+
+def _tokenize(content: bytes) -> List[bytes]:
+    """Whitespace tokens with delimiters split off (string bodies may span tokens)"""
+    for delimiter in (b")", b">", b"]"):
+        content = content.replace(delimiter, delimiter + b" ")
+    for delimiter in (b"(", b"<", b"[", b"/"):
+        content = content.replace(delimiter, b" " + delimiter)
+    return content.split()
+
+
+def _number(token: bytes) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        return 0.0
+
+
+def _shown_text(tokens: List[bytes], end: int, op: bytes) -> Tuple[str, int]:
+    """(literal text, string operand count) of the text-show operator at end"""
+    start = end - 1
+    limit = max(0, end - _STRING_LOOKBACK)
+    if op == b"TJ":
+        while start > limit and tokens[start] != b"[":
+            start -= 1
+        operands = tokens[start + 1 : end - 1]
+    else:
+        while start > limit and tokens[start][:1] not in (b"(", b"<"):
+            start -= 1
+        operands = tokens[start:end]
+
+    parts: List[bytes] = []
+    strings = 0
+    in_literal = False
+    for token in operands:
+        head = token[:1]
+        if head == b"<":
+            strings += 1
+        elif head == b"(" or in_literal:
+            if head == b"(" and not in_literal:
+                strings += 1
+                in_literal = True
+                token = token[1:]
+            if token.endswith(b")") and not token.endswith(b"\\)"):
+                in_literal = False
+                token = token[:-1]
+            parts.append(token)
+    return b" ".join(parts).decode("latin-1", "replace"), strings
+
+
+def analyze_content_stream(content: bytes) -> Dict:
+    """
+    Word/line/ruling statistics of a decoded page content stream
+
+    - text_lines: distinct baselines (cm/Tm/Td/TD/T* tracking, 1pt buckets)
+    - table_density: table rules per (rules + shown words)
+      (stroked re/l paths and hairline rectangles; clips/fills ignored)
+    - line_item_count: text lines showing a decimal amount (e.g. 1,250.00)
+    - scanned: no text shown but an XObject is painted
+
+    Transforms are approximated by their vertical translation only.
+    """
+    tokens = _tokenize(content)
+    lines: Dict[int, List[str]] = {}
+    base_stack: List[float] = []
+    base = 0.0
+    y = 0.0
+    leading = 0.0
+    words = 0
+    rulings = 0
+    painted = 0
+
+    for i, op in enumerate(tokens):
+        if op not in _CONTENT_OPS:
+            continue
+        if op in _TEXT_SHOW_OPS:
+            if op != b"Tj" and op != b"TJ":
+                y -= leading  # ' and " move to the next line first
+            text, strings = _shown_text(tokens, i, op)
+            words += len(text.split()) if text.strip() else strings
+            lines.setdefault(int(round(base + y)), []).append(text)
+        elif op == b"BT":
+            y = 0.0
+        elif op == b"Td" or op == b"TD":
+            ty = _number(tokens[i - 1])
+            y += ty
+            if op == b"TD":
+                leading = -ty
+        elif op == b"Tm":
+            y = _number(tokens[i - 1])
+        elif op == b"cm":
+            base += _number(tokens[i - 1])
+        elif op == b"q":
+            base_stack.append(base)
+        elif op == b"Q":
+            base = base_stack.pop() if base_stack else 0.0
+        elif op == b"TL":
+            leading = _number(tokens[i - 1])
+        elif op == b"T*":
+            y -= leading
+        elif op == b"Do":
+            painted += 1
+        else:
+            # re / l: stroked path or hairline rectangle
+            stroked = i + 1 < len(tokens) and tokens[i + 1] in _STROKE_OPS
+            if stroked or (
+                op == b"re"
+                and i >= 2
+                and min(abs(_number(tokens[i - 2])), abs(_number(tokens[i - 1])))
+                <= _HAIRLINE_PT
+            ):
+                rulings += 1
+
+    text_lines = len(lines)
+    line_texts = [" ".join(parts) for parts in lines.values()]
+    total = rulings + words
+    return {
+        "word_count": words,
+        "text_lines": text_lines,
+        "table_density": round(rulings / total, 3) if total else 0.0,
+        "line_item_count": sum(1 for text in line_texts if _AMOUNT.search(text)),
+        "container_count": len(
+            {match for text in line_texts for match in _CONTAINER_NO.findall(text)}
+        ),
+        "scanned": words == 0 and painted > 0,
+        "dpi": None,
+    }
+
+
+def probe_pdf(file_path: str) -> Dict:
+    """Probe a PDF file (see PDFProbe.probe)"""
+    return PDFProbe(file_path).probe()
+
+
+class PDFCharacteristicsStore:
+    """
+    Persistent probe results keyed by file fingerprint (JSON file)
+
+    Entries from another PROBE_VERSION are ignored. Without a path the
+    store is in-memory only. New entries are written by save() (call it
+    after a batch) and automatically at interpreter exit. The least
+    recently used fingerprints are dropped beyond max_entries.
+    """
+
+    def __init__(
+        self, cache_path: Optional[str] = None, max_entries: int = MAX_STORE_ENTRIES
+    ):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_entries = max_entries
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+        if self.cache_path:
+            atexit.register(self.save)
+
+    def _load(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == PROBE_VERSION:
+                self.entries = data.get("entries", {})
+                self._evict()
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Characteristics cache unreadable, starting empty: {e}")
+
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries"""
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+            self._dirty = True
+
+    def save(self):
+        """Write the store if it changed (atomic replace via a unique temp file)"""
+        if not self.cache_path or not self._dirty:
+            return
+        tmp_name = None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.cache_path.parent,
+                prefix=self.cache_path.name + ".",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_name = f.name
+                json.dump({"version": PROBE_VERSION, "entries": self.entries}, f)
+            os.replace(tmp_name, self.cache_path)
+            tmp_name = None
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write characteristics cache: {e}")
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def get_or_probe(self, file_path: str) -> Dict:
+        """Cached characteristics for the file, probing on miss (persisted by save())"""
+        fingerprint = file_fingerprint(file_path)
+        cached = self.entries.pop(fingerprint, None)
+        if cached is not None:
+            # Re-insert as most recently used
+            self.entries[fingerprint] = cached
+            self.hits += 1
+            return dict(cached)
+
+        self.misses += 1
+        result = probe_pdf(file_path)
+        self.entries[fingerprint] = result
+        self._dirty = True
+        self._evict()
+        return dict(result)
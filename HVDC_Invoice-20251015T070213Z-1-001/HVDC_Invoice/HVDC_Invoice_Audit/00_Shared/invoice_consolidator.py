@@ -19,9 +19,10 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import openpyxl
 import pandas as pd
 
+from sheet_grid import SheetGrid, open_workbook_readonly
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -54,7 +55,7 @@ class InvoiceConsolidator:
         VBA CompileAllSheets 재현
         """
         logger.info(f"Opening Excel file: {self.excel_path.name}")
-        self.wb = openpyxl.load_workbook(self.excel_path, data_only=True)
+        self.wb = open_workbook_readonly(self.excel_path)
         
         try:
             # 1. 인보이스 시트 목록
@@ -136,59 +137,64 @@ class InvoiceConsolidator:
         4. 데이터 행 추출 (IsNumeric(S/No) 또는 DESCRIPTION+RATE 있음)
         5. S/No 없으면 자동 번호 부여 (1, 2, 3...)
         """
-        ws = self.wb[sheet_name]
+        # 시트 값을 한 번에 2-D 배열로 읽음 (이후 조회는 메모리에서)
+        grid = SheetGrid.from_worksheet(self.wb[sheet_name])
         
         # 1. CWI Job Number 추출 (시트 내 레이블 검색)
-        cwi_job = self._get_value_from_label(ws, "CW1 Job Number")
+        cwi_job = self._get_value_from_label(grid, "CW1 Job Number")
         if not cwi_job:
-            cwi_job = self._get_value_from_label(ws, "CWI Job Number")
+            cwi_job = self._get_value_from_label(grid, "CWI Job Number")
         if not cwi_job:
             # Fallback: 시트 상단에서 BAMF로 시작하는 값 찾기
-            cwi_job = self._find_bamf_number(ws)
+            cwi_job = self._find_bamf_number(grid)
         if not cwi_job:
             cwi_job = "UNKNOWN"
         
         # 2. Order Ref. Number 추출 (시트 내 레이블 검색, Fallback: 시트명)
-        order_ref = self._get_value_from_label(ws, "Order Ref. Number")
+        order_ref = self._get_value_from_label(grid, "Order Ref. Number")
         if not order_ref:
             # Fallback: 시트 상단에서 HVDC-ADOPT로 시작하는 값 찾기
-            order_ref = self._find_hvdc_adopt(ws)
+            order_ref = self._find_hvdc_adopt(grid)
         if not order_ref:
             order_ref = self._extract_order_ref_from_sheet_name(sheet_name)
         
         # 3. 헤더 찾기 (우선순위)
         # 3-1. S/No 헤더 찾기 (다중 키워드 시도)
-        header_info = self._find_header_with_alternatives(ws)
-        sno_col = None
+        header_info = self._find_header_with_alternatives(grid)
         auto_sno = False
         
         if header_info:
             header_row, sno_col = header_info
+            first_col = sno_col
             logger.debug(f"[{sheet_name}] Found S/No at row={header_row}, col={sno_col}")
         else:
             # 3-2. S/No 없으면 → DESCRIPTION/RATE/TOTAL로 헤더 행 찾기
-            header_result = self._find_header_by_required_columns(ws)
+            header_result = self._find_header_by_required_columns(grid)
             if not header_result:
                 logger.warning(f"[{sheet_name}] No valid header found - skipping")
                 return None
             
             header_row, column_map = header_result
+            desc_col = column_map.get('DESCRIPTION')
+            rate_col = column_map.get('RATE')
+            if not desc_col or not rate_col:
+                logger.warning(f"[{sheet_name}] DESCRIPTION or RATE column not found - skipping")
+                return None
+            first_col = min(column_map.values())
             auto_sno = True
             logger.info(f"[{sheet_name}] No S/No column - will auto-generate (found {len(column_map)} required columns)")
         
-        header_row, sno_col_or_map = header_info if header_info else (header_row, column_map)
-        
         # 4. 헤더 전체 읽기 (S/No 컬럼부터 마지막 사용 컬럼까지)
         # VBA: lastCol = ws.Cells(firstHeaderRow, ws.Columns.Count).End(xlToLeft).Column
-        last_col = ws.max_column
-        for col in range(ws.max_column, sno_col - 1, -1):
-            if ws.cell(header_row, col).value:
+        last_col = grid.max_column
+        for col in range(grid.max_column, first_col - 1, -1):
+            if grid.value(header_row, col):
                 last_col = col
                 break
         
         headers = []
-        for col in range(sno_col, last_col + 1):
-            value = ws.cell(header_row, col).value
+        for col in range(first_col, last_col + 1):
+            value = grid.value(header_row, col)
             if value:
                 headers.append(str(value).strip())
             else:
@@ -196,23 +202,33 @@ class InvoiceConsolidator:
         
         # 5. 데이터 행 추출 (VBA: IsNumeric(S/No) AND Not IsEmpty)
         # VBA: lastUsedRow = ws.Cells(ws.Rows.Count, snCol).End(xlUp).Row
-        last_row = ws.max_row
+        last_row = grid.max_row
         data_rows = []
         
         for row_num in range(header_row + 1, last_row + 1):
-            sno_value = ws.cell(row_num, sno_col).value
+            if auto_sno:
+                # S/No 없음: DESCRIPTION 있고 RATE가 숫자면 데이터 행
+                desc_value = grid.value(row_num, desc_col)
+                is_data = bool(desc_value and str(desc_value).strip()) and self._is_numeric(
+                    grid.value(row_num, rate_col)
+                )
+            else:
+                # VBA 로직: IsNumeric(S/No) AND Not IsEmpty
+                sno_value = grid.value(row_num, sno_col)
+                is_data = sno_value is not None and self._is_numeric(sno_value)
             
-            # VBA 로직: IsNumeric(S/No) AND Not IsEmpty
-            if sno_value is not None and self._is_numeric(sno_value):
+            if is_data:
                 row_data = {
                     'CWI Job Number': cwi_job,
                     'Order Ref. Number': order_ref
                 }
+                if auto_sno:
+                    row_data['S/No'] = len(data_rows) + 1  # 자동 번호
                 
                 # 전체 행 복사 (VBA: ws.Range(...).Copy, xlPasteValues)
                 for idx, header in enumerate(headers):
-                    col = sno_col + idx
-                    cell_value = ws.cell(row_num, col).value
+                    col = first_col + idx
+                    cell_value = grid.value(row_num, col)
                     row_data[header] = cell_value
                 
                 data_rows.append(row_data)
@@ -227,7 +243,7 @@ class InvoiceConsolidator:
         logger.info(f"[{sheet_name}] Extracted {len(df)} rows (CWI: {cwi_job}, Order: {order_ref})")
         return df
 
-    def _get_value_from_label(self, ws, label_text: str) -> str:
+    def _get_value_from_label(self, grid, label_text: str) -> str:
         """
         VBA GetValueFromLabel 재현
         
@@ -235,17 +251,17 @@ class InvoiceConsolidator:
         VBA: foundCell.Offset(0, 1).Value
         """
         # 처음 20행, 10열만 스캔 (레이블은 보통 상단에 위치)
-        for row in range(1, min(20, ws.max_row + 1)):
-            for col in range(1, min(10, ws.max_column + 1)):
-                cell_value = ws.cell(row, col).value
+        for row in range(1, min(20, grid.max_row + 1)):
+            for col in range(1, min(10, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
                 if cell_value and label_text.lower() in str(cell_value).lower():
                     # 오른쪽 셀 값 반환
-                    right_value = ws.cell(row, col + 1).value
+                    right_value = grid.value(row, col + 1)
                     if right_value:
                         return str(right_value).strip()
         return ""
 
-    def _find_header_row_and_columns(self, ws, header_keyword: str) -> Optional[Tuple[int, int]]:
+    def _find_header_row_and_columns(self, grid, header_keyword: str) -> Optional[Tuple[int, int]]:
         """
         VBA FindHeaderRow + FindCol 재현
         
@@ -254,9 +270,9 @@ class InvoiceConsolidator:
         """
         # 전체 시트 스캔하여 "S/No" 찾기 (정확한 매칭)
         # VBA: ws.UsedRange.Find(What:=headerText, LookIn:=xlValues, LookAt:=xlWhole)
-        for row in range(1, min(50, ws.max_row + 1)):  # 처음 50행만 스캔
-            for col in range(1, min(30, ws.max_column + 1)):  # 처음 30열만 스캔
-                cell_value = ws.cell(row, col).value
+        for row in range(1, min(50, grid.max_row + 1)):  # 처음 50행만 스캔
+            for col in range(1, min(30, grid.max_column + 1)):  # 처음 30열만 스캔
+                cell_value = grid.value(row, col)
                 if cell_value:
                     # 정확한 매칭 (대소문자 무시, 공백 제거)
                     # VBA: LookAt:=xlWhole
@@ -269,6 +285,67 @@ class InvoiceConsolidator:
         
         return None
 
+    def _find_header_with_alternatives(self, grid) -> Optional[Tuple[int, int]]:
+        """다중 S/No 키워드로 헤더 찾기 (sno_keywords 우선순위 순)"""
+        for keyword in self.sno_keywords:
+            result = self._find_header_row_and_columns(grid, keyword)
+            if result:
+                return result
+        return None
+
+    def _find_header_by_required_columns(self, grid) -> Optional[Tuple[int, Dict[str, int]]]:
+        """
+        DESCRIPTION, RATE, TOTAL로 헤더 행 찾기
+        
+        Returns:
+            (header_row, {'DESCRIPTION': col, 'RATE': col, ...}) 또는 None
+        """
+        for row in range(1, min(50, grid.max_row + 1)):
+            found_headers = {}
+            
+            for col in range(1, min(30, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
+                if not cell_value:
+                    continue
+                
+                cell_upper = str(cell_value).upper().strip()
+                
+                # 필수 헤더 매칭
+                if 'DESCRIPTION' in cell_upper:
+                    found_headers['DESCRIPTION'] = col
+                elif 'RATE' == cell_upper or (cell_upper.startswith('RATE') and 'SOURCE' not in cell_upper):
+                    found_headers['RATE'] = col
+                elif 'TOTAL' in cell_upper:
+                    found_headers['TOTAL'] = col
+                elif "Q'TY" in cell_upper or 'QTY' in cell_upper:
+                    found_headers["Q'TY"] = col
+                elif 'RATE SOURCE' in cell_upper or 'RATE SORUCE' in cell_upper:  # 오타 포함
+                    found_headers['RATE SOURCE'] = col
+            
+            # 3개 이상 발견되면 헤더 행
+            if len(found_headers) >= 3:
+                return (row, found_headers)
+        
+        return None
+
+    def _find_bamf_number(self, grid) -> str:
+        """시트 상단에서 BAMF 번호 찾기"""
+        for row in range(1, min(20, grid.max_row + 1)):
+            for col in range(1, min(10, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
+                if cell_value and 'BAMF' in str(cell_value).upper():
+                    return str(cell_value).strip()
+        return ""
+
+    def _find_hvdc_adopt(self, grid) -> str:
+        """시트 상단에서 HVDC-ADOPT 번호 찾기"""
+        for row in range(1, min(20, grid.max_row + 1)):
+            for col in range(1, min(10, grid.max_column + 1)):
+                cell_value = grid.value(row, col)
+                if cell_value and 'HVDC-ADOPT' in str(cell_value).upper():
+                    return str(cell_value).strip()
+        return ""
+
     def _is_numeric(self, value) -> bool:
         """
         VBA IsNumeric 동작 재현
@@ -0,0 +1,158 @@
+"""
+Item Records Module
+===================
+
+송장 라인 1건 = __slots__ 레코드 (라인별 dict 대비 메모리 절감)
+
+- dict 스타일 접근 호환: item["status"], item.get(...), "gates" in item, dict(item)
+- 선언되지 않은 키는 레코드별 extra dict에 보관 (필요할 때만 생성)
+- Shipment 단위 데이터(증빙문서)는 ShipmentDocs에 1회 저장, 항목은 shipment_id로 참조
+- JSON(json_default) / DataFrame(records_to_frame) 내보내기
+
+Author: HVDC Logistics Team
+Version: 1.0.0
+Last Updated: 2026-10-19
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+# 내보내기 시 Shipment 참조를 풀어 쓰는 컬럼 (기존 CSV/Excel 보고서 호환)
+SHIPMENT_DOC_FIELDS = ("supporting_docs_list", "evidence_count", "evidence_types")
+
+
+class ItemRecord(MutableMapping):
+    """
+    __slots__ 기반 항목 레코드
+
+    하위 클래스는 FIELDS(출력 컬럼 순서)를 선언하고 __slots__ = FIELDS로 지정한다.
+    값이 설정되지 않은 필드는 dict에 키가 없는 것과 같이 동작한다.
+    """
+
+    __slots__ = ("_extra",)
+    FIELDS: Tuple[str, ...] = ()
+    _FIELD_SET: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, **values: Any):
+        self._extra: Optional[Dict[str, Any]] = None
+        for key, value in values.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self.FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def copy(self) -> Dict[str, Any]:
+        """dict 사본 (dict.copy 호환)"""
+        return dict(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self)
+
+
+class ShipmentDocs:
+    """
+    Shipment ID → 증빙문서 목록 (1회 저장)
+
+    항목은 shipment_id만 보관하고, 내보내기 시 expand()로
+    supporting_docs_list / evidence_count / evidence_types를 붙인다.
+    """
+
+    def __init__(self, docs_by_shipment: Optional[Dict[str, List[Dict]]] = None):
+        self.docs_by_shipment = docs_by_shipment if docs_by_shipment is not None else {}
+        self._evidence_types: Dict[str, List[str]] = {}
+
+    def docs(self, shipment_id: Optional[str]) -> List[Dict]:
+        return self.docs_by_shipment.get(shipment_id, [])
+
+    def evidence_types(self, shipment_id: Optional[str]) -> List[str]:
+        """문서 타입 목록 (Shipment별 1회 계산)"""
+        types = self._evidence_types.get(shipment_id)
+        if types is None:
+            types = list(set(doc["doc_type"] for doc in self.docs(shipment_id)))
+            self._evidence_types[shipment_id] = types
+        return types
+
+    def expand(self, item: ItemRecord) -> Dict[str, Any]:
+        """레코드 → dict (Shipment 문서 컬럼 포함)"""
+        record = dict(item)
+        shipment_id = record.get("shipment_id")
+        docs = self.docs(shipment_id)
+        record["supporting_docs_list"] = docs
+        record["evidence_count"] = len(docs)
+        record["evidence_types"] = self.evidence_types(shipment_id)
+        return record
+
+
+def json_default(obj: Any) -> Any:
+    """json.dump default: ItemRecord → dict, 그 외 → str (기존 default=str 동작)"""
+    if isinstance(obj, ItemRecord):
+        return obj.to_dict()
+    return str(obj)
+
+
+def records_to_frame(
+    records: Iterable[ItemRecord],
+    shipment_docs: Optional[ShipmentDocs] = None,
+) -> pd.DataFrame:
+    """
+    레코드 목록 → DataFrame (CSV/Excel 내보내기)
+
+    Args:
+        records: ItemRecord 목록
+        shipment_docs: 지정 시 Shipment 문서 컬럼을 풀어 씀
+    """
+    if shipment_docs is None:
+        rows = [dict(record) for record in records]
+    else:
+        rows = [shipment_docs.expand(record) for record in records]
+    return pd.DataFrame(rows)
@@ -11,29 +11,54 @@ Author: HVDC Logistics Team
 Version: 1.0.0
 """
 
-try:
-    from .pdf_parser import (
-        DSVPDFParser,
-        DocumentHeader,
-        BOEData,
-        DOData,
-        DNData,
-        CarrierInvoiceData,
-    )
-except ImportError:
-    # Fallback if dependencies not installed
-    DSVPDFParser = None
-    DocumentHeader = None
-    BOEData = None
-    DOData = None
-    DNData = None
-    CarrierInvoiceData = None
-
-from .cross_doc_validator import CrossDocValidator
-
-from .ontology_mapper import OntologyMapper
-
-from .workflow_automator import WorkflowAutomator
+import importlib
+
+# Export name -> defining submodule (PEP 562 lazy loading).
+# pdfplumber/PyPDF2/requests are imported only when a name is first used.
+_LAZY_EXPORTS = {
+    # Parser
+    "DSVPDFParser": ".pdf_parser",
+    "DocumentHeader": ".pdf_parser",
+    "BOEData": ".pdf_parser",
+    "DOData": ".pdf_parser",
+    "DNData": ".pdf_parser",
+    "CarrierInvoiceData": ".pdf_parser",
+    # Validator
+    "CrossDocValidator": ".cross_doc_validator",
+    # Ontology
+    "OntologyMapper": ".ontology_mapper",
+    # Fact store
+    "ShipmentFactStore": ".fact_store",
+    "DocumentFact": ".fact_store",
+    "CertificationFact": ".fact_store",
+    # Automation
+    "WorkflowAutomator": ".workflow_automator",
+    "scan_demurrage": ".demurrage_scanner",
+    "AlertDispatcher": ".alert_dispatcher",
+}
+
+# Parser names fall back to None if its dependencies are not installed
+_OPTIONAL_MODULES = {".pdf_parser"}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if module_name not in _OPTIONAL_MODULES:
+            raise
+        # Fallback if dependencies not installed
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Parser
@@ -47,8 +72,14 @@ __all__ = [
     "CrossDocValidator",
     # Ontology
     "OntologyMapper",
+    # Fact store
+    "ShipmentFactStore",
+    "DocumentFact",
+    "CertificationFact",
     # Automation
     "WorkflowAutomator",
+    "scan_demurrage",
+    "AlertDispatcher",
 ]
 
 __version__ = "1.0.0"
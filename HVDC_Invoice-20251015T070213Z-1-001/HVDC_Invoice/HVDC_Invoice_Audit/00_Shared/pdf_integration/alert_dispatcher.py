@@ -0,0 +1,308 @@
+"""
+Alert Dispatcher Module
+=======================
+
+백그라운드 알림 발송 큐 (Telegram/Slack)
+
+- submit()은 큐에 넣고 즉시 반환 → 감사 루프가 네트워크 대기로 멈추지 않음
+- 채널별 requests.Session 재사용 (keep-alive)
+- batch_window 동안 모인 메시지를 채널 길이 제한 내에서 1건으로 합쳐 발송
+- 채널별 최소 발송 간격 + 429 Retry-After 준수
+- 실패 시 지수 백오프 재시도, 프로세스 종료 시 flush (atexit)
+
+Author: HVDC Logistics Team
+Version: 1.0.0
+Last Updated: 2026-10-19
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+# 메시지 구분선 (배치 합치기)
+BATCH_SEPARATOR = "\n\n———\n\n"
+
+
+@dataclass
+class AlertChannel:
+    """발송 채널 설정"""
+
+    name: str
+    url: str
+    build_payload: Callable[[str], Dict[str, Any]]
+    max_chars: int = 4000  # Telegram 4096자 제한
+    min_interval: float = 1.0  # 채널 발송 간격 (초)
+
+
+def telegram_channel(bot_token: str, chat_id: str, **kwargs) -> AlertChannel:
+    """Telegram sendMessage 채널"""
+    return AlertChannel(
+        name="telegram",
+        url=f"https://api.telegram.org/bot{bot_token}/sendMessage",
+        build_payload=lambda text: {
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": "Markdown",
+        },
+        **kwargs,
+    )
+
+
+def slack_channel(webhook_url: str, **kwargs) -> AlertChannel:
+    """Slack Incoming Webhook 채널"""
+    kwargs.setdefault("max_chars", 39000)  # Slack text 40,000자 제한
+    return AlertChannel(
+        name="slack",
+        url=webhook_url,
+        build_payload=lambda text: {"text": text, "mrkdwn": True},
+        **kwargs,
+    )
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """429 응답의 대기 시간 (Slack: Retry-After 헤더, Telegram: parameters.retry_after)"""
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except Exception:
+        return None
+
+
+def batch_messages(messages: List[str], max_chars: int) -> List[str]:
+    """
+    메시지를 max_chars 이내 묶음으로 합치기 (순서 유지)
+
+    단일 메시지가 max_chars를 넘으면 그대로 단독 발송
+    """
+    batches: List[str] = []
+    current: List[str] = []
+    size = 0
+
+    for message in messages:
+        added = len(message) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and size + added > max_chars:
+            batches.append(BATCH_SEPARATOR.join(current))
+            current, size = [], 0
+            added = len(message)
+        current.append(message)
+        size += added
+
+    if current:
+        batches.append(BATCH_SEPARATOR.join(current))
+    return batches
+
+
+class AlertDispatcher:
+    """
+    백그라운드 알림 발송기
+
+    Features:
+    - 비동기 큐 (데몬 스레드 1개, 첫 submit 시 시작)
+    - 채널별 배치 합치기 / 최소 간격 / Retry-After
+    - 지수 백오프 재시도 (backoff_base × 2^n, 최대 backoff_max)
+    - flush()/close(), 종료 시 자동 flush
+    """
+
+    def __init__(
+        self,
+        channels: List[AlertChannel],
+        batch_window: float = 0.5,
+        max_retries: int = 4,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        timeout: float = 10,
+        session: Optional[requests.Session] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            channels: 발송 채널 목록
+            batch_window: 첫 메시지 이후 배치로 모으는 시간 (초)
+            max_retries: 배치당 최대 재시도 횟수
+            backoff_base: 첫 재시도 대기 (초)
+            backoff_max: 최대 재시도 대기 (초)
+            timeout: HTTP 요청 타임아웃 (초)
+            session: requests.Session (기본: 새 Session, 연결 재사용)
+            logger: 로거
+        """
+        self.channels = {channel.name: channel for channel in channels}
+        self.batch_window = batch_window
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.logger = logger or logging.getLogger("AlertDispatcher")
+
+        self.stats = {"queued": 0, "sent": 0, "failed": 0, "requests": 0, "retries": 0}
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._next_allowed: Dict[str, float] = {}
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+        atexit.register(self.close)
+
+    def submit(self, channel: str, message: str) -> bool:
+        """
+        메시지를 발송 큐에 추가 (즉시 반환)
+
+        Returns:
+            큐 추가 여부 (미등록 채널 또는 close 이후면 False)
+        """
+        if channel not in self.channels or self._closed:
+            return False
+
+        with self._idle:
+            self._pending += 1
+        self._count("queued")
+        self._queue.put((channel, message))
+        self._ensure_worker()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        큐의 메시지가 모두 발송(또는 최종 실패)될 때까지 대기
+
+        Returns:
+            timeout 전에 비워졌으면 True
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = 30.0) -> bool:
+        """남은 메시지 flush 후 워커 종료"""
+        if self._closed:
+            return True
+        drained = self.flush(timeout)
+        self._closed = True
+        atexit.unregister(self.close)
+
+        worker = self._worker
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout)
+        self.session.close()
+        return drained
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="AlertDispatcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            # batch_window 동안 도착한 메시지를 함께 처리
+            items = [item]
+            deadline = time.monotonic() + self.batch_window
+            stop = False
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        extra = self._queue.get(timeout=remaining)
+                    else:
+                        extra = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    stop = True
+                    break
+                items.append(extra)
+
+            by_channel: Dict[str, List[str]] = {}
+            for channel, message in items:
+                by_channel.setdefault(channel, []).append(message)
+
+            # 발송 중 예외가 나도 _pending은 반드시 감소 (flush 대기 해제)
+            try:
+                for channel, messages in by_channel.items():
+                    try:
+                        self._deliver(self.channels[channel], messages)
+                    except Exception:
+                        self.logger.exception(f"{channel} batch dropped")
+                        self._count("failed", len(messages))
+            finally:
+                with self._idle:
+                    self._pending -= len(items)
+                    self._idle.notify_all()
+
+            if stop:
+                return
+
+    def _deliver(self, channel: AlertChannel, messages: List[str]):
+        for text in batch_messages(messages, channel.max_chars):
+            count = text.count(BATCH_SEPARATOR) + 1
+            try:
+                sent = self._post(channel, text)
+            except Exception:
+                # RequestException 외 오류 (payload 생성, 응답 처리 등)
+                self.logger.exception(f"{channel.name} send crashed")
+                sent = False
+            self._count("sent" if sent else "failed", count)
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _wait_turn(self, channel: AlertChannel):
+        wait = self._next_allowed.get(channel.name, 0.0) - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _post(self, channel: AlertChannel, text: str) -> bool:
+        payload = channel.build_payload(text)
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_turn(channel)
+            delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            try:
+                self._count("requests")
+                response = self.session.post(channel.url, json=payload, timeout=self.timeout)
+                status = response.status_code
+            except requests.RequestException as e:
+                self.logger.warning(f"{channel.name} send error: {e}")
+                status = None
+            finally:
+                self._next_allowed[channel.name] = time.monotonic() + channel.min_interval
+
+            if status == 200:
+                return True
+            if status == 429:
+                delay = _retry_after(response) or delay
+            elif status is not None and status < 500:
+                # 4xx (429 제외): 재시도해도 같은 결과
+                self.logger.error(f"{channel.name} send failed: {status} - {response.text}")
+                return False
+
+            if attempt < self.max_retries:
+                self._count("retries")
+                self._next_allowed[channel.name] = max(
+                    self._next_allowed[channel.name], time.monotonic() + delay
+                )
+
+        self.logger.error(
+            f"{channel.name} send failed after {self.max_retries + 1} attempt(s)"
+        )
+        return False
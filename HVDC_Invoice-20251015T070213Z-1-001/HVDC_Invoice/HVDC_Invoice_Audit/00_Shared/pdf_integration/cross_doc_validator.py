@@ -5,15 +5,16 @@ Cross-Document Validator Module
 다중 문서 간 일관성 및 정합성 검증
 
 Author: HVDC Logistics Team
-Version: 1.0.0
-Last Updated: 2025-10-13
+Version: 1.1.0
+Last Updated: 2026-10-19
 """
 
 from typing import List, Dict, Optional, Tuple, Any
-from rdflib import Graph, Namespace
 from datetime import datetime
 import logging
 
+from .fact_store import ShipmentFactStore
+
 
 class CrossDocValidator:
     """
@@ -24,17 +25,23 @@ class CrossDocValidator:
     - Container 번호 일치 검증
     - Weight/Quantity 일치 검증
     - Date 논리 검증
-    - SPARQL 기반 불일치 탐지
+    - 팩트 테이블 기반 불일치 탐지 (Item/MBL 인덱스 hash join)
     """
 
-    def __init__(self, ontology_graph: Optional[Graph] = None):
+    def __init__(
+        self,
+        ontology_graph: Optional[Any] = None,
+        facts: Optional[ShipmentFactStore] = None,
+    ):
         """
         Args:
-            ontology_graph: OntologyMapper에서 생성된 RDF 그래프
+            ontology_graph: OntologyMapper에서 생성된 RDF 그래프 (선택, 임의 SPARQL용)
+            facts: OntologyMapper.facts 팩트 테이블 (미지정 시 빈 테이블)
         """
-        self.graph = ontology_graph if ontology_graph else Graph()
-        self.ex = Namespace("http://samsung.com/hvdc-project#")
-        self.logistics = Namespace("http://samsung.com/project-logistics#")
+        self.graph = ontology_graph
+        self.facts = facts if facts is not None else ShipmentFactStore()
+        self.ex = "http://samsung.com/hvdc-project#"
+        self.logistics = "http://samsung.com/project-logistics#"
 
         self.logger = self._setup_logger()
 
@@ -417,7 +424,7 @@ class CrossDocValidator:
 
     def run_sparql_validation(self, item_code: str) -> List[Dict]:
         """
-        SPARQL 기반 불일치 탐지
+        팩트 테이블 기반 불일치 탐지 (기존 SPARQL 규칙 대체)
 
         Args:
             item_code: HVDC Item Code
@@ -427,37 +434,25 @@ class CrossDocValidator:
         """
         issues = []
 
-        # Query 1: MBL 불일치
-        mbl_query = f"""
-        PREFIX logistics: <http://samsung.com/project-logistics#>
-
-        SELECT ?shipment ?doc1 ?doc2 ?mbl1 ?mbl2
-        WHERE {{
-            ?shipment logistics:containsItem <http://samsung.com/hvdc-project#Item_{item_code}> .
-            ?shipment logistics:describedIn ?doc1 .
-            ?shipment logistics:describedIn ?doc2 .
-
-            ?doc1 logistics:hasMBL ?mbl1 .
-            ?doc2 logistics:hasMBL ?mbl2 .
-
-            FILTER(?doc1 != ?doc2)
-            FILTER(?mbl1 != ?mbl2)
-        }}
-        """
-
-        try:
-            results = list(self.graph.query(mbl_query))
-            if results:
-                issues.append(
-                    {
-                        "type": "SPARQL_MBL_MISMATCH",
-                        "severity": "HIGH",
-                        "details": "MBL mismatch detected via SPARQL",
-                        "count": len(results),
-                    }
-                )
-        except Exception as e:
-            self.logger.error(f"SPARQL query error: {e}")
+        # Rule 1: MBL 불일치 - Item 문서(BOE/DO/CarrierInvoice) 간 MBL이 다른 쌍
+        conflicts = self.facts.mbl_conflicts(item_code)
+        if conflicts:
+            issues.append(
+                {
+                    "type": "SPARQL_MBL_MISMATCH",
+                    "severity": "HIGH",
+                    "details": "MBL mismatch detected: "
+                    + ", ".join(
+                        sorted(
+                            {
+                                f"{doc1.doc_type}:{doc1.mbl} vs {doc2.doc_type}:{doc2.mbl}"
+                                for doc1, doc2 in conflicts
+                            }
+                        )
+                    ),
+                    "count": len(conflicts),
+                }
+            )
 
         return issues
 
@@ -0,0 +1,150 @@
+"""
+Demurrage Scanner Module
+========================
+
+DO 목록(DataFrame) 단위 Demurrage Risk 스캔
+
+- 날짜: 알려진 포맷별 pd.to_datetime 일괄 파싱 → 남은 값만 dateutil 폴백 (고유 값 1회)
+- 남은 일수 / 리스크 등급 / 비용: 배열 연산
+- 결과는 WorkflowAutomator.check_demurrage_risk와 같은 규칙
+
+Author: HVDC Logistics Team
+Version: 1.0.0
+Last Updated: 2026-10-19
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# WorkflowAutomator._parse_date와 같은 순서 (먼저 맞는 포맷 우선)
+DATE_FORMATS = [
+    "%d-%m-%Y",  # 15-09-2025
+    "%d/%m/%Y",  # 15/09/2025
+    "%Y-%m-%d",  # 2025-09-15
+    "%d-%b-%Y",  # 22-Sep-2025
+    "%m/%d/%Y",  # 9/21/2025 (미국식)
+]
+
+_ONE_DAY = pd.Timedelta(days=1)
+
+
+def _dateutil_parse(value: str):
+    try:
+        from dateutil import parser as du
+
+        parsed = du.parse(value, dayfirst=False, yearfirst=False)
+    except Exception:
+        return pd.NaT
+    # 시간대 포함 값은 naive 현재 시각과 비교할 수 없음
+    return pd.NaT if parsed.tzinfo is not None else parsed
+
+
+def parse_validity_dates(values: Iterable) -> pd.Series:
+    """
+    DO Validity 날짜 일괄 파싱
+
+    Args:
+        values: 날짜 문자열(또는 datetime) 목록
+
+    Returns:
+        datetime64 Series (파싱 실패/빈 값/datetime64 범위 밖 날짜는 NaT)
+    """
+    raw = pd.Series(values, dtype=object)
+    raw = raw.reset_index(drop=True)
+    result = pd.Series(pd.NaT, index=raw.index, dtype="datetime64[ns]")
+
+    is_str = pd.Series([isinstance(v, str) for v in raw], dtype=bool)
+    is_datetime = pd.Series([isinstance(v, datetime) for v in raw], dtype=bool)
+    if is_datetime.any():
+        result[is_datetime] = pd.to_datetime(raw[is_datetime], errors="coerce")
+
+    pending = raw[is_str].str.strip()
+    pending = pending[pending != ""]
+
+    for fmt in DATE_FORMATS:
+        if pending.empty:
+            break
+        parsed = pd.to_datetime(pending, format=fmt, errors="coerce")
+        matched = parsed.notna()
+        result[matched[matched].index] = parsed[matched]
+        pending = pending[~matched]
+
+    if not pending.empty:
+        fallback = {value: _dateutil_parse(value) for value in pending.unique()}
+        # 9999년 등 범위 밖 날짜 1건이 배치 전체를 중단시키지 않도록 NaT 처리
+        result[pending.index] = pd.to_datetime(pending.map(fallback), errors="coerce")
+
+    return result
+
+
+def scan_demurrage(
+    do_frame: pd.DataFrame,
+    now: Optional[datetime] = None,
+    warning_days: int = 3,
+    cost_per_day: float = 75,
+) -> pd.DataFrame:
+    """
+    DO DataFrame Demurrage Risk 스캔
+
+    Args:
+        do_frame: DO 데이터 (delivery_valid_until, quantity, do_number, ...)
+        now: 기준 시각 (기본: 현재)
+        warning_days: 만료 전 경고 일수
+        cost_per_day: 컨테이너당 일일 비용
+
+    Returns:
+        입력 컬럼 + validity_date, days_remaining, risk_level, status, cost_usd,
+        parse_failed (리스크 없는 DO는 risk_level/status가 None)
+    """
+    now = now or datetime.now()
+    n = len(do_frame)
+
+    if "delivery_valid_until" in do_frame:
+        raw = do_frame["delivery_valid_until"].to_numpy(dtype=object)
+    else:
+        raw = np.full(n, None, dtype=object)
+    validity = parse_validity_dates(raw)
+
+    if "quantity" in do_frame:
+        quantity = do_frame["quantity"].to_numpy(dtype=object)
+        quantity = np.where(pd.isna(quantity), 1, quantity)
+    else:
+        quantity = np.ones(n, dtype=np.int64)
+
+    parsed = validity.notna().to_numpy()
+    # datetime.timedelta.days와 같은 내림 (만료 당일 = -1)
+    days = np.zeros(n, dtype=np.int64)
+    days[parsed] = ((validity[parsed] - pd.Timestamp(now)) // _ONE_DAY).to_numpy()
+
+    expired = parsed & (days < 0)
+    warning = parsed & ~expired & (days <= warning_days)
+
+    risk_level = np.select(
+        [expired, warning & (days <= 1), warning],
+        ["CRITICAL", "HIGH", "MEDIUM"],
+        default=None,
+    )
+    status = np.select([expired, warning], ["EXPIRED", "WARNING"], default=None)
+    # EXPIRED: 초과 일수 × 일일 비용 × 수량 / WARNING: 일일 비용 × 수량
+    cost = np.where(expired, np.abs(days), 1) * cost_per_day * quantity
+
+    present = np.array(
+        [
+            bool(v.strip()) if isinstance(v, str) else v is not None and not pd.isna(v)
+            for v in raw
+        ],
+        dtype=bool,
+    )
+
+    result = do_frame.reset_index(drop=True).copy()
+    result["validity_date"] = validity
+    result["days_remaining"] = days
+    result["risk_level"] = risk_level
+    result["status"] = status
+    result["cost_usd"] = np.where(expired | warning, cost, None)
+    result["parse_failed"] = present & ~parsed
+    result.index = do_frame.index
+    return result
@@ -0,0 +1,170 @@
+"""
+Shipment Fact Store Module
+==========================
+
+Cross-document 검증용 인메모리 팩트 테이블
+
+- 문서(BOE/DO/DN/CarrierInvoice) 1건 = DocumentFact 1행
+- Item Code / MBL / Container 해시 인덱스 → 검증 규칙은 hash join으로 실행
+- 규제 인증 요건(CertificationFact) + 첨부 문서 테이블
+- RDF(Turtle)는 OntologyMapper가 필요할 때만 팩트에서 직렬화
+
+Author: HVDC Logistics Team
+Version: 1.0.0
+Last Updated: 2026-10-19
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class DocumentFact:
+    """문서 1건의 정규화된 팩트"""
+
+    doc_type: str  # "BOE" | "DO" | "DN" | "CarrierInvoice"
+    doc_id: str  # dec_no / do_number / waybill_no / invoice_number
+    mbl: Optional[str] = None
+    item_code: Optional[str] = None
+    containers: Tuple[str, ...] = ()
+    hs_code: Optional[str] = None
+    data: Mapping[str, Any] = field(default_factory=dict, compare=False)
+
+
+@dataclass(frozen=True)
+class CertificationFact:
+    """Item별 규제 인증 요건"""
+
+    cert_id: str
+    item_code: str
+    cert_type: str
+    description: str
+    status: str
+    lead_time_days: int
+    hs_code: Optional[str] = None
+
+
+class ShipmentFactStore:
+    """
+    문서/인증 팩트 테이블 + 해시 인덱스
+
+    행은 추가만 가능 (append-only). 인덱스는 추가 시점에 갱신되므로
+    조회/검증 규칙은 그래프 탐색 없이 dict 조회로 실행된다.
+    """
+
+    def __init__(self):
+        self.documents: List[DocumentFact] = []
+        self.certifications: Dict[str, CertificationFact] = {}
+        self.attachments: Dict[str, List[str]] = {}  # cert_id → 첨부 문서
+
+        self._by_item: Dict[str, List[int]] = {}
+        self._by_mbl: Dict[str, List[int]] = {}
+        self._by_container: Dict[str, List[int]] = {}
+
+        # 팩트 변경 시 증가 (파생 캐시 무효화용)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    # ==================== 적재 ====================
+
+    def add_document(self, fact: DocumentFact) -> int:
+        """문서 팩트 추가 → 행 번호"""
+        row = len(self.documents)
+        self.documents.append(fact)
+
+        if fact.item_code:
+            self._by_item.setdefault(fact.item_code, []).append(row)
+        if fact.mbl:
+            self._by_mbl.setdefault(fact.mbl, []).append(row)
+        for container_no in fact.containers:
+            self._by_container.setdefault(container_no, []).append(row)
+
+        self.version += 1
+        return row
+
+    def add_certification(self, fact: CertificationFact) -> None:
+        """인증 요건 추가 (같은 cert_id는 1건으로 유지)"""
+        if fact.cert_id not in self.certifications:
+            self.certifications[fact.cert_id] = fact
+            self.version += 1
+
+    def attach_document(self, cert_id: str, document: str) -> None:
+        """인증 요건에 증빙 문서 연결"""
+        self.attachments.setdefault(cert_id, []).append(document)
+        self.version += 1
+
+    # ==================== 인덱스 조회 ====================
+
+    def _rows(self, rows: Iterable[int]) -> List[DocumentFact]:
+        return [self.documents[row] for row in rows]
+
+    def documents_for_item(self, item_code: str) -> List[DocumentFact]:
+        return self._rows(self._by_item.get(item_code, ()))
+
+    def documents_for_mbl(self, mbl: str) -> List[DocumentFact]:
+        return self._rows(self._by_mbl.get(mbl, ()))
+
+    def documents_for_container(self, container_no: str) -> List[DocumentFact]:
+        return self._rows(self._by_container.get(container_no, ()))
+
+    # ==================== 검증 규칙 (hash join) ====================
+
+    def mbl_conflicts(
+        self, item_code: str, doc_types: Tuple[str, ...] = ("BOE", "DO", "CarrierInvoice")
+    ) -> List[Tuple[DocumentFact, DocumentFact]]:
+        """
+        Item 문서 간 MBL 불일치 쌍
+
+        Item 인덱스로 문서를 모은 뒤 MBL 기준으로 그룹화하고, 서로 다른
+        MBL 그룹 간 (doc1, doc2) 순서쌍을 반환 (자기 조인 결과와 동일한 개수).
+        """
+        by_mbl: Dict[str, List[DocumentFact]] = {}
+        for fact in self.documents_for_item(item_code):
+            if fact.mbl and fact.doc_type in doc_types:
+                by_mbl.setdefault(fact.mbl, []).append(fact)
+
+        if len(by_mbl) < 2:
+            return []
+
+        groups = list(by_mbl.values())
+        return [
+            (doc1, doc2)
+            for i, group1 in enumerate(groups)
+            for j, group2 in enumerate(groups)
+            if i != j
+            for doc1 in group1
+            for doc2 in group2
+        ]
+
+    def missing_certifications(self) -> List[CertificationFact]:
+        """PENDING 상태이면서 첨부 문서가 없는 인증 요건"""
+        return [
+            cert
+            for cert_id, cert in self.certifications.items()
+            if cert.status == "PENDING" and not self.attachments.get(cert_id)
+        ]
+
+    # ==================== 내보내기 ====================
+
+    def to_frame(self):
+        """문서 팩트 DataFrame (컨테이너는 행 단위로 펼침)"""
+        import pandas as pd
+
+        records = [
+            {
+                "doc_type": fact.doc_type,
+                "doc_id": fact.doc_id,
+                "mbl": fact.mbl,
+                "item_code": fact.item_code,
+                "container_no": container_no,
+                "hs_code": fact.hs_code,
+            }
+            for fact in self.documents
+            for container_no in (fact.containers or (None,))
+        ]
+        return pd.DataFrame(
+            records,
+            columns=["doc_type", "doc_id", "mbl", "item_code", "container_no", "hs_code"],
+        )
@@ -2,19 +2,41 @@
 Ontology Mapper Module
 ======================
 
-RDF 트리플 생성 및 SPARQL 검증을 통한 온톨로지 통합
+파싱 문서 → 팩트 테이블(ShipmentFactStore) + RDF 트리플 매핑
+
+검증(인증서 누락, Cross-document)은 팩트 테이블 hash join으로 실행하고,
+rdflib Graph는 Turtle 내보내기/임의 SPARQL 조회 시에만 생성한다.
 
 Author: HVDC Logistics Team
-Version: 1.0.0
-Last Updated: 2025-10-13
+Version: 1.1.0
+Last Updated: 2026-10-19
 """
 
-from typing import List, Dict, Optional, Tuple, Any
-from rdflib import Graph, Namespace, Literal, URIRef, RDF, RDFS, XSD
+from typing import List, Dict, NamedTuple, Optional, Tuple, Any
 from datetime import datetime
 import logging
 import re
 
+from .fact_store import CertificationFact, DocumentFact, ShipmentFactStore
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDFS_NS = "http://www.w3.org/2000/01/rdf-schema#"
+XSD_NS = "http://www.w3.org/2001/XMLSchema#"
+RDF_TYPE = RDF_NS + "type"
+XSD_DECIMAL = XSD_NS + "decimal"
+XSD_INTEGER = XSD_NS + "integer"
+
+
+class Triple(NamedTuple):
+    """RDF 트리플 (rdflib 없이 보관, object는 URI 또는 Literal 값)"""
+
+    subject: str
+    predicate: str
+    obj: Any
+    is_uri: bool = False
+    datatype: Optional[str] = None
+
+
 try:
     # 새 파서: dict 형태 반환
     from parsers import dsv_pdf_parser as Parser
@@ -30,24 +52,22 @@ class OntologyMapper:
     파싱된 PDF 데이터를 RDF 온톨로지로 매핑
 
     Features:
-    - RDF Triple 생성
-    - SPARQL 검증 쿼리
+    - 문서 팩트 테이블 적재 (Item/MBL/Container 인덱스)
+    - RDF Triple 생성 (Graph는 필요 시 직렬화)
     - 규제 요건 자동 추론 (HS Code 기반)
     - Cross-document 연결
     """
 
     def __init__(self, base_uri: str = "http://samsung.com/hvdc-project#"):
-        self.graph = Graph()
         self.base_uri = base_uri
-        self.ex = Namespace(base_uri)
-        self.logistics = Namespace("http://samsung.com/project-logistics#")
+        self.ex = base_uri
+        self.logistics = "http://samsung.com/project-logistics#"
 
-        # 네임스페이스 바인딩
-        self.graph.bind("ex", self.ex)
-        self.graph.bind("logistics", self.logistics)
-        self.graph.bind("rdf", RDF)
-        self.graph.bind("rdfs", RDFS)
-        self.graph.bind("xsd", XSD)
+        # 팩트 테이블 (검증용) + 트리플 (순서 유지 집합, 직렬화용)
+        self.facts = ShipmentFactStore()
+        self._triples: Dict[Triple, None] = {}
+        self._graph = None
+        self._graph_size = -1
 
         self.logger = self._setup_logger()
 
@@ -98,9 +118,55 @@ class OntologyMapper:
         sanitized = re.sub(r"\s+", "_", sanitized)
         return sanitized[:100]  # 최대 100자
 
+    # ==================== 트리플 기록 ====================
+
+    def _uri(self, local_name: str) -> str:
+        return f"{self.ex}{local_name}"
+
+    def _type(self, subject: str, class_name: str) -> None:
+        self._triples[Triple(subject, RDF_TYPE, self.logistics + class_name, True)] = None
+
+    def _link(self, subject: str, predicate: str, obj: str) -> None:
+        self._triples[Triple(subject, self.logistics + predicate, obj, True)] = None
+
+    def _literal(
+        self, subject: str, predicate: str, value: Any, datatype: Optional[str] = None
+    ) -> None:
+        self._triples[
+            Triple(subject, self.logistics + predicate, value, False, datatype)
+        ] = None
+
+    @property
+    def graph(self):
+        """rdflib Graph (트리플 추가 후 첫 접근 시 생성, rdflib 필요)"""
+        if self._graph is None or self._graph_size != len(self._triples):
+            self._graph = self._build_graph()
+            self._graph_size = len(self._triples)
+        return self._graph
+
+    def _build_graph(self):
+        from rdflib import Graph, Literal, Namespace, URIRef, RDF, RDFS, XSD
+
+        graph = Graph()
+        graph.bind("ex", Namespace(self.ex))
+        graph.bind("logistics", Namespace(self.logistics))
+        graph.bind("rdf", RDF)
+        graph.bind("rdfs", RDFS)
+        graph.bind("xsd", XSD)
+
+        for triple in self._triples:
+            if triple.is_uri:
+                obj = URIRef(triple.obj)
+            elif triple.datatype:
+                obj = Literal(triple.obj, datatype=URIRef(triple.datatype))
+            else:
+                obj = Literal(triple.obj)
+            graph.add((URIRef(triple.subject), URIRef(triple.predicate), obj))
+        return graph
+
     def map_boe_to_ontology(
         self, boe_data: Any, item_code: Optional[str] = None
-    ) -> URIRef:
+    ) -> str:
         """
         BOE (Bill of Entry) 데이터를 온톨로지로 매핑 (dict 또는 dataclass 유사 객체)
 
@@ -116,82 +182,54 @@ class OntologyMapper:
 
         # Shipment 객체 생성
         mbl_no = data.get("mbl_no", "UNKNOWN")
-        shipment_uri = URIRef(self.ex[f"Shipment_{self._sanitize_uri(mbl_no)}"])
+        shipment_uri = self._uri(f"Shipment_{self._sanitize_uri(mbl_no)}")
 
-        self.graph.add((shipment_uri, RDF.type, self.logistics.DSVShipment))
-        self.graph.add((shipment_uri, self.logistics.hasMBL, Literal(mbl_no)))
+        self._type(shipment_uri, "DSVShipment")
+        self._literal(shipment_uri, "hasMBL", mbl_no)
 
         if data.get("vessel"):
-            self.graph.add(
-                (shipment_uri, self.logistics.hasVessel, Literal(data["vessel"]))
-            )
+            self._literal(shipment_uri, "hasVessel", data["vessel"])
 
         if data.get("voyage_no"):
-            self.graph.add(
-                (shipment_uri, self.logistics.hasVoyage, Literal(data["voyage_no"]))
-            )
+            self._literal(shipment_uri, "hasVoyage", data["voyage_no"])
 
         # CustomsDeclaration 객체 생성
         dec_no = data.get("dec_no", "UNKNOWN")
-        customs_uri = URIRef(self.ex[f"BOE_{dec_no}"])
+        customs_uri = self._uri(f"BOE_{dec_no}")
 
-        self.graph.add((customs_uri, RDF.type, self.logistics.CustomsDeclaration))
-        self.graph.add((customs_uri, self.logistics.hasDECNo, Literal(dec_no)))
+        self._type(customs_uri, "CustomsDeclaration")
+        self._literal(customs_uri, "hasDECNo", dec_no)
 
         if data.get("dec_date"):
-            self.graph.add(
-                (customs_uri, self.logistics.hasDecDate, Literal(data["dec_date"]))
-            )
+            self._literal(customs_uri, "hasDecDate", data["dec_date"])
 
         if data.get("hs_code"):
-            self.graph.add(
-                (customs_uri, self.logistics.hasHSCode, Literal(data["hs_code"]))
-            )
+            self._literal(customs_uri, "hasHSCode", data["hs_code"])
 
         if data.get("duty_aed"):
-            self.graph.add(
-                (
-                    customs_uri,
-                    self.logistics.hasDutyPaid,
-                    Literal(data["duty_aed"], datatype=XSD.decimal),
-                )
-            )
+            self._literal(customs_uri, "hasDutyPaid", data["duty_aed"], XSD_DECIMAL)
 
         if data.get("vat_aed"):
-            self.graph.add(
-                (
-                    customs_uri,
-                    self.logistics.hasVATPaid,
-                    Literal(data["vat_aed"], datatype=XSD.decimal),
-                )
-            )
+            self._literal(customs_uri, "hasVATPaid", data["vat_aed"], XSD_DECIMAL)
 
         # Shipment → CustomsDeclaration 링크
-        self.graph.add((shipment_uri, self.logistics.describedIn, customs_uri))
+        self._link(shipment_uri, "describedIn", customs_uri)
 
         # Container 객체들 생성
         containers = data.get("containers", [])
         if containers:
             for container_no in containers:
-                container_uri = URIRef(self.ex[f"Container_{container_no}"])
-                self.graph.add((container_uri, RDF.type, self.logistics.Container))
-                self.graph.add(
-                    (
-                        container_uri,
-                        self.logistics.hasContainerNo,
-                        Literal(container_no),
-                    )
-                )
-                self.graph.add(
-                    (shipment_uri, self.logistics.hasContainer, container_uri)
-                )
+                container_uri = self._uri(f"Container_{container_no}")
+                self._type(container_uri, "Container")
+                self._literal(container_uri, "hasContainerNo", container_no)
+                self._link(shipment_uri, "hasContainer", container_uri)
 
         # Item 연결
         if item_code:
-            item_uri = URIRef(self.ex[f"Item_{self._sanitize_uri(item_code)}"])
-            self.graph.add((item_uri, RDF.type, self.logistics.Item))
-            self.graph.add((item_uri, self.logistics.hasItemCode, Literal(item_code)))
-            self.graph.add((shipment_uri, self.logistics.containsItem, item_uri))
+            item_uri = self._uri(f"Item_{self._sanitize_uri(item_code)}")
+            self._type(item_uri, "Item")
+            self._literal(item_uri, "hasItemCode", item_code)
+            self._link(shipment_uri, "containsItem", item_uri)
 
             # 규제 요건 추론
             if data.get("hs_code") or data.get("description"):
@@ -200,14 +238,28 @@ class OntologyMapper:
                 )
 
                 for cert in cert_requirements:
-                    cert_uri = self._create_certification_requirement(item_uri, cert)
+                    self._create_certification_requirement(
+                        item_uri, cert, item_code, data.get("hs_code")
+                    )
+
+        self.facts.add_document(
+            DocumentFact(
+                "BOE",
+                dec_no,
+                mbl=data.get("mbl_no"),
+                item_code=item_code,
+                containers=tuple(containers or ()),
+                hs_code=data.get("hs_code"),
+                data=dict(data),
+            )
+        )
 
         self.logger.info(f"BOE mapped: {dec_no} → Shipment {mbl_no}")
         return shipment_uri
 
     def map_do_to_ontology(
         self, do_data: Any, item_code: Optional[str] = None
-    ) -> URIRef:
+    ) -> str:
         """
         DO (Delivery Order) 데이터를 온톨로지로 매핑
 
@@ -225,37 +277,30 @@ class OntologyMapper:
 
         # Shipment 객체 생성
         mbl_no = data.get("mbl_no", "UNKNOWN")
-        shipment_uri = URIRef(self.ex[f"Shipment_{self._sanitize_uri(mbl_no)}"])
+        shipment_uri = self._uri(f"Shipment_{self._sanitize_uri(mbl_no)}")
 
-        self.graph.add((shipment_uri, RDF.type, self.logistics.DSVShipment))
-        self.graph.add((shipment_uri, self.logistics.hasMBL, Literal(mbl_no)))
+        self._type(shipment_uri, "DSVShipment")
+        self._literal(shipment_uri, "hasMBL", mbl_no)
 
         # DeliveryOrder 객체 생성
         do_number = data.get("do_number", "UNKNOWN")
-        do_uri = URIRef(self.ex[f"DO_{do_number}"])
+        do_uri = self._uri(f"DO_{do_number}")
 
-        self.graph.add((do_uri, RDF.type, self.logistics.DeliveryOrder))
-        self.graph.add((do_uri, self.logistics.hasDONumber, Literal(do_number)))
+        self._type(do_uri, "DeliveryOrder")
+        self._literal(do_uri, "hasDONumber", do_number)
 
         if data.get("do_date"):
-            self.graph.add(
-                (do_uri, self.logistics.hasIssueDate, Literal(data["do_date"]))
-            )
+            self._literal(do_uri, "hasIssueDate", data["do_date"])
 
         if data.get("delivery_valid_until"):
-            self.graph.add(
-                (
-                    do_uri,
-                    self.logistics.hasExpiryDate,
-                    Literal(data["delivery_valid_until"]),
-                )
-            )
+            self._literal(do_uri, "hasExpiryDate", data["delivery_valid_until"])
 
         # Shipment → DO 링크
-        self.graph.add((shipment_uri, self.logistics.hasDeliveryOrder, do_uri))
+        self._link(shipment_uri, "hasDeliveryOrder", do_uri)
 
         # Container 객체들
         containers = data.get("containers", [])
+        container_nos = []
         if containers:
             for container_info in containers:
                 if isinstance(container_info, dict):
@@ -266,36 +311,38 @@ class OntologyMapper:
                     seal_no = None
 
                 if container_no:
-                    container_uri = URIRef(self.ex[f"Container_{container_no}"])
-                    self.graph.add((container_uri, RDF.type, self.logistics.Container))
-                    self.graph.add(
-                        (
-                            container_uri,
-                            self.logistics.hasContainerNo,
-                            Literal(container_no),
-                        )
-                    )
+                    container_nos.append(container_no)
+                    container_uri = self._uri(f"Container_{container_no}")
+                    self._type(container_uri, "Container")
+                    self._literal(container_uri, "hasContainerNo", container_no)
 
                     if seal_no:
-                        self.graph.add(
-                            (container_uri, self.logistics.hasSealNo, Literal(seal_no))
-                        )
+                        self._literal(container_uri, "hasSealNo", seal_no)
 
-                    self.graph.add(
-                        (shipment_uri, self.logistics.hasContainer, container_uri)
-                    )
+                    self._link(shipment_uri, "hasContainer", container_uri)
 
         # Item 연결
         if item_code:
-            item_uri = URIRef(self.ex[f"Item_{self._sanitize_uri(item_code)}"])
-            self.graph.add((shipment_uri, self.logistics.containsItem, item_uri))
+            item_uri = self._uri(f"Item_{self._sanitize_uri(item_code)}")
+            self._link(shipment_uri, "containsItem", item_uri)
+
+        self.facts.add_document(
+            DocumentFact(
+                "DO",
+                do_number,
+                mbl=data.get("mbl_no"),
+                item_code=item_code,
+                containers=tuple(container_nos),
+                data=dict(data),
+            )
+        )
 
         self.logger.info(f"DO mapped: {do_number} → Shipment {mbl_no}")
         return shipment_uri
 
     def map_dn_to_ontology(
         self, dn_data: Any, item_code: Optional[str] = None
-    ) -> URIRef:
+    ) -> str:
         """
         DN (Delivery Note) 데이터를 온톨로지로 매핑
 
@@ -313,88 +360,67 @@ class OntologyMapper:
 
         # TransportLeg 객체 생성
         waybill_no = data.get("waybill_no", "UNKNOWN")
-        transport_uri = URIRef(self.ex[f"Transport_{self._sanitize_uri(waybill_no)}"])
+        transport_uri = self._uri(f"Transport_{self._sanitize_uri(waybill_no)}")
 
-        self.graph.add((transport_uri, RDF.type, self.logistics.TransportLeg))
-        self.graph.add(
-            (transport_uri, self.logistics.hasWaybillNo, Literal(waybill_no))
-        )
+        self._type(transport_uri, "TransportLeg")
+        self._literal(transport_uri, "hasWaybillNo", waybill_no)
 
         if data.get("trip_no"):
-            self.graph.add(
-                (transport_uri, self.logistics.hasTripNo, Literal(data["trip_no"]))
-            )
+            self._literal(transport_uri, "hasTripNo", data["trip_no"])
 
         if data.get("driver_name"):
-            self.graph.add(
-                (transport_uri, self.logistics.hasDriver, Literal(data["driver_name"]))
-            )
+            self._literal(transport_uri, "hasDriver", data["driver_name"])
 
         if data.get("head_plate") or data.get("trailer_plate"):
             vehicle_id = f"{data.get('head_plate', '')}_{data.get('trailer_plate', '')}"
-            self.graph.add(
-                (transport_uri, self.logistics.hasVehicleID, Literal(vehicle_id))
-            )
+            self._literal(transport_uri, "hasVehicleID", vehicle_id)
 
         # Origin/Destination
         if data.get("loading_point"):
-            self.graph.add(
-                (
-                    transport_uri,
-                    self.logistics.hasOrigin,
-                    Literal(data["loading_point"]),
-                )
-            )
+            self._literal(transport_uri, "hasOrigin", data["loading_point"])
 
         if data.get("destination"):
-            self.graph.add(
-                (
-                    transport_uri,
-                    self.logistics.hasDestination,
-                    Literal(data["destination"]),
-                )
-            )
+            self._literal(transport_uri, "hasDestination", data["destination"])
 
         # Timing
         if data.get("loading_date"):
-            self.graph.add(
-                (
-                    transport_uri,
-                    self.logistics.hasLoadingDate,
-                    Literal(data["loading_date"]),
-                )
-            )
+            self._literal(transport_uri, "hasLoadingDate", data["loading_date"])
 
         if data.get("arrival_loading_time"):
-            self.graph.add(
-                (
-                    transport_uri,
-                    self.logistics.hasArrivalTime,
-                    Literal(data["arrival_loading_time"]),
-                )
-            )
+            self._literal(transport_uri, "hasArrivalTime", data["arrival_loading_time"])
 
         # Container 연결
         if data.get("container_no"):
-            container_uri = URIRef(self.ex[f"Container_{data['container_no']}"])
-            self.graph.add(
-                (transport_uri, self.logistics.transportsContainer, container_uri)
-            )
+            container_uri = self._uri(f"Container_{data['container_no']}")
+            self._link(transport_uri, "transportsContainer", container_uri)
 
         # Item 연결
         if item_code:
-            item_uri = URIRef(self.ex[f"Item_{self._sanitize_uri(item_code)}"])
-            self.graph.add((transport_uri, self.logistics.transportsItem, item_uri))
+            item_uri = self._uri(f"Item_{self._sanitize_uri(item_code)}")
+            self._link(transport_uri, "transportsItem", item_uri)
+
+        self.facts.add_document(
+            DocumentFact(
+                "DN",
+                waybill_no,
+                item_code=item_code,
+                containers=(data["container_no"],) if data.get("container_no") else (),
+                data=dict(data),
+            )
+        )
 
         self.logger.info(f"DN mapped: {waybill_no}")
         return transport_uri
 
-    def map_carrier_invoice_to_ontology(self, invoice_data: Any) -> URIRef:
+    def map_carrier_invoice_to_ontology(
+        self, invoice_data: Any, item_code: Optional[str] = None
+    ) -> str:
         """
         Carrier Invoice 데이터를 온톨로지로 매핑
 
         Args:
             invoice_data: CarrierInvoiceData 객체 또는 딕셔너리
+            item_code: HVDC Item Code
 
         Returns:
             Invoice URI
@@ -406,40 +432,34 @@ class OntologyMapper:
 
         # Invoice 객체 생성
         invoice_no = data.get("invoice_number", "UNKNOWN")
-        invoice_uri = URIRef(self.ex[f"Invoice_{invoice_no}"])
+        invoice_uri = self._uri(f"Invoice_{invoice_no}")
 
-        self.graph.add((invoice_uri, RDF.type, self.logistics.CarrierInvoice))
-        self.graph.add((invoice_uri, self.logistics.hasInvoiceNo, Literal(invoice_no)))
+        self._type(invoice_uri, "CarrierInvoice")
+        self._literal(invoice_uri, "hasInvoiceNo", invoice_no)
 
         if data.get("invoice_date"):
-            self.graph.add(
-                (
-                    invoice_uri,
-                    self.logistics.hasIssueDate,
-                    Literal(data["invoice_date"]),
-                )
-            )
+            self._literal(invoice_uri, "hasIssueDate", data["invoice_date"])
 
         if data.get("total_incl_tax"):
-            self.graph.add(
-                (
-                    invoice_uri,
-                    self.logistics.hasTotalAmount,
-                    Literal(data["total_incl_tax"], datatype=XSD.decimal),
-                )
-            )
+            self._literal(invoice_uri, "hasTotalAmount", data["total_incl_tax"], XSD_DECIMAL)
 
         if data.get("currency"):
-            self.graph.add(
-                (invoice_uri, self.logistics.hasCurrency, Literal(data["currency"]))
-            )
+            self._literal(invoice_uri, "hasCurrency", data["currency"])
 
         # BL 연결
         if data.get("bl_number"):
-            shipment_uri = URIRef(
-                self.ex[f"Shipment_{self._sanitize_uri(data['bl_number'])}"]
+            shipment_uri = self._uri(f"Shipment_{self._sanitize_uri(data['bl_number'])}")
+            self._link(invoice_uri, "billedFor", shipment_uri)
+
+        self.facts.add_document(
+            DocumentFact(
+                "CarrierInvoice",
+                invoice_no,
+                mbl=data.get("bl_number"),
+                item_code=item_code,
+                data=dict(data),
             )
-            self.graph.add((invoice_uri, self.logistics.billedFor, shipment_uri))
+        )
 
         self.logger.info(f"Carrier Invoice mapped: {invoice_no}")
         return invoice_uri
@@ -489,35 +509,40 @@ class OntologyMapper:
         return requirements
 
     def _create_certification_requirement(
-        self, item_uri: URIRef, cert_info: Dict
-    ) -> URIRef:
+        self, item_uri: str, cert_info: Dict, item_code: str, hs_code: Optional[str]
+    ) -> str:
         """CertificationRequirement 객체 생성"""
         cert_type = cert_info["type"]
-        cert_uri = URIRef(self.ex[f"Cert_{cert_type}_{item_uri.split('_')[-1]}"])
-
-        self.graph.add((cert_uri, RDF.type, self.logistics.CertificationRequirement))
-        self.graph.add((cert_uri, self.logistics.certType, Literal(cert_type)))
-        self.graph.add(
-            (
-                cert_uri,
-                self.logistics.certDescription,
-                Literal(cert_info["description"]),
-            )
-        )
-        self.graph.add((cert_uri, self.logistics.status, Literal(cert_info["status"])))
-        self.graph.add(
-            (
-                cert_uri,
-                self.logistics.leadTimeDays,
-                Literal(cert_info["lead_time_days"], datatype=XSD.integer),
-            )
-        )
+        cert_uri = self._uri(f"Cert_{cert_type}_{item_uri.split('_')[-1]}")
+
+        self._type(cert_uri, "CertificationRequirement")
+        self._literal(cert_uri, "certType", cert_type)
+        self._literal(cert_uri, "certDescription", cert_info["description"])
+        self._literal(cert_uri, "status", cert_info["status"])
+        self._literal(cert_uri, "leadTimeDays", cert_info["lead_time_days"], XSD_INTEGER)
 
         # Item → Certification 링크
-        self.graph.add((item_uri, self.logistics.requiresCertification, cert_uri))
+        self._link(item_uri, "requiresCertification", cert_uri)
+
+        self.facts.add_certification(
+            CertificationFact(
+                cert_id=cert_uri,
+                item_code=item_code,
+                cert_type=cert_type,
+                description=cert_info["description"],
+                status=cert_info["status"],
+                lead_time_days=cert_info["lead_time_days"],
+                hs_code=hs_code,
+            )
+        )
 
         return cert_uri
 
+    def attach_certification_document(self, cert_uri: str, document: str):
+        """인증 요건에 증빙 문서 첨부 (누락 인증서 검색에서 제외됨)"""
+        self._literal(cert_uri, "attachedDocument", document)
+        self.facts.attach_document(cert_uri, document)
+
     def run_sparql_query(self, query: str) -> List[Dict]:
         """
         SPARQL 쿼리 실행
@@ -545,29 +570,16 @@ class OntologyMapper:
         return results
 
     def validate_missing_certifications(self) -> List[Dict]:
-        """누락된 인증서 검색"""
-        query = """
-        PREFIX logistics: <http://samsung.com/project-logistics#>
-
-        SELECT ?item ?hs_code ?required_cert ?status
-        WHERE {
-            ?item a logistics:Item ;
-                  logistics:requiresCertification ?cert .
-
-            OPTIONAL { ?item logistics:hasHSCode ?hs_code }
-
-            ?cert logistics:certType ?required_cert ;
-                  logistics:status ?status .
-
-            FILTER(?status = "PENDING")
-
-            FILTER NOT EXISTS {
-                ?cert logistics:attachedDocument ?cert_doc
+        """누락된 인증서 검색 (PENDING + 첨부 문서 없음)"""
+        return [
+            {
+                "item": self._uri(f"Item_{self._sanitize_uri(cert.item_code)}"),
+                "hs_code": cert.hs_code,
+                "required_cert": cert.cert_type,
+                "status": cert.status,
             }
-        }
-        """
-
-        return self.run_sparql_query(query)
+            for cert in self.facts.missing_certifications()
+        ]
 
     def export_to_turtle(self, output_path: str):
         """RDF 그래프를 Turtle 형식으로 내보내기"""
@@ -579,22 +591,20 @@ class OntologyMapper:
 
     def get_graph_stats(self) -> Dict:
         """그래프 통계 반환"""
+        typed: Dict[str, set] = {}
+        for triple in self._triples:
+            if triple.predicate == RDF_TYPE:
+                typed.setdefault(triple.obj, set()).add(triple.subject)
+
+        def count(class_name: str) -> int:
+            return len(typed.get(self.logistics + class_name, ()))
+
         return {
-            "total_triples": len(self.graph),
-            "shipments": len(
-                list(self.graph.subjects(RDF.type, self.logistics.DSVShipment))
-            ),
-            "items": len(list(self.graph.subjects(RDF.type, self.logistics.Item))),
-            "containers": len(
-                list(self.graph.subjects(RDF.type, self.logistics.Container))
-            ),
-            "certifications": len(
-                list(
-                    self.graph.subjects(
-                        RDF.type, self.logistics.CertificationRequirement
-                    )
-                )
-            ),
+            "total_triples": len(self._triples),
+            "shipments": count("DSVShipment"),
+            "items": count("Item"),
+            "containers": count("Container"),
+            "certifications": count("CertificationRequirement"),
         }
 
 
@@ -11,20 +11,25 @@ Last Updated: 2025-10-13
 
 import requests
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 import logging
+import pandas as pd
 import yaml
 from pathlib import Path
 
+from .alert_dispatcher import AlertDispatcher, slack_channel, telegram_channel
+from .demurrage_scanner import scan_demurrage
+
 
 class WorkflowAutomator:
     """
     RPA 및 알림 자동화
 
     Features:
-    - Telegram/Slack 알림 발송
+    - Telegram/Slack 알림 발송 (백그라운드 큐, 배치/재시도)
     - DO Validity 만료 체크 (Demurrage Risk)
+    - DO 배치 스캔 (DataFrame) + 실행당 1건 다이제스트 알림
     - 자동 경고 시스템
     - 불일치 항목 자동 플래그
     """
@@ -67,6 +72,12 @@ class WorkflowAutomator:
             self.config.get("notifications", {}).get("slack", {}).get("webhook_url", "")
         )
 
+        # 발송 설정 (async: 백그라운드 큐, false: 호출 시 즉시 발송)
+        self.dispatch_config = self.config.get("notifications", {}).get("dispatch", {})
+        self.async_alerts = self.dispatch_config.get("async", True)
+        self._session = requests.Session()
+        self._dispatcher: Optional[AlertDispatcher] = None
+
         # Demurrage 설정
         self.demurrage_config = self.config.get("demurrage", {})
         self.warning_days = self.demurrage_config.get("warning_days_before_expiry", 3)
@@ -129,15 +140,95 @@ class WorkflowAutomator:
 
         # Telegram
         if "telegram" in channels and self.telegram_enabled:
-            results["telegram"] = self._send_telegram(message)
+            results["telegram"] = self._dispatch("telegram", message)
 
         # Slack
         if "slack" in channels and self.slack_enabled:
-            results["slack"] = self._send_slack(message)
+            results["slack"] = self._dispatch("slack", message)
 
         self.logger.info(f"Alert sent for {issue.get('type', 'UNKNOWN')}: {results}")
         return results
 
+    def trigger_digest(
+        self,
+        issues: List[Dict],
+        title: str = "HVDC Invoice Validation Digest",
+        channels: Optional[List[str]] = None,
+    ) -> Dict[str, bool]:
+        """
+        여러 이슈를 1건의 다이제스트 메시지로 발송 (채널별 요청 1회)
+
+        Args:
+            issues: 이슈 딕셔너리 리스트 (trigger_alert와 같은 형식)
+            title: 다이제스트 제목
+            channels: 알림 채널 리스트 ['telegram', 'slack']
+
+        Returns:
+            채널별 발송 성공 여부 (이슈가 없으면 빈 dict)
+        """
+        if not issues:
+            return {}
+
+        if channels is None:
+            channels = []
+            if self.telegram_enabled:
+                channels.append("telegram")
+            if self.slack_enabled:
+                channels.append("slack")
+
+        results = {}
+        message = self._format_digest_message(issues, title)
+
+        if "telegram" in channels and self.telegram_enabled:
+            results["telegram"] = self._dispatch("telegram", message)
+
+        if "slack" in channels and self.slack_enabled:
+            results["slack"] = self._dispatch("slack", message)
+
+        self.logger.info(f"Digest sent for {len(issues)} issue(s): {results}")
+        return results
+
+    def _format_digest_message(
+        self, issues: List[Dict], title: str, max_lines: int = 50
+    ) -> str:
+        """다이제스트 메시지 포맷팅 (심각도순, 최대 max_lines줄)"""
+        severity_emoji = {"CRITICAL": "🔴", "HIGH": "🟠", "MEDIUM": "🟡", "LOW": "🟢"}
+        order = {severity: i for i, severity in enumerate(severity_emoji)}
+
+        counts: Dict[str, int] = {}
+        for issue in issues:
+            severity = issue.get("severity", "LOW")
+            counts[severity] = counts.get(severity, 0) + 1
+
+        ranked = sorted(
+            issues, key=lambda issue: order.get(issue.get("severity", "LOW"), len(order))
+        )
+        lines = [
+            f"{severity_emoji.get(issue.get('severity', 'LOW'), '⚪')} "
+            f"[{issue.get('type', 'UNKNOWN')}] {issue.get('item_code', 'N/A')}: "
+            f"{issue.get('details', 'No details provided')}"
+            for issue in ranked[:max_lines]
+        ]
+        if len(issues) > max_lines:
+            lines.append(f"... and {len(issues) - max_lines} more")
+
+        breakdown = ", ".join(
+            f"{severity}: {counts[severity]}"
+            for severity in sorted(counts, key=lambda s: order.get(s, len(order)))
+        )
+
+        message = f"""
+📋 **{title}**
+
+**Issues**: {len(issues)} ({breakdown})
+
+{chr(10).join(lines)}
+
+**Timestamp**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        """.strip()
+
+        return message
+
     def _format_alert_message(self, issue: Dict) -> str:
         """알림 메시지 포맷팅"""
         severity_emoji = {"CRITICAL": "🔴", "HIGH": "🟠", "MEDIUM": "🟡", "LOW": "🟢"}
@@ -162,6 +253,73 @@ class WorkflowAutomator:
 
         return message
 
+    def _get_dispatcher(self) -> AlertDispatcher:
+        """백그라운드 발송기 (설정된 채널만 등록, 첫 사용 시 생성)"""
+        if self._dispatcher is None:
+            min_interval = self.dispatch_config.get("min_interval_seconds", 1.0)
+            channels = []
+            if self.telegram_token and self.telegram_channel:
+                channels.append(
+                    telegram_channel(
+                        self.telegram_token,
+                        self.telegram_channel,
+                        min_interval=min_interval,
+                    )
+                )
+            if self.slack_webhook:
+                channels.append(
+                    slack_channel(self.slack_webhook, min_interval=min_interval)
+                )
+
+            self._dispatcher = AlertDispatcher(
+                channels,
+                batch_window=self.dispatch_config.get("batch_window_seconds", 0.5),
+                max_retries=self.dispatch_config.get("max_retries", 4),
+                backoff_base=self.dispatch_config.get("backoff_base_seconds", 1.0),
+                backoff_max=self.dispatch_config.get("backoff_max_seconds", 30.0),
+                session=self._session,
+                logger=self.logger,
+            )
+        return self._dispatcher
+
+    def _dispatch(self, channel: str, message: str) -> bool:
+        """
+        채널로 메시지 발송 (async면 큐에 추가 후 즉시 반환)
+
+        Returns:
+            sync: 발송 성공 여부 / async: 큐 추가 여부
+        """
+        sender = self._send_telegram if channel == "telegram" else self._send_slack
+
+        if not self.async_alerts:
+            return sender(message)
+
+        dispatcher = self._get_dispatcher()
+        if channel not in dispatcher.channels:
+            # 미설정 채널: 동기 sender가 경고 로그 후 False 반환 (네트워크 없음)
+            return sender(message)
+        return dispatcher.submit(channel, message)
+
+    def flush_alerts(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 알림 발송 완료까지 대기
+
+        Returns:
+            timeout 전에 모두 처리되었으면 True
+        """
+        if self._dispatcher is None:
+            return True
+        return self._dispatcher.flush(timeout)
+
+    def close(self, timeout: Optional[float] = 30.0) -> bool:
+        """남은 알림 flush 후 발송기/세션 종료"""
+        drained = True
+        if self._dispatcher is not None:
+            drained = self._dispatcher.close(timeout)
+            self._dispatcher = None
+        self._session.close()
+        return drained
+
     def _send_telegram(self, message: str) -> bool:
         """Telegram 메시지 발송"""
         if not self.telegram_token or not self.telegram_channel:
@@ -176,7 +334,7 @@ class WorkflowAutomator:
         }
 
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._session.post(url, json=payload, timeout=10)
 
             if response.status_code == 200:
                 self.logger.info("Telegram message sent successfully")
@@ -200,7 +358,7 @@ class WorkflowAutomator:
         payload = {"text": message, "mrkdwn": True}
 
         try:
-            response = requests.post(self.slack_webhook, json=payload, timeout=10)
+            response = self._session.post(self.slack_webhook, json=payload, timeout=10)
 
             if response.status_code == 200:
                 self.logger.info("Slack message sent successfully")
@@ -413,25 +571,138 @@ class WorkflowAutomator:
         )
         return result
 
-    def batch_check_demurrage(self, do_list: List[Dict]) -> List[Dict]:
+    def scan_demurrage(
+        self, do_frame: pd.DataFrame, now: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        DO DataFrame Demurrage Risk 스캔 (알림 없음)
+
+        Args:
+            do_frame: DO 데이터 (delivery_valid_until, quantity, do_number, ...)
+            now: 기준 시각 (기본: 현재)
+
+        Returns:
+            validity_date, days_remaining, risk_level, status, cost_usd 컬럼 추가
+        """
+        return scan_demurrage(
+            do_frame,
+            now=now,
+            warning_days=self.warning_days,
+            cost_per_day=self.cost_per_day,
+        )
+
+    def batch_check_demurrage(
+        self,
+        do_list: Union[List[Dict], pd.DataFrame],
+        now: Optional[datetime] = None,
+    ) -> List[Dict]:
         """
         여러 DO의 Demurrage Risk 배치 체크
 
+        DO별 check_demurrage_risk 대신 DataFrame으로 한 번에 스캔하고,
+        알림은 실행당 1건의 다이제스트로 발송
+
         Args:
-            do_list: DO 데이터 리스트
+            do_list: DO 데이터 리스트 또는 DataFrame
+            now: 기준 시각 (기본: 현재)
 
         Returns:
-            리스크 정보 리스트
+            리스크 정보 리스트 (check_demurrage_risk와 같은 형식)
         """
+        if not self.demurrage_config.get("enabled", True):
+            return []
+
+        do_frame = (
+            do_list if isinstance(do_list, pd.DataFrame) else pd.DataFrame(do_list)
+        )
+        scanned = self.scan_demurrage(do_frame, now=now)
+
+        failed = scanned.loc[scanned["parse_failed"], "delivery_valid_until"]
+        if len(failed):
+            self.logger.warning(
+                f"Cannot parse {len(failed)} DO validity date(s): "
+                f"{failed.head(5).tolist()}"
+            )
+
         risks = []
+        alerts = []
+        flagged = scanned[scanned["status"].notna()]
+
+        def column(name):
+            if name not in flagged:
+                return [None] * len(flagged)
+            return flagged[name].tolist()
+
+        for (
+            status, risk_level, days, cost, validity, do_number, containers, item_code
+        ) in zip(
+            column("status"),
+            column("risk_level"),
+            column("days_remaining"),
+            column("cost_usd"),
+            column("validity_date"),
+            column("do_number"),
+            column("containers"),
+            column("item_code"),
+        ):
+            if not isinstance(do_number, str) and pd.isna(do_number):
+                do_number = None
+            if not isinstance(containers, list):
+                containers = []
+            if not isinstance(item_code, str):
+                item_code = "UNKNOWN"
+            validity_date = validity.isoformat()
+
+            if status == "EXPIRED":
+                days_overdue = abs(days)
+                risks.append(
+                    {
+                        "risk_level": "CRITICAL",
+                        "status": "EXPIRED",
+                        "days_overdue": days_overdue,
+                        "estimated_cost_usd": cost,
+                        "do_number": do_number,
+                        "validity_date": validity_date,
+                        "containers": containers,
+                    }
+                )
+                alerts.append(
+                    {
+                        "type": "DEMURRAGE_EXPIRED",
+                        "severity": "CRITICAL",
+                        "item_code": item_code,
+                        "details": f"DO {do_number} expired {days_overdue} days ago. "
+                        f"Estimated demurrage cost: ${cost:.2f}",
+                        "action": "Immediate container return required to avoid additional charges",
+                    }
+                )
+            else:
+                risks.append(
+                    {
+                        "risk_level": risk_level,
+                        "status": "WARNING",
+                        "days_remaining": days,
+                        "potential_cost_usd": cost,
+                        "do_number": do_number,
+                        "validity_date": validity_date,
+                        "containers": containers,
+                    }
+                )
+                alerts.append(
+                    {
+                        "type": "DEMURRAGE_RISK",
+                        "severity": risk_level,
+                        "item_code": item_code,
+                        "details": f"DO {do_number} expires in {days} day(s). "
+                        f"Potential demurrage cost: ${cost:.2f}/day",
+                        "action": f"Arrange container return within {days} day(s)",
+                    }
+                )
 
-        for do_data in do_list:
-            risk = self.check_demurrage_risk(do_data)
-            if risk:
-                risks.append(risk)
+        self.trigger_digest(alerts, title="HVDC Demurrage Risk Digest")
 
         self.logger.info(
-            f"Batch demurrage check: {len(risks)} risks found out of {len(do_list)} DOs"
+            f"Batch demurrage check: {len(risks)} risks found out of {len(do_frame)} DOs"
         )
         return risks
 
@@ -496,8 +767,8 @@ class WorkflowAutomator:
 
         # 알림 발송
         if total_items > 0:
-            self._send_telegram(message)
-            self._send_slack(message)
+            self._dispatch("telegram", message)
+            self._dispatch("slack", message)
 
         self.logger.info(
             f"Daily summary generated: {total_items} items, {summary['pass_rate']}% pass rate"
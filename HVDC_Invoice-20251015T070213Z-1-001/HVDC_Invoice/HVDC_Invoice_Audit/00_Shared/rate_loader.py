@@ -8,6 +8,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
+from cost_guard import assign_bands, delta_percent
+
 
 class UnifiedRateLoader:
     """통합 요율 데이터 로더"""
@@ -263,11 +265,8 @@ class UnifiedRateLoader:
         Returns:
             Delta % (소수점 2자리)
         """
-        if ref_rate == 0:
-            return 0.00  # 0으로 나누기 방지
-
-        delta = ((draft_rate - ref_rate) / ref_rate) * 100
-        return round(delta, 2)
+        # Ref = 0 → 0.00 (0으로 나누기 방지)
+        return delta_percent(draft_rate, ref_rate, zero_ref=0.0)
 
     def get_cost_guard_band(self, delta_pct: float) -> str:
         """
@@ -279,13 +278,9 @@ class UnifiedRateLoader:
         Returns:
             "PASS" | "WARN" | "HIGH" | "CRITICAL"
         """
-        abs_delta = abs(delta_pct)
-
-        for threshold, band in self.COST_GUARD_BANDS:
-            if abs_delta <= threshold:
-                return band
-
-        return "CRITICAL"
+        thresholds = [threshold for threshold, _ in self.COST_GUARD_BANDS[:-1]]
+        names = [band for _, band in self.COST_GUARD_BANDS]
+        return str(assign_bands([delta_pct], thresholds, names, na_band="CRITICAL")[0])
 
     def get_tolerance(self) -> float:
         """Tolerance 값 반환 (3%)"""
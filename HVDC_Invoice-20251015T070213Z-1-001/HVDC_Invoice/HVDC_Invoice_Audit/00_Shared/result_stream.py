@@ -0,0 +1,334 @@
+"""
+Result Stream Module
+====================
+
+감사 항목 스트리밍 저장 (NDJSON / CSV / JSON 문서)
+
+- 항목을 검증 직후 1건씩 기록 → 전체 결과 dict/DataFrame 없이 메모리 일정
+- flush_every 항목마다 flush → 실행 중에도 다른 도구가 읽기 시작 가능 (iter_ndjson)
+- NDJSON 마지막 줄: {"_summary": {...}} 요약 footer
+- CSV: footer 행 대신 <파일명>.summary.json (Excel/pandas CSV 리더 호환)
+- orjson 설치 시 직렬화 백엔드로 사용 (없으면 표준 json, 두 백엔드 출력 동일)
+
+Author: HVDC Logistics Team
+Version: 1.0.0
+Last Updated: 2026-10-19
+"""
+
+import csv
+import json
+import math
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+from item_records import json_default
+
+try:
+    import orjson
+
+    ORJSON_OK = True
+except ImportError:
+    ORJSON_OK = False
+
+SUMMARY_KEY = "_summary"
+
+PathLike = Union[str, Path]
+
+
+def _finite(obj: Any) -> Any:
+    """NaN/Infinity → None (dict/list/tuple 재귀)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson default: float 하위 타입(np.float64) → float, 그 외 json_default"""
+    if isinstance(obj, float):
+        return float(obj)
+    return json_default(obj)
+
+
+def _json_dumps(obj: Any, indent: bool) -> bytes:
+    options = {
+        "ensure_ascii": False,
+        "indent": 2 if indent else None,
+        "separators": (",", ": ") if indent else (",", ":"),
+        "allow_nan": False,
+    }
+    try:
+        text = json.dumps(obj, default=json_default, **options)
+    except ValueError as exc:
+        if "Out of range float" not in str(exc):
+            raise
+        text = json.dumps(
+            _finite(obj), default=lambda o: _finite(json_default(o)), **options
+        )
+    return text.encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    JSON 직렬화 (UTF-8 bytes)
+
+    orjson 설치 시 orjson, 없으면 json (ensure_ascii=False). 두 백엔드 출력 동일:
+    - 구분자 "," / ":" (indent 시 ": ")
+    - np.float64 → 숫자, datetime/date → str() ("2025-09-01 12:00:00")
+    - NaN/Infinity → null (orjson.loads로 다시 읽을 수 있는 JSON)
+    - ItemRecord 등 기본 미지원 타입은 json_default로 변환
+    |x| < 1e-4, ≥ 1e16 실수의 지수 표기만 다름 (1e-05 / 1e-5, 같은 값).
+    """
+    if ORJSON_OK:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            pass  # 64bit 초과 정수 등 → json
+    return _json_dumps(obj, indent)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    return orjson.loads(data) if ORJSON_OK else json.loads(data)
+
+
+def summary_path(path: PathLike) -> Path:
+    """CSV 요약 파일 경로 (result.csv → result.summary.json)"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.summary.json")
+
+
+class ResultStreamWriter:
+    """
+    감사 항목 스트리밍 기록기
+
+    Features:
+    - NDJSON (.ndjson/.jsonl) 또는 CSV (.csv), 확장자로 자동 선택
+    - 항목 수 / status별 건수 / 금액 합계 누적 → close() 시 요약 기록
+    - with 블록에서 예외 발생 시에도 요약 기록 (complete=False)
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        fmt: Optional[str] = None,
+        fieldnames: Optional[Sequence[str]] = None,
+        expand: Optional[Callable[[Any], Dict[str, Any]]] = None,
+        status_key: str = "status",
+        amount_key: Optional[str] = None,
+        flush_every: int = 100,
+        encoding: str = "utf-8-sig",
+    ):
+        """
+        Args:
+            path: 출력 파일 경로
+            fmt: "ndjson" 또는 "csv" (기본: 확장자)
+            fieldnames: CSV 컬럼 (기본: 첫 항목의 키)
+            expand: 기록 전 항목 변환 (예: ShipmentDocs.expand)
+            status_key: 요약 status_counts 기준 키
+            amount_key: 요약 amount_total 합산 키
+            flush_every: flush 간격 (항목 수)
+            encoding: CSV 인코딩 (기존 to_csv와 같은 utf-8-sig)
+        """
+        self.path = Path(path)
+        self.fmt = fmt or ("csv" if self.path.suffix.lower() == ".csv" else "ndjson")
+        if self.fmt not in ("ndjson", "csv"):
+            raise ValueError(f"Unsupported stream format: {self.fmt}")
+
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.expand = expand
+        self.status_key = status_key
+        self.amount_key = amount_key
+        self.flush_every = max(1, flush_every)
+
+        self.count = 0
+        self.status_counts: Counter = Counter()
+        self.amount_total = 0.0
+        self.started_at = datetime.now().isoformat()
+        self.summary: Optional[Dict[str, Any]] = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fmt == "csv":
+            self._file = open(self.path, "w", encoding=encoding, newline="")
+            self._writer: Optional[csv.DictWriter] = None
+        else:
+            self._file = open(self.path, "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(complete=exc_type is None)
+        return False
+
+    def write(self, item: Any):
+        """항목 1건 기록"""
+        row = self.expand(item) if self.expand else item
+
+        if self.fmt == "csv":
+            if self._writer is None:
+                self._writer = csv.DictWriter(
+                    self._file,
+                    fieldnames=self.fieldnames or list(row),
+                    restval="",
+                    extrasaction="ignore",
+                    lineterminator="\n",  # DataFrame.to_csv와 같은 줄바꿈
+                )
+                self._writer.writeheader()
+            self._writer.writerow(row)
+        else:
+            self._file.write(dumps(row) + b"\n")
+
+        self.count += 1
+        status = row.get(self.status_key)
+        if status is not None:
+            self.status_counts[status] += 1
+        if self.amount_key:
+            self.amount_total += row.get(self.amount_key) or 0
+
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        """항목 여러 건 기록 (기록 건수 반환)"""
+        before = self.count
+        for item in items:
+            self.write(item)
+        return self.count - before
+
+    def close(
+        self, extra: Optional[Dict[str, Any]] = None, complete: bool = True
+    ) -> Dict[str, Any]:
+        """
+        요약 기록 후 파일 닫기
+
+        Args:
+            extra: 요약에 추가할 항목 (예: 감사 통계)
+            complete: 정상 종료 여부
+
+        Returns:
+            요약 dict (이미 닫혔으면 기존 요약)
+        """
+        if self.summary is not None:
+            return self.summary
+
+        summary = {
+            "item_count": self.count,
+            "status_counts": dict(self.status_counts),
+            "started_at": self.started_at,
+            "finished_at": datetime.now().isoformat(),
+            "complete": complete,
+            "backend": "orjson" if ORJSON_OK else "json",
+        }
+        if self.amount_key:
+            summary["amount_total"] = round(self.amount_total, 2)
+        if extra:
+            summary.update(extra)
+
+        if self.fmt == "csv":
+            if self._writer is None and self.fieldnames:
+                csv.writer(self._file, lineterminator="\n").writerow(self.fieldnames)
+            self._file.close()
+            summary_path(self.path).write_bytes(dumps(summary, indent=True))
+        else:
+            self._file.write(dumps({SUMMARY_KEY: summary}) + b"\n")
+            self._file.close()
+
+        self.summary = summary
+        return summary
+
+
+def write_json_document(path: PathLike, document: Dict[str, Any], items_key: str) -> int:
+    """
+    JSON 문서 스트리밍 기록 (items_key 배열은 항목별 직렬화)
+
+    json.dump(indent=2)와 같은 구조·키 순서를 유지하되, 전체 문서를 한 번에
+    인코딩하지 않고 항목을 1줄씩 기록한다.
+
+    Returns:
+        기록한 항목 수
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+
+    with open(path, "wb") as f:
+        f.write(b"{")
+        for index, (key, value) in enumerate(document.items()):
+            f.write(b",\n  " if index else b"\n  ")
+            f.write(dumps(key) + b": ")
+            if key != items_key:
+                f.write(dumps(value))
+                continue
+
+            f.write(b"[")
+            for item in value:
+                f.write(b",\n    " if count else b"\n    ")
+                f.write(dumps(item))
+                count += 1
+            f.write(b"\n  ]" if count else b"]")
+        f.write(b"\n}\n")
+
+    return count
+
+
+def iter_ndjson(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """
+    NDJSON 항목 읽기 (요약 줄 제외)
+
+    기록 중인 파일도 읽을 수 있도록 줄바꿈으로 끝나지 않은 마지막 줄은 건너뛴다.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            record = loads(line)
+            if SUMMARY_KEY in record and len(record) == 1:
+                continue
+            yield record
+
+
+def read_summary(path: PathLike) -> Optional[Dict[str, Any]]:
+    """
+    스트림 요약 읽기 (아직 기록 중이면 None)
+
+    NDJSON은 마지막 줄만 읽고, CSV는 summary.json 파일을 읽는다.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        sidecar = summary_path(path)
+        return loads(sidecar.read_bytes()) if sidecar.exists() else None
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        block = 4096
+        data = b""
+        while end > 0 and data.count(b"\n") < 2:
+            start = max(0, end - block)
+            f.seek(start)
+            data = f.read(end - start) + data
+            end = start
+
+    lines = data.rstrip(b"\n").split(b"\n")
+    if not lines or not lines[-1]:
+        return None
+    try:
+        record = loads(lines[-1])
+    except ValueError:
+        return None
+    if isinstance(record, dict) and SUMMARY_KEY in record and len(record) == 1:
+        return record[SUMMARY_KEY]
+    return None
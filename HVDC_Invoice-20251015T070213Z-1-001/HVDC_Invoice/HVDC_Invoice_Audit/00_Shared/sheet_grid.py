@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+SheetGrid - 시트 값 2-D 배열
+read_only 워크북 시트를 iter_rows(values_only=True)로 한 번만 읽어
+레이블/헤더/데이터 조회를 메모리 배열에서 처리 (ws.cell() 반복 호출 제거)
+
+Version: 1.0.0
+Created: 2026-10-19
+"""
+
+from pathlib import Path
+from typing import Any, List, Sequence, Tuple
+
+import openpyxl
+
+
+def open_workbook_readonly(excel_path: Path):
+    """값 전용(read_only + data_only) 워크북 열기 - 사용 후 close() 필요"""
+    return openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+
+
+class SheetGrid:
+    """
+    시트 값 2-D 배열 (openpyxl과 같은 1-based 행/열 좌표)
+
+    범위 밖 좌표는 ws.cell(...).value와 마찬가지로 None 반환.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[Any]]):
+        width = max((len(r) for r in rows), default=0)
+        # 행 길이 맞춤 (read_only 시트는 행마다 길이가 다를 수 있음)
+        self.rows: List[Tuple[Any, ...]] = [
+            tuple(r) + (None,) * (width - len(r)) for r in rows
+        ]
+        self.max_row = len(self.rows)
+        self.max_column = width
+
+    @classmethod
+    def from_worksheet(cls, ws) -> "SheetGrid":
+        """시트 전체를 한 번에 값 배열로 변환"""
+        if hasattr(ws, "reset_dimensions"):
+            # read_only 시트는 <dimension> 태그 범위만 읽음 → 태그가 오래되면 행이 잘림
+            ws.reset_dimensions()
+        return cls(list(ws.iter_rows(values_only=True)))
+
+    def value(self, row: int, col: int) -> Any:
+        """1-based (row, col) 값"""
+        if 1 <= row <= self.max_row and 1 <= col <= self.max_column:
+            return self.rows[row - 1][col - 1]
+        return None
+
+    def row(self, row: int) -> Tuple[Any, ...]:
+        """1-based 행 전체 값 (max_column 길이)"""
+        if 1 <= row <= self.max_row:
+            return self.rows[row - 1]
+        return (None,) * self.max_column
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Supporting Documents 디렉토리 인덱스
+증빙문서 폴더를 한 번만 스캔하여 Shipment(Order Ref) → PDF 목록 조회를 메모리에서 처리
+
+- 하위 디렉토리 단위 PDF 목록 (MasterDataValidator.map_masterdata_to_pdf)
+- 전체 재귀 PDF 목록 + 파일 크기 (ShipmentAuditEngine.map_supporting_documents)
+- 디렉토리 mtime 변경 시에만 재스캔 (네트워크 드라이브 반복 listing 제거)
+
+Version: 1.0.0
+Created: 2026-10-19
+Author: MACHO-GPT v3.4-mini HVDC Project Enhancement
+"""
+
+import fnmatch
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_ref(text: str) -> str:
+    """공백, 쉼표 제거하고 소문자로 변환"""
+    return str(text).replace(" ", "").replace(",", "").lower()
+
+
+class SupportingDocsIndex:
+    """증빙문서 폴더 인덱스 (디렉토리 mtime 기반 무효화)"""
+
+    def __init__(self, root: Path, pattern: str = "*.pdf"):
+        self.root = Path(root)
+        self.pattern = pattern
+        self._lock = threading.Lock()
+        self._dir_mtimes: Dict[str, int] = {}
+        # 최상위 하위 디렉토리: (이름, 정규화 이름, 직속 PDF 목록) - 디렉토리 순서 유지
+        self._subdirs: List[Tuple[str, str, List[Path]]] = []
+        # 재귀 PDF 목록: (경로, 크기)
+        self._files: List[Tuple[Path, int]] = []
+        self._ref_cache: Dict[str, List[Path]] = {}
+        self._scanned = False
+
+    # ==================== 스캔/무효화 ====================
+
+    def _scan(self) -> None:
+        dir_mtimes: Dict[str, int] = {}
+        subdirs: List[Tuple[str, str, List[Path]]] = []
+        files: List[Tuple[Path, int]] = []
+
+        if self.root.is_dir():
+            dir_mtimes[str(self.root)] = self.root.stat().st_mtime_ns
+            for entry in os.scandir(self.root):
+                if entry.is_dir():
+                    pdfs = self._walk(Path(entry.path), dir_mtimes, files)
+                    subdirs.append((entry.name, normalize_ref(entry.name), pdfs))
+                elif fnmatch.fnmatch(entry.name, self.pattern):
+                    files.append((Path(entry.path), entry.stat().st_size))
+
+        self._dir_mtimes = dir_mtimes
+        self._subdirs = subdirs
+        self._files = files
+        self._ref_cache = {}
+        self._scanned = True
+        logger.info(
+            f"[DOCS INDEX] {self.root.name}: {len(subdirs)} folders, {len(files)} PDFs"
+        )
+
+    def _walk(
+        self, directory: Path, dir_mtimes: Dict[str, int], files: List[Tuple[Path, int]]
+    ) -> List[Path]:
+        """디렉토리 재귀 스캔, 직속 PDF 목록 반환"""
+        direct: List[Path] = []
+        try:
+            dir_mtimes[str(directory)] = directory.stat().st_mtime_ns
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            logger.warning(f"[DOCS INDEX] Scan failed: {directory} ({e})")
+            return direct
+
+        for entry in entries:
+            if entry.is_dir():
+                self._walk(Path(entry.path), dir_mtimes, files)
+            elif fnmatch.fnmatch(entry.name, self.pattern):
+                path = Path(entry.path)
+                direct.append(path)
+                files.append((path, entry.stat().st_size))
+        return direct
+
+    def is_stale(self) -> bool:
+        """스캔 이후 디렉토리(하위 포함) mtime 변경 여부"""
+        if not self._scanned:
+            return True
+        if not self.root.is_dir():
+            return bool(self._dir_mtimes)
+        for directory, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def refresh(self, force: bool = False) -> "SupportingDocsIndex":
+        """변경된 경우에만 재스캔 (검증 실행 시작 시 1회 호출)"""
+        with self._lock:
+            if force or self.is_stale():
+                self._scan()
+        return self
+
+    def _ensure(self) -> None:
+        if not self._scanned:
+            self.refresh()
+
+    # ==================== 조회 ====================
+
+    @property
+    def exists(self) -> bool:
+        """스캔 시점에 루트 폴더가 존재했는지"""
+        self._ensure()
+        return bool(self._dir_mtimes)
+
+    def pdfs_for_ref(self, order_ref: str) -> List[Path]:
+        """
+        Order Ref → 첫 번째 매칭 하위 디렉토리의 PDF 목록
+
+        매칭: 원본 부분 문자열 또는 정규화(공백/쉼표 제거, 소문자) 부분 문자열
+        """
+        self._ensure()
+        order_ref = str(order_ref)
+        cached = self._ref_cache.get(order_ref)
+        if cached is not None:
+            return list(cached)
+
+        normalized = normalize_ref(order_ref)
+        pdf_files: List[Path] = []
+        for name, name_normalized, pdfs in self._subdirs:
+            if order_ref in name or normalized in name_normalized:
+                pdf_files = pdfs
+                break  # 첫 번째 매칭 디렉토리만 사용
+
+        self._ref_cache[order_ref] = pdf_files
+        return list(pdf_files)
+
+    def files(self) -> List[Tuple[Path, int]]:
+        """재귀 PDF 목록 (경로, 크기)"""
+        self._ensure()
+        return list(self._files)
+
+
+_INDEXES: Dict[str, SupportingDocsIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_docs_index(root: Path, refresh: bool = False) -> SupportingDocsIndex:
+    """
+    프로세스 공용 인덱스 조회 (Validator/Audit Engine 간 공유)
+
+    Args:
+        root: 증빙문서 루트 폴더
+        refresh: True면 mtime 변경 확인 후 필요 시 재스캔
+    """
+    key = os.path.abspath(root)  # resolve()는 경로마다 stat 발생
+    with _INDEXES_LOCK:
+        index: Optional[SupportingDocsIndex] = _INDEXES.get(key)
+        if index is None:
+            index = SupportingDocsIndex(Path(root))
+            _INDEXES[key] = index
+    if refresh:
+        index.refresh()
+    return index
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Alert Dispatcher 테스트
+로컬 HTTP 스텁으로 비동기 발송, 배치 합치기, 재시도/백오프, Retry-After,
+연결 재사용, 종료 시 flush 확인
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf_integration.alert_dispatcher import (
+    BATCH_SEPARATOR,
+    AlertDispatcher,
+    batch_messages,
+    slack_channel,
+)
+from pdf_integration.workflow_automator import WorkflowAutomator
+
+
+class WebhookStub:
+    """응답 순서를 지정할 수 있는 로컬 webhook (HTTP/1.1 keep-alive)"""
+
+    def __init__(self):
+        self.requests = []  # (수신 시각, 클라이언트 포트, payload)
+        self.responses = []  # (status, headers) — 비면 200
+        self.delay = 0.0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                payload = json.loads(self.rfile.read(length))
+                time.sleep(stub.delay)
+                stub.requests.append((time.monotonic(), self.client_address[1], payload))
+                status, headers = stub.responses.pop(0) if stub.responses else (200, {})
+                body = b"ok"
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def texts(self):
+        return [payload["text"] for _, _, payload in self.requests]
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    webhook = WebhookStub()
+    yield webhook
+    webhook.stop()
+
+
+def _dispatcher(stub, **kwargs):
+    kwargs.setdefault("batch_window", 0.05)
+    kwargs.setdefault("backoff_base", 0.05)
+    return AlertDispatcher([slack_channel(stub.url, min_interval=0.0)], **kwargs)
+
+
+class TestBatchMessages:
+    """길이 제한 내 배치 합치기"""
+
+    def test_respects_max_chars_and_order(self):
+        messages = [f"message {i} " + "x" * 30 for i in range(10)]
+        batches = batch_messages(messages, max_chars=100)
+
+        assert all(len(batch) <= 100 for batch in batches)
+        assert BATCH_SEPARATOR.join(batches).split(BATCH_SEPARATOR) == messages
+
+    def test_oversized_message_is_sent_alone(self):
+        assert batch_messages(["a" * 50, "b"], max_chars=10) == ["a" * 50, "b"]
+
+
+class TestAlertDispatcher:
+    """백그라운드 큐 발송"""
+
+    def test_submit_does_not_block_and_batches(self, stub):
+        stub.delay = 0.2
+        dispatcher = _dispatcher(stub)
+
+        started = time.monotonic()
+        for i in range(100):
+            assert dispatcher.submit("slack", f"issue {i}")
+        assert time.monotonic() - started < 0.1
+
+        assert dispatcher.flush(timeout=10)
+        texts = stub.texts()
+        assert len(texts) < 10
+        assert BATCH_SEPARATOR.join(texts).split(BATCH_SEPARATOR) == [
+            f"issue {i}" for i in range(100)
+        ]
+        assert dispatcher.stats["sent"] == 100
+        dispatcher.close()
+
+    def test_reuses_connection(self, stub):
+        dispatcher = _dispatcher(stub, batch_window=0.0)
+        for i in range(3):
+            dispatcher.submit("slack", f"issue {i}")
+            dispatcher.flush(timeout=5)
+
+        assert len(stub.requests) == 3
+        assert len({port for _, port, _ in stub.requests}) == 1
+        dispatcher.close()
+
+    def test_retries_server_errors_with_backoff(self, stub):
+        stub.responses = [(500, {}), (503, {})]
+        dispatcher = _dispatcher(stub)
+
+        dispatcher.submit("slack", "issue")
+        assert dispatcher.flush(timeout=5)
+
+        times = [t for t, _, _ in stub.requests]
+        assert len(times) == 3
+        # 0.05초 → 0.1초 (지수 백오프)
+        assert times[1] - times[0] >= 0.05
+        assert times[2] - times[1] >= 0.1
+        assert dispatcher.stats == {
+            "queued": 1, "sent": 1, "failed": 0, "requests": 3, "retries": 2
+        }
+        dispatcher.close()
+
+    def test_honours_retry_after(self, stub):
+        stub.responses = [(429, {"Retry-After": "0.3"})]
+        dispatcher = _dispatcher(stub)
+
+        dispatcher.submit("slack", "issue")
+        assert dispatcher.flush(timeout=5)
+
+        times = [t for t, _, _ in stub.requests]
+        assert len(times) == 2
+        assert times[1] - times[0] >= 0.3
+        dispatcher.close()
+
+    def test_client_errors_are_not_retried(self, stub):
+        stub.responses = [(400, {})]
+        dispatcher = _dispatcher(stub)
+
+        dispatcher.submit("slack", "issue")
+        assert dispatcher.flush(timeout=5)
+
+        assert len(stub.requests) == 1
+        assert dispatcher.stats["failed"] == 1
+        dispatcher.close()
+
+    def test_gives_up_after_max_retries(self, stub):
+        stub.responses = [(500, {})] * 3
+        dispatcher = _dispatcher(stub, max_retries=2)
+
+        dispatcher.submit("slack", "issue")
+        assert dispatcher.flush(timeout=5)
+
+        assert len(stub.requests) == 3
+        assert dispatcher.stats["failed"] == 1
+        dispatcher.close()
+
+    def test_unexpected_error_does_not_hang_flush(self, stub):
+        def build_payload(text):
+            if "bad" in text:
+                raise ValueError("payload error")
+            return {"text": text}
+
+        channel = slack_channel(stub.url, min_interval=0.0)
+        channel.build_payload = build_payload
+        dispatcher = AlertDispatcher([channel], batch_window=0.05)
+
+        dispatcher.submit("slack", "bad issue")
+        assert dispatcher.flush(timeout=5)
+        assert dispatcher.stats["failed"] == 1
+
+        dispatcher.submit("slack", "next issue")
+        assert dispatcher.flush(timeout=5)
+        assert stub.texts() == ["next issue"]
+        assert dispatcher.stats["sent"] == 1
+        dispatcher.close()
+
+    def test_min_interval_between_posts(self, stub):
+        dispatcher = AlertDispatcher(
+            [slack_channel(stub.url, min_interval=0.2, max_chars=10)], batch_window=0.05
+        )
+        dispatcher.submit("slack", "a" * 8)
+        dispatcher.submit("slack", "b" * 8)
+        assert dispatcher.flush(timeout=5)
+
+        times = [t for t, _, _ in stub.requests]
+        assert len(times) == 2
+        assert times[1] - times[0] >= 0.2
+        dispatcher.close()
+
+    def test_close_flushes_pending(self, stub):
+        stub.delay = 0.1
+        dispatcher = _dispatcher(stub)
+        dispatcher.submit("slack", "last issue")
+
+        assert dispatcher.close(timeout=5)
+        assert stub.texts() == ["last issue"]
+        assert dispatcher.submit("slack", "after close") is False
+
+    def test_unknown_channel(self, stub):
+        dispatcher = _dispatcher(stub)
+        assert dispatcher.submit("telegram", "issue") is False
+        assert dispatcher.flush(timeout=0)
+        dispatcher.close()
+
+
+def _automator(tmp_path, url, **dispatch):
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        yaml.safe_dump(
+            {
+                "notifications": {
+                    "slack": {"enabled": True, "webhook_url": url},
+                    "dispatch": dispatch,
+                }
+            }
+        )
+    )
+    return WorkflowAutomator(str(config))
+
+
+class TestWorkflowAutomatorDispatch:
+    """auto_flag_inconsistencies 알림이 감사 루프를 막지 않음"""
+
+    REPORT = {
+        "item_code": "HVDC-ADOPT-SCT-0126",
+        "overall_status": "FAIL",
+        "all_issues": [
+            {"type": "MBL_MISMATCH", "severity": "HIGH", "details": f"issue {i}"}
+            for i in range(50)
+        ],
+        "severity_breakdown": {"HIGH": 50, "MEDIUM": 0},
+    }
+
+    def test_async_flagging_returns_before_delivery(self, tmp_path, stub):
+        stub.delay = 0.2
+        automator = _automator(
+            tmp_path, stub.url, batch_window_seconds=0.05, min_interval_seconds=0.0
+        )
+
+        started = time.monotonic()
+        result = automator.auto_flag_inconsistencies(self.REPORT)
+        assert time.monotonic() - started < 0.2
+        assert result["notified_count"] == 51
+
+        assert automator.flush_alerts(timeout=10)
+        delivered = BATCH_SEPARATOR.join(stub.texts())
+        assert delivered.count("HVDC Invoice Validation Alert") == 51
+        assert len(stub.requests) < 51
+        automator.close()
+
+    def test_sync_mode_posts_inline(self, tmp_path, stub):
+        automator = _automator(tmp_path, stub.url, **{"async": False})
+        assert automator.trigger_alert({"type": "TEST", "severity": "LOW"}) == {
+            "slack": True
+        }
+        assert len(stub.requests) == 1
+        automator.close()
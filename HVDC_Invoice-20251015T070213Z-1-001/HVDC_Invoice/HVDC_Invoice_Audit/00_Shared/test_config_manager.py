@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+ConfigurationManager 스냅샷/hot-reload 테스트
+설정 파일 변경 시 스냅샷 교체, 파싱 실패 시 기존 스냅샷 유지 확인
+"""
+
+import dataclasses
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config_manager import CONFIG_FILES, ConfigSnapshot, ConfigurationManager
+from contract_rate_resolver import ContractRateResolver
+
+RATE_DIR = Path(__file__).parent.parent / "Rate"
+CONTRACT_FILE = CONFIG_FILES["contract_rates_config"]
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    for filename in CONFIG_FILES.values():
+        shutil.copy(RATE_DIR / filename, tmp_path / filename)
+    return tmp_path
+
+
+def _update_contract(config_dir: Path, fee: str, rate: float) -> None:
+    """fixed_fees 요율 변경 후 mtime을 확실히 증가시킴"""
+    path = config_dir / CONTRACT_FILE
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["fixed_fees"][fee]["rate"] = rate
+    before = path.stat().st_mtime_ns
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+class TestConfigSnapshot:
+    """스냅샷 구성"""
+
+    def test_snapshot_is_frozen(self, config_dir):
+        manager = ConfigurationManager(config_dir)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            manager.snapshot.version = 99
+
+    def test_nested_config_is_read_only(self, config_dir):
+        snapshot = ConfigurationManager(config_dir).snapshot
+        with pytest.raises(TypeError):
+            snapshot.cost_guard_bands["PASS"]["max_delta"] = 99.0
+        with pytest.raises(TypeError):
+            snapshot.lane_map["KP_DSV_YD"]["rate"] = 1.0
+        with pytest.raises(TypeError):
+            snapshot.contract_rates_config["fixed_fees"]["DO_FEE_AIR"]["rate"] = 1.0
+        keywords = snapshot.fixed_fees["DO_FEE_AIR"]["keywords"]
+        assert isinstance(keywords, tuple)
+
+    def test_precomputed_tables(self, config_dir):
+        snapshot = ConfigurationManager(config_dir).snapshot
+        assert isinstance(snapshot, ConfigSnapshot)
+        assert snapshot.version == 1
+        assert "KP_DSV_YD" in snapshot.lane_map
+        assert all(alias == alias.upper() for alias, _ in snapshot.port_aliases)
+        assert all(
+            kw == kw.upper() for _, keywords, _ in snapshot.fixed_fee_keywords for kw in keywords
+        )
+
+    def test_loads_lazily(self, config_dir):
+        manager = ConfigurationManager(config_dir)
+        assert not manager.is_loaded
+        assert manager.get_lane_rate("Khalifa Port", "Storage Yard") == 252.00
+        assert manager.is_loaded
+
+    def test_get_lane_map_returns_copy(self, config_dir):
+        manager = ConfigurationManager(config_dir)
+        lane_map = manager.get_lane_map()
+        lane_map.clear()
+        assert manager.get_lane_map()
+
+
+class TestHotReload:
+    """파일 변경 감지 및 스냅샷 교체"""
+
+    def test_refresh_if_changed(self, config_dir):
+        manager = ConfigurationManager(config_dir)
+        old = manager.snapshot
+        assert manager.refresh_if_changed() is False
+
+        _update_contract(config_dir, "DO_FEE_AIR", 999.0)
+        assert manager.refresh_if_changed() is True
+        assert manager.snapshot is not old
+        assert manager.snapshot.version == old.version + 1
+        assert manager.get_do_fee("AIR") == 999.0
+        # 기존 스냅샷은 변경되지 않음
+        assert old.fixed_fees["DO_FEE_AIR"]["rate"] != 999.0
+
+    def test_invalid_json_keeps_snapshot(self, config_dir):
+        manager = ConfigurationManager(config_dir)
+        old = manager.snapshot
+        path = config_dir / CONTRACT_FILE
+        before = path.stat().st_mtime_ns
+        path.write_text("{ broken", encoding="utf-8")
+        os.utime(path, ns=(before + 10**9, before + 10**9))
+
+        assert manager.refresh_if_changed() is False
+        assert manager.snapshot is old
+
+    def test_auto_reload_polls_on_access(self, config_dir):
+        manager = ConfigurationManager(config_dir, auto_reload=True, poll_interval=0.0)
+        manager.load_all_configs()
+        _update_contract(config_dir, "DO_FEE_CONTAINER", 321.0)
+        assert manager.get_do_fee("CONTAINER") == 321.0
+
+    def test_resolver_recompiles_after_swap(self, config_dir):
+        manager = ConfigurationManager(config_dir)
+        resolver = ContractRateResolver(manager)
+        assert resolver.fixed_rule("MASTER DO FEE").kind == "do_fee"
+
+        _update_contract(config_dir, "CUSTOMS_CLEARANCE_FEE", 175.0)
+        manager.refresh_if_changed()
+        assert resolver.fixed_rule("CUSTOMS CLEARANCE").rate == 175.0
+
+    def test_watcher_thread(self, config_dir):
+        manager = ConfigurationManager(config_dir)
+        manager.load_all_configs()
+        manager.start_watching(interval=0.05)
+        try:
+            _update_contract(config_dir, "DO_FEE_AIR", 111.0)
+            deadline = time.monotonic() + 5
+            while manager.snapshot.version == 1 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert manager.get_do_fee("AIR") == 111.0
+        finally:
+            manager.stop_watching()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+ContractRateResolver 테스트
+설정 1회 컴파일 결정 테이블이 ConfigurationManager 조회와 같은 요율을 반환하는지 검증
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config_manager import ConfigurationManager
+from contract_rate_resolver import ContractRateResolver, FixedFeeRule
+from rate_loader import UnifiedRateLoader
+
+RATE_DIR = Path(__file__).parent.parent / "Rate"
+
+
+@pytest.fixture(scope="module")
+def config_manager():
+    manager = ConfigurationManager(RATE_DIR)
+    manager.load_all_configs()
+    return manager
+
+
+@pytest.fixture(scope="module")
+def rate_loader():
+    loader = UnifiedRateLoader(RATE_DIR)
+    loader.load_all_rates()
+    return loader
+
+
+@pytest.fixture
+def resolver(config_manager, rate_loader):
+    return ContractRateResolver(config_manager, rate_loader)
+
+
+class TestShptResolve:
+    """SHPT 조회 순서 (fixed_fees → Standard Items → Inland Trucking)"""
+
+    def test_contract_rate_first(self, resolver, config_manager):
+        expected = config_manager.get_contract_rate("HOUSE DO FEE")
+        assert expected is not None
+        assert resolver.resolve("House DO Fee") == expected
+
+    @pytest.mark.parametrize(
+        "description, expected",
+        [
+            ("TERMINAL HANDLING CHARGE 20FT", 280.00),
+            ("TERMINAL HANDLING CHARGE 40HC", 420.00),
+            ("TERMINAL HANDLING CHARGE (CW: 1200 KG)", 0.55),
+        ],
+    )
+    def test_terminal_handling_by_container(self, resolver, description, expected):
+        assert resolver.resolve(description) == expected
+
+    @pytest.mark.parametrize(
+        "description, expected",
+        [
+            ("TRANSPORTATION KHALIFA PORT STORAGE", 252.00),
+            ("TRUCKING AUH AIRPORT MOSB 3T", 100.00),
+            ("TRUCKING AUH AIRPORT MOSB", 200.00),
+            ("TRUCKING MIRFA SITE", 420.00),
+            ("TRUCKING SHUWEIHAT SITE", 600.00),
+        ],
+    )
+    def test_transport_keyword_fallback(self, resolver, description, expected):
+        assert resolver.resolve(description) == expected
+
+    def test_unknown_description_returns_none(self, resolver):
+        assert resolver.resolve("RANDOM CHARGE") is None
+
+    def test_resolve_is_memoized(self, resolver):
+        first = resolver.resolve("  terminal handling charge 20ft ")
+        assert ("TERMINAL HANDLING CHARGE 20FT", None) in resolver._shpt_cache
+        assert resolver.resolve("TERMINAL HANDLING CHARGE 20FT") == first
+
+    def test_compile_clears_memo(self, resolver):
+        resolver.resolve("TRUCKING MIRFA SITE")
+        resolver.compile()
+        assert resolver._shpt_cache == {}
+
+
+class TestResolveColumn:
+    """DESCRIPTION 컬럼 일괄 조회"""
+
+    def test_matches_per_row_resolve(self, resolver):
+        descriptions = pd.Series(
+            ["MASTER DO FEE", None, "TRUCKING MIRFA SITE", "RANDOM CHARGE", "MASTER DO FEE"],
+            index=[10, 11, 12, 13, 14],
+        )
+        result = resolver.resolve_column(descriptions)
+
+        assert result.dtype == "float64"
+        assert list(result.index) == [10, 11, 12, 13, 14]
+        assert result[10] == resolver.resolve("MASTER DO FEE")
+        assert pd.isna(result[11])
+        assert result[12] == 420.00
+        assert pd.isna(result[13])
+        assert result[14] == result[10]
+
+    def test_empty_column(self, resolver):
+        result = resolver.resolve_column(pd.Series([], dtype=object))
+        assert result.empty
+
+
+class TestMasterDataRules:
+    """MasterData 고정 요율 규칙 / 설정 기반 요율"""
+
+    def test_do_fee_rule_needs_transport_mode(self, resolver, config_manager):
+        assert resolver.fixed_rule("Master DO Fee") == FixedFeeRule("do_fee")
+        assert resolver.do_fee("AIR") == config_manager.get_do_fee("AIR")
+        assert resolver.do_fee("CONTAINER") == config_manager.get_do_fee("CONTAINER")
+
+    def test_customs_and_portal_fees(self, resolver, config_manager):
+        assert resolver.fixed_rule("Customs Clearance Fee").rate == (
+            config_manager.get_customs_clearance_fee()
+        )
+        assert resolver.fixed_rule("TRUCK APPOINTMENT").rate == (
+            config_manager.get_portal_fee_rate("APPOINTMENT_FEE", "USD")
+        )
+        assert resolver.fixed_rule("DPC FEE").rate == (
+            config_manager.get_portal_fee_rate("DPC_FEE", "USD")
+        )
+
+    def test_keyword_fee_matches_config_manager(self, resolver, config_manager):
+        for description in ("BOE PROCESSING", "HOUSE DO", "THC 20FT"):
+            expected = config_manager.get_fixed_fee_by_keywords(description)
+            rule = resolver.fixed_rule(description)
+            if expected is None:
+                assert rule is None
+            else:
+                assert rule.rate == expected["rate"]
+                assert rule.transport_mode == expected.get("transport_mode")
+
+    def test_no_rule_for_unknown(self, resolver):
+        assert resolver.fixed_rule("RANDOM CHARGE") is None
+
+    def test_config_rate_route(self, resolver, config_manager):
+        port, destination = resolver.parse_route_exact(
+            "TRANSPORTATION FROM AUH AIRPORT TO MIRFA"
+        )
+        expected = config_manager.get_inland_transportation_rate(port, destination)
+        if expected is None:
+            expected = config_manager.get_lane_rate(port, destination, "per truck")
+        assert resolver.config_rate("Transportation from AUH Airport to Mirfa") == expected
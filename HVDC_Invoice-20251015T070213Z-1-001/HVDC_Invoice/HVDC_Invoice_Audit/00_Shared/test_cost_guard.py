@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+COST-GUARD 일괄 판정 테스트
+evaluate_cost_guard 결과가 스칼라 get_cost_guard_band/check_auto_fail과 같은지 검증
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cost_guard import (
+    assign_bands,
+    calculate_delta_percents,
+    check_auto_fail,
+    delta_or_none,
+    delta_percent,
+    evaluate_cost_guard,
+    get_cost_guard_band,
+    get_cost_guard_bands_array,
+)
+
+BANDS_FILE = Path(__file__).parent.parent / "Rate" / "config_cost_guard_bands.json"
+
+
+@pytest.fixture(scope="module")
+def bands():
+    with open(BANDS_FILE, encoding="utf-8") as f:
+        return json.load(f)["cost_guard_bands"]
+
+
+class TestDeltaPercents:
+    """Delta % 일괄 계산"""
+
+    def test_matches_scalar_formula(self):
+        draft = [105.0, 95.0, 100.0, 260.0]
+        ref = [100.0, 100.0, 100.0, 252.0]
+        expected = [round((d - r) / r * 100, 2) for d, r in zip(draft, ref)]
+        assert calculate_delta_percents(draft, ref).tolist() == expected
+
+    def test_missing_values_are_nan(self):
+        delta = calculate_delta_percents([None, 100.0, "n/a", 100.0], [100.0, None, 100.0, 0])
+        assert np.isnan(delta).all()
+
+    def test_zero_ref_value(self):
+        delta = calculate_delta_percents([100.0], [0.0], zero_ref=0.0)
+        assert delta.tolist() == [0.0]
+
+    def test_unrounded(self):
+        delta = calculate_delta_percents([100.0], [3.0], decimals=None)
+        assert delta.tolist() == [(100.0 - 3.0) / 3.0 * 100]
+
+    def test_single_delta_percent(self):
+        assert delta_percent(105.0, 100.0) == 5.0
+        assert delta_percent(100.0, None) is None
+        assert delta_percent(100.0, 0) is None
+        assert delta_percent(100.0, 0, zero_ref=0.0) == 0.0
+
+
+class TestBands:
+    """밴드 판정"""
+
+    @pytest.mark.parametrize(
+        "delta", [0.0, 1.5, -2.0, 2.01, 5.0, -5.01, 10.0, 10.01, 15.0, 15.01, -40.0]
+    )
+    def test_band_matches_scalar(self, bands, delta):
+        result = get_cost_guard_bands_array(np.array([delta]), bands)
+        assert result[0] == get_cost_guard_band(delta, bands)
+
+    def test_nan_is_na(self, bands):
+        assert get_cost_guard_bands_array(np.array([np.nan]), bands)[0] == "N/A"
+
+    def test_config_thresholds_are_used(self):
+        custom = {"PASS": {"max_delta": 1.0}, "WARN": {"max_delta": 3.0}, "HIGH": {"max_delta": 4.0}}
+        result = get_cost_guard_bands_array(np.array([1.0, 2.0, 3.5, 4.5]), custom)
+        assert result.tolist() == ["PASS", "WARN", "HIGH", "CRITICAL"]
+
+    def test_assign_bands_custom_names(self):
+        names = ("PASS", "WARN", "HIGH", "CRITICAL", "AUTOFAIL")
+        result = assign_bands(
+            [2.0, -2.01, 5.0, 10.0, 15.0, 15.01, np.nan], [2, 5, 10, 15], names, na_band="AUTOFAIL"
+        )
+        assert result.tolist() == ["PASS", "WARN", "WARN", "HIGH", "CRITICAL", "AUTOFAIL", "AUTOFAIL"]
+
+
+class TestEvaluateCostGuard:
+    """송장 단위 일괄 판정"""
+
+    def test_columns_and_index(self, bands):
+        draft = pd.Series([100.0, 110.0, 120.0], index=["a", "b", "c"])
+        result = evaluate_cost_guard(draft, [100.0, 100.0, None], bands)
+
+        assert list(result.columns) == [
+            "delta_pct",
+            "cg_band",
+            "auto_fail",
+            "tolerance_low",
+            "tolerance_high",
+        ]
+        assert list(result.index) == ["a", "b", "c"]
+        assert result.loc["a", "cg_band"] == "PASS"
+        assert result.loc["b", "cg_band"] == "HIGH"
+        assert result.loc["c", "cg_band"] == "N/A"
+        assert result.loc["a", "tolerance_low"] == pytest.approx(97.0)
+        assert result.loc["a", "tolerance_high"] == pytest.approx(103.0)
+
+    def test_matches_scalar_api(self, bands):
+        rng = np.random.default_rng(7)
+        ref = np.round(rng.uniform(1, 2000, 500), 2)
+        draft = np.round(ref * rng.uniform(0.7, 1.3, 500), 2)
+        result = evaluate_cost_guard(draft, ref, bands, auto_fail_threshold=15.0)
+
+        for d, r, row in zip(draft, ref, result.itertuples(index=False)):
+            delta = round((d - r) / r * 100, 2)
+            assert delta_or_none(row.delta_pct) == delta
+            assert row.cg_band == get_cost_guard_band(delta, bands)
+            assert row.auto_fail == check_auto_fail(delta, 15.0)
+
+    def test_empty(self, bands):
+        assert evaluate_cost_guard([], [], bands).empty
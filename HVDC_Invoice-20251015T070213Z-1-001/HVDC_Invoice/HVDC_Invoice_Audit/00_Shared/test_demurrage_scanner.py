@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Demurrage Scanner 테스트
+일괄 날짜 파싱, 리스크 등급, DO별 체크와의 동일성, 로컬 webhook 다이제스트 1회 발송
+"""
+
+import json
+import sys
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf_integration import workflow_automator
+from pdf_integration.demurrage_scanner import parse_validity_dates, scan_demurrage
+from pdf_integration.workflow_automator import WorkflowAutomator
+
+NOW = datetime(2025, 10, 12, 9, 30)
+
+DO_LIST = [
+    {"do_number": "DO-EXPIRED", "delivery_valid_until": "08-10-2025", "quantity": 3,
+     "item_code": "HVDC-ADOPT-SCT-0126", "containers": ["CMAU2623154"]},
+    {"do_number": "DO-TODAY", "delivery_valid_until": "2025-10-12"},
+    {"do_number": "DO-HIGH", "delivery_valid_until": "13/10/2025", "quantity": 2},
+    {"do_number": "DO-MEDIUM", "delivery_valid_until": "15-Oct-2025"},
+    {"do_number": "DO-OK", "delivery_valid_until": "10/30/2025"},
+    {"do_number": "DO-FALLBACK", "delivery_valid_until": "October 14, 2025"},
+    {"do_number": "DO-BAD", "delivery_valid_until": "not a date"},
+    {"do_number": "DO-EMPTY", "delivery_valid_until": ""},
+    {"do_number": "DO-MISSING"},
+]
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+class TestParseValidityDates:
+    """알려진 포맷 우선 + dateutil 폴백"""
+
+    def test_known_formats_and_fallback(self):
+        parsed = parse_validity_dates(
+            ["15-09-2025", "15/09/2025", "2025-09-15", "22-Sep-2025", "9/21/2025",
+             " 5-9-2025 ", "September 22, 2025", "garbage", "", None,
+             datetime(2025, 9, 1)]
+        )
+        expected = [
+            "2025-09-15", "2025-09-15", "2025-09-15", "2025-09-22", "2025-09-21",
+            "2025-09-05", "2025-09-22", None, None, None, "2025-09-01",
+        ]
+        assert [None if pd.isna(v) else v.strftime("%Y-%m-%d") for v in parsed] == expected
+
+    def test_first_matching_format_wins(self):
+        # %d/%m/%Y가 %m/%d/%Y보다 먼저 → 03/04 = 4월 3일
+        assert parse_validity_dates(["03/04/2025"])[0] == pd.Timestamp("2025-04-03")
+
+
+class TestScanDemurrage:
+    """배열 연산 리스크 등급"""
+
+    def test_risk_tiers(self):
+        scanned = scan_demurrage(pd.DataFrame(DO_LIST), now=NOW).set_index("do_number")
+
+        assert scanned.loc["DO-EXPIRED", "status"] == "EXPIRED"
+        assert scanned.loc["DO-EXPIRED", "days_remaining"] == -5
+        assert scanned.loc["DO-EXPIRED", "cost_usd"] == 5 * 75 * 3
+        # 만료 당일 0시 < 현재 → 이미 만료 (timedelta.days 내림)
+        assert scanned.loc["DO-TODAY", "status"] == "EXPIRED"
+        assert scanned.loc["DO-HIGH", "risk_level"] == "HIGH"
+        assert scanned.loc["DO-HIGH", "cost_usd"] == 75 * 2
+        assert scanned.loc["DO-MEDIUM", "risk_level"] == "MEDIUM"
+        assert scanned.loc["DO-FALLBACK", "risk_level"] == "HIGH"
+        assert scanned.loc["DO-OK", "status"] is None
+        assert scanned["parse_failed"].sum() == 1
+        assert scanned.loc["DO-BAD", "parse_failed"]
+
+    def test_out_of_range_dates_marked_parse_failed(self):
+        frame = pd.DataFrame(
+            DO_LIST[:3]
+            + [
+                {"do_number": "DO-FAR", "delivery_valid_until": "31-12-9999"},
+                {"do_number": "DO-OLD", "delivery_valid_until": "1/1/1500"},
+                {"do_number": "DO-DT", "delivery_valid_until": datetime(9999, 12, 31)},
+            ]
+        )
+        scanned = scan_demurrage(frame, now=NOW).set_index("do_number")
+
+        assert list(scanned["parse_failed"]) == [False, False, False, True, True, True]
+        assert scanned.loc[["DO-FAR", "DO-OLD", "DO-DT"], "status"].isna().all()
+        assert scanned.loc["DO-EXPIRED", "status"] == "EXPIRED"
+        assert scanned.loc["DO-HIGH", "risk_level"] == "HIGH"
+
+    def test_keeps_input_index(self):
+        frame = pd.DataFrame(DO_LIST[:3], index=[10, 20, 30])
+        assert list(scan_demurrage(frame, now=NOW).index) == [10, 20, 30]
+
+
+class TestBatchCheckDemurrage:
+    """DO별 check_demurrage_risk와 같은 결과, 알림은 다이제스트 1건"""
+
+    def test_matches_per_do_check(self, monkeypatch):
+        monkeypatch.setattr(workflow_automator, "datetime", _FrozenDatetime)
+        automator = WorkflowAutomator()
+
+        per_do_alerts = []
+        monkeypatch.setattr(
+            automator, "trigger_alert",
+            lambda issue, channels=None: per_do_alerts.append(issue),
+        )
+        digests = []
+        monkeypatch.setattr(
+            automator, "trigger_digest",
+            lambda issues, title=None, channels=None: digests.append(issues),
+        )
+
+        expected = [
+            risk for do in DO_LIST if (risk := automator.check_demurrage_risk(do))
+        ]
+        risks = automator.batch_check_demurrage(DO_LIST, now=NOW)
+
+        assert risks == expected
+        assert digests == [per_do_alerts]
+
+    def test_out_of_range_date_does_not_abort_batch(self, monkeypatch):
+        automator = WorkflowAutomator()
+        monkeypatch.setattr(automator, "trigger_digest", lambda *args, **kwargs: {})
+
+        risks = automator.batch_check_demurrage(
+            DO_LIST + [{"do_number": "DO-FAR", "delivery_valid_until": "31-12-9999"}],
+            now=NOW,
+        )
+
+        assert [risk["do_number"] for risk in risks] == [
+            risk["do_number"] for risk in automator.batch_check_demurrage(DO_LIST, now=NOW)
+        ]
+
+    def test_disabled(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        config.write_text(yaml.safe_dump({"demurrage": {"enabled": False}}))
+        assert WorkflowAutomator(str(config)).batch_check_demurrage(DO_LIST, now=NOW) == []
+
+
+@pytest.fixture
+def webhook_stub():
+    """로컬 Slack webhook 스텁 (수신 payload 기록)"""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/hook", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_single_digest_post_per_run(tmp_path, webhook_stub):
+    url, received = webhook_stub
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        yaml.safe_dump(
+            {
+                "notifications": {"slack": {"enabled": True, "webhook_url": url}},
+                "demurrage": {"enabled": True, "warning_days_before_expiry": 3},
+            }
+        )
+    )
+    automator = WorkflowAutomator(str(config))
+
+    risks = automator.batch_check_demurrage(pd.DataFrame(DO_LIST), now=NOW)
+    assert automator.flush_alerts(timeout=10)
+    automator.close()
+
+    assert len(risks) == 5
+    assert len(received) == 1
+    text = received[0]["text"]
+    assert "HVDC Demurrage Risk Digest" in text
+    for risk in risks:
+        assert risk["do_number"] in text
+    # 심각도순: CRITICAL 먼저
+    assert text.index("DO-EXPIRED") < text.index("DO-MEDIUM")
+
+
+def test_digest_truncates_long_lists():
+    automator = WorkflowAutomator()
+    issues = [
+        {"type": "DEMURRAGE_RISK", "severity": "MEDIUM", "item_code": f"ITEM-{i}"}
+        for i in range(60)
+    ]
+    message = automator._format_digest_message(issues, "Digest", max_lines=10)
+    assert "ITEM-9:" in message and "ITEM-10:" not in message
+    assert "... and 50 more" in message
+    assert automator.trigger_digest([]) == {}
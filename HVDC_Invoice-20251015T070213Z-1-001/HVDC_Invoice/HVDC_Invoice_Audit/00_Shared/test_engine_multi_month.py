@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+MultiMonthConsolidator 테스트
+프로세스 풀 병렬 통합 + 파일 해시 캐시
+"""
+
+import sys
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import engine_multi_month
+from engine_multi_month import MultiMonthConsolidator
+
+
+def _write_invoice(path: Path, order_ref: str, rates):
+    """S/No 헤더가 있는 인보이스 시트 1개짜리 워크북 생성"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "SCT-0001"
+    ws.append(["Order Ref. Number", order_ref])
+    ws.append([])
+    ws.append(["S/No", "RATE SOURCE", "DESCRIPTION", "RATE", "Q'TY", "TOTAL (USD)"])
+    for idx, rate in enumerate(rates, start=1):
+        ws.append([idx, "CONTRACT", f"ITEM {idx}", rate, 1, rate])
+    wb.save(path)
+
+
+@pytest.fixture
+def shpt_folder(tmp_path):
+    """3개월치 인보이스 폴더"""
+    for label, ref, rates in [
+        ("AUG 2024", "HVDC-ADOPT-SCT-0001", [10.0, 20.0]),
+        ("SEPT 2024", "HVDC-ADOPT-SCT-0002", [30.0]),
+        ("JANUARY 2025", "HVDC-ADOPT-SCT-0003", [40.0, 50.0, 60.0]),
+    ]:
+        _write_invoice(tmp_path / f"SCNT SHIPMENT DRAFT INVOICE ({label}).xlsx", ref, rates)
+    return tmp_path
+
+
+class TestMultiMonthConsolidator:
+    """병렬/캐시 통합 테스트"""
+
+    def test_should_match_sequential_when_parallel(self, shpt_folder, tmp_path):
+        """프로세스 풀 결과 == 순차 결과 (월 순서 유지)"""
+        sequential = MultiMonthConsolidator(shpt_folder, use_cache=False)
+        parallel = MultiMonthConsolidator(shpt_folder, workers=3, use_cache=False)
+
+        expected = sequential.consolidate_all_months()
+        result = parallel.consolidate_all_months()
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert result["Month"].tolist() == ["2024-08"] * 2 + ["2024-09"] + ["2025-01"] * 3
+        assert result["No"].tolist() == list(range(1, 7))
+
+    def test_should_reuse_cache_for_unchanged_files(self, shpt_folder, tmp_path, monkeypatch):
+        """내용이 같은 파일은 재통합하지 않음, 변경된 파일만 재통합"""
+        cache_dir = tmp_path / "cache"
+        first = MultiMonthConsolidator(shpt_folder, cache_dir=cache_dir).consolidate_all_months()
+
+        calls = []
+        original = engine_multi_month.consolidate_workbook
+
+        def counting(file_path):
+            calls.append(Path(file_path).name)
+            return original(file_path)
+
+        monkeypatch.setattr(engine_multi_month, "consolidate_workbook", counting)
+
+        again = MultiMonthConsolidator(shpt_folder, cache_dir=cache_dir).consolidate_all_months()
+        pd.testing.assert_frame_equal(again, first)
+        assert calls == []
+
+        _write_invoice(
+            shpt_folder / "SCNT SHIPMENT DRAFT INVOICE (SEPT 2024).xlsx",
+            "HVDC-ADOPT-SCT-0002",
+            [35.0],
+        )
+        updated = MultiMonthConsolidator(shpt_folder, cache_dir=cache_dir).consolidate_all_months()
+        assert calls == ["SCNT SHIPMENT DRAFT INVOICE (SEPT 2024).xlsx"]
+        assert updated.loc[updated["Month"] == "2024-09", "RATE"].tolist() == [35.0]
+        assert len(list(cache_dir.glob("*.pkl"))) == 3
+
+    def test_should_not_write_cache_into_input_folder(self, shpt_folder):
+        consolidator = MultiMonthConsolidator(shpt_folder)
+        assert consolidator.cache_dir == engine_multi_month.DEFAULT_CACHE_DIR
+        assert shpt_folder not in consolidator.cache_dir.parents
+
+    def test_engine_version_covers_sheet_grid(self, monkeypatch):
+        """sheet_grid 변경도 캐시 키에 반영"""
+        engine_multi_month._engine_version.cache_clear()
+        before = engine_multi_month._engine_version()
+
+        original = engine_multi_month.file_digest
+        grid_path = Path(engine_multi_month.sheet_grid.__file__)
+
+        def patched(path):
+            digest = original(path)
+            return "changed" + digest if Path(path) == grid_path else digest
+
+        monkeypatch.setattr(engine_multi_month, "file_digest", patched)
+        engine_multi_month._engine_version.cache_clear()
+        try:
+            assert engine_multi_month._engine_version() != before
+        finally:
+            engine_multi_month._engine_version.cache_clear()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+ShipmentFactStore 테스트
+OntologyMapper 팩트 적재, 인덱스 조회, Cross-document 검증 규칙(hash join) 확인
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf_integration.cross_doc_validator import CrossDocValidator
+from pdf_integration.fact_store import CertificationFact, DocumentFact, ShipmentFactStore
+from pdf_integration.ontology_mapper import OntologyMapper
+
+ITEM = "HVDC-ADOPT-SCT-0126"
+
+BOE = {
+    "dec_no": "20252101030815",
+    "mbl_no": "CHN2595234",
+    "containers": ["CMAU2623154", "TGHU8788690"],
+    "hs_code": "8504400000",
+    "description": "Static converters",
+}
+
+
+@pytest.fixture
+def mapper():
+    mapper = OntologyMapper()
+    mapper.map_boe_to_ontology(BOE, ITEM)
+    mapper.map_do_to_ontology(
+        {
+            "do_number": "DO-001",
+            "mbl_no": "CHN2595234",
+            "containers": [{"container_no": "CMAU2623154", "seal_no": "S1"}],
+        },
+        ITEM,
+    )
+    mapper.map_dn_to_ontology({"waybill_no": "WB-01", "container_no": "CMAU2623154"}, ITEM)
+    return mapper
+
+
+class TestShipmentFactStore:
+    """인덱스 및 검증 규칙"""
+
+    def test_indices(self):
+        store = ShipmentFactStore()
+        store.add_document(DocumentFact("BOE", "D1", mbl="M1", item_code="I1", containers=("C1",)))
+        store.add_document(DocumentFact("DO", "O1", mbl="M1", item_code="I1", containers=("C1", "C2")))
+        store.add_document(DocumentFact("DN", "W1", item_code="I2", containers=("C2",)))
+
+        assert len(store) == 3
+        assert [f.doc_id for f in store.documents_for_item("I1")] == ["D1", "O1"]
+        assert [f.doc_id for f in store.documents_for_mbl("M1")] == ["D1", "O1"]
+        assert [f.doc_id for f in store.documents_for_container("C2")] == ["O1", "W1"]
+        assert store.documents_for_item("UNKNOWN") == []
+        assert store.version == 3
+
+    def test_mbl_conflicts_counts_ordered_pairs(self):
+        store = ShipmentFactStore()
+        store.add_document(DocumentFact("BOE", "D1", mbl="M1", item_code="I1"))
+        store.add_document(DocumentFact("DO", "O1", mbl="M1", item_code="I1"))
+        store.add_document(DocumentFact("CarrierInvoice", "V1", mbl="M2", item_code="I1"))
+        store.add_document(DocumentFact("DN", "W1", mbl="M3", item_code="I1"))
+
+        conflicts = store.mbl_conflicts("I1")
+        # (BOE,DO) × CarrierInvoice 양방향, DN은 MBL 비교 대상 아님
+        assert len(conflicts) == 4
+        assert all(doc1.mbl != doc2.mbl for doc1, doc2 in conflicts)
+        assert store.mbl_conflicts("I2") == []
+
+    def test_missing_certifications(self):
+        store = ShipmentFactStore()
+        for cert_id, status in (("C1", "PENDING"), ("C2", "PENDING"), ("C3", "APPROVED")):
+            store.add_certification(
+                CertificationFact(cert_id, "I1", "MOIAT", "MOIAT CoC", status, 14)
+            )
+        store.attach_document("C2", "coc.pdf")
+
+        assert [c.cert_id for c in store.missing_certifications()] == ["C1"]
+
+    def test_to_frame_explodes_containers(self):
+        store = ShipmentFactStore()
+        store.add_document(DocumentFact("BOE", "D1", mbl="M1", containers=("C1", "C2")))
+        store.add_document(DocumentFact("CarrierInvoice", "V1", mbl="M1"))
+
+        frame = store.to_frame()
+        assert frame["container_no"].tolist() == ["C1", "C2", None]
+
+
+class TestOntologyMapperFacts:
+    """매퍼 → 팩트 테이블 적재"""
+
+    def test_documents_are_indexed(self, mapper):
+        docs = mapper.facts.documents_for_item(ITEM)
+        assert [f.doc_type for f in docs] == ["BOE", "DO", "DN"]
+        assert [f.doc_type for f in mapper.facts.documents_for_container("CMAU2623154")] == [
+            "BOE",
+            "DO",
+            "DN",
+        ]
+
+    def test_missing_certifications_include_hs_code(self, mapper):
+        missing = mapper.validate_missing_certifications()
+        assert missing == [
+            {
+                "item": "http://samsung.com/hvdc-project#Item_HVDC-ADOPT-SCT-0126",
+                "hs_code": "8504400000",
+                "required_cert": "MOIAT",
+                "status": "PENDING",
+            }
+        ]
+
+        mapper.attach_certification_document(
+            mapper.facts.missing_certifications()[0].cert_id, "moiat_coc.pdf"
+        )
+        assert mapper.validate_missing_certifications() == []
+
+    def test_graph_stats(self, mapper):
+        stats = mapper.get_graph_stats()
+        assert stats["shipments"] == 1
+        assert stats["items"] == 1
+        assert stats["containers"] == 2
+        assert stats["certifications"] == 1
+        assert stats["total_triples"] > 0
+
+
+class TestCrossDocFactValidation:
+    """CrossDocValidator 팩트 테이블 규칙"""
+
+    def test_no_issue_when_mbl_consistent(self, mapper):
+        validator = CrossDocValidator(facts=mapper.facts)
+        assert validator.run_sparql_validation(ITEM) == []
+
+    def test_mbl_mismatch(self, mapper):
+        mapper.map_carrier_invoice_to_ontology(
+            {"invoice_number": "INV-9", "bl_number": "CHN0000001"}, ITEM
+        )
+        validator = CrossDocValidator(facts=mapper.facts)
+
+        issues = validator.run_sparql_validation(ITEM)
+        assert len(issues) == 1
+        assert issues[0]["type"] == "SPARQL_MBL_MISMATCH"
+        assert issues[0]["severity"] == "HIGH"
+        assert issues[0]["count"] == 4
+
+
+def test_import_does_not_need_rdflib():
+    code = (
+        "import sys\n"
+        "from pdf_integration.ontology_mapper import OntologyMapper\n"
+        "from pdf_integration.cross_doc_validator import CrossDocValidator\n"
+        "m = OntologyMapper(); m.map_boe_to_ontology({'mbl_no': 'M1'}, 'I1')\n"
+        "CrossDocValidator(facts=m.facts).run_sparql_validation('I1')\n"
+        "assert 'rdflib' not in sys.modules\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).parent, check=True
+    )
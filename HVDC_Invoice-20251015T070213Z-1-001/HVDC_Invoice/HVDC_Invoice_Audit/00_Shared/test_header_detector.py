@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+HeaderDetector 테스트
+토큰 메모/배치 점수화가 감지 결과를 바꾸지 않는지 확인
+"""
+
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import engine_individual_sheets
+from engine_individual_sheets import HeaderDetector
+
+
+@pytest.fixture
+def sheet():
+    """두 줄 헤더 + 오타 헤더가 섞인 시트"""
+    return pd.DataFrame(
+        [
+            ["Order Ref. Number", "HVDC-ADOPT-SCT-0001", None, None, None],
+            [None, None, None, None, None],
+            ["S/No", "RATE SORUCE", "AMOUT", "RATE", "TOTAL (USD)"],
+            [1, "CONTRACT", "DO FEE", 150, 150],
+        ]
+    )
+
+
+def test_should_detect_same_header_with_cold_and_warm_cache(sheet, monkeypatch):
+    """빈 캐시/채워진 캐시 모두 동일한 감지 결과"""
+    monkeypatch.setattr(engine_individual_sheets, "_TOKEN_MATCH_CACHE", OrderedDict())
+
+    cold = HeaderDetector().detect(sheet)
+    assert engine_individual_sheets._TOKEN_MATCH_CACHE
+    warm = HeaderDetector().detect(sheet)
+
+    assert cold == warm
+    # 빈 행 + 헤더 행 2행 결합 후보가 +0.05 가산으로 선택됨
+    assert (cold.header_row_index, cold.two_row_joined) == (1, True)
+    assert cold.mapping == {
+        0: "sno",
+        1: "ratesource",
+        2: "amount",  # 오타 → 퍼지 매칭
+        3: "rate",
+        4: "total",
+    }
+
+
+def test_should_apply_threshold_per_detector(sheet, monkeypatch):
+    """메모는 임계값 적용 전 점수 보관 (임계값별 결과 유지)"""
+    monkeypatch.setattr(engine_individual_sheets, "_TOKEN_MATCH_CACHE", OrderedDict())
+
+    assert 2 in HeaderDetector(fuzz_threshold=78).detect(sheet).mapping
+    assert 2 not in HeaderDetector(fuzz_threshold=95).detect(sheet).mapping
+
+
+def test_should_cap_token_cache(sheet, monkeypatch):
+    """토큰 메모는 상한을 넘지 않고, 제거된 토큰도 다시 점수화됨"""
+    expected = HeaderDetector().detect(sheet)
+    monkeypatch.setattr(engine_individual_sheets, "_TOKEN_MATCH_CACHE", OrderedDict())
+    monkeypatch.setattr(engine_individual_sheets, "_TOKEN_MATCH_CACHE_SIZE", 4)
+
+    assert HeaderDetector().detect(sheet) == expected
+    assert len(engine_individual_sheets._TOKEN_MATCH_CACHE) <= 4
+
+    engine_individual_sheets._match_tokens([f"filler {i}" for i in range(10)])
+    assert len(engine_individual_sheets._TOKEN_MATCH_CACHE) == 4
+    assert HeaderDetector().detect(sheet) == expected
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Item Records 테스트
+dict 호환 접근, extra 키, JSON/DataFrame 내보내기, Shipment 문서 참조, 메모리 절감 확인
+"""
+
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from item_records import ItemRecord, ShipmentDocs, json_default, records_to_frame
+
+
+class Line(ItemRecord):
+    __slots__ = FIELDS = ("s_no", "status", "issues", "gates", "shipment_id")
+
+
+DOCS = {
+    "HVDC-ADOPT-SCT-0126": [
+        {"doc_type": "BOE", "file_name": "HVDC-ADOPT-SCT-0126_BOE.pdf"},
+        {"doc_type": "DO", "file_name": "HVDC-ADOPT-SCT-0126_DO.pdf"},
+    ]
+}
+
+
+class TestItemRecord:
+    """dict 스타일 접근"""
+
+    def test_mapping_access(self):
+        line = Line(s_no="1", status="PASS", issues=[])
+
+        assert line["status"] == "PASS"
+        assert line.get("gates", {}) == {}
+        assert "gates" not in line and "status" in line
+        with pytest.raises(KeyError):
+            line["gates"]
+
+        line["issues"].append("금액 불일치")
+        line["status"] = "FAIL"
+        assert dict(line) == {"s_no": "1", "status": "FAIL", "issues": ["금액 불일치"]}
+        assert len(line) == 3
+
+    def test_field_order_and_extra_keys(self):
+        line = Line(status="PASS", s_no="2")
+        line["custom_note"] = "x"
+
+        assert list(line) == ["s_no", "status", "custom_note"]
+        assert line.to_dict() == {"s_no": "2", "status": "PASS", "custom_note": "x"}
+        del line["custom_note"]
+        assert "custom_note" not in line
+        with pytest.raises(KeyError):
+            del line["gates"]
+
+    def test_copy_returns_dict(self):
+        line = Line(s_no="3", status="PASS")
+        copied = line.copy()
+        copied["status"] = "FAIL"
+
+        assert isinstance(copied, dict)
+        assert line["status"] == "PASS"
+
+    def test_slots_only(self):
+        assert not hasattr(Line(s_no="4"), "__dict__")
+
+
+class TestExport:
+    """JSON / DataFrame 내보내기"""
+
+    def test_json_default(self):
+        payload = {"items": [Line(s_no="1", status="PASS", issues=[])], "at": Path("x")}
+        loaded = json.loads(json.dumps(payload, default=json_default))
+
+        assert loaded == {"items": [{"s_no": "1", "status": "PASS", "issues": []}], "at": "x"}
+
+    def test_records_to_frame_expands_shipment_docs(self):
+        records = [
+            Line(s_no=str(i), status="PASS", shipment_id="HVDC-ADOPT-SCT-0126")
+            for i in range(3)
+        ] + [Line(s_no="9", status="FAIL", shipment_id="HVDC-ADOPT-HE-0471")]
+
+        frame = records_to_frame(records, ShipmentDocs(DOCS))
+
+        assert list(frame["s_no"]) == ["0", "1", "2", "9"]
+        assert list(frame["evidence_count"]) == [2, 2, 2, 0]
+        assert sorted(frame.loc[0, "evidence_types"]) == ["BOE", "DO"]
+        assert frame.loc[0, "supporting_docs_list"] is DOCS["HVDC-ADOPT-SCT-0126"]
+        assert frame.loc[3, "supporting_docs_list"] == []
+        assert "supporting_docs_list" not in records_to_frame(records).columns
+
+
+class Validation(ItemRecord):
+    """ItemValidation과 같은 규모 (검증 필드 20개 + shipment_id)"""
+
+    __slots__ = FIELDS = tuple(f"field_{i}" for i in range(20)) + ("shipment_id",)
+
+
+def _allocated(build):
+    tracemalloc.start()
+    items = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(items) == 20000
+    return size
+
+
+def test_records_use_several_times_less_memory_than_dicts():
+    docs = DOCS["HVDC-ADOPT-SCT-0126"]
+    fields = {f"field_{i}": i for i in range(20)}
+
+    dict_size = _allocated(
+        lambda: [
+            dict(
+                fields,
+                supporting_docs_list=docs,
+                evidence_count=len(docs),
+                evidence_types=list(set(doc["doc_type"] for doc in docs)),
+            )
+            for _ in range(20000)
+        ]
+    )
+    record_size = _allocated(
+        lambda: [
+            Validation(**fields, shipment_id="HVDC-ADOPT-SCT-0126")
+            for _ in range(20000)
+        ]
+    )
+
+    assert dict_size > 3 * record_size
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+지연 import 테스트
+pdf_integration / hybrid_integration 패키지와 감사 엔진 import 시
+PDF 스택(rdflib, pdfplumber, PyPDF2, requests)을 로드하지 않는지 확인
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_import_time import IMPORT_BUDGETS_MS, measure_import
+
+
+class TestLazyImports:
+    def test_should_not_load_pdf_stack_on_import(self):
+        """패키지/엔진 import만으로는 PDF 스택 미로드"""
+        for module, (cwd, _) in IMPORT_BUDGETS_MS.items():
+            _, loaded = measure_import(module, cwd)
+            assert loaded == [], (module, loaded)
+
+    def test_should_resolve_exports_on_first_access(self):
+        """첫 접근 시 하위 모듈 import 후 패키지에 캐시"""
+        import hybrid_integration
+
+        assert "HybridPDFRouter" in dir(hybrid_integration)
+        router_cls = hybrid_integration.HybridPDFRouter
+        assert router_cls.__module__ == "hybrid_integration.hybrid_pdf_router"
+        assert vars(hybrid_integration)["HybridPDFRouter"] is router_cls
+
+    def test_should_keep_parser_fallback(self):
+        """pdf_parser 의존성 미설치 시에도 이름 접근은 실패하지 않음 (None 또는 클래스)"""
+        import pdf_integration
+
+        parser_cls = pdf_integration.DSVPDFParser
+        assert parser_cls is None or parser_cls.__name__ == "DSVPDFParser"
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+PDF Probe / 문서 특성 저장소 테스트
+xref 기반 페이지 수, 첫 페이지 콘텐츠 분석, 비 PDF fallback, 캐시 영속성,
+HybridPDFRouter 연동 확인
+"""
+
+import json
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from hybrid_integration import pdf_probe
+from hybrid_integration.hybrid_pdf_router import HybridPDFRouter
+from hybrid_integration.pdf_probe import (
+    PDFCharacteristicsStore,
+    analyze_content_stream,
+    probe_pdf,
+)
+
+# 저장소에 포함된 실제 공급사 PDF (Sept 2025 폴더는 DRM 파일이라 scan fallback)
+REAL_PDF_DIR = (
+    Path(__file__).resolve().parents[4]
+    / "Samsung C&T (HVDC) Shippments (Aug2025) - Supporting Documents"
+)
+
+INVOICE_CONTENT = b"""
+0.5 w
+36 700 540 0.5 re f
+36 600 m 576 600 l S
+BT /F1 10 Tf 36 720 Td (COMMERCIAL INVOICE) Tj ET
+BT /F1 10 Tf 36 680 Td (Container TCLU1234567 freight) Tj 400 0 Td (1,250.00) Tj ET
+BT /F1 10 Tf 36 660 Td [(Container MSKU7654321) -250 (handling)] TJ 400 0 Td (375.50) Tj ET
+BT /F1 10 Tf 36 640 Td (Total) Tj ET
+"""
+
+
+def build_pdf(content: bytes, pages: int = 1, compress: bool = True) -> bytes:
+    """classic xref 테이블을 가진 최소 PDF"""
+    stream = zlib.compress(content) if compress else content
+    filters = b" /Filter /FlateDecode" if compress else b""
+    first_page = 4
+    kids = b" ".join(b"%d 0 R" % (first_page + i) for i in range(pages))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % pages,
+        b"<< /Length %d%s >>\nstream\n" % (len(stream), filters) + stream + b"\nendstream",
+    ]
+    objects += [
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 3 0 R >>"
+    ] * pages
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(out)
+
+
+@pytest.fixture
+def invoice_pdf(tmp_path):
+    path = tmp_path / "HVDC-ADOPT-SCT-0114_CarrierInvoice.pdf"
+    path.write_bytes(build_pdf(INVOICE_CONTENT, pages=3))
+    return path
+
+
+class TestPDFProbe:
+    """구조(xref) 분석 및 첫 페이지 샘플"""
+
+    def test_xref_page_count_and_sample(self, invoice_pdf):
+        result = probe_pdf(str(invoice_pdf))
+        assert result["probe_method"] == "xref"
+        assert result["pages"] == 3
+        assert result["text_lines"] == 4
+        assert result["line_item_count"] == 2
+        assert result["container_count"] == 2
+        assert result["scanned"] is False
+        assert 0.0 < result["table_density"] < 1.0
+
+    def test_uncompressed_stream(self, tmp_path):
+        path = tmp_path / "plain.pdf"
+        path.write_bytes(build_pdf(INVOICE_CONTENT, compress=False))
+        assert probe_pdf(str(path))["line_item_count"] == 2
+
+    def test_non_pdf_falls_back_to_scan(self, tmp_path):
+        path = tmp_path / "drm_BOE.pdf"
+        path.write_bytes(b"<## NASCA DRM FILE - VER1.00 ##>" + b"\x00" * 4096)
+        result = probe_pdf(str(path))
+        assert result["probe_method"] == "scan"
+        assert result["pages"] >= 1
+
+    @pytest.mark.parametrize(
+        "relative_path, pages, scanned",
+        [
+            # classic xref 테이블
+            ("03. HVDC-ADOPT-SCT-0107 - BAMF0017307/HVDC-ADOPT-SCT-0107_BOE.pdf", 5, False),
+            # xref stream + object stream
+            ("02. HVDC-ADOPT-SIM-0092 - SZRH0201006/HVDC-ADOPT-SIM-0092_BOE.pdf", 4, False),
+            # 스캔 이미지
+            ("01. HVDC-ADOPT-SIM-0079AB - BAMF0016935/HVDC-ADOPT-SIM-0079AB_CourierFee.pdf", 2, True),
+        ],
+    )
+    def test_real_pdf_uses_xref_fast_path(self, relative_path, pages, scanned):
+        path = REAL_PDF_DIR / relative_path
+        if not path.exists():
+            pytest.skip("supporting document PDFs not available")
+        result = probe_pdf(str(path))
+        assert result["probe_method"] == "xref"
+        assert result["pages"] == pages
+        assert result["scanned"] is scanned
+
+    def test_image_only_page_is_scanned(self):
+        result = analyze_content_stream(b"q 612 0 0 792 0 0 cm /Im0 Do Q")
+        assert result["scanned"] is True
+        assert result["word_count"] == 0
+
+    def test_clipping_rectangles_are_not_rulings(self):
+        result = analyze_content_stream(
+            b"0 0 612 792 re W n BT 10 10 Td (A B C) Tj ET"
+        )
+        assert result["table_density"] == 0.0
+
+
+class TestPDFCharacteristicsStore:
+    """fingerprint 캐시"""
+
+    def test_persists_between_instances(self, tmp_path, invoice_pdf):
+        cache = tmp_path / "cache" / "characteristics.json"
+        store = PDFCharacteristicsStore(str(cache))
+        first = store.get_or_probe(str(invoice_pdf))
+        assert (store.hits, store.misses) == (0, 1)
+        # 조회마다 쓰지 않음 — 배치 후 save() (또는 종료 시)
+        assert not cache.exists()
+        store.save()
+        assert cache.exists()
+        assert list(cache.parent.glob("*.tmp")) == []
+
+        reloaded = PDFCharacteristicsStore(str(cache))
+        assert reloaded.get_or_probe(str(invoice_pdf)) == first
+        assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+    def test_changed_file_is_probed_again(self, tmp_path, invoice_pdf):
+        store = PDFCharacteristicsStore("")
+        store.get_or_probe(str(invoice_pdf))
+        invoice_pdf.write_bytes(build_pdf(INVOICE_CONTENT, pages=5))
+        assert store.get_or_probe(str(invoice_pdf))["pages"] == 5
+        assert store.misses == 2
+
+    def test_other_probe_version_is_ignored(self, tmp_path, invoice_pdf, monkeypatch):
+        cache = tmp_path / "characteristics.json"
+        store = PDFCharacteristicsStore(str(cache))
+        store.get_or_probe(str(invoice_pdf))
+        store.save()
+        assert json.loads(cache.read_text())["version"] == pdf_probe.PROBE_VERSION
+
+        monkeypatch.setattr(pdf_probe, "PROBE_VERSION", "next")
+        assert PDFCharacteristicsStore(str(cache)).entries == {}
+
+    def test_returns_copies(self, invoice_pdf):
+        store = PDFCharacteristicsStore("")
+        store.get_or_probe(str(invoice_pdf))["pages"] = 99
+        assert store.get_or_probe(str(invoice_pdf))["pages"] == 3
+
+
+    def test_save_only_when_changed(self, tmp_path, invoice_pdf):
+        cache = tmp_path / "characteristics.json"
+        store = PDFCharacteristicsStore(str(cache))
+        store.get_or_probe(str(invoice_pdf))
+        store.save()
+        cache.write_text("sentinel")
+
+        store.get_or_probe(str(invoice_pdf))
+        store.save()
+        assert cache.read_text() == "sentinel"
+
+    def test_stale_fixed_tmp_name_does_not_block_save(self, tmp_path, invoice_pdf):
+        cache = tmp_path / "characteristics.json"
+        # 이전 방식의 고정 임시 파일 이름이 디렉터리로 남아 있어도 저장됨
+        cache.with_suffix(".tmp").mkdir()
+        store = PDFCharacteristicsStore(str(cache))
+        store.get_or_probe(str(invoice_pdf))
+        store.save()
+        assert json.loads(cache.read_text())["entries"]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        paths = []
+        for pages in (1, 2, 3):
+            path = tmp_path / f"doc{pages}.pdf"
+            path.write_bytes(build_pdf(INVOICE_CONTENT, pages=pages))
+            paths.append(str(path))
+
+        store = PDFCharacteristicsStore("", max_entries=2)
+        store.get_or_probe(paths[0])
+        store.get_or_probe(paths[1])
+        store.get_or_probe(paths[0])  # doc1 최근 사용
+        store.get_or_probe(paths[2])  # doc2 제거
+        assert len(store.entries) == 2
+
+        store.get_or_probe(paths[0])
+        assert store.misses == 3
+        store.get_or_probe(paths[1])
+        assert store.misses == 4
+
+    def test_oversized_cache_is_trimmed_on_load(self, tmp_path, invoice_pdf):
+        cache = tmp_path / "characteristics.json"
+        entries = {f"fp{i}": {"pages": i} for i in range(5)}
+        cache.write_text(json.dumps({"version": pdf_probe.PROBE_VERSION, "entries": entries}))
+
+        store = PDFCharacteristicsStore(str(cache), max_entries=3)
+        assert list(store.entries) == ["fp2", "fp3", "fp4"]
+
+
+class TestHybridPDFRouterProbe:
+    """라우터 문서 특성 연동"""
+
+    @pytest.fixture
+    def router(self):
+        return HybridPDFRouter(log_level="WARNING", characteristics_cache="")
+
+    def test_analyze_document_uses_probe(self, router, invoice_pdf):
+        characteristics = router._analyze_document(str(invoice_pdf))
+        assert characteristics["doc_type"] == "CarrierInvoice"
+        assert characteristics["pages"] == 3
+        assert characteristics["container_count"] == 2
+        assert characteristics["probe_method"] == "xref"
+        assert characteristics["dpi"] == 300
+
+        router.decide_route(str(invoice_pdf))
+        cache_metrics = router.get_routing_metrics()["characteristics_cache"]
+        assert cache_metrics == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_missing_file_uses_estimates(self, router, tmp_path):
+        characteristics = router._analyze_document(str(tmp_path / "missing_BOE.pdf"))
+        assert characteristics["doc_type"] == "BOE"
+        assert characteristics["pages"] == 1
+        assert "probe_method" not in characteristics
+
+    @pytest.mark.parametrize(
+        "filename, doc_type",
+        [
+            ("HVDC-ADOPT-SCT-0114_CarrierInvoice.pdf", "CarrierInvoice"),
+            ("HVDC-ADOPT-SCT-0114_DN (KP-DSV).pdf", "DN"),
+            ("HVDC-ADOPT-SCT-0114_DO.pdf", "DO"),
+            ("HVDC-ADOPT-HE-0471_BOE.pdf", "BOE"),
+            ("HVDC-ADOPT-SCT-0114_PortCNTAdminInsp.pdf", "Other"),
+        ],
+    )
+    def test_detect_doc_type_token_boundaries(self, router, filename, doc_type):
+        assert router._detect_doc_type(filename) == doc_type
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Result Stream 테스트
+NDJSON 요약 footer, 기록 중 읽기, CSV 요약 파일, JSON 문서 스트리밍, 메모리 일정 확인
+"""
+
+import csv
+import json
+import sys
+import tracemalloc
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import result_stream
+from item_records import ItemRecord
+from result_stream import (
+    ResultStreamWriter,
+    iter_ndjson,
+    read_summary,
+    summary_path,
+    write_json_document,
+)
+
+
+class Line(ItemRecord):
+    __slots__ = FIELDS = ("s_no", "status", "total_usd", "issues")
+
+
+def _lines(count):
+    for i in range(count):
+        yield Line(
+            s_no=str(i),
+            status="PASS" if i % 3 else "FAIL",
+            total_usd=1.5,
+            issues=["금액 불일치"] if i % 3 == 0 else [],
+        )
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """orjson / 표준 json 두 백엔드 모두 확인"""
+    if request.param == "orjson":
+        if not result_stream.ORJSON_OK:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(result_stream, "ORJSON_OK", False)
+    return request.param
+
+
+class TestNdjson:
+    """NDJSON 항목 + 요약 footer"""
+
+    def test_items_and_summary_footer(self, tmp_path, backend):
+        path = tmp_path / "items.ndjson"
+        with ResultStreamWriter(path, amount_key="total_usd") as stream:
+            assert stream.write_many(_lines(10)) == 10
+
+        items = list(iter_ndjson(path))
+        assert len(items) == 10
+        assert items[0] == {"s_no": "0", "status": "FAIL", "total_usd": 1.5, "issues": ["금액 불일치"]}
+
+        summary = read_summary(path)
+        assert summary["item_count"] == 10
+        assert summary["status_counts"] == {"FAIL": 4, "PASS": 6}
+        assert summary["amount_total"] == 15.0
+        assert summary["complete"] is True
+        assert summary["backend"] == backend
+        assert json.loads(path.read_bytes().splitlines()[-1]) == {"_summary": summary}
+
+    def test_readable_while_writing(self, tmp_path):
+        path = tmp_path / "items.ndjson"
+        stream = ResultStreamWriter(path, flush_every=5)
+        stream.write_many(_lines(12))
+
+        # flush된 10건까지 읽힘, 요약은 아직 없음
+        assert [item["s_no"] for item in iter_ndjson(path)] == [str(i) for i in range(10)]
+        assert read_summary(path) is None
+
+        stream.close(extra={"statistics": {"total_items": 12}})
+        assert len(list(iter_ndjson(path))) == 12
+        assert read_summary(path)["statistics"] == {"total_items": 12}
+
+    def test_partial_trailing_line_skipped(self, tmp_path):
+        path = tmp_path / "items.ndjson"
+        path.write_bytes(b'{"s_no": "1"}\n{"s_no": "2"}\n{"s_n')
+
+        assert list(iter_ndjson(path)) == [{"s_no": "1"}, {"s_no": "2"}]
+        assert read_summary(path) is None
+
+    def test_exception_marks_incomplete(self, tmp_path):
+        path = tmp_path / "items.ndjson"
+        with pytest.raises(RuntimeError):
+            with ResultStreamWriter(path) as stream:
+                stream.write_many(_lines(3))
+                raise RuntimeError("검증 중단")
+
+        summary = read_summary(path)
+        assert summary["complete"] is False
+        assert summary["item_count"] == 3
+
+    def test_close_is_idempotent(self, tmp_path):
+        stream = ResultStreamWriter(tmp_path / "items.ndjson")
+        first = stream.close()
+        assert stream.close(extra={"ignored": True}) is first
+
+
+class TestCsv:
+    """CSV 기록 + summary.json"""
+
+    def test_fieldnames_expand_and_sidecar(self, tmp_path, backend):
+        path = tmp_path / "result.csv"
+        expand = lambda item: dict(item, evidence_count=2)
+        with ResultStreamWriter(
+            path, fieldnames=Line.FIELDS + ("evidence_count",), expand=expand
+        ) as stream:
+            stream.write_many(_lines(4))
+            stream.write(Line(s_no="9"))
+
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 5
+        assert rows[1] == {"s_no": "1", "status": "PASS", "total_usd": "1.5", "issues": "[]", "evidence_count": "2"}
+        assert rows[4]["status"] == ""
+        assert b"\r\n" not in path.read_bytes()
+
+        assert summary_path(path) == tmp_path / "result.summary.json"
+        assert read_summary(path)["status_counts"] == {"FAIL": 2, "PASS": 2}
+
+    def test_empty_with_fieldnames_writes_header(self, tmp_path):
+        path = tmp_path / "result.csv"
+        ResultStreamWriter(path, fieldnames=Line.FIELDS).close()
+
+        assert path.read_text(encoding="utf-8-sig") == "s_no,status,total_usd,issues\n"
+        assert read_summary(path)["item_count"] == 0
+
+    def test_unsupported_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            ResultStreamWriter(tmp_path / "result.xml", fmt="xml")
+
+
+def test_write_json_document_matches_json_dump(tmp_path, backend):
+    document = {
+        "audit_info": {"audit_id": "A-1", "timestamp": Path("x")},
+        "items": list(_lines(5)),
+        "statistics": {"total_items": 5},
+    }
+    path = tmp_path / "result.json"
+
+    assert write_json_document(path, document, "items") == 5
+
+    loaded = json.loads(path.read_text(encoding="utf-8"))
+    assert list(loaded) == ["audit_info", "items", "statistics"]
+    assert loaded["audit_info"]["timestamp"] == "x"
+    assert loaded["items"] == [dict(line) for line in _lines(5)]
+
+    empty = tmp_path / "empty.json"
+    write_json_document(empty, {"items": [], "statistics": {}}, "items")
+    assert json.loads(empty.read_text(encoding="utf-8")) == {"items": [], "statistics": {}}
+
+
+def test_dumps_same_bytes_for_both_backends(monkeypatch):
+    np = pytest.importorskip("numpy")
+    if not result_stream.ORJSON_OK:
+        pytest.skip("orjson not installed")
+    payload = {
+        "rate": np.float64(1.5),
+        "qty": np.int64(3),
+        "at": datetime(2025, 9, 1, 12, 0),
+        "on": date(2025, 9, 1),
+        "delta": float("nan"),
+        "ref": np.float64("nan"),
+        "items": [Line(s_no="1", status="PASS", total_usd=float("inf"), issues=[])],
+        "note": "금액",
+        "missing": None,
+    }
+
+    with_orjson = [result_stream.dumps(payload), result_stream.dumps(payload, indent=True)]
+    monkeypatch.setattr(result_stream, "ORJSON_OK", False)
+    with_json = [result_stream.dumps(payload), result_stream.dumps(payload, indent=True)]
+
+    assert with_orjson == with_json
+    loaded = json.loads(with_json[0])
+    assert loaded["rate"] == 1.5
+    assert loaded["at"] == "2025-09-01 12:00:00"
+    assert loaded["delta"] is None and loaded["ref"] is None
+    assert loaded["items"][0]["total_usd"] is None
+
+
+def _peak(tmp_path, count):
+    tracemalloc.start()
+    with ResultStreamWriter(tmp_path / f"{count}.ndjson") as stream:
+        stream.write_many(_lines(count))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def test_peak_memory_flat_regardless_of_item_count(tmp_path):
+    small = _peak(tmp_path, 1000)
+    large = _peak(tmp_path, 20000)
+
+    assert large < 2 * small
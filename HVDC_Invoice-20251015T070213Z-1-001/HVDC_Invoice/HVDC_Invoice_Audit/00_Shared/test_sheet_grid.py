@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+SheetGrid 테스트
+read_only 시트 값 배열이 ws.cell(...).value 조회와 동일한지 확인
+"""
+
+import re
+import sys
+import zipfile
+from pathlib import Path
+
+import openpyxl
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from invoice_consolidator import InvoiceConsolidator
+from sheet_grid import SheetGrid, open_workbook_readonly
+
+
+def test_should_match_cell_lookup(tmp_path):
+    """1-based 조회, 범위 밖 None, 행 길이 패딩"""
+    path = tmp_path / "grid.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "SCT-0001"
+    ws["A1"] = "Order Ref. Number"
+    ws["B1"] = "HVDC-ADOPT-SCT-0001"
+    ws["A3"] = "S/No"
+    ws["D3"] = "RATE"
+    ws["A4"] = 1
+    ws["D4"] = 12.5
+    wb.save(path)
+
+    reference = openpyxl.load_workbook(path, data_only=True)["SCT-0001"]
+    readonly = open_workbook_readonly(path)
+    try:
+        grid = SheetGrid.from_worksheet(readonly["SCT-0001"])
+    finally:
+        readonly.close()
+
+    assert (grid.max_row, grid.max_column) == (reference.max_row, reference.max_column)
+    for row in range(1, grid.max_row + 2):
+        for col in range(1, grid.max_column + 2):
+            assert grid.value(row, col) == reference.cell(row, col).value
+    assert grid.row(2) == (None, None, None, None)
+    assert grid.row(99) == (None, None, None, None)
+
+
+def test_stale_dimension_tag_does_not_truncate_rows(tmp_path):
+    """<dimension ref>가 실제 범위보다 작아도 전체 행을 읽음"""
+    path = tmp_path / "stale.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["A1"] = "S/No"
+    ws["C1"] = "RATE"
+    ws["A5"] = 3
+    ws["C5"] = 7.5
+    wb.save(path)
+
+    stale = tmp_path / "stale_dim.xlsx"
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(stale, "w") as dst:
+        for name in src.namelist():
+            data = src.read(name)
+            if name == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:B2"', data)
+            dst.writestr(name, data)
+
+    readonly = open_workbook_readonly(stale)
+    try:
+        grid = SheetGrid.from_worksheet(readonly.active)
+    finally:
+        readonly.close()
+
+    assert (grid.max_row, grid.max_column) == (5, 3)
+    assert grid.row(5) == (3, None, 7.5)
+
+
+def test_invoice_consolidator_with_and_without_sno(tmp_path):
+    """S/No 시트 + S/No 없는 시트(자동 번호) 통합"""
+    path = tmp_path / "invoice.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "SCT0126"
+    ws["A1"] = "CW1 Job Number"
+    ws["B1"] = "BAMF0012345"
+    ws.append([])
+    ws.append(["S/No", "RATE SOURCE", "DESCRIPTION", "RATE", "Q'TY", "TOTAL (USD)"])
+    ws.append([1, "CONTRACT", "DO FEE", 150, 1, 150])
+    ws.append([2, "CONTRACT", "CUSTOMS CLEARANCE", 150, 1, 150])
+    ws.append(["TOTAL", None, None, None, None, 300])
+
+    ws = wb.create_sheet("HE0471")
+    ws["A1"] = "HVDC-ADOPT-HE-0471"
+    ws.append(["RATE SOURCE", "DESCRIPTION", "RATE", "Q'TY", "TOTAL (USD)"])
+    ws.append(["AT COST", "INSPECTION FEE", 87.5, 2, 175])
+    ws.append([None, "NOTE ONLY", None, None, None])
+    wb.save(path)
+
+    df = InvoiceConsolidator(path).consolidate()
+
+    assert list(df["Order Ref. Number"]) == ["HVDC-ADOPT-SCT-0126"] * 2 + ["HVDC-ADOPT-HE-0471"]
+    assert list(df["CWI Job Number"]) == ["BAMF0012345"] * 2 + ["UNKNOWN"]
+    assert list(df["S/No"]) == [1, 2, 1]
+    assert list(df["DESCRIPTION"]) == ["DO FEE", "CUSTOMS CLEARANCE", "INSPECTION FEE"]
+    assert list(df["TOTAL (USD)"]) == [150, 150, 175]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+SupportingDocsIndex 테스트
+HVDC Project - Supporting Documents 디렉토리 인덱스
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from supporting_docs_index import SupportingDocsIndex, get_docs_index
+
+
+@pytest.fixture
+def docs_root(tmp_path):
+    """증빙문서 폴더 fixture"""
+    root = tmp_path / "Supporting Documents"
+    for folder, files in {
+        "01. HVDC-ADOPT-SCT-0126": ["HVDC-ADOPT-SCT-0126_BOE.pdf", "notes.txt"],
+        "02. HVDC-ADOPT-HE-0325, 0326": ["HVDC-ADOPT-HE-0325_DO.pdf"],
+    }.items():
+        (root / folder / "nested").mkdir(parents=True)
+        for name in files:
+            (root / folder / name).write_bytes(b"%PDF")
+    (root / "01. HVDC-ADOPT-SCT-0126" / "nested" / "HVDC-ADOPT-SCT-0126_DN.pdf").write_bytes(
+        b"%PDF-1"
+    )
+    return root
+
+
+class TestSupportingDocsIndex:
+    """디렉토리 인덱스 조회/무효화 테스트"""
+
+    def test_should_map_order_ref_to_direct_pdfs(self, docs_root):
+        """Order Ref → 매칭 폴더 직속 PDF (원본/정규화 매칭)"""
+        index = SupportingDocsIndex(docs_root)
+
+        pdfs = index.pdfs_for_ref("HVDC-ADOPT-SCT-0126")
+        assert [p.name for p in pdfs] == ["HVDC-ADOPT-SCT-0126_BOE.pdf"]
+
+        # 공백/쉼표/대소문자 차이는 정규화 매칭
+        pdfs = index.pdfs_for_ref("hvdc-adopt-he-0325 0326")
+        assert [p.name for p in pdfs] == ["HVDC-ADOPT-HE-0325_DO.pdf"]
+
+        assert index.pdfs_for_ref("HVDC-ADOPT-XXX-9999") == []
+
+    def test_should_list_recursive_pdfs_with_size(self, docs_root):
+        """재귀 PDF 목록 + 파일 크기"""
+        files = {p.name: size for p, size in SupportingDocsIndex(docs_root).files()}
+        assert files == {
+            "HVDC-ADOPT-SCT-0126_BOE.pdf": 4,
+            "HVDC-ADOPT-SCT-0126_DN.pdf": 6,
+            "HVDC-ADOPT-HE-0325_DO.pdf": 4,
+        }
+
+    def test_should_rescan_only_when_directory_changes(self, docs_root):
+        """디렉토리 mtime 변경 시에만 재스캔"""
+        index = SupportingDocsIndex(docs_root).refresh()
+        assert not index.is_stale()
+
+        folder = docs_root / "01. HVDC-ADOPT-SCT-0126"
+        (folder / "HVDC-ADOPT-SCT-0126_DO.pdf").write_bytes(b"%PDF")
+        stamp = folder.stat().st_mtime + 5
+        os.utime(folder, (stamp, stamp))
+
+        assert index.is_stale()
+        assert len(index.pdfs_for_ref("HVDC-ADOPT-SCT-0126")) == 1  # 갱신 전 캐시
+        index.refresh()
+        assert len(index.pdfs_for_ref("HVDC-ADOPT-SCT-0126")) == 2
+
+    def test_should_share_index_per_root(self, docs_root, tmp_path):
+        """같은 루트는 프로세스 내 동일 인덱스 공유"""
+        assert get_docs_index(docs_root) is get_docs_index(Path(str(docs_root)))
+        missing = get_docs_index(tmp_path / "missing", refresh=True)
+        assert not missing.exists
+        assert missing.files() == []
@@ -778,7 +778,11 @@ class UnifiedIRAdapter:
             return True
 
     def extract_invoice_line_item(
-        self, unified_ir: Dict[str, Any], category: str, draft_total: float = 0.0
+        self,
+        unified_ir: Dict[str, Any],
+        category: str,
+        draft_total: float = 0.0,
+        invoice_data: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         PDF에서 특정 Category의 실제 청구 라인 아이템 추출
@@ -787,6 +791,7 @@ class UnifiedIRAdapter:
             unified_ir: Unified IR 데이터
             category: 검색할 카테고리 (예: "TERMINAL HANDLING FEE")
             draft_total: Draft 인보이스 총액 (금액 범위 검증용, 선택적)
+            invoice_data: 미리 추출한 extract_invoice_data() 결과 (문서당 1회 추출 재사용)
 
         Returns:
             {
@@ -798,7 +803,8 @@ class UnifiedIRAdapter:
             } or None
         """
         # Extract invoice data using existing method
-        invoice_data = self.extract_invoice_data(unified_ir)
+        if invoice_data is None:
+            invoice_data = self.extract_invoice_data(unified_ir)
         items = invoice_data.get("items", [])
 
         logger.info(f"Extracted {len(items)} line items from PDF")
@@ -997,7 +1003,10 @@ class UnifiedIRAdapter:
         return None
 
     def extract_rate_for_category(
-        self, unified_ir: Dict[str, Any], category: str
+        self,
+        unified_ir: Dict[str, Any],
+        category: str,
+        invoice_data: Optional[Dict[str, Any]] = None,
     ) -> Optional[float]:
         """
         특정 Category의 요율 추출 (Fuzzy Matching + 키워드 기반)
@@ -1005,6 +1014,7 @@ class UnifiedIRAdapter:
         Args:
             unified_ir: Unified IR
             category: 찾을 카테고리 (예: "INLAND TRUCKING", "DO FEE")
+            invoice_data: 미리 추출한 extract_invoice_data() 결과 (선택적)
 
         Returns:
             요율 (float) 또는 None
@@ -1012,7 +1022,8 @@ class UnifiedIRAdapter:
         from difflib import SequenceMatcher
 
         # Extract invoice data
-        invoice_data = self.extract_invoice_data(unified_ir)
+        if invoice_data is None:
+            invoice_data = self.extract_invoice_data(unified_ir)
         items = invoice_data.get("items", [])
 
         if not items:
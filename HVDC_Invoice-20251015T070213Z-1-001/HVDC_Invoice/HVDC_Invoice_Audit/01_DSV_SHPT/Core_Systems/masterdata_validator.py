@@ -10,30 +10,52 @@ Author: MACHO-GPT v3.4-mini HVDC Project Enhancement
 
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import logging
 
 # Configuration Manager import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "00_Shared"))
 from config_manager import ConfigurationManager
 from category_normalizer import CategoryNormalizer
-from cost_guard import get_cost_guard_band, check_auto_fail
+from cost_guard import (
+    check_auto_fail,
+    delta_or_none,
+    delta_percent,
+    evaluate_cost_guard,
+    get_cost_guard_band,
+)
 from formula_parser import parse_rate_from_formula_or_fixed, KNOWN_AED_RATES
+from supporting_docs_index import get_docs_index
+from contract_rate_resolver import ContractRateResolver
+
+
+# PDF Integration: rdflib/pdfplumber 스택은 레거시 PDF 경로 사용 시점에 로드 (지연 import)
+@lru_cache(maxsize=None)
+def pdf_available() -> bool:
+    """레거시 PDF Integration 모듈 로드 가능 여부 (최초 1회 import)"""
+    try:
+        from pdf_integration import (  # noqa: F401
+            DSVPDFParser,
+            CrossDocValidator,
+            OntologyMapper,
+            WorkflowAutomator,
+        )
+    except ImportError:
+        return False
+    return True
+
 
-# PDF Integration import
-try:
-    from pdf_integration import (
-        DSVPDFParser,
-        CrossDocValidator,
-        OntologyMapper,
-        WorkflowAutomator,
-    )
+def __getattr__(name):
+    # PEP 562: 기존 PDF_AVAILABLE 상수 호환
+    if name == "PDF_AVAILABLE":
+        return pdf_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -52,6 +74,9 @@ class MasterDataValidator:
         self.config_manager = ConfigurationManager(self.rate_dir)
         self.config_manager.load_all_configs()
 
+        # Contract 참조 요율 결정 테이블 (설정 1회 컴파일)
+        self.rate_resolver = ContractRateResolver(self.config_manager)
+
         # Category Normalizer 초기화
         self.normalizer = CategoryNormalizer()
 
@@ -78,10 +103,8 @@ class MasterDataValidator:
             / "SCNT Import (Sept 2025) - Supporting Documents"
         )
 
-        # Configuration 데이터 로드
-        self.lane_map = self.config_manager.get_lane_map()
-        self.cost_guard_bands = self.config_manager.get_cost_guard_bands()
-        self.fx_rate = self.config_manager.get_fx_rate("USD", "AED")
+        # Lane Map / COST-GUARD 밴드 / FX 환율은 조회 시점 스냅샷에서 읽음
+        # (아래 property, hot-reload 반영)
 
         # Hybrid System Feature Flag
         self.use_hybrid = os.getenv("USE_HYBRID", "false").lower() == "true"
@@ -121,7 +144,7 @@ class MasterDataValidator:
                 self.ir_adapter = None
                 logger.warning(f"⚠️ UnifiedIRAdapter not available: {e}")
             
-            if PDF_AVAILABLE:
+            if pdf_available():
                 try:
                     from invoice_pdf_integration import InvoicePDFIntegration
 
@@ -133,8 +156,14 @@ class MasterDataValidator:
             else:
                 self.pdf_integration = None
 
-        # PDF 캐시
+        # PDF 캐시: (parser, pdf 경로) → 파싱 결과 / Unified IR → invoice_data
+        # validate_all() 실행 범위에서만 유지 (시작/종료 시 비움)
         self.pdf_cache = {}
+        self.invoice_data_cache = {}
+        self._cache_lock = threading.Lock()
+
+        # Shipment 그룹 병렬 검증 worker 수 (Hybrid API/PDF I/O 대기 위주)
+        self.max_workers = int(os.getenv("VALIDATION_WORKERS", "4"))
 
         # SEPT 시트에서 Mode 정보 로드 (Transport Mode 식별 개선)
         try:
@@ -153,6 +182,23 @@ class MasterDataValidator:
             self.mode_lookup = {}
             self.pol_pod_lookup = {}
 
+    # ==================== 설정 (현재 스냅샷) ====================
+
+    @property
+    def lane_map(self) -> Mapping[str, Mapping[str, Any]]:
+        """Lane Map (ConfigurationManager 현재 스냅샷)"""
+        return self.config_manager.snapshot.lane_map
+
+    @property
+    def cost_guard_bands(self) -> Mapping[str, Mapping[str, Any]]:
+        """COST-GUARD 밴드 (ConfigurationManager 현재 스냅샷)"""
+        return self.config_manager.snapshot.cost_guard_bands
+
+    @property
+    def fx_rate(self) -> float:
+        """USD→AED 환율 (ConfigurationManager 현재 스냅샷)"""
+        return self.config_manager.get_fx_rate("USD", "AED")
+
     def load_masterdata(self) -> pd.DataFrame:
         """MasterData 시트 로드"""
 
@@ -243,123 +289,77 @@ class MasterDataValidator:
         if pd.isna(description):
             return None
 
-        desc_upper = str(description).upper()
-
-        # Priority 1: 고빈도 고정 요율
-        # DO FEE 처리
-        if any(kw in desc_upper for kw in ["MASTER DO FEE", "DO FEE"]):
+        # Priority 1-2: 고정 요율 (DO FEE, Customs, Portal Fee, fixed_fees 키워드)
+        rule = self.rate_resolver.fixed_rule(description)
+        if rule is not None:
+            if rule.kind == "do_fee":
+                return self.rate_resolver.do_fee(self._identify_transport_mode(row))
+            if not rule.transport_mode:
+                return rule.rate
+            # Transport mode 필요 시 검증 (불일치 시 Priority 3으로)
             transport_mode = self._identify_transport_mode(row)
-            return self.config_manager.get_do_fee(transport_mode)
-
-        # CUSTOMS CLEARANCE 처리
-        if any(
-            kw in desc_upper
-            for kw in ["CUSTOMS CLEARANCE", "CUSTOM CLEARANCE", "CLEARANCE FEE"]
-        ):
-            return self.config_manager.get_customs_clearance_fee()
-
-        # Portal Fees 처리 (Config 우선 - PDF보다 먼저)
-        if "APPOINTMENT FEE" in desc_upper or "TRUCK APPOINTMENT" in desc_upper:
-            return self.config_manager.get_portal_fee_rate("APPOINTMENT_FEE", "USD")
-
-        if "DPC FEE" in desc_upper:
-            return self.config_manager.get_portal_fee_rate("DPC_FEE", "USD")
-
-        if "DOCUMENT PROCESSING FEE" in desc_upper or "DOCS PROCESSING" in desc_upper:
-            return self.config_manager.get_portal_fee_rate(
-                "DOCUMENT_PROCESSING_FEE", "USD"
-            )
-
-        # Priority 2: 키워드 기반 고정 요율 조회
-        fixed_fee = self.config_manager.get_fixed_fee_by_keywords(description)
-        if fixed_fee:
-            # Transport mode 필요 시 검증
-            if fixed_fee.get("transport_mode"):
-                transport_mode = self._identify_transport_mode(row)
-                if fixed_fee["transport_mode"].upper() == transport_mode.upper():
-                    return fixed_fee["rate"]
-            else:
-                return fixed_fee["rate"]
+            if rule.transport_mode.upper() == transport_mode.upper():
+                return rule.rate
 
         # Priority 3: 기존 로직 (Configuration, Lane Map, PDF)
-        desc_upper = str(description).upper()
-
         # row가 제공되지 않으면 기본값 사용
         if row is None:
             row = pd.Series({"CHARGE GROUP": "Contract"})
 
         charge_group = str(row.get("CHARGE GROUP", "")).strip().upper()
 
-        # 1. CONTRACT 항목: Configuration 우선
+        # 1. CONTRACT 항목: Configuration(fixed_fees → Inland → Lane) 우선, PDF 폴백
         if "CONTRACT" in charge_group:
-            # 1-1. Fixed contract rates (config_contract_rates.json)
-            contract_rate = self.config_manager.get_contract_rate(description)
-            if contract_rate is not None:
-                return contract_rate
-
-            # 1-2. Inland Transportation (config_contract_rates.json - inland_transportation)
-            if any(
-                kw in desc_upper
-                for kw in ["TRANSPORTATION", "TRUCKING", "INLAND", "FROM", "TO"]
-            ):
-                # Description에서 출발지/목적지 파싱
-                port, destination = self._parse_transportation_route(description)
-                if port and destination:
-                    # 새로운 inland_transportation 우선 조회
-                    inland_rate = self.config_manager.get_inland_transportation_rate(
-                        port, destination
-                    )
-                    if inland_rate is not None:
-                        return inland_rate
-
-                    # Fallback: lane_map 조회
-                    ref_rate = self.config_manager.get_lane_rate(
-                        port, destination, "per truck"
-                    )
-                    if ref_rate is not None:
-                        return ref_rate
-
-            # 1-3. Fallback: PDF (계약서 스캔본)
-            pdf_rate = self._extract_rate_from_pdf(row)
+            config_rate = self.rate_resolver.config_rate(description)
+            if config_rate is not None:
+                return config_rate
+            return self._extract_rate_from_pdf(row)
+
+        # 2. 일반 항목: PDF 우선, Configuration 폴백
+        pdf_rate = self._extract_rate_from_pdf(row)
+        if pdf_rate:
             return pdf_rate
-
-        # 2. 일반 항목: PDF 우선
+        return self.rate_resolver.config_rate(description)
+
+    def clear_pdf_cache(self) -> None:
+        """PDF 파싱/invoice_data 캐시 비우기 (디스크의 PDF 변경 반영, 메모리 해제)"""
+        with self._cache_lock:
+            self.pdf_cache.clear()
+            self.invoice_data_cache.clear()
+
+    def _parse_pdf_cached(self, pdf_path: Path, legacy: bool = False) -> Optional[Dict]:
+        """PDF 파싱 결과 캐시 (검증 실행 동안 PDF당 1회 파싱)"""
+        key = ("legacy" if legacy else "hybrid", str(pdf_path))
+        with self._cache_lock:
+            if key in self.pdf_cache:
+                return self.pdf_cache[key]
+
+        # 파싱은 lock 밖에서 수행 (shipment 그룹 간 PDF 공유는 드묾)
+        if legacy:
+            parsed = self.pdf_integration.parse_pdf(str(pdf_path))
         else:
-            # 2-1. PDF 첨부파일에서 추출
-            pdf_rate = self._extract_rate_from_pdf(row)
-            if pdf_rate:
-                return pdf_rate
-
-            # 2-2. Fallback: Configuration
-            contract_rate = self.config_manager.get_contract_rate(description)
-            if contract_rate is not None:
-                return contract_rate
-
-            # Inland Transportation fallback
-            if any(
-                kw in desc_upper
-                for kw in ["TRANSPORTATION", "TRUCKING", "INLAND", "FROM", "TO"]
-            ):
-                port, destination = self._parse_transportation_route(description)
-                if port and destination:
-                    # 새로운 inland_transportation 우선 조회
-                    inland_rate = self.config_manager.get_inland_transportation_rate(
-                        port, destination
-                    )
-                    if inland_rate is not None:
-                        return inland_rate
+            parsed = self.hybrid_client.parse_pdf(str(pdf_path), "invoice")
 
-                    # Fallback: lane_map 조회
-                    ref_rate = self.config_manager.get_lane_rate(
-                        port, destination, "per truck"
-                    )
-                    if ref_rate is not None:
-                        return ref_rate
+        with self._cache_lock:
+            self.pdf_cache[key] = parsed
+        return parsed
 
-        # 3. 기타 표준 요율 (추후 확장 가능)
-        return None
+    def _invoice_data_cached(self, pdf_path: Path, unified_ir: Dict) -> Dict:
+        """Unified IR → invoice_data (라인 아이템 구조) 문서당 1회 추출"""
+        key = str(pdf_path)
+        with self._cache_lock:
+            if key in self.invoice_data_cache:
+                return self.invoice_data_cache[key]
 
-    def _extract_pdf_line_item(self, row: pd.Series) -> Optional[Dict]:
+        invoice_data = self.ir_adapter.extract_invoice_data(unified_ir)
+
+        with self._cache_lock:
+            self.invoice_data_cache[key] = invoice_data
+        return invoice_data
+
+    def _extract_pdf_line_item(
+        self, row: pd.Series, pdf_mapping: Optional[Dict] = None
+    ) -> Optional[Dict]:
         """
         PDF에서 실제 청구 라인 아이템 추출 (금액, 수량, 단가)
 
@@ -379,7 +379,8 @@ class MasterDataValidator:
         normalized_category = self.normalizer.normalize(category)
 
         # PDF 매핑
-        pdf_mapping = self.map_masterdata_to_pdf(row)
+        if pdf_mapping is None:
+            pdf_mapping = self.map_masterdata_to_pdf(row)
         if pdf_mapping["pdf_count"] == 0:
             return None
 
@@ -390,19 +391,20 @@ class MasterDataValidator:
         if self.use_hybrid and self.hybrid_client and self.ir_adapter:
             for pdf_path in pdf_mapping["pdf_files"]:
                 try:
-                    # Hybrid API로 파싱 요청
-                    unified_ir = self.hybrid_client.parse_pdf(str(pdf_path), "invoice")
+                    # Hybrid API로 파싱 요청 (캐시)
+                    unified_ir = self._parse_pdf_cached(pdf_path)
 
                     if unified_ir:
+                        invoice_data = self._invoice_data_cached(pdf_path, unified_ir)
                         # 실제 라인 아이템 추출 (정규화 우선, 원본 Fallback)
                         # draft_total을 전달하여 금액 범위 검증 수행
                         line_item = self.ir_adapter.extract_invoice_line_item(
-                            unified_ir, normalized_category, draft_total
+                            unified_ir, normalized_category, draft_total, invoice_data
                         )
 
                         if not line_item:
                             line_item = self.ir_adapter.extract_invoice_line_item(
-                                unified_ir, category, draft_total
+                                unified_ir, category, draft_total, invoice_data
                             )
 
                         if line_item:
@@ -437,19 +439,20 @@ class MasterDataValidator:
                         f"[HYBRID] Parsing {pdf_path.name} for '{normalized_category}'"
                     )
 
-                    # 1. Hybrid API로 파싱 요청
-                    unified_ir = self.hybrid_client.parse_pdf(str(pdf_path), "invoice")
+                    # 1. Hybrid API로 파싱 요청 (캐시)
+                    unified_ir = self._parse_pdf_cached(pdf_path)
 
                     if unified_ir:
+                        invoice_data = self._invoice_data_cached(pdf_path, unified_ir)
                         # 2. 정규화된 Category로 요율 추출 (먼저 시도)
                         rate = self.ir_adapter.extract_rate_for_category(
-                            unified_ir, normalized_category
+                            unified_ir, normalized_category, invoice_data
                         )
 
                         # 3. Fallback: 원본 Category로 시도
                         if not rate or rate <= 0:
                             rate = self.ir_adapter.extract_rate_for_category(
-                                unified_ir, category
+                                unified_ir, category, invoice_data
                             )
 
                         if rate and rate > 0:
@@ -465,7 +468,7 @@ class MasterDataValidator:
                     continue
 
         # Fallback: Legacy PDF Integration
-        if not PDF_AVAILABLE or not self.pdf_integration:
+        if not self.pdf_integration or not pdf_available():
             return None
 
         logger.info(f"[LEGACY] Using legacy PDF integration for '{category}'")
@@ -473,7 +476,7 @@ class MasterDataValidator:
         # PDF 파싱 및 Rate 추출 (기존 로직)
         for pdf_path in pdf_mapping["pdf_files"]:
             try:
-                pdf_data = self.pdf_integration.parse_pdf(str(pdf_path))
+                pdf_data = self._parse_pdf_cached(pdf_path, legacy=True)
 
                 # Category 매칭
                 matched_rate = self._match_category_in_pdf(category, pdf_data)
@@ -513,57 +516,12 @@ class MasterDataValidator:
             return round(rate / fx_rate, 2)
         return rate
 
-    def _parse_transportation_route(self, description: str) -> tuple:
-        """Description에서 출발지/목적지 추출"""
-
-        import re
-
-        desc_upper = str(description).upper()
-
-        # "FROM ... TO ..." 패턴
-        match = re.search(r"FROM\s+([A-Z\s]+)\s+TO\s+([A-Z\s]+)", desc_upper)
-        if match:
-            port = match.group(1).strip()
-            destination = match.group(2).strip()
-
-            # Normalization
-            port = self._normalize_location(port)
-            destination = self._normalize_location(destination)
-
-            return (port, destination)
-
-        return (None, None)
-
-    def _normalize_location(self, location: str) -> str:
-        """위치명 정규화"""
-
-        normalization = self.config_manager.get_normalization_aliases()
-        location_upper = str(location).strip().upper()
-
-        # Check ports
-        ports = normalization.get("ports", {})
-        for alias, standard in ports.items():
-            if str(alias).upper() == location_upper:
-                return standard
-
-        # Check destinations
-        destinations = normalization.get("destinations", {})
-        for alias, standard in destinations.items():
-            if str(alias).upper() == location_upper:
-                return standard
-
-        # No match found - return original
-        return location.strip()
-
     def calculate_delta_percent(
         self, draft_rate: float, ref_rate: float
     ) -> Optional[float]:
-        """Delta % 계산"""
+        """Delta % 계산 (계산 불가 / Ref = 0 → None)"""
 
-        if pd.isna(draft_rate) or pd.isna(ref_rate) or ref_rate == 0:
-            return None
-
-        return round(((draft_rate - ref_rate) / ref_rate) * 100, 2)
+        return delta_percent(draft_rate, ref_rate)
 
     def get_cost_guard_band_legacy(self, delta_percent: Optional[float]) -> str:
         """
@@ -638,33 +596,13 @@ class MasterDataValidator:
 
         order_ref = row.get("Order Ref. Number")  # "HVDC-ADOPT-SCT-0126"
 
-        if pd.isna(order_ref) or not self.supporting_docs_path.exists():
+        docs_index = get_docs_index(self.supporting_docs_path)
+        if pd.isna(order_ref) or not docs_index.exists:
             return {"shipment_id": None, "pdf_count": 0, "pdf_files": []}
 
         # PDF 파일들은 하위 디렉토리 안에 있음
-        # 패턴: "NN. {order_ref}/" 디렉토리 찾기
-        pdf_files = []
-
-        # 정규화 함수
-        def normalize(text):
-            """공백, 쉼표 제거하고 소문자로 변환"""
-            return text.replace(" ", "").replace(",", "").lower()
-
-        order_ref_normalized = normalize(str(order_ref))
-
-        # 재귀적으로 PDF 찾기 (하위 디렉토리 포함)
-        for subdir in self.supporting_docs_path.iterdir():
-            if subdir.is_dir():
-                dir_name_normalized = normalize(subdir.name)
-
-                # 정확한 매칭 또는 정규화 매칭
-                if (
-                    order_ref in subdir.name
-                    or order_ref_normalized in dir_name_normalized
-                ):
-                    # 해당 디렉토리 안의 모든 PDF 찾기
-                    pdf_files.extend(list(subdir.glob("*.pdf")))
-                    break  # 첫 번째 매칭 디렉토리만 사용
+        # 패턴: "NN. {order_ref}/" 디렉토리 찾기 (디렉토리 인덱스에서 조회)
+        pdf_files = docs_index.pdfs_for_ref(order_ref)
 
         return {
             "shipment_id": order_ref,
@@ -672,8 +610,8 @@ class MasterDataValidator:
             "pdf_files": pdf_files,
         }
 
-    def validate_row(self, row: pd.Series) -> Dict:
-        """MasterData 행 검증"""
+    def _resolve_reference(self, row: pd.Series) -> Tuple[str, Optional[float]]:
+        """Charge Group 분류 + 기준 요율 조회 → (charge_group, ref_rate)"""
 
         # Charge Group 분류
         charge_group = self.classify_charge_group(
@@ -692,18 +630,54 @@ class MasterDataValidator:
                 row.get("DESCRIPTION"), "USD"
             )
 
-        # Delta 계산
-        delta_pct = self.calculate_delta_percent(row.get("RATE"), ref_rate)
+        return charge_group, ref_rate
 
-        # COST-GUARD 밴드 (Config 기반)
-        cg_band = get_cost_guard_band(delta_pct, self.cost_guard_bands)
+    def _cost_guard_frame(
+        self, draft_rates: List, ref_rates: List[Optional[float]]
+    ) -> pd.DataFrame:
+        """Delta/COST-GUARD 밴드/Auto-Fail(15%) 일괄 계산 (Config 기반)"""
+        return evaluate_cost_guard(
+            draft_rates, ref_rates, self.cost_guard_bands, auto_fail_threshold=15.0
+        )
+
+    def validate_row(
+        self,
+        row: pd.Series,
+        pdf_info: Optional[Dict] = None,
+        reference: Optional[Tuple[str, Optional[float]]] = None,
+        cost_guard: Optional[Tuple] = None,
+    ) -> Dict:
+        """
+        MasterData 행 검증
+
+        Args:
+            row: MasterData 행
+            pdf_info: shipment 그룹에서 미리 해석한 PDF 매핑
+            reference: 미리 조회한 (charge_group, ref_rate)
+            cost_guard: 그룹 단위 _cost_guard_frame 결과 행 (itertuples)
+        """
+
+        if reference is None:
+            reference = self._resolve_reference(row)
+        charge_group, ref_rate = reference
+
+        # Delta + COST-GUARD 밴드 (Config 기반)
+        if cost_guard is None:
+            cost_guard = next(
+                self._cost_guard_frame([row.get("RATE")], [ref_rate]).itertuples(
+                    index=False
+                )
+            )
+        delta_pct = delta_or_none(cost_guard.delta_pct)
+        cg_band = cost_guard.cg_band
 
         # PDF 매핑
-        pdf_info = self.map_masterdata_to_pdf(row)
+        if pdf_info is None:
+            pdf_info = self.map_masterdata_to_pdf(row)
         pdf_count = pdf_info["pdf_count"]
 
         # PDF 실제 청구 금액/수량 검증 (NEW)
-        pdf_line_item = self._extract_pdf_line_item(row)
+        pdf_line_item = self._extract_pdf_line_item(row, pdf_info)
 
         # Gate 점수 (PDF 고려)
         gate_score = self.calculate_gate_score(row, ref_rate, charge_group, pdf_count)
@@ -761,10 +735,10 @@ class MasterDataValidator:
             if delta_pct is not None:
                 # Config 기반 밴드로 PASS 판정
                 if cg_band == "PASS":
-                validation_status = "PASS"
+                    validation_status = "PASS"
                 # Auto-Fail 체크 (15% threshold from Config)
-                elif check_auto_fail(delta_pct, auto_fail_threshold=15.0):
-                validation_status = "FAIL"
+                elif cost_guard.auto_fail:
+                    validation_status = "FAIL"
 
         # Portal Fee 항목 (특수 허용 오차 ±0.5%)
         elif charge_group == "PortalFee" and delta_pct is not None:
@@ -1001,20 +975,21 @@ class MasterDataValidator:
         # MasterData 로드
         df_master = self.load_masterdata()
 
-        # 검증 결과 저장용 리스트
-        validation_results = []
+        # 증빙문서 인덱스: 실행당 1회 (디렉토리 변경 시에만 재스캔)
+        get_docs_index(self.supporting_docs_path, refresh=True)
 
         logger.info(f"\nValidating {len(df_master)} items...")
 
-        for idx, row in df_master.iterrows():
-            validation = self.validate_row(row)
-            validation_results.append(validation)
-
-            if (idx + 1) % 20 == 0:
-                logger.info(f"  Processed: {idx + 1}/{len(df_master)}")
+        # Shipment 그룹 단위 검증 → 입력 행 순서로 재정렬
+        # PDF 캐시는 이번 실행 동안만 사용 (이전 실행의 파싱 결과 재사용 안 함)
+        self.clear_pdf_cache()
+        try:
+            validation_results = self._validate_grouped(df_master)
+        finally:
+            self.clear_pdf_cache()
 
-        # 검증 결과를 DataFrame으로 변환
-        df_validation = pd.DataFrame(validation_results)
+        # 검증 결과를 DataFrame으로 변환 (df_master와 행 정렬 유지)
+        df_validation = pd.DataFrame(validation_results, index=df_master.index)
 
         # 원본 + 검증 결과 결합
         df_result = pd.concat([df_master, df_validation], axis=1)
@@ -1028,6 +1003,67 @@ class MasterDataValidator:
 
         return df_result
 
+    def _validate_group(
+        self, df_master: pd.DataFrame, positions: List[int]
+    ) -> List[Tuple[int, Dict]]:
+        """
+        Shipment(Order Ref) 그룹 검증
+
+        PDF 매핑은 그룹당 1회 해석하고, PDF 파싱/라인 아이템 구조는
+        캐시로 공유되어 그룹의 모든 행이 같은 문서 결과를 재사용한다.
+        """
+        group = df_master.iloc[positions]
+        pdf_info = self.map_masterdata_to_pdf(group.iloc[0])
+        rows = [row for _, row in group.iterrows()]
+
+        # 기준 요율을 먼저 모두 조회한 뒤 그룹 전체 Delta/밴드 일괄 계산
+        references = [self._resolve_reference(row) for row in rows]
+        cost_guard = self._cost_guard_frame(
+            [row.get("RATE") for row in rows], [ref_rate for _, ref_rate in references]
+        )
+        return [
+            (position, self.validate_row(row, pdf_info, reference, guard))
+            for position, row, reference, guard in zip(
+                positions, rows, references, cost_guard.itertuples(index=False)
+            )
+        ]
+
+    def _validate_grouped(self, df_master: pd.DataFrame) -> List[Dict]:
+        """Order Ref 그룹을 worker pool에 분배, 결과는 입력 행 순서로 반환"""
+        if "Order Ref. Number" in df_master.columns:
+            groups = [
+                list(positions)
+                for positions in df_master.groupby(
+                    "Order Ref. Number", sort=False, dropna=False
+                ).indices.values()
+            ]
+        else:
+            groups = [list(range(len(df_master)))]
+
+        results: List[Optional[Dict]] = [None] * len(df_master)
+        workers = max(1, min(self.max_workers, len(groups)))
+        logger.info(f"  Shipment groups: {len(groups)} (workers: {workers})")
+
+        processed = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._validate_group, df_master, positions)
+                for positions in groups
+            ]
+            for future in as_completed(futures):
+                group_results = future.result()
+                for position, validation in group_results:
+                    results[position] = validation
+
+                # 20건 단위 진행 로그
+                if (processed + len(group_results)) // 20 > processed // 20:
+                    logger.info(
+                        f"  Processed: {processed + len(group_results)}/{len(df_master)}"
+                    )
+                processed += len(group_results)
+
+        return results
+
     def _print_statistics(self, df: pd.DataFrame):
         """검증 통계 출력"""
 
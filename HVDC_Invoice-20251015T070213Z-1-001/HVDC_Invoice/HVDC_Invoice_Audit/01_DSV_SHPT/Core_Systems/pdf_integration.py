@@ -58,8 +58,8 @@ class InvoicePDFIntegration:
         # PDF 모듈 초기화
         if PDF_INTEGRATION_OK:
             self.pdf_parser = DSVPDFParser(log_level="INFO")
-            self.doc_validator = CrossDocValidator()
             self.ontology_mapper = OntologyMapper()
+            self.doc_validator = CrossDocValidator(facts=self.ontology_mapper.facts)
 
             # Config 경로 결정
             if not config_path:
@@ -204,22 +204,26 @@ class InvoicePDFIntegration:
                 "error": str(e),
             }
 
-    def validate_invoice_with_docs(
-        self, invoice_item: Dict, shipment_id: str, pdf_files: List[Dict]
+    def validate_shipment_docs(
+        self,
+        shipment_id: str,
+        pdf_files: List[Dict],
+        parse_result: Optional[Dict] = None,
     ) -> Dict:
         """
-        Invoice 항목 + PDF 데이터 통합 검증
+        Shipment 단위 PDF 검증 (Invoice 항목과 무관한 부분, Shipment당 1회)
 
         Args:
-            invoice_item: Invoice 항목 딕셔너리
             shipment_id: Shipment ID
             pdf_files: PDF 파일 리스트
+            parse_result: parse_supporting_docs 결과 (이미 파싱한 경우 재사용)
 
         Returns:
-            통합 검증 결과
+            {"pdf_validation": {...}, "demurrage_risk": ...}
         """
         # 1. PDF 파싱
-        parse_result = self.parse_supporting_docs(shipment_id, pdf_files)
+        if parse_result is None:
+            parse_result = self.parse_supporting_docs(shipment_id, pdf_files)
 
         # 2. Cross-document 검증
         documents_for_validation = []
@@ -243,18 +247,19 @@ class InvoicePDFIntegration:
                 "all_issues": [],
             }
 
-        # 3. Invoice 검증에 PDF 데이터 통합
-        enhanced_validation = invoice_item.copy()
-        enhanced_validation["pdf_validation"] = {
-            "enabled": True,
-            "parsed_files": parse_result["parsed_count"],
-            "total_files": parse_result["total_files"],
-            "cross_doc_status": doc_report["overall_status"],
-            "cross_doc_issues": doc_report["total_issues"],
-            "issues_detail": doc_report.get("all_issues", []),
+        shipment_result = {
+            "pdf_validation": {
+                "enabled": True,
+                "parsed_files": parse_result["parsed_count"],
+                "total_files": parse_result["total_files"],
+                "cross_doc_status": doc_report["overall_status"],
+                "cross_doc_issues": doc_report["total_issues"],
+                "issues_detail": doc_report.get("all_issues", []),
+            },
+            "demurrage_risk": None,
         }
 
-        # 4. Demurrage Risk 체크 (DO 파일이 있으면)
+        # 3. Demurrage Risk 체크 (DO 파일이 있으면)
         for doc in parse_result["documents"]:
             if doc.get("header", {}).get("doc_type") == "DO" and doc.get("data"):
                 if self.workflow_automator:
@@ -266,10 +271,42 @@ class InvoicePDFIntegration:
                     )
 
                     if demurrage_risk:
-                        enhanced_validation["demurrage_risk"] = demurrage_risk
-                        enhanced_validation["pdf_validation"][
-                            "has_demurrage_risk"
-                        ] = True
+                        shipment_result["demurrage_risk"] = demurrage_risk
+                        shipment_result["pdf_validation"]["has_demurrage_risk"] = True
+
+        return shipment_result
+
+    def validate_invoice_with_docs(
+        self,
+        invoice_item: Dict,
+        shipment_id: str,
+        pdf_files: List[Dict],
+        shipment_result: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        Invoice 항목 + PDF 데이터 통합 검증
+
+        Args:
+            invoice_item: Invoice 항목 딕셔너리
+            shipment_id: Shipment ID
+            pdf_files: PDF 파일 리스트
+            shipment_result: validate_shipment_docs 결과 (Shipment 내 항목 간 공유)
+
+        Returns:
+            통합 검증 결과
+        """
+        if shipment_result is None:
+            shipment_result = self.validate_shipment_docs(shipment_id, pdf_files)
+
+        # Invoice 검증에 PDF 데이터 통합 (항목별 사본)
+        pdf_validation = dict(shipment_result["pdf_validation"])
+        pdf_validation["issues_detail"] = list(pdf_validation["issues_detail"])
+
+        enhanced_validation = invoice_item.copy()
+        enhanced_validation["pdf_validation"] = pdf_validation
+
+        if shipment_result.get("demurrage_risk"):
+            enhanced_validation["demurrage_risk"] = shipment_result["demurrage_risk"]
 
         return enhanced_validation
 
@@ -305,44 +342,51 @@ class InvoicePDFIntegration:
 
         return enriched
 
-    def run_pdf_gates(self, invoice_item: Dict, pdf_data: Dict) -> Dict:
+    def run_shipment_gates(self, pdf_data: Dict) -> List[Dict]:
+        """
+        문서 전용 PDF Gate (Gate-12~14) - Invoice 항목과 무관하므로 Shipment당 1회
+
+        Args:
+            pdf_data: PDF 파싱 결과
+
+        Returns:
+            Gate-12, Gate-13, Gate-14 결과 리스트
+        """
+        return [
+            # Gate-12: Container 번호 일치
+            self._gate_12_container_consistency(pdf_data),
+            # Gate-13: Weight 일치
+            self._gate_13_weight_consistency(pdf_data),
+            # Gate-14: 누락 인증서 체크
+            self._gate_14_certification_check(pdf_data),
+        ]
+
+    def run_pdf_gates(
+        self,
+        invoice_item: Dict,
+        pdf_data: Dict,
+        shipment_gates: Optional[List[Dict]] = None,
+    ) -> Dict:
         """
         PDF 기반 Gate 검증 (Gate-11~14)
 
         Args:
             invoice_item: Invoice 항목
             pdf_data: PDF 파싱 결과
+            shipment_gates: run_shipment_gates 결과 (없으면 여기서 계산)
 
         Returns:
             Gate 검증 결과
         """
-        gate_results = []
-        total_score = 0
-        max_score = 0
-
-        # Gate-11: BOE-Invoice MBL 일치
-        gate_11 = self._gate_11_mbl_consistency(invoice_item, pdf_data)
-        gate_results.append(gate_11)
-        total_score += gate_11["score"]
-        max_score += 100
-
-        # Gate-12: Container 번호 일치
-        gate_12 = self._gate_12_container_consistency(pdf_data)
-        gate_results.append(gate_12)
-        total_score += gate_12["score"]
-        max_score += 100
-
-        # Gate-13: Weight 일치
-        gate_13 = self._gate_13_weight_consistency(pdf_data)
-        gate_results.append(gate_13)
-        total_score += gate_13["score"]
-        max_score += 100
-
-        # Gate-14: 누락 인증서 체크
-        gate_14 = self._gate_14_certification_check(pdf_data)
-        gate_results.append(gate_14)
-        total_score += gate_14["score"]
-        max_score += 100
+        if shipment_gates is None:
+            shipment_gates = self.run_shipment_gates(pdf_data)
+
+        # Gate-11: BOE-Invoice MBL 일치 (항목별) + Shipment Gate 결합
+        gate_results = [self._gate_11_mbl_consistency(invoice_item, pdf_data)]
+        gate_results.extend(dict(gate) for gate in shipment_gates)
+
+        total_score = sum(gate["score"] for gate in gate_results)
+        max_score = 100 * len(gate_results)
 
         # 전체 결과
         avg_score = round(total_score / max_score * 100, 1) if max_score > 0 else 0
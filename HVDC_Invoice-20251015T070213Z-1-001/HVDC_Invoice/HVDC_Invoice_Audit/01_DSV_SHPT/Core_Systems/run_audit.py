@@ -56,71 +56,58 @@ def run_full_validation():
         # 처리 시간
         elapsed_time = time.time() - start_time
 
+        stats = results["statistics"]
+        total_items = stats["total_items"]
+
         # 결과 요약
         print(f"\n[RESULTS]")
-        print(f"  Total items processed: {results['summary']['total_items']}")
-        print(f"  Total sheets: {results['summary']['total_sheets']}")
+        print(f"  Total items processed: {total_items}")
+        print(f"  Total sheets: {stats['total_sheets']}")
         print(f"  Processing time: {elapsed_time:.2f} seconds")
 
+        # 항목은 결과 스트림을 1회 순회하며 집계 (전체 목록 미보관)
+        contract_items = 0
+        contract_with_ref = 0
+        status_counts = {}
+        charge_groups = {}
+        for item in audit_system.iter_items(results):
+            status = item.get("status", "UNKNOWN")
+            status_counts[status] = status_counts.get(status, 0) + 1
+            group = item.get("charge_group", "UNKNOWN")
+            charge_groups[group] = charge_groups.get(group, 0) + 1
+            if group == "Contract":
+                contract_items += 1
+                if item.get("ref_rate_usd") is not None:
+                    contract_with_ref += 1
+
         # Contract 검증 분석
-        contract_items = [
-            item
-            for item in results["detailed_results"]
-            if item.get("charge_group") == "Contract"
-        ]
-        contract_with_ref = len(
-            [item for item in contract_items if item.get("ref_rate_usd") is not None]
-        )
         contract_coverage = (
-            (contract_with_ref / len(contract_items) * 100)
-            if len(contract_items) > 0
-            else 0
+            (contract_with_ref / contract_items * 100) if contract_items > 0 else 0
         )
 
         print(f"\n[CONTRACT VALIDATION]")
-        print(f"  Total Contract items: {len(contract_items)}")
+        print(f"  Total Contract items: {contract_items}")
         print(f"  Items with ref_rate: {contract_with_ref}")
         print(f"  Coverage: {contract_coverage:.1f}%")
 
         # 상태 분포
-        status_counts = {}
-        for item in results["detailed_results"]:
-            status = item.get("status", "UNKNOWN")
-            status_counts[status] = status_counts.get(status, 0) + 1
-
         print(f"\n[STATUS DISTRIBUTION]")
         for status, count in sorted(status_counts.items()):
-            percentage = (
-                (count / results["summary"]["total_items"] * 100)
-                if results["summary"]["total_items"] > 0
-                else 0
-            )
+            percentage = (count / total_items * 100) if total_items > 0 else 0
             print(f"  {status}: {count} ({percentage:.1f}%)")
 
         # Charge Group 분포
-        charge_groups = {}
-        for item in results["detailed_results"]:
-            group = item.get("charge_group", "UNKNOWN")
-            charge_groups[group] = charge_groups.get(group, 0) + 1
-
         print(f"\n[CHARGE GROUP DISTRIBUTION]")
         for group, count in sorted(charge_groups.items()):
-            percentage = (
-                (count / results["summary"]["total_items"] * 100)
-                if results["summary"]["total_items"] > 0
-                else 0
-            )
+            percentage = (count / total_items * 100) if total_items > 0 else 0
             print(f"  {group}: {count} ({percentage:.1f}%)")
 
         # 성능 메트릭
-        items_per_second = (
-            results["summary"]["total_items"] / elapsed_time if elapsed_time > 0 else 0
-        )
+        items_per_second = total_items / elapsed_time if elapsed_time > 0 else 0
         print(f"\n[PERFORMANCE]")
         print(f"  Items/second: {items_per_second:.1f}")
-        print(
-            f"  Avg time/item: {elapsed_time / results['summary']['total_items'] * 1000:.2f} ms"
-        )
+        if total_items > 0:
+            print(f"  Avg time/item: {elapsed_time / total_items * 1000:.2f} ms")
 
         # 결과 파일 위치
         print(f"\n[OUTPUT FILES]")
@@ -7,12 +7,14 @@
 - Month 컬럼 추가 (C열)
 
 Usage:
-    python consolidate_all_months.py
+    python consolidate_all_months.py [--workers N] [--no-cache]
 
 Output:
     out/masterdata_all_months_YYYYMMDD_HHMMSS.xlsx
 """
 
+import argparse
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -24,6 +26,18 @@ from engine_multi_month import MultiMonthConsolidator
 
 def main():
     """14개월 인보이스 통합 실행"""
+
+    parser = argparse.ArgumentParser(description="Multi-month invoice consolidation")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="병렬 처리 프로세스 수 (1=순차)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="파일별 통합 결과 캐시 사용 안 함"
+    )
+    args = parser.parse_args()
     
     print("=" * 80)
     print("Multi-Month Invoice Consolidation System")
@@ -42,13 +56,19 @@ def main():
     print(f"[INPUT] Folder: {shpt_folder}")
     print()
     
-    # 통합 실행
+    output_dir = Path(__file__).parent / "out"
+    
+    # 통합 실행 (파일별 캐시는 출력 폴더 아래에 보관)
     try:
-        consolidator = MultiMonthConsolidator(shpt_folder)
+        consolidator = MultiMonthConsolidator(
+            shpt_folder,
+            workers=args.workers,
+            cache_dir=output_dir / "consolidation_cache",
+            use_cache=not args.no_cache,
+        )
         all_data = consolidator.consolidate_all_months()
         
         # 결과 저장
-        output_dir = Path(__file__).parent / "out"
         output_dir.mkdir(exist_ok=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -12,30 +12,96 @@ Shipment Invoice Audit Engine
 """
 
 import pandas as pd
-import json
 import os
 import re
 import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 from pathlib import Path
 import logging
+from collections import Counter
 
 # UnifiedRateLoader and ConfigurationManager import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "00_Shared"))
 from rate_loader import UnifiedRateLoader
 from config_manager import ConfigurationManager
-from cost_guard import get_cost_guard_band, check_auto_fail
+from cost_guard import delta_or_none, evaluate_cost_guard
+from supporting_docs_index import get_docs_index
+from contract_rate_resolver import ContractRateResolver
+from item_records import SHIPMENT_DOC_FIELDS, ItemRecord, ShipmentDocs
+from result_stream import ResultStreamWriter, iter_ndjson, write_json_document
+
+
+# PDF Integration: 엔진 생성 시점에 로드 (지연 import, 모듈 import 비용 제거)
+@lru_cache(maxsize=None)
+def load_pdf_integration():
+    """InvoicePDFIntegration 클래스 로드 (의존성 미설치 시 None)"""
+    try:
+        from invoice_pdf_integration import InvoicePDFIntegration
+    except ImportError:
+        logging.warning(
+            "PDF Integration not available. Install dependencies: pip install pdfplumber rdflib"
+        )
+        return None
+    return InvoicePDFIntegration
+
+
+def __getattr__(name):
+    # PEP 562: 기존 PDF_INTEGRATION_AVAILABLE 상수 호환
+    if name == "PDF_INTEGRATION_AVAILABLE":
+        return load_pdf_integration() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# PDF Integration import
-try:
-    from invoice_pdf_integration import InvoicePDFIntegration
 
-    PDF_INTEGRATION_AVAILABLE = True
-except ImportError:
-    PDF_INTEGRATION_AVAILABLE = False
-    logging.warning(
-        "PDF Integration not available. Install dependencies: pip install pdfplumber rdflib"
+class InvoiceLine(ItemRecord):
+    """시트에서 추출한 송장 라인"""
+
+    __slots__ = FIELDS = (
+        "sheet_name",
+        "s_no",
+        "description",
+        "rate_source",
+        "unit_rate",
+        "quantity",
+        "total_usd",
+        "formula_text",
+        "remark",
+    )
+
+
+class ItemValidation(ItemRecord):
+    """
+    항목 검증 결과
+
+    증빙문서는 Shipment 단위로 audit_result["supporting_docs"]에 1회 저장하고
+    항목은 shipment_id로 참조한다 (CSV 내보내기 시 ShipmentDocs로 풀어 씀).
+    """
+
+    __slots__ = FIELDS = (
+        "s_no",
+        "sheet_name",
+        "description",
+        "rate_source",
+        "unit_rate",
+        "quantity",
+        "total_usd",
+        "status",
+        "flag",
+        "delta_pct",
+        "cg_band",
+        "charge_group",
+        "issues",
+        "tolerance",
+        "ref_rate_usd",
+        "doc_aed",
+        "gate_status",
+        "gate_score",
+        "gate_fails",
+        "pdf_validation",
+        "demurrage_risk",
+        "gates",
+        "shipment_id",
     )
 
 
@@ -86,7 +152,8 @@ class ShipmentAuditEngine:
         )
 
         # PDF Integration 초기화
-        if PDF_INTEGRATION_AVAILABLE:
+        InvoicePDFIntegration = load_pdf_integration()
+        if InvoicePDFIntegration is not None:
             try:
                 self.pdf_integration = InvoicePDFIntegration(
                     audit_system=self, config_path=None  # 기본 경로 사용
@@ -99,17 +166,11 @@ class ShipmentAuditEngine:
             self.pdf_integration = None
             logging.warning("⚠️ PDF Integration not available")
 
-        # Lane Map (ConfigurationManager에서 로드)
-        self.lane_map = self.config_manager.get_lane_map()
-
-        # Normalization Map (ConfigurationManager에서 로드)
-        self.normalization_map = self.config_manager.get_normalization_aliases()
-
-        # COST-GUARD 밴드 (ConfigurationManager에서 로드)
-        self.cost_guard_bands = self.config_manager.get_cost_guard_bands()
+        # Lane Map / Normalization Map / COST-GUARD 밴드 / FX 환율은
+        # 조회 시점 스냅샷에서 읽음 (아래 property, hot-reload 반영)
 
-        # FX 환율 (ConfigurationManager에서 로드)
-        self.fx_rate = self.config_manager.get_fx_rate("USD", "AED")
+        # Contract 참조 요율 결정 테이블 (설정 1회 컴파일)
+        self.rate_resolver = ContractRateResolver(self.config_manager, self.rate_loader)
 
         # Portal Fee 설정 (Enhanced 기능)
         self.portal_fee_keywords = [
@@ -143,6 +204,28 @@ class ShipmentAuditEngine:
 
     # ==================== Portal Fee 검증 메서드 (Enhanced) ====================
 
+    # ==================== 설정 (현재 스냅샷) ====================
+
+    @property
+    def lane_map(self) -> Mapping[str, Mapping[str, Any]]:
+        """Lane Map (ConfigurationManager 현재 스냅샷)"""
+        return self.config_manager.snapshot.lane_map
+
+    @property
+    def normalization_map(self) -> Mapping[str, Mapping[str, str]]:
+        """Normalization Map (ConfigurationManager 현재 스냅샷)"""
+        return self.config_manager.snapshot.normalization_aliases
+
+    @property
+    def cost_guard_bands(self) -> Mapping[str, Mapping[str, Any]]:
+        """COST-GUARD 밴드 (ConfigurationManager 현재 스냅샷)"""
+        return self.config_manager.snapshot.cost_guard_bands
+
+    @property
+    def fx_rate(self) -> float:
+        """USD→AED 환율 (ConfigurationManager 현재 스냅샷)"""
+        return self.config_manager.get_fx_rate("USD", "AED")
+
     def is_portal_fee(self, rate_source: str, description: str) -> bool:
         """Portal Fee 여부 판별"""
         rs = (rate_source or "").upper()
@@ -340,17 +423,17 @@ class ShipmentAuditEngine:
 
                     remark = str(row.get("REMARK", row.get("Remark", ""))).strip()
 
-                    item = {
-                        "sheet_name": sheet_name,
-                        "s_no": s_no,
-                        "description": description,
-                        "rate_source": rate_source,
-                        "unit_rate": rate,
-                        "quantity": qty,
-                        "total_usd": total,
-                        "formula_text": formula,
-                        "remark": remark,
-                    }
+                    item = InvoiceLine(
+                        sheet_name=sheet_name,
+                        s_no=s_no,
+                        description=description,
+                        rate_source=rate_source,
+                        unit_rate=rate,
+                        quantity=qty,
+                        total_usd=total,
+                        formula_text=formula,
+                        remark=remark,
+                    )
 
                     items.append(item)
 
@@ -365,26 +448,84 @@ class ShipmentAuditEngine:
 
         return items
 
-    def validate_enhanced_item(self, item: Dict, supporting_docs: List[Dict]) -> Dict:
-        """Enhanced 송장 항목 검증 (Portal Fee + Gate 포함)"""
-        validation = {
-            "s_no": item["s_no"],
-            "sheet_name": item["sheet_name"],
-            "description": item["description"],
-            "rate_source": item["rate_source"],
-            "unit_rate": item["unit_rate"],
-            "quantity": item["quantity"],
-            "total_usd": item["total_usd"],
-            "status": "PASS",
-            "flag": "OK",
-            "delta_pct": 0.0,
-            "cg_band": "PASS",
-            "charge_group": "Other",
-            "issues": [],
-            "tolerance": 0.03,  # 기본 3%
-            "ref_rate_usd": None,
-            "doc_aed": None,
+    def _contract_cost_guard(
+        self, items: List[Dict], ref_rates: List[Optional[float]]
+    ) -> List[Tuple]:
+        """Contract 항목 COST-GUARD 일괄 판정 → (ref_rate, delta_pct, cg_band, auto_fail)"""
+        frame = evaluate_cost_guard(
+            [item["unit_rate"] for item in items],
+            ref_rates,
+            self.cost_guard_bands,
+            auto_fail_threshold=15.0,
+            zero_ref=0.0,  # rate_loader.calculate_delta_percent 호환
+        )
+        return list(
+            zip(
+                ref_rates,
+                frame["delta_pct"].tolist(),
+                frame["cg_band"].tolist(),
+                frame["auto_fail"].tolist(),
+            )
+        )
+
+    def _is_contract_item(self, item: Dict) -> bool:
+        """validate_enhanced_item의 Contract 분기 대상 여부"""
+        return "CONTRACT" in item["rate_source"].upper() and not self.is_portal_fee(
+            item["rate_source"], item["description"]
+        )
+
+    def validate_enhanced_items(
+        self, items: List[Dict], supporting_docs: List[Dict]
+    ) -> List[ItemValidation]:
+        """
+        시트 항목 일괄 검증
+
+        Contract 항목의 참조 요율을 모두 조회한 뒤 Delta/밴드/Auto-Fail을
+        한 번에 계산하고, 항목별 검증에 결과를 전달한다.
+        """
+        contract_items = [item for item in items if self._is_contract_item(item)]
+        ref_rates = [self._find_contract_ref_rate(item) for item in contract_items]
+        cost_guard = {
+            id(item): result
+            for item, result in zip(
+                contract_items, self._contract_cost_guard(contract_items, ref_rates)
+            )
         }
+        return [
+            self.validate_enhanced_item(item, supporting_docs, cost_guard.get(id(item)))
+            for item in items
+        ]
+
+    def validate_enhanced_item(
+        self,
+        item: Dict,
+        supporting_docs: List[Dict],
+        cost_guard: Optional[Tuple] = None,
+    ) -> ItemValidation:
+        """
+        Enhanced 송장 항목 검증 (Portal Fee + Gate 포함)
+
+        cost_guard: validate_enhanced_items에서 일괄 계산한 Contract 판정
+        (None이면 이 항목만 계산)
+        """
+        validation = ItemValidation(
+            s_no=item["s_no"],
+            sheet_name=item["sheet_name"],
+            description=item["description"],
+            rate_source=item["rate_source"],
+            unit_rate=item["unit_rate"],
+            quantity=item["quantity"],
+            total_usd=item["total_usd"],
+            status="PASS",
+            flag="OK",
+            delta_pct=0.0,
+            cg_band="PASS",
+            charge_group="Other",
+            issues=[],
+            tolerance=0.03,  # 기본 3%
+            ref_rate_usd=None,
+            doc_aed=None,
+        )
 
         try:
             # 1. 금액 계산 검증
@@ -443,23 +584,19 @@ class ShipmentAuditEngine:
             elif "CONTRACT" in rate_source_upper:
                 validation["charge_group"] = "Contract"
 
-                # Contract 항목 ref_rate 조회
-                ref_rate = self._find_contract_ref_rate(item)
+                # Contract 항목 ref_rate 조회 + COST-GUARD (Config 기반)
+                if cost_guard is None:
+                    ref_rate = self._find_contract_ref_rate(item)
+                    cost_guard = self._contract_cost_guard([item], [ref_rate])[0]
+                ref_rate, delta_pct, cg_band, auto_fail = cost_guard
+
                 if ref_rate is not None:
                     validation["ref_rate_usd"] = ref_rate
-
-                    # Delta % 계산
-                    delta_pct = self.rate_loader.calculate_delta_percent(
-                        item["unit_rate"], ref_rate
-                    )
-                    validation["delta_pct"] = delta_pct
-
-                    # COST-GUARD 밴드 결정 (Config 기반)
-                    cg_band = get_cost_guard_band(delta_pct, self.cost_guard_bands)
+                    validation["delta_pct"] = delta_or_none(delta_pct)
                     validation["cg_band"] = cg_band
 
-                    # 상태 업데이트 (Auto-Fail 조건 체크, Config 기반)
-                    if check_auto_fail(delta_pct, auto_fail_threshold=15.0):
+                    # 상태 업데이트 (Auto-Fail 조건 체크)
+                    if auto_fail:
                         validation["status"] = "FAIL"
                         validation["flag"] = "CRITICAL"
                     elif cg_band in ["HIGH", "CRITICAL"]:
@@ -504,94 +641,7 @@ class ShipmentAuditEngine:
         Returns:
             참조 요율 (USD) 또는 None
         """
-        description = item.get("description", "").strip()
-        desc_upper = description.upper()
-
-        # 1. ConfigurationManager로 고정 요율 조회 먼저 시도
-        # MASTER DO FEE, CUSTOMS CLEARANCE 등
-        contract_rate = self.config_manager.get_contract_rate(description)
-        if contract_rate is not None:
-            return contract_rate
-
-        # 2. Standard Items 키워드 기반 조회
-        standard_keywords = [
-            ("DO FEE", "DO Fee"),
-            ("MASTER DO", "DO Fee"),
-            ("CUSTOMS CLEARANCE", "Custom Clearance"),
-            ("CUSTOM CLEARANCE", "Custom Clearance"),
-            ("TERMINAL HANDLING FEE", "Terminal Handling Charge"),
-            ("TERMINAL HANDLING CHARGE", "Terminal Handling Charge"),
-            ("TERMINAL HANDLING", "Terminal Handling Charge"),
-            ("PORT HANDLING", "Port Handling Charge"),
-            ("THC", "Terminal Handling Charge"),
-        ]
-
-        for keyword_match, keyword_lookup in standard_keywords:
-            if keyword_match in desc_upper:
-                # Port 추출 시도
-                port = self._extract_port_from_description(description)
-                if not port:
-                    port = "Khalifa Port"  # 기본값
-
-                # Terminal Handling의 경우 container type에 따라 다름
-                if "TERMINAL HANDLING" in keyword_match or keyword_match == "THC":
-                    # Container type 추출
-                    if "20DC" in desc_upper or "20FT" in desc_upper:
-                        return 280.00  # THC_20FT from config
-                    elif "40HC" in desc_upper or "40FT" in desc_upper:
-                        return 420.00  # THC_40FT from config
-                    elif "KG" in desc_upper or "CW:" in desc_upper:
-                        return 0.55  # Abu Dhabi Airport per KG
-
-                # Rate Loader로 조회
-                ref_rate = self.rate_loader.get_standard_rate(keyword_lookup, port)
-                if ref_rate is not None:
-                    return ref_rate
-
-        # 3. Inland Trucking (Transportation) 조회 - SHPT 통합 로직
-        if (
-            "TRANSPORTATION" in desc_upper
-            or "TRUCKING" in desc_upper
-            or "INLAND" in desc_upper
-        ):
-            # Description에서 Port와 Destination 파싱
-            port, destination = self._parse_transportation_route(description)
-
-            if port and destination:
-                # ConfigurationManager로 Lane rate 조회 (SHPT 로직)
-                ref_rate = self.config_manager.get_lane_rate(
-                    port, destination, "per truck"
-                )
-                if ref_rate is not None:
-                    return ref_rate
-
-                # Lane Map 직접 조회 (SHPT get_standard_rate 방식)
-                ref_rate = self.get_standard_rate_shpt_style(
-                    port, destination, "per truck"
-                )
-                if ref_rate is not None:
-                    return ref_rate
-
-            # 파싱 실패 시 Lane Map 폴백 (기존 로직 유지)
-            if "KHALIFA PORT" in desc_upper and (
-                "STORAGE" in desc_upper or "DSV" in desc_upper or "YARD" in desc_upper
-            ):
-                return 252.00
-            elif (
-                "DSV" in desc_upper and "KHALIFA" in desc_upper
-            ):  # DSV → KHALIFA (EMPTY RETURN)
-                return 252.00
-            elif "AUH AIRPORT" in desc_upper and "MOSB" in desc_upper:
-                if "3 TON PU" in desc_upper or "3T" in desc_upper:
-                    return 100.00  # AUH → MOSB (3T PU)
-                else:
-                    return 200.00  # AUH → MOSB (FB)
-            elif "MIRFA" in desc_upper:
-                return 420.00
-            elif "SHUWEIHAT" in desc_upper or "SHU" in desc_upper:
-                return 600.00
-
-        return None
+        return self.rate_resolver.resolve(item.get("description", ""))
 
     def get_standard_rate_shpt_style(
         self, port: str, destination: str, unit: str
@@ -608,18 +658,23 @@ class ShipmentAuditEngine:
         Returns:
             표준 요율 (USD) 또는 None
         """
+        # 한 번의 조회는 같은 버전의 스냅샷 사용
+        snapshot = self.config_manager.snapshot
+        lane_map = snapshot.lane_map
+        normalization_map = snapshot.normalization_aliases
+
         # Lane Map에서 직접 조회
         lane_key = f"{port}_{destination}".replace(" ", "_").upper()
-        if lane_key in self.lane_map:
-            return self.lane_map[lane_key].get("rate")
+        if lane_key in lane_map:
+            return lane_map[lane_key].get("rate")
 
         # 정규화 후 재시도
         normalized_port = port
         normalized_dest = destination
 
-        if self.normalization_map:
-            port_aliases = self.normalization_map.get("ports", {})
-            dest_aliases = self.normalization_map.get("destinations", {})
+        if normalization_map:
+            port_aliases = normalization_map.get("ports", {})
+            dest_aliases = normalization_map.get("destinations", {})
 
             # Port 정규화
             for alias, canonical in port_aliases.items():
@@ -635,86 +690,11 @@ class ShipmentAuditEngine:
 
         # 정규화된 키로 재조회
         lane_key = f"{normalized_port}_{normalized_dest}".replace(" ", "_").upper()
-        if lane_key in self.lane_map:
-            return self.lane_map[lane_key].get("rate")
+        if lane_key in lane_map:
+            return lane_map[lane_key].get("rate")
 
         return None
 
-    def _extract_port_from_description(self, description: str) -> Optional[str]:
-        """Description에서 Port 이름 추출 (정규화 별칭 사용)"""
-        desc_upper = description.upper()
-
-        # ConfigurationManager 별칭 사용
-        if self.normalization_map:
-            port_aliases = self.normalization_map.get("ports", {})
-            for alias, canonical in port_aliases.items():
-                if alias.upper() in desc_upper:
-                    return canonical
-
-        # 폴백: 기존 로직
-        if "KHALIFA" in desc_upper or "KP" in desc_upper:
-            return "Khalifa Port"
-        elif "JEBEL ALI" in desc_upper or "JAP" in desc_upper:
-            return "Jebel Ali Port"
-        elif "ABU DHABI AIRPORT" in desc_upper or "AUH" in desc_upper:
-            return "Abu Dhabi Airport"
-        elif "DUBAI AIRPORT" in desc_upper or "DXB" in desc_upper:
-            return "Dubai Airport"
-        elif "MUSSAFAH" in desc_upper or "MOSB" in desc_upper:
-            return "Musaffah Port"
-
-        return None
-
-    def _parse_transportation_route(
-        self, description: str
-    ) -> Tuple[Optional[str], Optional[str]]:
-        """
-        Transportation description에서 Port와 Destination 파싱
-
-        예: "TRANSPORTATION FROM KHALIFA PORT TO STORAGE YARD"
-
-        Returns:
-            (port, destination) 튜플
-        """
-        desc_upper = description.upper()
-
-        # FROM ... TO ... 패턴
-        import re
-
-        match = re.search(r"FROM\s+(.+?)\s+TO\s+(.+)", desc_upper)
-        if match:
-            origin = match.group(1).strip()
-            destination = match.group(2).strip()
-
-            # 정규화
-            port = self._extract_port_from_description(origin)
-            dest = self._normalize_destination(destination)
-
-            return (port, dest)
-
-        return (None, None)
-
-    def _normalize_destination(self, destination: str) -> Optional[str]:
-        """Destination 정규화 (ConfigurationManager 별칭 사용)"""
-        dest_upper = destination.upper()
-
-        # ConfigurationManager 별칭 사용
-        if self.normalization_map:
-            dest_aliases = self.normalization_map.get("destinations", {})
-            for alias, canonical in dest_aliases.items():
-                if alias.upper() in dest_upper:
-                    return canonical
-
-        # 폴백: 기존 로직
-        if "MIRFA" in dest_upper:
-            return "MIRFA SITE"
-        elif "SHUWEIHAT" in dest_upper or "SHU" in dest_upper:
-            return "SHUWEIHAT Site"
-        elif "STORAGE" in dest_upper or "YARD" in dest_upper or "DSV" in dest_upper:
-            return "Storage Yard"
-
-        return destination
-
     def map_supporting_documents(self) -> Dict[str, List[Dict]]:
         """증빙문서 매핑 생성"""
         supporting_docs = {}
@@ -725,10 +705,10 @@ class ShipmentAuditEngine:
                 continue
 
             try:
-                pdf_files = list(docs_path.rglob("*.pdf"))
+                pdf_files = get_docs_index(docs_path, refresh=True).files()
                 logging.info(f"[DOCS] {docs_path.name}: {len(pdf_files)} PDFs found")
 
-                for pdf_file in pdf_files:
+                for pdf_file, file_size in pdf_files:
                     # 파일명에서 Shipment ID 추출
                     shipment_id = self.extract_shipment_id(pdf_file.name)
 
@@ -743,7 +723,7 @@ class ShipmentAuditEngine:
                                 "file_name": pdf_file.name,
                                 "file_path": str(pdf_file),
                                 "doc_type": doc_type,
-                                "file_size": pdf_file.stat().st_size,
+                                "file_size": file_size,
                             }
                         )
 
@@ -787,8 +767,45 @@ class ShipmentAuditEngine:
 
     # ==================== 메인 감사 실행 ====================
 
-    def run_full_enhanced_audit(self):
-        """전체 Enhanced 감사 실행"""
+    def open_result_streams(
+        self, timestamp: str, supporting_docs: Dict[str, List[Dict]]
+    ) -> Dict[str, ResultStreamWriter]:
+        """
+        항목 스트림 열기 (검증 중 NDJSON/CSV에 1건씩 기록)
+
+        NDJSON 항목은 shipment_id 참조를 그대로 기록하고,
+        CSV는 기존 보고서와 같이 증빙문서 컬럼을 풀어 쓴다.
+        """
+        stem = f"shpt_sept_2025_enhanced_result_{timestamp}"
+        return {
+            "ndjson": ResultStreamWriter(
+                self.out_dir / "NDJSON" / f"{stem}.ndjson", amount_key="total_usd"
+            ),
+            "csv": self._csv_stream(
+                self.out_dir / "CSV" / f"{stem}.csv", supporting_docs
+            ),
+        }
+
+    def _csv_stream(
+        self, csv_file: Path, supporting_docs: Dict[str, List[Dict]]
+    ) -> ResultStreamWriter:
+        """항목 CSV 스트림 (기존 컬럼 + 증빙문서 컬럼)"""
+        return ResultStreamWriter(
+            csv_file,
+            fieldnames=ItemValidation.FIELDS + SHIPMENT_DOC_FIELDS,
+            expand=ShipmentDocs(supporting_docs).expand,
+            amount_key="total_usd",
+        )
+
+    def run_full_enhanced_audit(self, keep_items: bool = False):
+        """
+        전체 Enhanced 감사 실행
+
+        기본은 항목을 메모리에 보관하지 않고 스트림 파일에만 기록
+        (audit_result["items"]는 빈 목록, 통계는 누적 집계, 항목은 iter_items로 읽음)
+        keep_items: True면 audit_result["items"]에도 항목 보관 (소규모 실행/테스트용)
+        """
+        streams = {}
         try:
             logging.info("=" * 80)
             logging.info("[START] SHPT Enhanced Sept 2025 full audit")
@@ -802,9 +819,17 @@ class ShipmentAuditEngine:
             # 2. 증빙문서 매핑
             supporting_docs = self.map_supporting_documents()
 
-            # 3. 모든 시트 처리
+            # 3. 모든 시트 처리 (검증된 항목은 즉시 스트림 기록)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            streams = self.open_result_streams(timestamp, supporting_docs)
             all_items = []
             sheet_summary = []
+            total_items = 0
+            status_counts = Counter()
+            group_counts = Counter()
+            total_amount = 0
+            gate_pass_items = 0
+            gate_score_sum = 0
 
             logging.info("\n📋 시트별 송장 항목 추출 및 검증 중...\n")
 
@@ -852,15 +877,38 @@ class ShipmentAuditEngine:
                                     f"  [PDF] {shipment_id} parsing failed: {e}"
                                 )
 
-                        for item in items:
-                            validation = self.validate_enhanced_item(item, sheet_docs)
+                        # Shipment 단위 PDF 검증 (Cross-doc, Demurrage, Gate-12~14)
+                        shipment_pdf_result = None
+                        shipment_gates = None
+                        if pdf_validation_data and self.pdf_integration:
+                            try:
+                                shipment_pdf_result = (
+                                    self.pdf_integration.validate_shipment_docs(
+                                        shipment_id, sheet_docs, pdf_validation_data
+                                    )
+                                )
+                                shipment_gates = (
+                                    self.pdf_integration.run_shipment_gates(
+                                        pdf_validation_data
+                                    )
+                                )
+                            except Exception as e:
+                                logging.warning(
+                                    f"  [PDF] {shipment_id} shipment validation failed: {e}"
+                                )
+
+                        validations = self.validate_enhanced_items(items, sheet_docs)
+                        for item, validation in zip(items, validations):
 
-                            # PDF 검증 통합
-                            if pdf_validation_data and self.pdf_integration:
+                            # PDF 검증 통합 (항목별: Gate-11 + Shipment 결과 결합)
+                            if shipment_gates is not None:
                                 try:
                                     enriched = (
                                         self.pdf_integration.validate_invoice_with_docs(
-                                            item, shipment_id, sheet_docs
+                                            item,
+                                            shipment_id,
+                                            sheet_docs,
+                                            shipment_result=shipment_pdf_result,
                                         )
                                     )
 
@@ -875,7 +923,9 @@ class ShipmentAuditEngine:
                                     # PDF Gates 실행 (Gate-11~14)
                                     pdf_gates_result = (
                                         self.pdf_integration.run_pdf_gates(
-                                            item, pdf_validation_data
+                                            item,
+                                            pdf_validation_data,
+                                            shipment_gates=shipment_gates,
                                         )
                                     )
 
@@ -920,13 +970,20 @@ class ShipmentAuditEngine:
                                         f"  [PDF] PDF validation failed for item {item.get('s_no')}: {e}"
                                     )
 
-                            # 증빙문서 정보 추가
-                            validation["supporting_docs_list"] = sheet_docs
-                            validation["evidence_count"] = len(sheet_docs)
-                            validation["evidence_types"] = list(
-                                set(doc["doc_type"] for doc in sheet_docs)
-                            )
-                            all_items.append(validation)
+                            # 증빙문서는 Shipment 단위로 1회 저장, 항목은 ID로 참조
+                            validation["shipment_id"] = shipment_id
+                            for stream in streams.values():
+                                stream.write(validation)
+
+                            total_items += 1
+                            status_counts[validation["status"]] += 1
+                            group_counts[validation["charge_group"]] += 1
+                            total_amount += validation["total_usd"]
+                            if validation.get("gate_status") == "PASS":
+                                gate_pass_items += 1
+                            gate_score_sum += validation.get("gate_score", 0)
+                            if keep_items:
+                                all_items.append(validation)
 
                         sheet_summary.append(
                             {
@@ -941,42 +998,20 @@ class ShipmentAuditEngine:
                     logging.error(f"  [ERROR] {sheet_name} processing error: {e}")
 
             logging.info(
-                f"\n[OK] Total {len(all_items)} items extracted and validated from {len(sheet_summary)} sheets"
+                f"\n[OK] Total {total_items} items extracted and validated from {len(sheet_summary)} sheets"
             )
 
-            # 4. 통계 계산
-            total_items = len(all_items)
-            pass_items = len([item for item in all_items if item["status"] == "PASS"])
-            review_items = len(
-                [
-                    item
-                    for item in all_items
-                    if item["status"] == "REVIEW_NEEDED" or item["status"] == "REVIEW"
-                ]
-            )
-            error_items = len([item for item in all_items if item["status"] == "ERROR"])
-            fail_items = len([item for item in all_items if item["status"] == "FAIL"])
+            # 4. 통계 계산 (검증 중 누적 집계)
+            pass_items = status_counts["PASS"]
+            review_items = status_counts["REVIEW_NEEDED"] + status_counts["REVIEW"]
+            error_items = status_counts["ERROR"]
+            fail_items = status_counts["FAIL"]
 
-            portal_fee_items = len(
-                [item for item in all_items if item["charge_group"] == "PortalFee"]
-            )
-            contract_items = len(
-                [item for item in all_items if item["charge_group"] == "Contract"]
-            )
-            at_cost_items = len(
-                [item for item in all_items if item["charge_group"] == "AtCost"]
-            )
+            portal_fee_items = group_counts["PortalFee"]
+            contract_items = group_counts["Contract"]
+            at_cost_items = group_counts["AtCost"]
 
-            total_amount = sum(item["total_usd"] for item in all_items)
-
-            gate_pass_items = len(
-                [item for item in all_items if item.get("gate_status") == "PASS"]
-            )
-            avg_gate_score = (
-                sum(item.get("gate_score", 0) for item in all_items) / total_items
-                if total_items > 0
-                else 0
-            )
+            avg_gate_score = gate_score_sum / total_items if total_items > 0 else 0
 
             # 5. 결과 생성
             audit_result = {
@@ -991,6 +1026,9 @@ class ShipmentAuditEngine:
                     "total_supporting_docs": sum(
                         len(pdfs) for pdfs in supporting_docs.values()
                     ),
+                    "result_files": {
+                        name: str(stream.path) for name, stream in streams.items()
+                    },
                 },
                 "statistics": {
                     "total_sheets": len(sheet_summary),
@@ -1029,6 +1067,10 @@ class ShipmentAuditEngine:
                 "items": all_items,
             }
 
+            # 스트림 요약 footer 기록
+            for stream in streams.values():
+                stream.close(extra={"statistics": audit_result["statistics"]})
+
             # 6. 결과 저장
             self.save_enhanced_results(audit_result)
 
@@ -1038,12 +1080,21 @@ class ShipmentAuditEngine:
             return audit_result
 
         except Exception as e:
+            for stream in streams.values():
+                stream.close(complete=False)
             logging.error(f"[ERROR] Full audit error: {e}")
             import traceback
 
             logging.error(traceback.format_exc())
             return None
 
+    def iter_items(self, audit_result) -> Iterator[Dict]:
+        """감사 항목 순회 (보관 항목 없으면 NDJSON 스트림 파일에서 1건씩 읽음)"""
+        ndjson_file = audit_result["audit_info"].get("result_files", {}).get("ndjson")
+        if audit_result["items"] or ndjson_file is None:
+            return iter(audit_result["items"])
+        return iter_ndjson(ndjson_file)
+
     def save_enhanced_results(self, audit_result):
         """Enhanced 감사 결과 저장 (Excel 출력 추가)"""
         try:
@@ -1055,19 +1106,25 @@ class ShipmentAuditEngine:
                 / "JSON"
                 / f"shpt_sept_2025_enhanced_result_{timestamp}.json"
             )
-            json_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(audit_result, f, indent=2, ensure_ascii=False)
+            # 항목은 1건씩 직렬화 (전체 문서를 한 번에 인코딩하지 않음)
+            document = dict(audit_result, items=self.iter_items(audit_result))
+            write_json_document(json_file, document, "items")
 
             logging.info(f"\n💾 JSON 결과 저장: {json_file}")
 
-            # CSV 파일 저장 (새 폴더 구조)
-            csv_file = (
-                self.out_dir / "CSV" / f"shpt_sept_2025_enhanced_result_{timestamp}.csv"
-            )
-            csv_file.parent.mkdir(parents=True, exist_ok=True)
-            items_df = pd.DataFrame(audit_result["items"])
-            items_df.to_csv(csv_file, index=False, encoding="utf-8-sig")
+            # CSV 파일 (run_full_enhanced_audit에서는 검증 중 이미 스트림 기록됨)
+            result_files = audit_result["audit_info"].get("result_files", {})
+            if "csv" in result_files:
+                csv_file = Path(result_files["csv"])
+            else:
+                csv_file = (
+                    self.out_dir
+                    / "CSV"
+                    / f"shpt_sept_2025_enhanced_result_{timestamp}.csv"
+                )
+                stream = self._csv_stream(csv_file, audit_result["supporting_docs"])
+                with stream:
+                    stream.write_many(audit_result["items"])
 
             logging.info(f"💾 CSV 결과 저장: {csv_file}")
 
@@ -1202,7 +1259,9 @@ def main():
 
         # Portal Fee 항목 상세 출력
         portal_fee_items = [
-            item for item in result["items"] if item["charge_group"] == "PortalFee"
+            item
+            for item in auditor.iter_items(result)
+            if item["charge_group"] == "PortalFee"
         ]
         if portal_fee_items:
             logging.info(f"\n[PORTAL FEE] {len(portal_fee_items)} items:")
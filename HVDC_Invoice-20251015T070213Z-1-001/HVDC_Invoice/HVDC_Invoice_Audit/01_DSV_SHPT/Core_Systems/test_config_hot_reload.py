@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+설정 hot-reload 반영 테스트
+엔진/검증기가 Lane Map·COST-GUARD 밴드를 조회 시점 스냅샷에서 읽는지 확인
+
+Version: 1.0.0
+Created: 2026-10-19
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "00_Shared"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config_manager import CONFIG_FILES, ConfigurationManager
+from masterdata_validator import MasterDataValidator
+from shipment_audit_engine import ShipmentAuditEngine
+
+RATE_DIR = Path(__file__).parent.parent.parent / "Rate"
+
+
+class TestConfigHotReload(unittest.TestCase):
+    """설정 파일 변경 → refresh_if_changed → 엔진/검증기 조회 결과 반영"""
+
+    def setUp(self):
+        self.config_dir = Path(tempfile.mkdtemp())
+        for filename in CONFIG_FILES.values():
+            shutil.copy(RATE_DIR / filename, self.config_dir / filename)
+        self.manager = ConfigurationManager(self.config_dir)
+        self.manager.load_all_configs()
+
+    def tearDown(self):
+        shutil.rmtree(self.config_dir, ignore_errors=True)
+
+    def _update(self, name, update):
+        """설정 파일 수정 후 mtime을 확실히 증가시키고 재로드"""
+        path = self.config_dir / CONFIG_FILES[name]
+        data = json.loads(path.read_text(encoding="utf-8"))
+        update(data)
+        before = path.stat().st_mtime_ns
+        path.write_text(json.dumps(data), encoding="utf-8")
+        os.utime(path, ns=(before + 10**9, before + 10**9))
+        self.assertTrue(self.manager.refresh_if_changed())
+
+    def _set_lane_rate(self, data):
+        data["sea_transport"]["KP_DSV_YD"]["rate"] = 300.0
+
+    def _set_pass_band(self, data):
+        data["cost_guard_bands"]["PASS"]["max_delta"] = 3.0
+
+    def test_engine_reads_current_snapshot(self):
+        engine = ShipmentAuditEngine()
+        engine.config_manager = self.manager
+        rate = engine.lane_map["KP_DSV_YD"]["rate"]
+        self.assertEqual(engine.get_standard_rate_shpt_style("KP", "DSV YD", "per truck"), rate)
+
+        self._update("lane_config", self._set_lane_rate)
+        self._update("cost_guard_config", self._set_pass_band)
+
+        self.assertEqual(engine.get_standard_rate_shpt_style("KP", "DSV YD", "per truck"), 300.0)
+        self.assertEqual(engine.cost_guard_bands["PASS"]["max_delta"], 3.0)
+
+    def test_validator_reads_current_snapshot(self):
+        validator = MasterDataValidator()
+        validator.config_manager = self.manager
+        self.assertEqual(validator.get_cost_guard_band_legacy(2.5), "WARN")
+
+        self._update("cost_guard_config", self._set_pass_band)
+
+        self.assertEqual(validator.cost_guard_bands["PASS"]["max_delta"], 3.0)
+        self.assertEqual(validator.get_cost_guard_band_legacy(2.5), "PASS")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+MasterData Shipment 그룹 검증 테스트
+validate_all 그룹/병렬 실행이 행 단위 순차 검증과 동일한지 확인
+
+Version: 1.0.0
+Created: 2026-10-19
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "00_Shared"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from masterdata_validator import MasterDataValidator
+from unified_ir_adapter import UnifiedIRAdapter
+
+
+SAMPLE_IR = {
+    "doc_id": "invoice.pdf",
+    "engine": "docling",
+    "pages": 1,
+    "blocks": [
+        {
+            "type": "table",
+            "table": {
+                "rows": [
+                    ["Description", "Qty", "Unit Rate", "Amount"],
+                    ["INLAND TRUCKING", "1", "252.00", "252.00"],
+                    ["DO FEE", "1", "150.00", "150.00"],
+                ]
+            },
+        }
+    ],
+    "meta": {"confidence": 0.92},
+}
+
+
+class TestGroupedValidation(unittest.TestCase):
+    """Order Ref 그룹 단위 검증 테스트"""
+
+    def setUp(self):
+        self.docs = Path(tempfile.mkdtemp())
+        for ref in ["HVDC-ADOPT-SCT-0126", "HVDC-ADOPT-SCT-0127"]:
+            folder = self.docs / f"01. {ref}"
+            folder.mkdir()
+            for doc in ["BOE", "DO", "INVOICE"]:
+                (folder / f"{ref}_{doc}.pdf").write_bytes(b"%PDF")
+
+        self.df_master = pd.DataFrame(
+            {
+                "Order Ref. Number": [
+                    "HVDC-ADOPT-SCT-0126",
+                    "HVDC-ADOPT-SCT-0127",
+                    "HVDC-ADOPT-SCT-0126",
+                    None,
+                    "HVDC-ADOPT-SCT-0127",
+                ],
+                "DESCRIPTION": [
+                    "DO FEE",
+                    "INLAND TRUCKING",
+                    "INLAND TRUCKING",
+                    "DO FEE",
+                    "DO FEE",
+                ],
+                "RATE SOURCE": ["CONTRACT"] * 5,
+                "RATE": [150.0, 252.0, 260.0, 150.0, 150.0],
+                "TOTAL (USD)": [150.0, 252.0, 260.0, 150.0, 150.0],
+            }
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.docs, ignore_errors=True)
+
+    def _validator(self, workers):
+        validator = MasterDataValidator()
+        validator.supporting_docs_path = self.docs
+        validator.use_hybrid = True
+        validator.hybrid_client = Mock()
+        validator.hybrid_client.parse_pdf.return_value = SAMPLE_IR
+        validator.ir_adapter = UnifiedIRAdapter()
+        validator.max_workers = workers
+        validator.load_masterdata = Mock(return_value=self.df_master)
+        validator._print_statistics = Mock()
+        return validator
+
+    def test_grouped_matches_row_by_row(self):
+        """그룹/병렬 결과 == 행 단위 순차 결과 (행 정렬 유지)"""
+        sequential = self._validator(1)
+        expected = [sequential.validate_row(row) for _, row in self.df_master.iterrows()]
+
+        result = self._validator(4).validate_all()
+
+        self.assertEqual(len(result), len(self.df_master))
+        self.assertEqual(
+            result["Order Ref. Number"].tolist(),
+            self.df_master["Order Ref. Number"].tolist(),
+        )
+        pd.testing.assert_frame_equal(
+            result[list(expected[0].keys())], pd.DataFrame(expected)
+        )
+
+    def test_each_pdf_parsed_once_per_run(self):
+        """PDF는 실행당 1회만 파싱"""
+        validator = self._validator(4)
+        validator.validate_all()
+
+        parsed = [c.args[0] for c in validator.hybrid_client.parse_pdf.call_args_list]
+        self.assertTrue(parsed)
+        self.assertEqual(len(parsed), len(set(parsed)))
+
+    def test_pdf_cache_scoped_to_run(self):
+        """다음 실행은 PDF를 다시 파싱하고, 실행 후 캐시는 비어 있음"""
+        validator = self._validator(4)
+        validator.validate_all()
+        first = validator.hybrid_client.parse_pdf.call_count
+        self.assertEqual(validator.pdf_cache, {})
+        self.assertEqual(validator.invoice_data_cache, {})
+
+        validator.validate_all()
+        self.assertEqual(validator.hybrid_client.parse_pdf.call_count, 2 * first)
+
+    def test_pdf_cache_cleared_on_error(self):
+        validator = self._validator(1)
+        validator.pdf_cache[("hybrid", "stale.pdf")] = SAMPLE_IR
+        validator._validate_grouped = Mock(side_effect=RuntimeError("boom"))
+
+        with self.assertRaises(RuntimeError):
+            validator.validate_all()
+        self.assertEqual(validator.pdf_cache, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
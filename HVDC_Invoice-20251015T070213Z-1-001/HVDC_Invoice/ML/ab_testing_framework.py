@@ -11,6 +11,8 @@ from typing import Dict, List, Tuple
 from scipy import stats
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 
+FEATURE_NAMES = ['token_set', 'levenshtein', 'fuzzy_sort']
+
 
 class ABTestingFramework:
     """
@@ -47,13 +49,24 @@ class ABTestingFramework:
         Returns:
             하이브리드 점수 배열
         """
-        scores = (
-            df['token_set'] * weights['token_set'] +
-            df['levenshtein'] * weights['levenshtein'] + 
-            df['fuzzy_sort'] * weights['fuzzy_sort']
+        return self._hybrid_scores(self._feature_columns(df), weights)
+    
+    @staticmethod
+    def _feature_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """특징 컬럼 → numpy 배열 (가중치 세트 비교 시 1회만 추출)"""
+        return {name: df[name].to_numpy() for name in FEATURE_NAMES}
+    
+    @staticmethod
+    def _hybrid_scores(
+        features: Dict[str, np.ndarray],
+        weights: Dict[str, float]
+    ) -> np.ndarray:
+        """가중 합 (token_set → levenshtein → fuzzy_sort 순서 고정)"""
+        return (
+            features['token_set'] * weights['token_set'] +
+            features['levenshtein'] * weights['levenshtein'] +
+            features['fuzzy_sort'] * weights['fuzzy_sort']
         )
-        
-        return scores.values
     
     def predict_matches(
         self,
@@ -117,13 +130,14 @@ class ABTestingFramework:
             비교 결과 딕셔너리
         """
         y_true = df['actual_match'].values
+        features = self._feature_columns(df)
         
         # Default weights 성능
-        pred_default = self.predict_matches(df, default_weights)
+        pred_default = (self._hybrid_scores(features, default_weights) >= self.threshold).astype(int)
         metrics_default = self.calculate_metrics(y_true, pred_default)
         
         # Optimized weights 성능
-        pred_optimized = self.predict_matches(df, optimized_weights)
+        pred_optimized = (self._hybrid_scores(features, optimized_weights) >= self.threshold).astype(int)
         metrics_optimized = self.calculate_metrics(y_true, pred_optimized)
         
         # 개선도 계산
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FeatureCache - 학습 샘플 특징 행렬 캐시
+TrainingDataGenerator 샘플 → (token_set, levenshtein, fuzzy_sort) 특징 행렬을
+샘플 내용 해시로 캐시하여 학습/CV/A/B 테스트가 같은 행렬을 재사용
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+FEATURE_NAMES = ['token_set', 'levenshtein', 'fuzzy_sort']
+
+# 특징 계산에 쓰이는 샘플 필드 (캐시 키)
+_KEY_FIELDS = ('origin_invoice', 'dest_invoice', 'origin_lane', 'dest_lane', 'label')
+
+# 매칭과 같은 Origin/Destination 가중 평균
+ORIGIN_WEIGHT = 0.6
+DEST_WEIGHT = 0.4
+
+
+def samples_key(samples: List[Dict]) -> str:
+    """샘플 목록 내용 해시 (특징 계산에 쓰이는 필드만)"""
+    payload = json.dumps(
+        [[sample.get(field) for field in _KEY_FIELDS] for sample in samples],
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _pair_features(invoice_values: list, lane_values: list) -> Dict[str, np.ndarray]:
+    """(송장 값, 레인 값) 쌍별 특징: 고유 문자열 행렬 1회 계산 후 쌍 인덱스로 조회"""
+    from ml_integration import similarity_feature_matrix
+
+    invoice_unique = list(dict.fromkeys(invoice_values))
+    lane_unique = list(dict.fromkeys(lane_values))
+    matrices = similarity_feature_matrix(invoice_unique, lane_unique)
+
+    invoice_index = {value: i for i, value in enumerate(invoice_unique)}
+    lane_index = {value: i for i, value in enumerate(lane_unique)}
+    rows = np.array([invoice_index[v] for v in invoice_values], dtype=np.int64)
+    cols = np.array([lane_index[v] for v in lane_values], dtype=np.int64)
+
+    return {name: matrices[name][rows, cols] for name in FEATURE_NAMES}
+
+
+def compute_feature_matrix(samples: List[Dict]) -> np.ndarray:
+    """
+    샘플 → 특징 행렬 (n_samples × 3, FEATURE_NAMES 순서)
+
+    각 특징 = 0.6 × origin 유사도 + 0.4 × destination 유사도
+    (find_matching_lane_ml의 가중 합과 선형이므로 학습 가중치를 그대로 적용 가능)
+    """
+    if not samples:
+        return np.zeros((0, len(FEATURE_NAMES)))
+
+    origin = _pair_features(
+        [s.get('origin_invoice', '') for s in samples],
+        [s.get('origin_lane', '') for s in samples]
+    )
+    dest = _pair_features(
+        [s.get('dest_invoice', '') for s in samples],
+        [s.get('dest_lane', '') for s in samples]
+    )
+
+    return np.column_stack([
+        ORIGIN_WEIGHT * origin[name] + DEST_WEIGHT * dest[name]
+        for name in FEATURE_NAMES
+    ])
+
+
+class FeatureCache:
+    """
+    샘플 특징 행렬 캐시
+
+    Features:
+    - 메모리 캐시 (같은 프로세스 내 학습/A/B 테스트 재사용)
+    - cache_dir 지정 시 {key}.npy 저장, memory-map으로 로드
+    - 특징 DataFrame: token_set, levenshtein, fuzzy_sort, label, actual_match
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            cache_dir: .npy 캐시 폴더 (None이면 메모리 캐시만)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory: Dict[str, np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Optional[Path]:
+        return self.cache_dir / f"features_{key}.npy" if self.cache_dir else None
+
+    def get_matrix(self, samples: List[Dict]) -> np.ndarray:
+        """
+        특징 행렬 (n_samples × 3)
+
+        Args:
+            samples: TrainingDataGenerator.samples
+
+        Returns:
+            캐시된 행렬 (읽기 전용)
+        """
+        key = samples_key(samples)
+
+        matrix = self._memory.get(key)
+        if matrix is not None:
+            self.hits += 1
+            return matrix
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            self.hits += 1
+            matrix = np.load(path, mmap_mode='r')
+        else:
+            self.misses += 1
+            matrix = compute_feature_matrix(samples)
+            matrix.setflags(write=False)
+            if path is not None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                np.save(path, matrix)
+
+        self._memory[key] = matrix
+        return matrix
+
+    def get_frame(self, samples: List[Dict]) -> pd.DataFrame:
+        """
+        특징 DataFrame (WeightOptimizer.train / ABTestingFramework.compare_weights 입력)
+
+        Returns:
+            columns: token_set, levenshtein, fuzzy_sort, label, actual_match
+        """
+        matrix = self.get_matrix(samples)
+        df = pd.DataFrame(np.array(matrix), columns=FEATURE_NAMES)
+        labels = np.array([int(s.get('label', 0)) for s in samples], dtype=np.int64)
+        df['label'] = labels
+        df['actual_match'] = labels
+        return df
+
+
+_DEFAULT_CACHE: Optional[FeatureCache] = None
+
+
+def default_feature_cache() -> FeatureCache:
+    """프로세스 기본 캐시 (메모리)"""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = FeatureCache()
+    return _DEFAULT_CACHE
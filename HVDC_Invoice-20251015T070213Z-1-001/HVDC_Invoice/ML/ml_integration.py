@@ -4,14 +4,19 @@
 Enhanced Matching + ML Integration
 ===================================
 ML 최적화 가중치를 적용한 하이브리드 매칭 시스템
+- 단건: find_matching_lane_ml (레인 순회)
+- 배치: BatchLaneMatcher (아이템 × 레인 유사도 행렬, 레벨별 벡터 마스크)
 """
 
 import pickle
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
 from enhanced_matching import (
     token_set_similarity,
     levenshtein_similarity,
+    levenshtein_distance,
     fuzzy_token_sort_similarity,
     normalize_location,
     normalize_vehicle,
@@ -21,6 +26,13 @@ from enhanced_matching import (
     VEHICLE_GROUPS
 )
 
+try:
+    from rapidfuzz import process as _rf_process
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+    _USE_RAPIDFUZZ = True
+except ImportError:
+    _USE_RAPIDFUZZ = False
+
 
 # ============================================================================
 # ML WEIGHTS LOADER
@@ -30,6 +42,8 @@ class MLWeightsManager:
     """
     ML 학습된 가중치 관리 클래스
     - 가중치 로드/저장
+    - 레지스트리 폴더 지정 시 최신 버전 metadata.json의 가중치만 로드
+      (모델 파일 역직렬화 없음)
     - Fallback to default weights
     """
     
@@ -51,11 +65,15 @@ class MLWeightsManager:
         ML 학습된 가중치 로드
         
         Args:
-            model_path: .pkl 모델 파일 경로
+            model_path: .pkl 모델 파일 경로 또는 ModelRegistry 폴더
         """
         try:
-            with open(model_path, 'rb') as f:
-                model_data = pickle.load(f)
+            if Path(model_path).is_dir():
+                from model_registry import ModelRegistry
+                model_data = ModelRegistry(model_path).load_metadata()
+            else:
+                with open(model_path, 'rb') as f:
+                    model_data = pickle.load(f)
             
             if 'weights' in model_data:
                 self.weights = model_data['weights']
@@ -92,6 +110,7 @@ def set_ml_weights(model_path: str):
     
     Usage:
         set_ml_weights('models/optimized_weights.pkl')
+        set_ml_weights('models/registry')  # 레지스트리 최신 버전
         # 이후 모든 hybrid_similarity_ml 호출에 적용됨
     """
     global _weights_manager
@@ -127,6 +146,122 @@ def hybrid_similarity_ml(s1: str, s2: str) -> float:
     return total_score
 
 
+# ============================================================================
+# SIMILARITY MATRICES (배치 매칭용)
+# ============================================================================
+
+def _levenshtein_similarity_matrix(queries: List[str], choices: List[str]) -> np.ndarray:
+    """
+    levenshtein_similarity 행렬 (입력은 대문자 문자열)
+
+    편집거리(정수)만 행렬로 구하고 1 - distance / max_len은 같은 부동소수 연산으로 계산
+    """
+    if not queries or not choices:
+        return np.zeros((len(queries), len(choices)))
+
+    if _USE_RAPIDFUZZ:
+        distances = _rf_process.cdist(
+            queries, choices,
+            scorer=_rf_levenshtein.distance, processor=None, dtype=np.int32
+        )
+    else:
+        distances = np.array(
+            [[levenshtein_distance(q, c) for c in choices] for q in queries]
+        )
+
+    max_len = np.maximum.outer(
+        np.array([len(q) for q in queries]), np.array([len(c) for c in choices])
+    )
+    # 두 문자열 모두 빈 문자열이면 distance 0 → 1.0 (levenshtein_similarity의 s1 == s2)
+    return 1.0 - distances / np.maximum(max_len, 1)
+
+
+def _token_set_similarity_matrix(queries: List[str], choices: List[str]) -> np.ndarray:
+    """token_set_similarity 행렬: 토큰 incidence 행렬 곱으로 교집합 크기 계산"""
+    query_tokens = [set(q.split()) for q in queries]
+    choice_tokens = [set(c.split()) for c in choices]
+
+    vocab: Dict[str, int] = {}
+    for tokens in query_tokens + choice_tokens:
+        for token in tokens:
+            vocab.setdefault(token, len(vocab))
+
+    # 0/1 float 행렬 곱 (BLAS): 교집합 크기는 작은 정수라 float64로 정확히 표현됨
+    def incidence(token_sets):
+        matrix = np.zeros((len(token_sets), len(vocab)))
+        for row, tokens in enumerate(token_sets):
+            matrix[row, [vocab[t] for t in tokens]] = 1
+        return matrix
+
+    query_matrix = incidence(query_tokens)
+    choice_matrix = incidence(choice_tokens)
+    intersection = query_matrix @ choice_matrix.T
+    union = query_matrix.sum(axis=1)[:, None] + choice_matrix.sum(axis=1)[None, :] - intersection
+
+    # 어느 한쪽 토큰이 없으면 union == 0 또는 intersection == 0 → 0.0
+    return np.divide(
+        intersection, union,
+        out=np.zeros(intersection.shape), where=union > 0
+    )
+
+
+def similarity_feature_matrix(queries: list, choices: list) -> Dict[str, np.ndarray]:
+    """
+    문자열 목록 × 목록 유사도 feature 행렬
+
+    Returns:
+        {"token_set", "levenshtein", "fuzzy_sort"} → (len(queries), len(choices)) 행렬
+        (각 원소는 단건 similarity 함수와 같은 값, NaN/None 입력은 0)
+    """
+    def prepare(values):
+        valid = ~pd.isna(np.array(values, dtype=object)) if values else np.zeros(0, bool)
+        upper = [str(v).upper() if ok else "" for v, ok in zip(values, valid)]
+        return valid, upper
+
+    query_valid, query_upper = prepare(queries)
+    choice_valid, choice_upper = prepare(choices)
+
+    def sort_tokens(strings):
+        return [" ".join(sorted(s.split())) for s in strings]
+
+    features = {
+        "token_set": _token_set_similarity_matrix(query_upper, choice_upper),
+        "levenshtein": _levenshtein_similarity_matrix(query_upper, choice_upper),
+        "fuzzy_sort": _levenshtein_similarity_matrix(
+            sort_tokens(query_upper), sort_tokens(choice_upper)
+        ),
+    }
+
+    valid = np.outer(query_valid, choice_valid)
+    for matrix in features.values():
+        matrix[~valid] = 0.0
+
+    return features
+
+
+def hybrid_similarity_ml_matrix(
+    queries: list,
+    choices: list,
+    weights: Optional[Dict[str, float]] = None
+) -> np.ndarray:
+    """
+    hybrid_similarity_ml 행렬 (queries × choices)
+
+    feature 행렬에 가중치를 한 번에 적용. 합산 순서는 hybrid_similarity_ml과 같음
+    (BLAS dot은 합산 순서/FMA 차이로 임계값 경계 결과가 달라질 수 있어 사용하지 않음)
+    """
+    if weights is None:
+        weights = _weights_manager.get_weights()
+
+    features = similarity_feature_matrix(queries, choices)
+
+    total_score = np.zeros((len(queries), len(choices)))
+    for key in weights:
+        total_score = total_score + features[key] * weights[key]
+
+    return total_score
+
+
 # ============================================================================
 # ENHANCED MATCHING WITH ML
 # ============================================================================
@@ -302,6 +437,224 @@ def find_matching_lane_ml(
     return None
 
 
+# ============================================================================
+# VECTORIZED MATCHING (find_matching_lane_ml 행렬 버전)
+# ============================================================================
+
+def _codes(values: list, vocab: Dict) -> np.ndarray:
+    """값 → 정수 코드 (같은 vocab을 쓰는 배열끼리 == 비교용)"""
+    return np.array([vocab.setdefault(v, len(vocab)) for v in values], dtype=np.int64)
+
+
+class BatchLaneMatcher:
+    """
+    find_matching_lane_ml과 같은 4단계 매칭을 아이템 × 레인 행렬로 계산
+
+    - 레인 정규화/권역/차량 그룹은 생성 시 1회 계산
+    - 같은 (origin, destination, vehicle, unit) 아이템은 1회만 매칭
+    - 아이템 위치/차량 정규화는 고유 값별 1회 (인스턴스 캐시)
+    - 유사도는 고유 문자열 × 레인 문자열 행렬(hybrid_similarity_ml_matrix)에서 조회
+    - 레벨별 후보는 마스크, 최고점 레인은 argmax (동점이면 앞 레인 = 단건 순회와 동일)
+    """
+
+    CHUNK_SIZE = 2048  # 아이템 키 청크 (K × L 행렬 메모리 제한)
+
+    def __init__(self, approved_lanes: list, weights: Optional[Dict[str, float]] = None):
+        self.approved_lanes = approved_lanes
+        self.weights = weights
+
+        raw_origin = [lane.get("origin", "") for lane in approved_lanes]
+        raw_dest = [lane.get("destination", "") for lane in approved_lanes]
+        raw_vehicle = [lane.get("vehicle", "") for lane in approved_lanes]
+
+        self._lane_choices = {
+            "raw_origin": raw_origin,
+            "raw_dest": raw_dest,
+            "norm_origin": [normalize_location(o) for o in raw_origin],
+            "norm_dest": [normalize_location(d) for d in raw_dest],
+        }
+        self._lane_vehicle_norm = [normalize_vehicle(v) for v in raw_vehicle]
+        self._lane_unit = [str(lane.get("unit", "per truck")) for lane in approved_lanes]
+        self._lane_origin_region = [get_region(o) for o in self._lane_choices["norm_origin"]]
+        self._lane_dest_region = [get_region(d) for d in self._lane_choices["norm_dest"]]
+        self._lane_vehicle_group = [get_vehicle_group(v) for v in raw_vehicle]
+
+        self._location_cache: Dict = {}
+        self._vehicle_cache: Dict = {}
+        self._region_cache: Dict = {}
+        self._group_cache: Dict = {}
+
+    @staticmethod
+    def _memoized(values: list, cache: Dict, func) -> list:
+        """고유 값별 1회 계산 (정규화/권역/차량 그룹)"""
+        out = []
+        for value in values:
+            if value not in cache:
+                cache[value] = func(value)
+            out.append(cache[value])
+        return out
+
+    def match(
+        self,
+        origins: list,
+        destinations: list,
+        vehicles: list,
+        units: list
+    ) -> List[Optional[Dict]]:
+        """
+        아이템 목록 매칭
+
+        Returns:
+            아이템별 find_matching_lane_ml 결과와 같은 dict 또는 None
+        """
+        keys = list(zip(origins, destinations, vehicles, units))
+        unique_keys = list(dict.fromkeys(keys))
+
+        key_results: Dict[tuple, Optional[Dict]] = {}
+        for start in range(0, len(unique_keys), self.CHUNK_SIZE):
+            chunk = unique_keys[start:start + self.CHUNK_SIZE]
+            key_results.update(zip(chunk, self._match_unique(chunk)))
+
+        # 아이템마다 별도 dict (lane_data는 원본 레인 참조)
+        return [
+            dict(key_results[key]) if key_results[key] else None
+            for key in keys
+        ]
+
+    def _similarity(self, queries: list, lane_field: str, query_index, sim_matrix, choice_index):
+        """(아이템 × 레인) 유사도: 고유 문자열 행렬에서 인덱스 조회"""
+        rows = np.array([query_index[q] for q in queries], dtype=np.int64)
+        cols = np.array(
+            [choice_index[c] for c in self._lane_choices[lane_field]], dtype=np.int64
+        )
+        return sim_matrix[np.ix_(rows, cols)]
+
+    def _match_unique(self, keys: List[tuple]) -> List[Optional[Dict]]:
+        n_lanes = len(self.approved_lanes)
+        if not keys or n_lanes == 0:
+            return [None] * len(keys)
+
+        origins = [k[0] for k in keys]
+        destinations = [k[1] for k in keys]
+        origin_norm = self._memoized(origins, self._location_cache, normalize_location)
+        dest_norm = self._memoized(destinations, self._location_cache, normalize_location)
+        vehicle_norm = self._memoized(
+            [k[2] for k in keys], self._vehicle_cache, normalize_vehicle
+        )
+        unit_str = [str(k[3]) for k in keys]
+
+        # 문자열 비교는 공통 정수 코드로 변환해 브로드캐스트
+        location_vocab: Dict = {}
+        vehicle_vocab: Dict = {}
+        unit_vocab: Dict = {}
+        region_vocab: Dict = {None: -1}
+        group_vocab: Dict = {None: -1}
+
+        vehicle_eq = (
+            _codes(vehicle_norm, vehicle_vocab)[:, None]
+            == _codes(self._lane_vehicle_norm, vehicle_vocab)[None, :]
+        )
+        unit_eq = (
+            _codes(unit_str, unit_vocab)[:, None]
+            == _codes(self._lane_unit, unit_vocab)[None, :]
+        )
+        vehicle_unit_eq = vehicle_eq & unit_eq
+
+        # LEVEL 1: 정확 매칭
+        exact = (
+            vehicle_unit_eq
+            & (
+                _codes(origin_norm, location_vocab)[:, None]
+                == _codes(self._lane_choices["norm_origin"], location_vocab)[None, :]
+            )
+            & (
+                _codes(dest_norm, location_vocab)[:, None]
+                == _codes(self._lane_choices["norm_dest"], location_vocab)[None, :]
+            )
+        )
+
+        # 유사도: 고유 아이템 문자열 × 고유 레인 문자열 1회 계산
+        query_strings = list(dict.fromkeys(origins + destinations))
+        choice_strings = list(dict.fromkeys(
+            s for values in self._lane_choices.values() for s in values
+        ))
+        sim_matrix = hybrid_similarity_ml_matrix(query_strings, choice_strings, self.weights)
+        query_index = {s: i for i, s in enumerate(query_strings)}
+        choice_index = {s: i for i, s in enumerate(choice_strings)}
+
+        def total_similarity(origin_field: str, dest_field: str) -> np.ndarray:
+            origin_sim = self._similarity(origins, origin_field, query_index, sim_matrix, choice_index)
+            dest_sim = self._similarity(destinations, dest_field, query_index, sim_matrix, choice_index)
+            # 가중 평균 (Origin 60%, Destination 40%)
+            return 0.6 * origin_sim + 0.4 * dest_sim
+
+        # LEVEL 2: ML 유사도 (레인 원문 대비), 임계값 0.65
+        similarity_total = total_similarity("raw_origin", "raw_dest")
+        similarity_ok = vehicle_unit_eq & (similarity_total >= 0.65)
+
+        # LEVEL 3: 권역 (아이템 권역이 모두 있을 때만), 점수 0.5
+        origin_region = _codes(
+            self._memoized(origin_norm, self._region_cache, get_region), region_vocab
+        )
+        dest_region = _codes(
+            self._memoized(dest_norm, self._region_cache, get_region), region_vocab
+        )
+        region_ok = (
+            vehicle_unit_eq
+            & ((origin_region >= 0) & (dest_region >= 0))[:, None]
+            & (origin_region[:, None] == _codes(self._lane_origin_region, region_vocab)[None, :])
+            & (dest_region[:, None] == _codes(self._lane_dest_region, region_vocab)[None, :])
+        )
+
+        # LEVEL 4: 차량 그룹 (레인 정규화 위치 대비), 임계값 0.4
+        vehicle_group = _codes(
+            self._memoized(vehicle_norm, self._group_cache, get_vehicle_group), group_vocab
+        )
+        vehicle_type_total = total_similarity("norm_origin", "norm_dest")
+        vehicle_type_ok = (
+            unit_eq
+            & (vehicle_group >= 0)[:, None]
+            & (vehicle_group[:, None] == _codes(self._lane_vehicle_group, group_vocab)[None, :])
+            & (vehicle_type_total >= 0.4)
+        )
+
+        levels = [
+            ("EXACT", exact, None),
+            ("SIMILARITY_ML", similarity_ok, similarity_total),
+            ("REGION", region_ok, None),
+            ("VEHICLE_TYPE_ML", vehicle_type_ok, vehicle_type_total),
+        ]
+
+        results: List[Optional[Dict]] = [None] * len(keys)
+        pending = np.ones(len(keys), dtype=bool)
+        for level, mask, scores in levels:
+            hit = pending & mask.any(axis=1)
+            if not hit.any():
+                continue
+            if scores is None:
+                best = mask.argmax(axis=1)  # 첫 후보 레인
+            else:
+                best = np.where(mask, scores, -np.inf).argmax(axis=1)
+
+            for row in np.flatnonzero(hit):
+                lane_index = int(best[row])
+                if level == "EXACT":
+                    score = 1.0
+                elif level == "REGION":
+                    score = 0.5
+                else:
+                    score = float(scores[row, lane_index])
+                results[row] = {
+                    "row_index": lane_index + 2,
+                    "match_score": score,
+                    "match_level": level,
+                    "lane_data": self.approved_lanes[lane_index]
+                }
+            pending &= ~hit
+
+        return results
+
+
 # ============================================================================
 # BATCH PROCESSING WITH ML
 # ============================================================================
@@ -323,31 +676,50 @@ def batch_match_with_ml(
     
     Returns:
         매칭 결과 리스트
+
+    Note:
+        verbose=False: BatchLaneMatcher 행렬 매칭
+        verbose=True: 아이템별 매칭 로그를 위해 단건 find_matching_lane_ml 사용 (결과 동일)
     """
     # ML 가중치 설정
     if model_path:
         set_ml_weights(model_path)
     
-    results = []
-    
-    for i, row in items_df.iterrows():
-        origin = row.get("origin", "")
-        destination = row.get("destination", "")
-        vehicle = row.get("vehicle", "")
-        unit = row.get("unit", "per truck")
-        
-        match_result = find_matching_lane_ml(
-            origin, destination, vehicle, unit,
-            approved_lanes, verbose=verbose
+    def column(name, default):
+        if name in items_df.columns:
+            return items_df[name].tolist()
+        return [default] * len(items_df)
+
+    origins = column("origin", "")
+    destinations = column("destination", "")
+    vehicles = column("vehicle", "")
+    units = column("unit", "per truck")
+
+    if verbose:
+        match_results = [
+            find_matching_lane_ml(
+                origin, destination, vehicle, unit,
+                approved_lanes, verbose=verbose
+            )
+            for origin, destination, vehicle, unit
+            in zip(origins, destinations, vehicles, units)
+        ]
+    else:
+        match_results = BatchLaneMatcher(approved_lanes).match(
+            origins, destinations, vehicles, units
         )
-        
-        results.append({
+
+    results = [
+        {
             'item_index': i,
             'origin': origin,
             'destination': destination,
             'vehicle': vehicle,
             'match_result': match_result
-        })
+        }
+        for i, origin, destination, vehicle, match_result
+        in zip(items_df.index, origins, destinations, vehicles, match_results)
+    ]
     
     # 통계 출력
     if verbose:
@@ -377,8 +749,6 @@ def batch_match_with_ml(
 # ============================================================================
 
 if __name__ == "__main__":
-    import pandas as pd
-    
     print("="*80)
     print("Enhanced Matching with ML Integration - Example")
     print("="*80)
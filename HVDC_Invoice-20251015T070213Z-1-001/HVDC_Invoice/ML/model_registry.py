@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ModelRegistry - 버전별 모델 저장소
+모델은 joblib(비압축, memory-map 로드 가능), 가중치/성능은 metadata.json으로 분리 저장
+
+    registry/
+        LATEST              ← 최신 버전 이름 (예: v0003)
+        v0003/
+            metadata.json   ← weights, training_results, feature_names, models
+            logistic.joblib
+            random_forest.joblib
+            gradient_boosting.joblib
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import joblib
+
+LATEST_FILE = 'LATEST'
+METADATA_FILE = 'metadata.json'
+
+
+class ModelRegistry:
+    """
+    버전별 모델 레지스트리
+
+    Features:
+    - 저장할 때마다 새 버전 (v0001, v0002, ...)
+    - 가중치만 필요한 경우 metadata.json만 읽음 (모델 역직렬화 없음)
+    - 모델 로드는 mmap_mode='r' (큰 배열은 메모리 매핑)
+    """
+
+    def __init__(self, root: str):
+        """
+        초기화
+
+        Args:
+            root: 레지스트리 폴더
+        """
+        self.root = Path(root)
+
+    def list_versions(self) -> List[str]:
+        """저장된 버전 목록 (오래된 순)"""
+        if not self.root.exists():
+            return []
+        return sorted(
+            p.name for p in self.root.iterdir()
+            if p.is_dir() and p.name.startswith('v') and (p / METADATA_FILE).exists()
+        )
+
+    def latest_version(self) -> Optional[str]:
+        """최신 버전 이름 (없으면 None)"""
+        latest = self.root / LATEST_FILE
+        if latest.exists():
+            version = latest.read_text(encoding='utf-8').strip()
+            if (self.root / version / METADATA_FILE).exists():
+                return version
+        versions = self.list_versions()
+        return versions[-1] if versions else None
+
+    def _version_dir(self, version: Optional[str]) -> Path:
+        version = version or self.latest_version()
+        if version is None:
+            raise FileNotFoundError(f"레지스트리에 모델이 없습니다: {self.root}")
+        return self.root / version
+
+    def save(
+        self,
+        models: Dict[str, Any],
+        weights: Dict[str, float],
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """
+        새 버전으로 모델 저장
+
+        Args:
+            models: 모델 이름 → 학습된 estimator
+            weights: 추출된 가중치
+            metadata: 추가 메타데이터 (training_results, feature_names, cv_folds 등)
+
+        Returns:
+            저장된 버전 이름
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        # 저장이 중단된 버전 폴더(metadata.json 없음)도 번호는 건너뜀
+        numbers = [
+            int(p.name[1:]) for p in self.root.iterdir()
+            if p.is_dir() and p.name[:1] == 'v' and p.name[1:].isdigit()
+        ]
+        version = f"v{max(numbers, default=0) + 1:04d}"
+        version_dir = self.root / version
+        version_dir.mkdir()
+
+        model_files = {}
+        for name, model in models.items():
+            filename = f"{name}.joblib"
+            # 비압축 저장 → 로드 시 numpy 배열 memory-map 가능
+            joblib.dump(model, version_dir / filename)
+            model_files[name] = filename
+
+        record = dict(metadata or {})
+        record.update({
+            'version': version,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'weights': weights,
+            'models': model_files,
+        })
+
+        # metadata.json을 마지막에 기록 → 목록에는 완전히 저장된 버전만 나타남
+        tmp_path = version_dir / (METADATA_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=2, default=float)
+        os.replace(tmp_path, version_dir / METADATA_FILE)
+
+        latest_tmp = self.root / (LATEST_FILE + '.tmp')
+        latest_tmp.write_text(version, encoding='utf-8')
+        os.replace(latest_tmp, self.root / LATEST_FILE)
+
+        return version
+
+    def load_metadata(self, version: Optional[str] = None) -> Dict:
+        """
+        버전 메타데이터 (기본: 최신)
+
+        Returns:
+            metadata.json 내용 (weights 포함)
+        """
+        with open(self._version_dir(version) / METADATA_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_weights(self, version: Optional[str] = None) -> Dict[str, float]:
+        """가중치만 로드 (모델 파일은 읽지 않음)"""
+        return self.load_metadata(version)['weights']
+
+    def load_model(
+        self,
+        name: str,
+        version: Optional[str] = None,
+        mmap_mode: Optional[str] = 'r'
+    ):
+        """
+        모델 로드
+
+        Args:
+            name: 모델 이름 (logistic, random_forest, gradient_boosting)
+            version: 버전 (기본: 최신)
+            mmap_mode: joblib memory-map 모드 (None이면 메모리로 전부 로드)
+        """
+        version_dir = self._version_dir(version)
+        with open(version_dir / METADATA_FILE, 'r', encoding='utf-8') as f:
+            model_files = json.load(f)['models']
+        if name not in model_files:
+            raise ValueError(f"모델 '{name}'이 {version_dir.name}에 없습니다")
+        return joblib.load(version_dir / model_files[name], mmap_mode=mmap_mode)
+
+    def load_models(
+        self,
+        version: Optional[str] = None,
+        mmap_mode: Optional[str] = 'r'
+    ) -> Dict[str, Any]:
+        """버전의 모든 모델 로드"""
+        metadata = self.load_metadata(version)
+        return {
+            name: self.load_model(name, metadata['version'], mmap_mode)
+            for name in metadata['models']
+        }
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FeatureCache 테스트
+샘플 특징 계산, 메모리/디스크 캐시, A/B 테스트 재사용
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# enhanced_matching.py (02_DSV_DOMESTIC)
+sys.path.insert(
+    0, str(Path(__file__).parent.parent / "HVDC_Invoice_Audit" / "02_DSV_DOMESTIC")
+)
+
+from ab_testing_framework import ABTestingFramework
+from feature_cache import FeatureCache, compute_feature_matrix
+from training_data_generator import TrainingDataGenerator
+from weight_optimizer import WeightOptimizer
+
+
+@pytest.fixture
+def generator():
+    generator = TrainingDataGenerator()
+    pairs = [
+        ("DSV Mussafah Yard", "Mirfa PMO Site", "DSV MUSSAFAH YARD", "MIRFA SITE"),
+        ("M44 WH", "Shuweihat Power", "M44 WAREHOUSE", "SHUWEIHAT SITE"),
+        ("Mina Zayed Port", "ICAD WH", "MINA ZAYED PORT", "ICAD WAREHOUSE"),
+        ("DSV Musafah Yrd", "Samsung MOSB", "DSV MUSSAFAH YARD", "SAMSUNG MOSB YARD"),
+    ]
+    for origin, dest, lane_origin, lane_dest in pairs * 5:
+        generator.add_positive_sample(origin, dest, "Flatbed", lane_origin, lane_dest, "FLATBED")
+        generator.add_negative_sample(origin, dest, "Flatbed", lane_dest, lane_origin, "FLATBED")
+    return generator
+
+
+class TestFeatureCache:
+    """FeatureCache 클래스 테스트"""
+
+    def test_features_match_scalar_similarity(self, generator):
+        from ml_integration import (
+            fuzzy_token_sort_similarity,
+            levenshtein_similarity,
+            token_set_similarity,
+        )
+
+        matrix = compute_feature_matrix(generator.samples)
+        assert matrix.shape == (len(generator.samples), 3)
+
+        sample = generator.samples[1]
+        for column, func in enumerate(
+            [token_set_similarity, levenshtein_similarity, fuzzy_token_sort_similarity]
+        ):
+            expected = (
+                0.6 * func(sample['origin_invoice'], sample['origin_lane'])
+                + 0.4 * func(sample['dest_invoice'], sample['dest_lane'])
+            )
+            assert matrix[1, column] == expected
+
+    def test_memory_cache(self, generator):
+        cache = FeatureCache()
+        first = cache.get_matrix(generator.samples)
+        assert cache.get_matrix(list(generator.samples)) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert not first.flags.writeable
+
+    def test_disk_cache_is_memory_mapped(self, generator, tmp_path):
+        first = FeatureCache(str(tmp_path)).get_matrix(generator.samples)
+
+        reloaded = FeatureCache(str(tmp_path))
+        matrix = reloaded.get_matrix(generator.samples)
+        assert isinstance(matrix, np.memmap)
+        assert np.array_equal(matrix, first)
+        assert reloaded.misses == 0
+
+    def test_changed_samples_are_recomputed(self, generator):
+        cache = FeatureCache()
+        cache.get_matrix(generator.samples)
+        generator.add_positive_sample("A", "B", "Truck", "A", "B", "TRUCK")
+        assert cache.get_matrix(generator.samples).shape[0] == len(generator.samples)
+        assert cache.misses == 2
+
+    def test_frame_feeds_training_and_ab_test(self, generator):
+        cache = FeatureCache()
+        df = generator.to_feature_frame(cache)
+        assert list(df.columns) == [
+            'token_set', 'levenshtein', 'fuzzy_sort', 'label', 'actual_match'
+        ]
+
+        optimizer = WeightOptimizer()
+        optimizer.train_cv(df, cv_folds=2, n_jobs=1)
+        weights = optimizer.extract_weights()
+
+        comparison = ABTestingFramework().compare_weights(
+            generator.to_feature_frame(cache),
+            {'token_set': 0.4, 'levenshtein': 0.3, 'fuzzy_sort': 0.3},
+            weights
+        )
+        assert set(comparison) == {'default', 'optimized', 'improvement'}
+        assert cache.misses == 1
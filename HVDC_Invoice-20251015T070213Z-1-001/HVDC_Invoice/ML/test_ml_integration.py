@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ml_integration 배치 매칭 테스트
+BatchLaneMatcher(행렬) 결과가 단건 find_matching_lane_ml과 같은지 확인
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# enhanced_matching.py (02_DSV_DOMESTIC)
+sys.path.insert(
+    0, str(Path(__file__).parent.parent / "HVDC_Invoice_Audit" / "02_DSV_DOMESTIC")
+)
+
+import ml_integration
+from ml_integration import (
+    BatchLaneMatcher,
+    batch_match_with_ml,
+    find_matching_lane_ml,
+    hybrid_similarity_ml,
+    hybrid_similarity_ml_matrix,
+)
+
+LOCATIONS = [
+    "DSV Mussafah Yard", "DSV MUSAFAH YRD", "M44 WH", "M44 WAREHOUSE",
+    "Mirfa PMO Site", "Samsung Mirfa PMO", "Shuweihat Power", "MOSB",
+    "Samsung MOSB Yard", "Mina Zayed Port", "Jebel Ali Port", "ICAD WH",
+    "Khalifa Port", "Unknown Place", "", None, float("nan"),
+]
+VEHICLES = ["Flatbed", "40T Flat Bed", "Low Bed", "Trailer", "Truck", "Mobile Crane", ""]
+UNITS = ["per truck", "per truck", "per ton"]
+
+
+def _result_key(result):
+    if result is None:
+        return None
+    return (result["row_index"], result["match_score"], result["match_level"], id(result["lane_data"]))
+
+
+class TestBatchLaneMatcher:
+    """행렬 매칭 = 단건 매칭"""
+
+    @pytest.fixture
+    def lanes(self):
+        rng = np.random.default_rng(42)
+        lanes = [
+            {
+                "origin": LOCATIONS[rng.integers(len(LOCATIONS) - 2)],
+                "destination": LOCATIONS[rng.integers(len(LOCATIONS) - 2)],
+                "vehicle": VEHICLES[rng.integers(len(VEHICLES))],
+                "unit": UNITS[rng.integers(len(UNITS))],
+            }
+            for _ in range(60)
+        ]
+        # 동일 레인 중복 → 동점 시 앞 레인 선택 확인
+        return lanes + [dict(lane) for lane in lanes[:10]]
+
+    @pytest.fixture
+    def items_df(self):
+        rng = np.random.default_rng(7)
+        items = pd.DataFrame(
+            [
+                {
+                    "origin": LOCATIONS[rng.integers(len(LOCATIONS))],
+                    "destination": LOCATIONS[rng.integers(len(LOCATIONS))],
+                    "vehicle": VEHICLES[rng.integers(len(VEHICLES))],
+                    "unit": UNITS[rng.integers(len(UNITS))],
+                }
+                for _ in range(300)
+            ]
+        )
+        items.index = items.index * 2 + 5
+        return items
+
+    def test_batch_matches_single_item_path(self, lanes, items_df):
+        results = batch_match_with_ml(items_df, lanes)
+
+        assert [r["item_index"] for r in results] == list(items_df.index)
+        levels = set()
+        for result, (_, row) in zip(results, items_df.iterrows()):
+            expected = find_matching_lane_ml(
+                row["origin"], row["destination"], row["vehicle"], row["unit"], lanes
+            )
+            assert _result_key(result["match_result"]) == _result_key(expected)
+            if expected:
+                levels.add(expected["match_level"])
+                assert result["match_result"]["lane_data"] is expected["lane_data"]
+
+        assert levels == {"EXACT", "SIMILARITY_ML", "REGION", "VEHICLE_TYPE_ML"}
+
+    def test_without_rapidfuzz(self, lanes, items_df, monkeypatch):
+        monkeypatch.setattr(ml_integration, "_USE_RAPIDFUZZ", False)
+        items = items_df.head(60)
+        matcher = BatchLaneMatcher(lanes)
+        results = matcher.match(
+            items["origin"].tolist(), items["destination"].tolist(),
+            items["vehicle"].tolist(), items["unit"].tolist(),
+        )
+        for result, (_, row) in zip(results, items.iterrows()):
+            expected = find_matching_lane_ml(
+                row["origin"], row["destination"], row["vehicle"], row["unit"], lanes
+            )
+            assert _result_key(result) == _result_key(expected)
+
+    def test_duplicate_items_get_separate_results(self, lanes):
+        matcher = BatchLaneMatcher(lanes)
+        item = (lanes[0]["origin"], lanes[0]["destination"], lanes[0]["vehicle"], lanes[0]["unit"])
+        first, second = matcher.match(*[[value, value] for value in item])
+        assert first == second and first is not second
+
+    def test_missing_columns_use_defaults(self, lanes):
+        results = batch_match_with_ml(pd.DataFrame({"origin": ["M44 WH"]}), lanes)
+        assert results[0]["destination"] == ""
+
+    def test_empty_lanes(self):
+        assert BatchLaneMatcher([]).match(["A"], ["B"], ["Truck"], ["per truck"]) == [None]
+
+
+def test_similarity_matrix_matches_scalar():
+    strings = ["DSV Mussafah Yard", "MUSAFAH YRD", "", None, "Mina  Zayed Port", "PORT MINA"]
+    weights = {"fuzzy_sort": 0.31, "token_set": 0.4471, "levenshtein": 0.2429}
+    ml_integration._weights_manager.weights = weights
+    try:
+        matrix = hybrid_similarity_ml_matrix(strings, strings)
+        for i, s1 in enumerate(strings):
+            for j, s2 in enumerate(strings):
+                assert matrix[i, j] == hybrid_similarity_ml(s1, s2)
+    finally:
+        ml_integration._weights_manager.weights = dict(
+            ml_integration.MLWeightsManager.DEFAULT_WEIGHTS
+        )
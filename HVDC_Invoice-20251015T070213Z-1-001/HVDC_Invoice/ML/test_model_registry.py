@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ModelRegistry 테스트
+버전 관리, metadata 분리 로드, MLWeightsManager 연동
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from model_registry import ModelRegistry
+
+# enhanced_matching.py (02_DSV_DOMESTIC)
+sys.path.insert(
+    0, str(Path(__file__).parent.parent / "HVDC_Invoice_Audit" / "02_DSV_DOMESTIC")
+)
+
+WEIGHTS = {'token_set': 0.5, 'levenshtein': 0.2, 'fuzzy_sort': 0.3}
+
+
+@pytest.fixture
+def model():
+    X = np.array([[0.9, 0.9, 0.9], [0.1, 0.2, 0.1], [0.8, 0.7, 0.9], [0.2, 0.1, 0.3]])
+    return LogisticRegression().fit(X, [1, 0, 1, 0])
+
+
+class TestModelRegistry:
+    """ModelRegistry 클래스 테스트"""
+
+    def test_empty_registry(self, tmp_path):
+        registry = ModelRegistry(str(tmp_path / "registry"))
+        assert registry.list_versions() == []
+        assert registry.latest_version() is None
+        with pytest.raises(FileNotFoundError):
+            registry.load_weights()
+
+    def test_versions_and_latest(self, tmp_path, model):
+        registry = ModelRegistry(str(tmp_path))
+        assert registry.save({'logistic': model}, WEIGHTS) == "v0001"
+        assert registry.save({'logistic': model}, {**WEIGHTS, 'token_set': 0.6}) == "v0002"
+
+        assert registry.list_versions() == ["v0001", "v0002"]
+        assert registry.latest_version() == "v0002"
+        assert registry.load_weights()['token_set'] == 0.6
+        assert registry.load_weights("v0001") == WEIGHTS
+
+    def test_load_model_memory_mapped(self, tmp_path, model):
+        registry = ModelRegistry(str(tmp_path))
+        registry.save({'logistic': model}, WEIGHTS, {'n_samples': 4})
+
+        loaded = registry.load_model('logistic')
+        assert isinstance(loaded.coef_, np.memmap)
+        assert np.array_equal(loaded.coef_, model.coef_)
+        assert registry.load_metadata()['n_samples'] == 4
+
+        with pytest.raises(ValueError):
+            registry.load_model('random_forest')
+
+    def test_incomplete_version_is_ignored(self, tmp_path, model):
+        registry = ModelRegistry(str(tmp_path))
+        registry.save({'logistic': model}, WEIGHTS)
+        (tmp_path / "v0002").mkdir()  # metadata.json 없음 (저장 중단)
+        assert registry.list_versions() == ["v0001"]
+        assert registry.save({'logistic': model}, WEIGHTS) == "v0003"
+        assert registry.latest_version() == "v0003"
+
+
+def test_weights_manager_reads_registry_metadata_only(tmp_path, model, monkeypatch):
+    from ml_integration import MLWeightsManager
+
+    ModelRegistry(str(tmp_path)).save({'logistic': model}, WEIGHTS)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("모델 파일을 읽으면 안 됨")
+
+    monkeypatch.setattr("joblib.load", fail)
+    manager = MLWeightsManager(str(tmp_path))
+    assert manager.is_optimized()
+    assert manager.get_weights() == WEIGHTS
@@ -181,3 +181,36 @@ class TestTrainingDataGenerator:
             ]
             assert len(matching_lane) == 0  # 매칭되는 레인이 없어야 함
 
+    
+    def test_negative_samples_are_reproducible_with_seed(self):
+        """같은 random_state → 같은 Negative sample"""
+        approved_lanes = [
+            {'origin': f'ORIGIN {i % 7}', 'destination': f'DEST {i % 5}',
+             'vehicle': ['FLATBED', 'TRAILER'][i % 2], 'unit': 'per truck'}
+            for i in range(40)
+        ]
+        
+        first = TrainingDataGenerator()
+        first.generate_negative_samples_auto(approved_lanes, n_samples=200, random_state=3)
+        second = TrainingDataGenerator()
+        second.generate_negative_samples_auto(approved_lanes, n_samples=200, random_state=3)
+        
+        assert first.samples == second.samples
+        assert first.get_negative_count() == 200
+        
+        existing = {(l['origin'], l['destination'], l['vehicle']) for l in approved_lanes}
+        for sample in first.samples:
+            assert (sample['origin_lane'], sample['dest_lane'], sample['vehicle_lane']) not in existing
+    
+    def test_negative_samples_stop_when_no_invalid_combination(self, capsys):
+        """모든 조합이 존재하면 경고 후 종료"""
+        approved_lanes = [
+            {'origin': 'A', 'destination': 'B', 'vehicle': 'TRUCK', 'unit': 'per truck'},
+            {'origin': 'A', 'destination': 'B', 'vehicle': 'TRUCK', 'unit': 'per ton'},
+        ]
+        
+        generator = TrainingDataGenerator()
+        generator.generate_negative_samples_auto(approved_lanes, n_samples=5)
+        
+        assert generator.get_sample_count() == 0
+        assert "0개만 생성됨" in capsys.readouterr().out
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TrainingSampleStore 테스트
+추가 저장, (송장 항목, 레인) 중복 제거, 배치 스트리밍 확인
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# enhanced_matching.py (02_DSV_DOMESTIC) - 특징 계산용
+sys.path.insert(
+    0, str(Path(__file__).parent.parent / "HVDC_Invoice_Audit" / "02_DSV_DOMESTIC")
+)
+
+from feature_cache import FeatureCache
+from training_data_generator import TrainingDataGenerator
+from training_sample_store import TrainingSampleStore
+
+
+def _generator(n=30):
+    generator = TrainingDataGenerator()
+    for i in range(n):
+        generator.add_positive_sample(
+            f"DSV Mussafah Yard {i}", "Mirfa PMO Site", "40T Flatbed",
+            f"DSV MUSSAFAH YARD {i}", "MIRFA SITE", "FLATBED",
+            metadata={'month': '2025-09'} if i == 0 else None
+        )
+        generator.add_negative_sample(
+            f"DSV Mussafah Yard {i}", "Jebel Ali Port", "Trailer",
+            f"M44 WAREHOUSE {i}", "MIRFA SITE", "FLATBED"
+        )
+    return generator
+
+
+class TestTrainingSampleStore:
+    """TrainingSampleStore 클래스 테스트"""
+
+    def test_should_append_and_skip_duplicates(self, tmp_path):
+        """같은 (항목, 레인) 키는 다시 저장하지 않아야 함"""
+        generator = _generator()
+        db_path = str(tmp_path / "samples.sqlite")
+
+        assert generator.save_to_store(db_path) == 60
+        assert generator.save_to_store(db_path) == 0
+
+        generator.add_positive_sample("New", "Item", "Truck", "NEW", "LANE", "TRUCK")
+        assert generator.save_to_store(db_path) == 1
+
+        with TrainingSampleStore(db_path) as store:
+            assert store.count() == 61
+            assert store.count(label=1) == 31
+            assert store.count(label=0) == 30
+
+    def test_should_roundtrip_samples_in_order(self, tmp_path):
+        """저장 순서와 메타데이터를 그대로 복원해야 함"""
+        generator = _generator()
+        db_path = str(tmp_path / "samples.sqlite")
+        generator.save_to_store(db_path)
+
+        loaded = TrainingDataGenerator()
+        loaded.load_from_store(db_path)
+
+        assert loaded.samples == generator.samples
+
+    def test_should_stream_batches(self):
+        """배치 크기 단위로 스트리밍해야 함"""
+        with TrainingSampleStore(':memory:') as store:
+            store.append(_generator().samples)
+            sizes = [len(batch) for batch in store.iter_batches(batch_size=25)]
+
+        assert sizes == [25, 25, 10]
+
+    def test_should_import_json(self, tmp_path):
+        """기존 JSON 파일을 가져와야 함"""
+        generator = _generator(5)
+        json_path = tmp_path / "samples.json"
+        generator.save_to_json(str(json_path))
+
+        with TrainingSampleStore(':memory:') as store:
+            assert store.import_json(str(json_path)) == 10
+            assert store.load_samples() == json.loads(json_path.read_text(encoding='utf-8'))
+
+    def test_streamed_features_match_full_frame(self):
+        """배치별 특징 = 전체 특징"""
+        generator = _generator()
+
+        with TrainingSampleStore(':memory:') as store:
+            store.append(generator.samples)
+            streamed = store.to_feature_frame(batch_size=7)
+
+        expected = FeatureCache().get_frame(generator.samples)
+        assert np.array_equal(streamed.to_numpy(), expected.to_numpy())
+        assert list(streamed.columns) == list(expected.columns)
+
+    def test_empty_store(self):
+        """빈 저장소"""
+        with TrainingSampleStore(':memory:') as store:
+            assert store.count() == 0
+            assert store.load_samples() == []
+            assert len(store.to_feature_frame()) == 0
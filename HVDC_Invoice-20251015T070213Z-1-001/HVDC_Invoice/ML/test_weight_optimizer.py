@@ -148,3 +148,50 @@ class TestWeightOptimizer:
         for model_name, metrics in results.items():
             assert best_accuracy >= metrics['accuracy']
 
+
+
+class TestWeightOptimizerCV:
+    """k-fold 교차검증 병렬 학습 + 레지스트리"""
+
+    @pytest.fixture
+    def training_df(self):
+        rng = np.random.default_rng(0)
+        positive = rng.uniform(0.6, 1.0, size=(60, 3))
+        negative = rng.uniform(0.0, 0.5, size=(60, 3))
+        df = pd.DataFrame(
+            np.vstack([positive, negative]),
+            columns=['token_set', 'levenshtein', 'fuzzy_sort']
+        )
+        df['label'] = [1] * 60 + [0] * 60
+        return df
+
+    def test_train_cv_parallel_matches_sequential(self, training_df):
+        sequential = WeightOptimizer()
+        results = sequential.train_cv(training_df, cv_folds=3, n_jobs=1)
+
+        parallel = WeightOptimizer()
+        assert parallel.train_cv(training_df, cv_folds=3, n_jobs=2) == results
+
+        for model_name, metrics in results.items():
+            assert len(sequential.cv_scores[model_name]) == 3
+            assert 'accuracy_std' in metrics
+            assert metrics['accuracy'] > 0.9
+
+        assert sequential.extract_weights() == parallel.extract_weights()
+        assert sequential.get_best_model_name() in results
+
+    def test_registry_roundtrip(self, training_df, tmp_path):
+        optimizer = WeightOptimizer()
+        optimizer.train_cv(training_df, cv_folds=3, n_jobs=1)
+
+        registry_dir = tmp_path / "registry"
+        assert optimizer.save_to_registry(str(registry_dir)) == "v0001"
+        assert optimizer.save_to_registry(str(registry_dir), metadata={'n_samples': 120}) == "v0002"
+
+        loaded = WeightOptimizer()
+        loaded.load_from_registry(str(registry_dir))
+        assert loaded.extract_weights() == optimizer.extract_weights()
+        assert loaded.training_results == optimizer.training_results
+
+        features = {'token_set': 0.9, 'levenshtein': 0.85, 'fuzzy_sort': 0.88}
+        assert loaded.predict_probability(features) == optimizer.predict_probability(features)
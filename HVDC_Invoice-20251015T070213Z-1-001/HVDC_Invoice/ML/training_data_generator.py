@@ -6,9 +6,10 @@ TDD로 구현됨
 """
 
 import json
-import random
 from typing import Optional, Dict, List
 
+import numpy as np
+
 
 class TrainingDataGenerator:
     """
@@ -17,6 +18,7 @@ class TrainingDataGenerator:
     Features:
     - Positive/Negative sample 추가
     - JSON 저장/로드
+    - 누적 저장소(TrainingSampleStore) 추가 저장/로드
     - 샘플 통계 조회
     """
     
@@ -118,6 +120,44 @@ class TrainingDataGenerator:
         with open(input_path, 'r', encoding='utf-8') as f:
             self.samples = json.load(f)
     
+    def save_to_store(self, db_path: str) -> int:
+        """
+        샘플을 누적 저장소에 추가 (기존 샘플 재작성 없음, 중복 키 무시)
+        
+        Args:
+            db_path: TrainingSampleStore SQLite 파일 경로
+        
+        Returns:
+            새로 저장된 샘플 수
+        """
+        from training_sample_store import TrainingSampleStore
+        
+        with TrainingSampleStore(db_path) as store:
+            return store.append(self.samples)
+    
+    def load_from_store(self, db_path: str):
+        """
+        누적 저장소에서 샘플 데이터 로드
+        
+        Args:
+            db_path: TrainingSampleStore SQLite 파일 경로
+        """
+        from training_sample_store import TrainingSampleStore
+        
+        with TrainingSampleStore(db_path) as store:
+            self.samples = store.load_samples()
+    
+    def to_feature_frame(self, cache=None):
+        """
+        샘플 특징 DataFrame (token_set, levenshtein, fuzzy_sort, label, actual_match)
+        
+        Args:
+            cache: FeatureCache (None이면 프로세스 기본 캐시 → 학습/A/B 테스트가 재사용)
+        """
+        from feature_cache import default_feature_cache
+        
+        return (cache or default_feature_cache()).get_frame(self.samples)
+    
     def get_sample_count(self) -> int:
         """전체 샘플 개수"""
         return len(self.samples)
@@ -133,7 +173,8 @@ class TrainingDataGenerator:
     def generate_negative_samples_auto(
         self,
         approved_lanes: List[Dict],
-        n_samples: int = 100
+        n_samples: int = 100,
+        random_state: Optional[int] = None
     ):
         """
         자동으로 Negative sample 생성
@@ -141,38 +182,53 @@ class TrainingDataGenerator:
         전략: ApprovedLaneMap의 레인들을 섞어서
         실제로 존재하지 않는 origin-destination 조합 생성
         
+        (origin, destination, vehicle)을 정수 코드 키로 만든 뒤
+        후보 조합을 배치로 뽑아 존재 여부를 np.isin으로 한 번에 판정
+        
         Args:
             approved_lanes: ApprovedLaneMap 레인 리스트
             n_samples: 생성할 negative sample 개수
+            random_state: 난수 시드 (optional)
         """
         if len(approved_lanes) < 2:
             raise ValueError("최소 2개 이상의 레인이 필요합니다")
         
+        rng = np.random.default_rng(random_state)
+        n_lanes = len(approved_lanes)
+        
+        origin_codes, origins = _encode([lane['origin'] for lane in approved_lanes])
+        dest_codes, destinations = _encode([lane['destination'] for lane in approved_lanes])
+        vehicle_codes, vehicles = _encode([lane['vehicle'] for lane in approved_lanes])
+        
+        n_dest, n_vehicle = len(destinations), len(vehicles)
+        lane_keys = np.unique(
+            (origin_codes * n_dest + dest_codes) * n_vehicle + vehicle_codes
+        )
+        
         generated_count = 0
         max_attempts = n_samples * 10  # 무한 루프 방지
         attempts = 0
         
         while generated_count < n_samples and attempts < max_attempts:
-            attempts += 1
+            batch = min(max(2 * (n_samples - generated_count), 64), max_attempts - attempts)
+            attempts += batch
             
-            # 랜덤하게 2개의 레인 선택
-            lane1, lane2 = random.sample(approved_lanes, 2)
+            # 서로 다른 2개의 레인 선택 (lane1의 origin/vehicle + lane2의 destination)
+            first = rng.integers(n_lanes, size=batch)
+            second = (first + rng.integers(1, n_lanes, size=batch)) % n_lanes
             
-            # 잘못된 조합 생성 (lane1의 origin + lane2의 destination)
-            origin = lane1['origin']
-            destination = lane2['destination']
-            vehicle = lane1['vehicle']
+            candidate_keys = (
+                origin_codes[first] * n_dest + dest_codes[second]
+            ) * n_vehicle + vehicle_codes[first]
             
-            # 이 조합이 실제로 존재하는지 확인
-            is_valid_combination = any(
-                lane['origin'] == origin and
-                lane['destination'] == destination and
-                lane['vehicle'] == vehicle
-                for lane in approved_lanes
-            )
+            # 존재하지 않는 조합만 negative sample로 추가
+            accepted = np.flatnonzero(~np.isin(candidate_keys, lane_keys))
+            accepted = accepted[:n_samples - generated_count]
             
-            # 존재하지 않는 조합이면 negative sample로 추가
-            if not is_valid_combination:
+            for i in accepted:
+                origin = origins[origin_codes[first[i]]]
+                destination = destinations[dest_codes[second[i]]]
+                vehicle = vehicles[vehicle_codes[first[i]]]
                 self.add_negative_sample(
                     origin_invoice=origin,
                     dest_invoice=destination,
@@ -181,8 +237,14 @@ class TrainingDataGenerator:
                     dest_lane=destination,
                     vehicle_lane=vehicle
                 )
-                generated_count += 1
+            generated_count += len(accepted)
         
         if generated_count < n_samples:
             print(f"⚠️  Warning: {n_samples}개 중 {generated_count}개만 생성됨")
 
+
+def _encode(values: List) -> tuple:
+    """값 리스트 → (정수 코드 배열, 고유 값 리스트)"""
+    uniques = list(dict.fromkeys(values))
+    index = {value: i for i, value in enumerate(uniques)}
+    return np.array([index[v] for v in values], dtype=np.int64), uniques
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TrainingSampleStore - 학습 샘플 누적 저장소 (SQLite)
+월별로 늘어나는 학습 샘플을 전체 JSON 재작성 없이 추가 저장하고,
+(송장 항목, 레인) 키로 중복을 제거하며, 배치 단위로 스트리밍 조회
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+# (송장 항목, 레인) 중복 제거 키
+KEY_FIELDS = (
+    'origin_invoice', 'dest_invoice', 'vehicle_invoice',
+    'origin_lane', 'dest_lane', 'vehicle_lane',
+)
+SAMPLE_FIELDS = KEY_FIELDS + ('label', 'metadata')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    id INTEGER PRIMARY KEY,
+    origin_invoice TEXT NOT NULL,
+    dest_invoice TEXT NOT NULL,
+    vehicle_invoice TEXT NOT NULL,
+    origin_lane TEXT NOT NULL,
+    dest_lane TEXT NOT NULL,
+    vehicle_lane TEXT NOT NULL,
+    label INTEGER NOT NULL,
+    metadata TEXT,
+    UNIQUE (origin_invoice, dest_invoice, vehicle_invoice,
+            origin_lane, dest_lane, vehicle_lane)
+)
+"""
+
+_INSERT = (
+    f"INSERT OR IGNORE INTO samples ({', '.join(SAMPLE_FIELDS)}) "
+    f"VALUES ({', '.join('?' for _ in SAMPLE_FIELDS)})"
+)
+_SELECT = f"SELECT id, {', '.join(SAMPLE_FIELDS)} FROM samples"
+
+
+def _to_row(sample: Dict) -> tuple:
+    metadata = sample.get('metadata')
+    return tuple(str(sample.get(field) or '') for field in KEY_FIELDS) + (
+        int(sample['label']),
+        json.dumps(metadata, ensure_ascii=False) if metadata else None,
+    )
+
+
+def _to_sample(row: tuple) -> Dict:
+    sample = dict(zip(KEY_FIELDS, row[1:7]))
+    sample['label'] = row[7]
+    if row[8] is not None:
+        sample['metadata'] = json.loads(row[8])
+    return sample
+
+
+class TrainingSampleStore:
+    """
+    학습 샘플 저장소
+
+    Features:
+    - 추가 전용 (append): 기존 샘플은 다시 쓰지 않음
+    - (송장 항목, 레인) 키 중복 제거 (먼저 저장된 샘플 유지)
+    - id 순서 배치 스트리밍 (샘플 dict / 특징 DataFrame)
+    """
+
+    def __init__(self, db_path: str):
+        """
+        초기화
+
+        Args:
+            db_path: SQLite 파일 경로 (':memory:' 가능)
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """연결 종료"""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, samples: Iterable[Dict]) -> int:
+        """
+        샘플 추가 (중복 키는 무시)
+
+        Args:
+            samples: TrainingDataGenerator.samples 형식의 dict
+
+        Returns:
+            새로 저장된 샘플 수
+        """
+        before = self._conn.total_changes
+        with self._conn:
+            self._conn.executemany(_INSERT, (_to_row(s) for s in samples))
+        return self._conn.total_changes - before
+
+    def import_json(self, json_path: str) -> int:
+        """save_to_json 파일 가져오기 (기존 JSON → 저장소 이전)"""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return self.append(json.load(f))
+
+    def count(self, label: Optional[int] = None) -> int:
+        """샘플 수 (label 지정 시 해당 label만)"""
+        if label is None:
+            query, params = "SELECT COUNT(*) FROM samples", ()
+        else:
+            query, params = "SELECT COUNT(*) FROM samples WHERE label = ?", (int(label),)
+        return self._conn.execute(query, params).fetchone()[0]
+
+    def iter_batches(self, batch_size: int = 10000) -> Iterator[List[Dict]]:
+        """
+        샘플 배치 스트리밍 (저장 순서)
+
+        Args:
+            batch_size: 배치당 샘플 수
+
+        Yields:
+            샘플 dict 리스트
+        """
+        last_id = 0
+        while True:
+            with closing(self._conn.execute(
+                f"{_SELECT} WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+            )) as cursor:
+                rows = cursor.fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [_to_sample(row) for row in rows]
+
+    def load_samples(self) -> List[Dict]:
+        """전체 샘플 로드"""
+        return [sample for batch in self.iter_batches() for sample in batch]
+
+    def iter_feature_frames(self, batch_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        배치별 특징 DataFrame 스트리밍 (FeatureCache.get_frame과 같은 컬럼)
+
+        Yields:
+            token_set, levenshtein, fuzzy_sort, label, actual_match
+        """
+        from feature_cache import FeatureCache
+
+        # 배치마다 내용이 달라 캐시 재사용이 없으므로 메모리 캐시를 배치별로 버림
+        for batch in self.iter_batches(batch_size):
+            yield FeatureCache().get_frame(batch)
+
+    def to_feature_frame(self, batch_size: int = 10000) -> pd.DataFrame:
+        """
+        전체 특징 DataFrame (WeightOptimizer.train / train_cv 입력)
+
+        샘플 dict는 배치 단위로만 메모리에 존재하고 숫자 특징만 누적
+        """
+        frames = list(self.iter_feature_frames(batch_size))
+        if not frames:
+            from feature_cache import FeatureCache
+            return FeatureCache().get_frame([])
+        return pd.concat(frames, ignore_index=True)
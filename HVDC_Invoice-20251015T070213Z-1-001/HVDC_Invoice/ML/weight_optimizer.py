@@ -8,12 +8,40 @@ TDD로 구현됨
 import pickle
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple
-from sklearn.model_selection import train_test_split
+from typing import Dict, Optional, Tuple
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.model_selection import StratifiedKFold, train_test_split
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 
+from model_registry import ModelRegistry
+
+METRIC_NAMES = ['accuracy', 'precision', 'recall', 'f1']
+
+
+def _fit_model(model, X: np.ndarray, y: np.ndarray):
+    """모델 복제 후 학습 (병렬 작업 단위)"""
+    return clone(model).fit(X, y)
+
+
+def _fit_and_score(
+    model,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray
+) -> Dict[str, float]:
+    """fold 1개 학습 + 평가 (병렬 작업 단위)"""
+    y_pred = _fit_model(model, X_train, y_train).predict(X_test)
+    return {
+        'accuracy': accuracy_score(y_test, y_pred),
+        'precision': precision_score(y_test, y_pred, zero_division=0),
+        'recall': recall_score(y_test, y_pred, zero_division=0),
+        'f1': f1_score(y_test, y_pred, zero_division=0)
+    }
+
 
 class WeightOptimizer:
     """
@@ -21,8 +49,9 @@ class WeightOptimizer:
     
     Features:
     - 3가지 모델 학습 (Logistic Regression, Random Forest, Gradient Boosting)
+    - k-fold 교차검증 학습 (모델 × fold 병렬, train_cv)
     - Feature importance 기반 가중치 추출
-    - 모델 저장/로드
+    - 모델 저장/로드 (pickle, 버전별 레지스트리)
     - 매칭 확률 예측
     """
     
@@ -45,6 +74,7 @@ class WeightOptimizer:
         self.trained_models = {}
         self.feature_names = ['token_set', 'levenshtein', 'fuzzy_sort']
         self.training_results = {}
+        self.cv_scores = {}
         self.X_train = None
         self.y_train = None
     
@@ -97,6 +127,61 @@ class WeightOptimizer:
         self.training_results = results
         return results
     
+    def train_cv(
+        self,
+        df: pd.DataFrame,
+        cv_folds: int = 5,
+        n_jobs: int = -1
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        k-fold 교차검증 학습
+
+        모델 × fold 학습/평가를 joblib으로 병렬 실행한 뒤, 각 모델을
+        전체 데이터로 다시 학습(병렬)하여 trained_models에 저장
+
+        Args:
+            df: 학습 데이터 (columns: token_set, levenshtein, fuzzy_sort, label)
+            cv_folds: fold 수 (StratifiedKFold, shuffle, random_state=42)
+            n_jobs: 병렬 작업 수 (-1: 전체 CPU)
+
+        Returns:
+            모델별 CV 평균 메트릭 (+ {metric}_std)
+        """
+        X = df[self.feature_names].values
+        y = df['label'].values
+
+        splitter = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=42)
+        folds = list(splitter.split(X, y))
+        model_names = list(self.models)
+
+        with Parallel(n_jobs=n_jobs) as parallel:
+            fold_scores = parallel(
+                delayed(_fit_and_score)(
+                    self.models[name], X[train_idx], y[train_idx], X[test_idx], y[test_idx]
+                )
+                for name in model_names
+                for train_idx, test_idx in folds
+            )
+            final_models = parallel(
+                delayed(_fit_model)(self.models[name], X, y) for name in model_names
+            )
+
+        results = {}
+        for i, name in enumerate(model_names):
+            scores = fold_scores[i * cv_folds:(i + 1) * cv_folds]
+            self.cv_scores[name] = scores
+            results[name] = {}
+            for metric in METRIC_NAMES:
+                values = np.array([score[metric] for score in scores])
+                results[name][metric] = float(values.mean())
+                results[name][f'{metric}_std'] = float(values.std())
+
+        self.trained_models = dict(zip(model_names, final_models))
+        self.X_train = X
+        self.y_train = y
+        self.training_results = results
+        return results
+    
     def extract_weights(self, model_name: str = 'random_forest') -> Dict[str, float]:
         """
         Feature importance 기반 가중치 추출
@@ -163,6 +248,53 @@ class WeightOptimizer:
         self.training_results = data.get('training_results', {})
         self.feature_names = data.get('feature_names', self.feature_names)
     
+    def save_to_registry(
+        self,
+        registry_dir: str,
+        model_name: str = 'random_forest',
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """
+        버전별 레지스트리에 모델 저장
+
+        Args:
+            registry_dir: 레지스트리 폴더
+            model_name: 가중치를 추출할 모델
+            metadata: 추가 메타데이터 (예: feature_key, n_samples)
+
+        Returns:
+            저장된 버전 이름
+        """
+        record = {
+            'weights_model': model_name,
+            'training_results': self.training_results,
+            'feature_names': self.feature_names,
+        }
+        record.update(metadata or {})
+        return ModelRegistry(registry_dir).save(
+            self.trained_models, self.extract_weights(model_name), record
+        )
+    
+    def load_from_registry(
+        self,
+        registry_dir: str,
+        version: Optional[str] = None,
+        mmap_mode: Optional[str] = 'r'
+    ):
+        """
+        레지스트리에서 모델 로드 (기본: 최신 버전, 배열은 memory-map)
+
+        Args:
+            registry_dir: 레지스트리 폴더
+            version: 버전 이름 (None이면 최신)
+            mmap_mode: joblib memory-map 모드
+        """
+        registry = ModelRegistry(registry_dir)
+        metadata = registry.load_metadata(version)
+        self.trained_models = registry.load_models(metadata['version'], mmap_mode)
+        self.training_results = metadata.get('training_results', {})
+        self.feature_names = metadata.get('feature_names', self.feature_names)
+    
     def predict_probability(
         self,
         features: Dict[str, float],
@@ -9,16 +9,21 @@ Stage 4: Balanced Boost Edition - ML 위험도 정규화 및 혼합 위험도 
 """
 
 import argparse
+import importlib
 import logging
+import re
 import shutil
 import sys
 import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import pandas as pd
 import yaml
 
+if TYPE_CHECKING:  # pragma: no cover - pandas is imported on first stage use
+    from scripts.core.interchange import InterchangeSettings
+
 
 logger = logging.getLogger("hvdc_pipeline.run_pipeline")
 
@@ -27,48 +32,93 @@ PIPELINE_ROOT = Path(__file__).resolve().parent
 PROJECT_ROOT = PIPELINE_ROOT
 PIPELINE_CONFIG_PATH = PROJECT_ROOT / "config" / "pipeline_config.yaml"
 STAGE2_CONFIG_PATH = PROJECT_ROOT / "config" / "stage2_derived_config.yaml"
+STAGE4_CONFIG_PATH = PROJECT_ROOT / "scripts" / "stage4_anomaly" / "stage4.yaml"
 DEFAULT_STAGE3_SHEET = 0  # First sheet (HITACHI_입고로직_종합리포트_Fixed)
+STAGE3_COMBINED_SHEET = "통합_원본데이터_Fixed"  # Stage 3 interchange artifact sheet
 sys.path.append(str(PIPELINE_ROOT))
 
-# �� Stage ����Ʈ
-try:  # pragma: no cover - optional dependency guard
-    from scripts.stage1_sync_sorted.data_synchronizer_v30 import DataSynchronizerV30
-    from scripts.stage1_sync_sorted.data_synchronizer_v29 import DataSynchronizerV29
-    from scripts.stage1_sync_no_sorting.data_synchronizer_v29_no_sorting import (
-        DataSynchronizerV29NoSorting,
-    )
-except ImportError:  # pragma: no cover - runtime import guard
-    DataSynchronizerV30 = None  # type: ignore[assignment]
-    DataSynchronizerV29 = None  # type: ignore[assignment]
-    DataSynchronizerV29NoSorting = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency guard
-    from scripts.stage2_derived.derived_columns_processor import (
-        process_derived_columns,
-        resolve_synced_input_path as resolve_stage2_synced_input_path,
-    )
-except ImportError:  # pragma: no cover - runtime import guard
-    process_derived_columns = None  # type: ignore[assignment]
-    resolve_stage2_synced_input_path = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency guard
-    from scripts.stage3_report.report_generator import HVDCExcelReporterFinal
-except ImportError:  # pragma: no cover - runtime import guard
-    HVDCExcelReporterFinal = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency guard
-    from scripts.stage4_anomaly.anomaly_detector_balanced import (
-        DetectorConfig,
-        HybridAnomalyDetector,
-    )
-except ImportError:  # pragma: no cover - runtime import guard
-    DetectorConfig = None  # type: ignore[assignment]
-    HybridAnomalyDetector = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency guard
-    from scripts.stage4_anomaly.anomaly_visualizer import AnomalyVisualizer
-except ImportError:  # pragma: no cover - runtime import guard
-    AnomalyVisualizer = None  # type: ignore[assignment]
+# Stage별 코드 버전 지문 대상 / Source paths fingerprinted per stage
+_SCRIPTS_ROOT = PIPELINE_ROOT / "scripts"
+STAGE_CODE_PATHS: Dict[int, List[Path]] = {
+    1: [
+        _SCRIPTS_ROOT / "stage1_sync_sorted",
+        _SCRIPTS_ROOT / "stage1_sync_no_sorting",
+        _SCRIPTS_ROOT / "core",
+    ],
+    2: [_SCRIPTS_ROOT / "stage2_derived", _SCRIPTS_ROOT / "core" / "interchange.py"],
+    3: [_SCRIPTS_ROOT / "stage3_report", _SCRIPTS_ROOT / "core" / "interchange.py"],
+    4: [_SCRIPTS_ROOT / "stage4_anomaly", _SCRIPTS_ROOT / "core" / "interchange.py"],
+}
+
+# Stage 컴포넌트 지연 로딩 테이블 / Lazily imported stage components
+# 이름 → (모듈, 속성). 실행하는 Stage의 모듈만 첫 사용 시 import 하므로
+# --help 및 단일 Stage 실행 시 sklearn/PyOD 등 무거운 의존성을 로드하지 않습니다.
+_STAGE_COMPONENTS: Dict[str, Tuple[str, str]] = {
+    "DataSynchronizerV30": (
+        "scripts.stage1_sync_sorted.data_synchronizer_v30",
+        "DataSynchronizerV30",
+    ),
+    "DataSynchronizerV29": (
+        "scripts.stage1_sync_sorted.data_synchronizer_v29",
+        "DataSynchronizerV29",
+    ),
+    "DataSynchronizerV29NoSorting": (
+        "scripts.stage1_sync_no_sorting.data_synchronizer_v29_no_sorting",
+        "DataSynchronizerV29NoSorting",
+    ),
+    "process_derived_columns": (
+        "scripts.stage2_derived.derived_columns_processor",
+        "process_derived_columns",
+    ),
+    "resolve_stage2_derived_output_path": (
+        "scripts.stage2_derived.derived_columns_processor",
+        "resolve_derived_output_path",
+    ),
+    "resolve_stage2_synced_input_path": (
+        "scripts.stage2_derived.derived_columns_processor",
+        "resolve_synced_input_path",
+    ),
+    "HVDCExcelReporterFinal": (
+        "scripts.stage3_report.report_generator",
+        "HVDCExcelReporterFinal",
+    ),
+    "DetectorConfig": (
+        "scripts.stage4_anomaly.anomaly_detector_balanced",
+        "DetectorConfig",
+    ),
+    "HybridAnomalyDetector": (
+        "scripts.stage4_anomaly.anomaly_detector_balanced",
+        "HybridAnomalyDetector",
+    ),
+    "AnomalyVisualizer": (
+        "scripts.stage4_anomaly.anomaly_visualizer",
+        "AnomalyVisualizer",
+    ),
+}
+_loaded_components: Dict[str, Any] = {}
+
+
+def stage_component(name: str) -> Any:
+    """Stage 컴포넌트를 첫 사용 시 import 합니다 (실패 시 None)."""
+    if name not in _loaded_components:
+        module_name, attribute = _STAGE_COMPONENTS[name]
+        try:  # pragma: no cover - optional dependency guard
+            value = getattr(importlib.import_module(module_name), attribute)
+        except ImportError:  # pragma: no cover - runtime import guard
+            logger.debug("Stage component unavailable: %s", name, exc_info=True)
+            value = None
+        _loaded_components[name] = value
+    return _loaded_components[name]
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562: run_pipeline.<Component> 접근 시 지연 import."""
+    if name in _STAGE_COMPONENTS:
+        return stage_component(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+from scripts.core.stage_cache import StageCache
 
 
 # 각 Stage 임포트
@@ -105,6 +155,18 @@ def load_stage2_config() -> Dict:
         return {}
 
 
+def resolve_interchange(
+    pipeline_config: Dict, args: argparse.Namespace
+) -> "InterchangeSettings":
+    """인터체인지 설정을 계산합니다. / Resolve binary interchange settings."""
+    from scripts.core.interchange import InterchangeSettings
+
+    settings = InterchangeSettings.from_config(pipeline_config)
+    if getattr(args, "fast_io", False):
+        settings = replace(settings, enabled=True)
+    return settings
+
+
 def configure_logging(pipeline_config: Dict) -> None:
     """로깅 설정을 초기화합니다. / Configure logging for the pipeline."""
 
@@ -152,20 +214,208 @@ def print_banner():
     print("=" * 80 + "\n")
 
 
+def resolve_stage4_input(stage4_cfg: Dict) -> Path:
+    """Stage 4 입력 파일을 찾습니다. / Resolve the Stage 4 input report.
+
+    설정 파일이 없으면 reports 폴더에서 같은 패턴의 최신 보고서를 선택합니다.
+    """
+
+    input_file = stage4_cfg.get("input_file")
+    if not input_file:
+        raise ValueError("Stage 4 입력 파일 설정이 누락되었습니다.")
+    input_path = resolve_repo_path(input_file)
+
+    # 자동 탐색: config의 파일이 없으면 reports 폴더에서 최신 파일 찾기
+    if not input_path.exists():
+        filename = input_path.name
+        # 타임스탬프 패턴 (YYYYMMDD_HHMMSS) 찾아서 *로 치환
+        pattern_str = re.sub(r"_\d{8}_\d{6}_", "_*_", filename)
+
+        report_dir = input_path.parent
+        if report_dir.exists():
+            matching_files = sorted(
+                report_dir.glob(pattern_str),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
+            if matching_files:
+                input_path = matching_files[0]
+                print(f"INFO: 최신 보고서 파일 자동 선택: {input_path.name}")
+            else:
+                raise FileNotFoundError(
+                    f"Stage 4 입력 파일을 찾을 수 없습니다: {input_file}\n"
+                    f"reports 폴더에서 '{pattern_str}' 패턴의 파일도 찾을 수 없습니다."
+                )
+    return input_path
+
+
+def _load_optional_yaml(path: Path) -> Dict:
+    """YAML 파일을 로드하고 없으면 빈 dict를 반환합니다."""
+
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as handle:
+        return yaml.safe_load(handle) or {}
+
+
+def build_detector_config(args: Optional[argparse.Namespace] = None):
+    """stage4.yaml model 섹션과 CLI 재정의로 DetectorConfig를 생성합니다."""
+
+    stage4_yaml = _load_optional_yaml(STAGE4_CONFIG_PATH)
+    model_cfg = dict((stage4_yaml.get("stage4") or {}).get("model") or {})
+    mode_override = getattr(args, "stage4_model_mode", None)
+    if mode_override:
+        model_cfg["mode"] = mode_override
+    if model_cfg.get("model_dir"):
+        model_cfg["model_dir"] = str(resolve_repo_path(model_cfg["model_dir"]))
+    return stage_component("DetectorConfig").from_model_config(model_cfg)
+
+
+def stage_fingerprint(
+    stage_num: int,
+    cache: StageCache,
+    pipeline_config: Dict,
+    stage2_config: Dict,
+    args: argparse.Namespace,
+) -> str:
+    """Stage 캐시 지문을 계산합니다. / Compute the cache fingerprint of a stage.
+
+    입력 파일, 관련 설정 섹션, Stage 코드 버전을 포함합니다.
+    """
+    from scripts.core.interchange import artifact_path
+
+    stages_cfg = pipeline_config.get("stages", {})
+    interchange = resolve_interchange(pipeline_config, args)
+    inputs: List[Path] = []
+    config: Dict = {"interchange": vars(interchange)}
+
+    if stage_num == 1:
+        io_cfg = stages_cfg.get("stage1", {}).get("io", {})
+        inputs = [
+            resolve_repo_path(io_cfg[key])
+            for key in ("master_file", "warehouse_file")
+            if io_cfg.get(key)
+        ]
+        config.update(
+            stage=stages_cfg.get("stage1", {}),
+            no_sorting=getattr(args, "no_sorting", False),
+        )
+    elif stage_num == 2:
+        resolve_stage2_synced_input_path = stage_component(
+            "resolve_stage2_synced_input_path"
+        )
+        if resolve_stage2_synced_input_path is not None:
+            synced = resolve_stage2_synced_input_path(
+                pipeline_config_path=PIPELINE_CONFIG_PATH,
+                stage2_config_path=STAGE2_CONFIG_PATH,
+                project_root=PROJECT_ROOT,
+            )
+            inputs = [synced, artifact_path(synced, interchange.format)]
+        config.update(stage=stage2_config, paths=pipeline_config.get("paths", {}))
+    elif stage_num == 3:
+        io_cfg = stages_cfg.get("stage3", {}).get("io", {})
+        for key in ("hitachi_file", "siemens_file", "invoice_file"):
+            if io_cfg.get(key):
+                path = resolve_repo_path(io_cfg[key])
+                inputs.extend([path, artifact_path(path, interchange.format)])
+        config.update(
+            stage=stages_cfg.get("stage3", {}),
+            report_dir=getattr(args, "stage3_report_dir", None),
+        )
+    elif stage_num == 4:
+        io_cfg = stages_cfg.get("stage4", {}).get("io", {})
+        try:
+            input_path = resolve_stage4_input(io_cfg)
+            inputs = [input_path, artifact_path(input_path, interchange.format)]
+        except (ValueError, FileNotFoundError):
+            inputs = []
+        config.update(
+            stage=stages_cfg.get("stage4", {}),
+            stage4_yaml=_load_optional_yaml(STAGE4_CONFIG_PATH),
+            overrides={
+                key: getattr(args, key, None)
+                for key in (
+                    "stage4_sheet_name",
+                    "stage4_excel_out",
+                    "stage4_json_out",
+                    "stage4_visualize",
+                    "stage4_no_visualize",
+                    "stage4_case_column",
+                    "stage4_model_mode",
+                )
+            },
+        )
+
+    code = [PIPELINE_ROOT / "run_pipeline.py"] + STAGE_CODE_PATHS.get(stage_num, [])
+    return cache.fingerprint(inputs=inputs, config=config, code=code)
+
+
 def run_stage(
     stage_num: int,
     pipeline_config: Dict,
     stage2_config: Dict,
     args: argparse.Namespace,
+    cache: Optional[StageCache] = None,
+) -> bool:
+    """특정 Stage를 실행합니다 (캐시 적용). / Execute a stage unless cached."""
+
+    if cache is None:
+        return _execute_stage(stage_num, pipeline_config, stage2_config, args)
+
+    force = getattr(args, "force", False)
+    fingerprint = stage_fingerprint(
+        stage_num, cache, pipeline_config, stage2_config, args
+    )
+    if not force and cache.is_fresh(stage_num, fingerprint):
+        print(f"[CACHED] Stage {stage_num} is up to date - skipped")
+        for output in cache.outputs(stage_num):
+            print(f"      - {output}")
+        print("")
+        return True
+
+    cache.mark_executed(stage_num)
+    outputs: List[Path] = []
+    if not _execute_stage(
+        stage_num, pipeline_config, stage2_config, args, outputs=outputs
+    ):
+        return False
+
+    # Stage 실행이 입력을 수정할 수 있으므로(예: Stage 4 색상 표시) 실행 후 재계산
+    cache.record(
+        stage_num,
+        stage_fingerprint(stage_num, cache, pipeline_config, stage2_config, args),
+        outputs,
+    )
+    return True
+
+
+def _execute_stage(
+    stage_num: int,
+    pipeline_config: Dict,
+    stage2_config: Dict,
+    args: argparse.Namespace,
+    outputs: Optional[List[Path]] = None,
 ) -> bool:
     """특정 Stage를 실행합니다. / Execute a single pipeline stage."""
+    import pandas as pd
+
+    from scripts.core.interchange import (
+        artifact_path,
+        move_artifact,
+        output_exists,
+        read_stage_frame,
+        write_artifact,
+    )
 
     stage_start_time = time.time()
-    stage_outputs: List[Path] = []
+    stage_outputs: List[Path] = [] if outputs is None else outputs
+    interchange = resolve_interchange(pipeline_config, args)
 
     try:
         if stage_num == 1:
             print("[Stage 1] Data Synchronization...")
+            DataSynchronizerV30 = stage_component("DataSynchronizerV30")
+            DataSynchronizerV29 = stage_component("DataSynchronizerV29")
             # Try v30 (semantic matching) first, fallback to v29
             if DataSynchronizerV30 is not None:
                 print("INFO: Using v3.0 with semantic header matching")
@@ -197,6 +447,9 @@ def run_stage(
 
             # Select synchronizer based on no_sorting flag and version
             if getattr(args, "no_sorting", False):
+                DataSynchronizerV29NoSorting = stage_component(
+                    "DataSynchronizerV29NoSorting"
+                )
                 if DataSynchronizerV29NoSorting is None:
                     raise ImportError("비정렬 버전 스크립트를 찾을 수 없습니다.")
                 synchronizer = DataSynchronizerV29NoSorting()
@@ -229,11 +482,25 @@ def run_stage(
                 return False
 
             stage_outputs.append(Path(sync_result.output_path).resolve())
+            sync_data = getattr(sync_result, "data", None)
+            if interchange.enabled and sync_data is not None:
+                artifact = write_artifact(
+                    sync_data, Path(sync_result.output_path), interchange.format
+                )
+                if artifact is not None:
+                    stage_outputs.append(artifact.resolve())
             logger.info("Stage 1 동기화 통계: %s", sync_result.stats)
             print(f"INFO: Stage 1 produced synced file: {sync_result.output_path}")
 
         elif stage_num == 2:
             print("[Stage 2] Derived Columns Generation...")
+            process_derived_columns = stage_component("process_derived_columns")
+            resolve_stage2_synced_input_path = stage_component(
+                "resolve_stage2_synced_input_path"
+            )
+            resolve_stage2_derived_output_path = stage_component(
+                "resolve_stage2_derived_output_path"
+            )
             if (
                 process_derived_columns is None
                 or resolve_stage2_synced_input_path is None
@@ -250,12 +517,23 @@ def run_stage(
                 pipeline_config_path=PIPELINE_CONFIG_PATH,
                 stage2_config_path=STAGE2_CONFIG_PATH,
                 project_root=PROJECT_ROOT,
+                interchange=interchange,
             )
             if not success:
                 return False
+            derived_path = resolve_stage2_derived_output_path(
+                stage2_config=stage2_config, project_root=PROJECT_ROOT
+            )
+            for candidate in (
+                derived_path,
+                artifact_path(derived_path, interchange.format),
+            ):
+                if candidate.exists():
+                    stage_outputs.append(candidate.resolve())
 
         elif stage_num == 3:
             print("[Stage 3] Report Generation...")
+            HVDCExcelReporterFinal = stage_component("HVDCExcelReporterFinal")
             if HVDCExcelReporterFinal is None:
                 raise ImportError("Stage 3 보고서 생성 모듈을 불러오지 못했습니다.")
             stage3_cfg = (
@@ -266,6 +544,7 @@ def run_stage(
 
             reporter = HVDCExcelReporterFinal()
             calculator = reporter.calculator
+            calculator.interchange = interchange
 
             data_root = stage3_cfg.get("data_root")
             if data_root:
@@ -274,7 +553,7 @@ def run_stage(
             hitachi_file = stage3_cfg.get("hitachi_file")
             if hitachi_file:
                 hitachi_path = resolve_repo_path(hitachi_file)
-                if not hitachi_path.exists():
+                if not output_exists(hitachi_path, interchange):
                     raise FileNotFoundError(
                         f"Stage 3 HITACHI 데이터가 존재하지 않습니다: {hitachi_path}"
                     )
@@ -284,7 +563,7 @@ def run_stage(
             siemens_file = stage3_cfg.get("siemens_file")
             if siemens_file:
                 siemens_path = resolve_repo_path(siemens_file)
-                if not siemens_path.exists():
+                if not output_exists(siemens_path, interchange):
                     logger.warning(
                         "Stage 3 SIMENSE 데이터가 존재하지 않습니다: %s", siemens_path
                     )
@@ -293,7 +572,7 @@ def run_stage(
             invoice_file = stage3_cfg.get("invoice_file")
             if invoice_file:
                 invoice_path = resolve_repo_path(invoice_file)
-                if not invoice_path.exists():
+                if not output_exists(invoice_path, interchange):
                     logger.warning(
                         "Stage 3 인보이스 데이터가 존재하지 않습니다: %s", invoice_path
                     )
@@ -324,6 +603,11 @@ def run_stage(
                 stage_outputs.append(excel_target.resolve())
             else:
                 stage_outputs.append(excel_source.resolve())
+            if interchange.enabled:
+                # Stage 4 --fast-io는 보고서 옆 아티팩트를 읽으므로 함께 이동
+                artifact = move_artifact(excel_source, excel_target, interchange.format)
+                if artifact is not None:
+                    stage_outputs.append(artifact.resolve())
 
             csv_source_dir = Path.cwd() / "output"
             if csv_source_dir.exists() and csv_source_dir.is_dir():
@@ -338,6 +622,8 @@ def run_stage(
 
         elif stage_num == 4:
             print("[Stage 4] Anomaly Detection...")
+            DetectorConfig = stage_component("DetectorConfig")
+            HybridAnomalyDetector = stage_component("HybridAnomalyDetector")
             if DetectorConfig is None or HybridAnomalyDetector is None:
                 raise ImportError("Stage 4 이상치 탐지 모듈을 불러오지 못했습니다.")
             stage4_cfg = (
@@ -346,34 +632,7 @@ def run_stage(
             if not stage4_cfg:
                 raise ValueError("Stage 4 IO 설정이 비어 있습니다.")
 
-            input_file = stage4_cfg.get("input_file")
-            if not input_file:
-                raise ValueError("Stage 4 입력 파일 설정이 누락되었습니다.")
-            input_path = resolve_repo_path(input_file)
-
-            # 자동 탐색: config의 파일이 없으면 reports 폴더에서 최신 파일 찾기
-            if not input_path.exists():
-                import re
-
-                filename = input_path.name
-                # 타임스탬프 패턴 (YYYYMMDD_HHMMSS) 찾아서 *로 치환
-                pattern_str = re.sub(r"_\d{8}_\d{6}_", "_*_", filename)
-
-                report_dir = input_path.parent
-                if report_dir.exists():
-                    matching_files = sorted(
-                        report_dir.glob(pattern_str),
-                        key=lambda p: p.stat().st_mtime,
-                        reverse=True,
-                    )
-                    if matching_files:
-                        input_path = matching_files[0]
-                        print(f"INFO: 최신 보고서 파일 자동 선택: {input_path.name}")
-                    else:
-                        raise FileNotFoundError(
-                            f"Stage 4 입력 파일을 찾을 수 없습니다: {input_file}\n"
-                            f"reports 폴더에서 '{pattern_str}' 패턴의 파일도 찾을 수 없습니다."
-                        )
+            input_path = resolve_stage4_input(stage4_cfg)
 
             sheet_name = (
                 getattr(args, "stage4_sheet_name", None)
@@ -393,11 +652,17 @@ def run_stage(
                 )
 
             if input_path.suffix.lower() in {".xlsx", ".xlsm", ".xls"}:
-                df = pd.read_excel(input_path, sheet_name=sheet_name)
+                # Stage 3 아티팩트는 통합 원본 시트만 담고 있음
+                use_artifact = sheet_name == STAGE3_COMBINED_SHEET
+                df = read_stage_frame(
+                    input_path,
+                    interchange if use_artifact else None,
+                    sheet_name=sheet_name,
+                )
             else:
                 df = pd.read_csv(input_path)
 
-            detector = HybridAnomalyDetector(DetectorConfig())
+            detector = HybridAnomalyDetector(build_detector_config(args))
 
             excel_override = getattr(args, "stage4_excel_out", None)
             json_override = getattr(args, "stage4_json_out", None)
@@ -437,6 +702,7 @@ def run_stage(
             )
 
             if visualize:
+                AnomalyVisualizer = stage_component("AnomalyVisualizer")
                 if AnomalyVisualizer is None:
                     logger.error(
                         "AnomalyVisualizer 모듈을 불러오지 못했습니다. Stage 4 시각화 표시 비활성화됨을 확인하세요."
@@ -499,6 +765,15 @@ def run_stage(
         return False
 
 
+def build_stage_cache(
+    pipeline_config: Dict, args: argparse.Namespace
+) -> StageCache:
+    """Stage 캐시를 생성합니다. / Build the stage result cache."""
+
+    enabled = False if getattr(args, "no_cache", False) else None
+    return StageCache.from_config(pipeline_config, PIPELINE_ROOT, enabled=enabled)
+
+
 def run_all_stages(
     pipeline_config: Dict, stage2_config: Dict, args: argparse.Namespace
 ) -> bool:
@@ -508,9 +783,10 @@ def run_all_stages(
 
     stages = [1, 2, 3, 4]
     total_start_time = time.time()
+    cache = build_stage_cache(pipeline_config, args)
 
     for stage_num in stages:
-        if not run_stage(stage_num, pipeline_config, stage2_config, args):
+        if not run_stage(stage_num, pipeline_config, stage2_config, args, cache):
             print(f"[FAILED] Pipeline stopped at Stage {stage_num}")
             return False
 
@@ -530,9 +806,10 @@ def run_specific_stages(
     """지정된 Stage만 실행합니다. / Run only selected stages."""
 
     print(f"[INFO] Selected stages: {stage_list}")
+    cache = build_stage_cache(pipeline_config, args)
 
     for stage_num in stage_list:
-        if not run_stage(stage_num, pipeline_config, stage2_config, args):
+        if not run_stage(stage_num, pipeline_config, stage2_config, args, cache):
             print(f"[FAILED] Pipeline stopped at Stage {stage_num}")
             return False
 
@@ -550,6 +827,8 @@ def main():
   python run_pipeline.py --all                    # 전체 파이프라인 실행
   python run_pipeline.py --stage 1,2              # Stage 1, 2만 실행
   python run_pipeline.py --stage 2                # Stage 2만 실행
+  python run_pipeline.py --all --fast-io          # Parquet 인터체인지로 실행
+  python run_pipeline.py --all --force            # 캐시 무시하고 전체 재실행
         """,
     )
 
@@ -594,6 +873,26 @@ def main():
         type=str,
         help="Stage 4 Case 컬럼명 지정 / Specify Stage 4 case column",
     )
+    parser.add_argument(
+        "--stage4-model-mode",
+        choices=["refit", "score"],
+        help="Stage 4 모델 재학습/저장 모델 점수화 / Refit or score with the persisted model",
+    )
+    parser.add_argument(
+        "--fast-io",
+        action="store_true",
+        help="Stage 간 Parquet/Feather 인터체인지 사용 / Use binary interchange between stages",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="캐시를 무시하고 Stage 재실행 / Re-run stages even if cached",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Stage 결과 캐시 비활성화 / Disable stage result caching",
+    )
     parser.add_argument(
         "--no-sorting",
         action="store_true",
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+파이프라인 진입점 import 시간 벤치마크 (`python -X importtime` 예산 검사)
+
+각 대상을 새 인터프리터에서 import 하여 누적 import 시간과 무거운 의존성
+(pandas/sklearn/PyOD) 로드 여부를 확인합니다. 예산 초과 시 종료 코드 1.
+
+사용:
+    python -m scripts.benchmark_import_time
+    python -m scripts.benchmark_import_time --budget-scale 2.0
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PIPELINE_ROOT = Path(__file__).resolve().parent.parent
+
+# 모듈 → 누적 import 예산(ms)
+IMPORT_BUDGETS_MS: Dict[str, float] = {
+    "run_pipeline": 250.0,
+    "scripts.core.stage_cache": 50.0,
+    "scripts.core": 50.0,
+}
+# `run_pipeline.py --help` 전체 실행 예산(ms, 인터프리터 기동 포함)
+HELP_BUDGET_MS = 500.0
+# 진입점 import 시 로드되면 안 되는 모듈
+HEAVY_MODULES = ("pandas", "numpy", "sklearn", "pyod", "openpyxl")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """새 인터프리터에서 module을 import 하여 (누적 ms, 로드된 무거운 모듈) 반환"""
+    probe = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=PIPELINE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(4) == module and len(match.group(3)) == 1:
+            cumulative_us = int(match.group(2))
+    heavy = [m for m in proc.stdout.strip().split(",") if m]
+    return cumulative_us / 1000.0, heavy
+
+
+def measure_help() -> float:
+    """`run_pipeline.py --help` 실행 시간(ms)"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "run_pipeline.py", "--help"],
+        cwd=PIPELINE_ROOT,
+        capture_output=True,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Pipeline import-time budget check")
+    p.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="느린 머신에서 예산 배율 (기본 1.0)",
+    )
+    args = p.parse_args()
+
+    failures = 0
+    print(f"{'target':<28} {'ms':>8} {'budget':>8}  heavy modules")
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        elapsed, heavy = measure_import(module)
+        limit = budget * args.budget_scale
+        ok = elapsed <= limit and not heavy
+        failures += not ok
+        print(
+            f"{module:<28} {elapsed:8.1f} {limit:8.1f}  "
+            f"{', '.join(heavy) or '-'}{'' if ok else '  << FAIL'}"
+        )
+
+    elapsed = measure_help()
+    limit = HELP_BUDGET_MS * args.budget_scale
+    failures += elapsed > limit
+    print(
+        f"{'run_pipeline.py --help':<28} {elapsed:8.1f} {limit:8.1f}"
+        f"{'' if elapsed <= limit else '  << FAIL'}"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,12 +11,48 @@ Main Components:
 - header_normalizer: Normalizes header names handling all edge cases
 - semantic_matcher: Matches headers based on meaning, not exact strings
 - header_registry: Configuration for semantic mappings across all stages
+
+Exports are loaded lazily (PEP 562) so that importing a light submodule such
+as ``scripts.core.stage_cache`` does not pull in pandas/numpy.
 """
 
-from .header_detector import HeaderDetector, detect_header_row
-from .header_normalizer import HeaderNormalizer, normalize_header
-from .semantic_matcher import SemanticMatcher, find_header_by_meaning
-from .header_registry import HeaderRegistry, HVDC_HEADER_REGISTRY, HeaderCategory, HeaderDefinition
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .header_detector import HeaderDetector, detect_header_row
+    from .header_normalizer import HeaderNormalizer, normalize_header
+    from .semantic_matcher import SemanticMatcher, find_header_by_meaning
+    from .header_registry import HeaderRegistry, HVDC_HEADER_REGISTRY, HeaderCategory, HeaderDefinition
+
+# Export name -> defining submodule
+_LAZY_EXPORTS = {
+    "HeaderDetector": ".header_detector",
+    "detect_header_row": ".header_detector",
+    "HeaderNormalizer": ".header_normalizer",
+    "normalize_header": ".header_normalizer",
+    "SemanticMatcher": ".semantic_matcher",
+    "find_header_by_meaning": ".semantic_matcher",
+    "HeaderRegistry": ".header_registry",
+    "HVDC_HEADER_REGISTRY": ".header_registry",
+    "HeaderCategory": ".header_registry",
+    "HeaderDefinition": ".header_registry",
+}
+
+
+def __getattr__(name):
+    """Import an exported name on first access and cache it on the package."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = "1.0.0"
 __all__ = [
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Stage Interchange Module
+========================
+
+Binary (Parquet / Feather) hand-off between pipeline stages.
+
+Every stage still produces its Excel deliverable, but Excel is a slow
+interchange format: each downstream stage has to re-parse the whole
+workbook through openpyxl. When the interchange mode is enabled, a stage
+also writes a typed Arrow artifact next to its Excel output, and the next
+stage reads that artifact instead of the workbook whenever it is present
+and fresh.
+
+Artifact naming:
+    data/processed/derived/HVDC WAREHOUSE_HITACHI(HE).xlsx
+    data/processed/derived/HVDC WAREHOUSE_HITACHI(HE).parquet
+
+An artifact is "fresh" when it is at least as new as its Excel companion.
+If someone edits the workbook by hand afterwards, the workbook wins and the
+stale artifact is ignored. Frames that Arrow cannot store without changing
+their types (mixed-type object columns) get no artifact, so the next stage
+reads the workbook for them.
+
+The mode is opt-in through ``pipeline_config.yaml``::
+
+    interchange:
+      enabled: false
+      format: "parquet"          # parquet | feather
+      intermediate_excel: true   # false = skip Excel for non human-facing outputs
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = {"parquet": ".parquet", "feather": ".feather"}
+
+
+@dataclass(frozen=True)
+class InterchangeSettings:
+    """
+    Interchange options shared by all stages.
+
+    Attributes:
+        enabled: Write and read binary artifacts between stages
+        format: Artifact format, ``parquet`` or ``feather``
+        intermediate_excel: Keep writing Excel for intermediate outputs
+            (Stage 2 derived file). Human-facing reports are always written.
+    """
+
+    enabled: bool = False
+    format: str = "parquet"
+    intermediate_excel: bool = True
+
+    @classmethod
+    def from_config(
+        cls, pipeline_config: Optional[Dict[str, Any]]
+    ) -> "InterchangeSettings":
+        """
+        Build settings from the ``interchange`` section of the pipeline config.
+
+        Args:
+            pipeline_config: Parsed ``pipeline_config.yaml`` (may be None)
+
+        Returns:
+            InterchangeSettings (disabled when the section is missing)
+        """
+        section = (pipeline_config or {}).get("interchange") or {}
+        fmt = str(section.get("format", "parquet")).lower()
+        if fmt not in SUPPORTED_FORMATS:
+            logger.warning("Unknown interchange format '%s', using parquet", fmt)
+            fmt = "parquet"
+        return cls(
+            enabled=bool(section.get("enabled", False)),
+            format=fmt,
+            intermediate_excel=bool(section.get("intermediate_excel", True)),
+        )
+
+    @property
+    def writes_intermediate_excel(self) -> bool:
+        """Whether intermediate stage outputs should still be written as Excel."""
+        return self.intermediate_excel or not self.enabled
+
+
+def artifact_path(excel_path: Path, fmt: str = "parquet") -> Path:
+    """
+    Return the binary artifact path that sits next to an Excel output.
+
+    Args:
+        excel_path: Excel deliverable path
+        fmt: Artifact format
+
+    Returns:
+        Path with the artifact suffix
+    """
+    return Path(excel_path).with_suffix(SUPPORTED_FORMATS.get(fmt, ".parquet"))
+
+
+def unsafe_columns(df: pd.DataFrame) -> List[str]:
+    """
+    List the columns that would not round-trip through Arrow unchanged.
+
+    Excel columns frequently mix numbers and text in one column (e.g. "N/A"
+    next to quantities). Arrow needs a single type per column, so storing
+    such a column would coerce its values and the fast path would no longer
+    return the frame the Excel path returns. Non-string column labels are
+    reported for the same reason.
+    """
+    unsafe = []
+    for column in df.columns:
+        if not isinstance(column, str):
+            unsafe.append(str(column))
+            continue
+        series = df[column]
+        if series.dtype != object:
+            continue
+        kinds = {type(value) for value in series.dropna()}
+        if len(kinds) > 1:
+            unsafe.append(column)
+    return unsafe
+
+
+def write_artifact(
+    df: pd.DataFrame, excel_path: Path, fmt: str = "parquet"
+) -> Optional[Path]:
+    """
+    Write the binary artifact for an Excel output.
+
+    Args:
+        df: Frame to store
+        excel_path: Excel deliverable the artifact belongs to
+        fmt: Artifact format
+
+    Returns:
+        Written artifact path, or None when no Arrow engine is installed or
+        the frame cannot be stored without changing its types (the caller
+        then relies on the Excel output)
+    """
+    target = artifact_path(excel_path, fmt)
+    unsafe = unsafe_columns(df)
+    if unsafe:
+        # 이전 실행의 아티팩트가 남아 있으면 새 Excel 대신 읽히므로 제거
+        target.unlink(missing_ok=True)
+        logger.warning(
+            "Interchange artifact skipped (%s): mixed-type columns %s",
+            target.name,
+            unsafe[:5],
+        )
+        return None
+    target.parent.mkdir(parents=True, exist_ok=True)
+    frame = df.reset_index(drop=True)
+    try:
+        if fmt == "feather":
+            frame.to_feather(target)
+        else:
+            frame.to_parquet(target, index=False)
+    except ImportError as err:
+        target.unlink(missing_ok=True)
+        logger.warning("Interchange artifact skipped (%s): %s", target.name, err)
+        return None
+    logger.info("Interchange artifact written: %s", target)
+    return target
+
+
+def is_fresh(excel_path: Path, fmt: str = "parquet") -> bool:
+    """
+    Check whether the artifact for an Excel output can be trusted.
+
+    Args:
+        excel_path: Excel deliverable path
+        fmt: Artifact format
+
+    Returns:
+        True when the artifact exists and is not older than the workbook
+    """
+    target = artifact_path(excel_path, fmt)
+    if not target.exists():
+        return False
+    excel_path = Path(excel_path)
+    if not excel_path.exists():
+        return True
+    return target.stat().st_mtime >= excel_path.stat().st_mtime
+
+
+def move_artifact(excel_source: Path, excel_target: Path, fmt: str = "parquet") -> Optional[Path]:
+    """
+    Move the artifact along with its Excel output.
+
+    Stages that relocate their workbook after writing it (Stage 3 moves the
+    report into the reports directory) must move the artifact too, otherwise
+    the next stage finds no artifact or a stale one from an earlier run.
+    The modification time is preserved, so freshness is unchanged.
+
+    Args:
+        excel_source: Original Excel path
+        excel_target: New Excel path
+        fmt: Artifact format
+
+    Returns:
+        New artifact path, or None when there was no artifact to move
+    """
+    source = artifact_path(excel_source, fmt)
+    target = artifact_path(excel_target, fmt)
+    if not source.exists():
+        target.unlink(missing_ok=True)
+        return None
+    if source.resolve() != target.resolve():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(source), str(target))
+    return target
+
+
+def read_artifact(excel_path: Path, fmt: str = "parquet") -> Optional[pd.DataFrame]:
+    """
+    Read the artifact for an Excel output if it is present and fresh.
+
+    Args:
+        excel_path: Excel deliverable path
+        fmt: Artifact format
+
+    Returns:
+        DataFrame, or None when the caller should fall back to Excel
+    """
+    if not is_fresh(excel_path, fmt):
+        return None
+    target = artifact_path(excel_path, fmt)
+    try:
+        if fmt == "feather":
+            df = pd.read_feather(target)
+        else:
+            df = pd.read_parquet(target)
+    except Exception as err:  # pylint: disable=broad-except
+        logger.warning("Interchange artifact unreadable (%s): %s", target, err)
+        return None
+    logger.info("Interchange artifact loaded: %s", target)
+    return df
+
+
+def output_exists(
+    excel_path: Path, settings: Optional[InterchangeSettings] = None
+) -> bool:
+    """
+    Check whether a stage output is available in any form.
+
+    Args:
+        excel_path: Excel deliverable path
+        settings: Interchange settings (artifact considered only when enabled)
+
+    Returns:
+        True if the workbook or, in interchange mode, its artifact exists
+    """
+    if Path(excel_path).exists():
+        return True
+    if settings is not None and settings.enabled:
+        return artifact_path(excel_path, settings.format).exists()
+    return False
+
+
+def read_stage_frame(
+    excel_path: Path,
+    settings: Optional[InterchangeSettings] = None,
+    **read_excel_kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Load a stage output, preferring the fresh binary artifact.
+
+    Args:
+        excel_path: Excel deliverable path
+        settings: Interchange settings; Excel is always used when disabled
+        **read_excel_kwargs: Passed to ``pd.read_excel`` on fallback
+
+    Returns:
+        Loaded DataFrame
+    """
+    if settings is not None and settings.enabled:
+        df = read_artifact(excel_path, settings.format)
+        if df is not None:
+            return df
+    return pd.read_excel(excel_path, **read_excel_kwargs)
@@ -24,8 +24,12 @@ Key Features:
 - Multiple matching strategies (exact, partial, phonetic)
 - Fallback mechanisms when no exact match exists
 - Detailed matching reports for debugging
+- Registry aliases compiled once; results cached per column set
 """
 
+import threading
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Set
@@ -161,6 +165,214 @@ class MatchReport:
         print("\n" + "=" * 70)
 
 
+class _TrieNode:
+    """Node of an alias trie."""
+
+    __slots__ = ("children", "terminal", "aliases")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.terminal: Optional[str] = None  # alias ending at this node
+        self.aliases: Set[str] = set()  # aliases passing through this node
+
+
+def _trie_insert(root: _TrieNode, text: str, alias: str) -> _TrieNode:
+    """Insert text into the trie, tagging every node on its path with alias."""
+    node = root
+    for char in text:
+        node = node.children.setdefault(char, _TrieNode())
+        node.aliases.add(alias)
+    return node
+
+
+@dataclass
+class ColumnTable:
+    """
+    Matching data for one DataFrame header set.
+    
+    Built once per tuple of column names and reused for every semantic key.
+    
+    Attributes:
+        normalized_columns: Mapping of normalized names to original names
+        candidates: Per semantic key, (normalized_column, score) pairs with a
+            positive similarity score, sorted by score descending
+    """
+    normalized_columns: Dict[str, str]
+    candidates: Dict[str, List[Tuple[str, float]]]
+
+
+class CompiledAliasIndex:
+    """
+    Registry aliases compiled once into lookup structures.
+    
+    Every alias is normalized a single time and stored in:
+    - a per-key tuple of normalized aliases (exact matching order)
+    - a prefix trie (alias contained in a column, shared prefixes)
+    - a suffix trie (column contained in an alias)
+    
+    Scoring a column walks the tries instead of comparing it against every
+    alias, and yields the same scores as
+    SemanticMatcher._calculate_similarity_score. Column tables are cached
+    in an LRU keyed by the tuple of column names, so re-matching the same
+    header set costs only dictionary lookups.
+    """
+    
+    def __init__(self, registry, normalizer, cache_size: int = 64):
+        self.registry = registry
+        self.normalizer = normalizer
+        self.cache_size = cache_size
+        self._definition_count = len(registry.definitions)
+        self._tables: "OrderedDict[tuple, ColumnTable]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.key_aliases: Dict[str, Tuple[str, ...]] = {}
+        self.alias_keys: Dict[str, List[str]] = {}
+        self._prefix_root = _TrieNode()
+        self._suffix_root = _TrieNode()
+        
+        for key, definition in registry.definitions.items():
+            normalized_aliases = []
+            for alias in definition.aliases:
+                normalized_aliases.extend(
+                    normalizer.normalize_with_alternatives(alias)
+                )
+            # Remove duplicates while preserving order
+            normalized_aliases = tuple(dict.fromkeys(normalized_aliases))
+            self.key_aliases[key] = normalized_aliases
+            
+            for alias in normalized_aliases:
+                if not alias:
+                    continue  # Empty aliases never score
+                keys = self.alias_keys.setdefault(alias, [])
+                if not keys:
+                    _trie_insert(self._prefix_root, alias, alias).terminal = alias
+                    for start in range(len(alias)):
+                        _trie_insert(self._suffix_root, alias[start:], alias)
+                keys.append(key)
+    
+    def is_stale(self) -> bool:
+        """Whether definitions were registered after compilation."""
+        return len(self.registry.definitions) != self._definition_count
+    
+    def aliases_for(self, semantic_key: str) -> Tuple[str, ...]:
+        """
+        Normalized aliases for a semantic key, in registry order.
+        
+        Raises:
+            KeyError: If the semantic key is not registered
+        """
+        if semantic_key not in self.key_aliases:
+            raise KeyError(f"No header definition found for '{semantic_key}'")
+        return self.key_aliases[semantic_key]
+    
+    def score_column(self, column: str) -> Dict[str, float]:
+        """
+        Best similarity score per alias for one normalized column.
+        
+        Only aliases with a positive score are returned. Each rule keeps the
+        arithmetic of _calculate_similarity_score so scores are identical.
+        """
+        scores: Dict[str, float] = {}
+        if not column:
+            return scores
+        column_len = len(column)
+        
+        def offer(alias: str, score: float):
+            if score > scores.get(alias, 0.0):
+                scores[alias] = score
+        
+        # Alias contained in column: walk the prefix trie from every offset
+        for start in range(column_len):
+            node = self._prefix_root
+            for char in column[start:]:
+                node = node.children.get(char)
+                if node is None:
+                    break
+                if node.terminal is not None:
+                    alias = node.terminal
+                    if alias == column:
+                        offer(alias, 1.0)
+                    else:
+                        offer(alias, len(alias) / column_len * 0.9)
+        
+        # Column contained in alias: one walk of the suffix trie
+        node = self._suffix_root
+        for char in column:
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            for alias in node.aliases:
+                if alias != column:
+                    offer(alias, column_len / len(alias) * 0.85)
+        
+        # Common prefix of at least 3 characters: deepest shared node wins
+        path = []
+        node = self._prefix_root
+        for char in column:
+            node = node.children.get(char)
+            if node is None:
+                break
+            path.append(node)
+        seen: Set[str] = set()
+        for depth in range(len(path), 2, -1):
+            for alias in path[depth - 1].aliases:
+                if alias in seen:
+                    continue
+                seen.add(alias)
+                max_len = max(len(alias), column_len)
+                offer(alias, (depth / max_len) * 0.7)
+        
+        return scores
+    
+    def table(self, columns, normalize, df: pd.DataFrame) -> ColumnTable:
+        """
+        Cached column table for a header set.
+        
+        Args:
+            columns: Original column names (cache key)
+            normalize: Callable returning the normalized-to-original mapping
+                for df, called only when the header set is not cached yet
+            df: The DataFrame being matched
+        """
+        cache_key = tuple(columns)
+        with self._lock:
+            cached = self._tables.get(cache_key)
+            if cached is not None:
+                self._tables.move_to_end(cache_key)
+                return cached
+        
+        normalized_columns = normalize(df)
+        
+        # Single pass over columns: score every key at once
+        key_scores: Dict[str, List[Tuple[str, float]]] = {}
+        for norm_col in normalized_columns:
+            best: Dict[str, float] = {}
+            for alias, score in self.score_column(norm_col).items():
+                for key in self.alias_keys[alias]:
+                    if score > best.get(key, 0.0):
+                        best[key] = score
+            for key, score in best.items():
+                key_scores.setdefault(key, []).append((norm_col, score))
+        for matches in key_scores.values():
+            matches.sort(key=lambda x: x[1], reverse=True)
+        
+        table = ColumnTable(
+            normalized_columns=normalized_columns,
+            candidates=key_scores,
+        )
+        with self._lock:
+            self._tables[cache_key] = table
+            while len(self._tables) > self.cache_size:
+                self._tables.popitem(last=False)
+        return table
+    
+    def clear_cache(self):
+        """Drop all cached column tables."""
+        with self._lock:
+            self._tables.clear()
+
+
 class SemanticMatcher:
     """
     Engine for matching semantic keys to actual DataFrame columns.
@@ -204,6 +416,19 @@ class SemanticMatcher:
         self.normalizer = normalizer or HeaderNormalizer()
         self.min_confidence = min_confidence
         self.allow_partial = allow_partial
+        # Matchers on the default registry/normalizer share one compiled index
+        self._shared_index = registry is None and normalizer is None
+        self._index: Optional[CompiledAliasIndex] = None
+    
+    @property
+    def index(self) -> CompiledAliasIndex:
+        """Compiled alias index (rebuilt if the registry gained definitions)."""
+        if self._index is None or self._index.is_stale():
+            if self._shared_index:
+                self._index = _default_index()
+            else:
+                self._index = CompiledAliasIndex(self.registry, self.normalizer)
+        return self._index
     
     def match_dataframe(
         self,
@@ -243,8 +468,8 @@ class SemanticMatcher:
             else:
                 semantic_keys = self.registry.get_all_semantic_keys()
         
-        # Normalize all DataFrame column names once for efficiency
-        normalized_columns = self._normalize_dataframe_columns(df)
+        # Normalize and score the header set once (cached per column tuple)
+        table = self.index.table(df.columns, self._normalize_dataframe_columns, df)
         
         # Attempt to match each semantic key
         results = []
@@ -252,12 +477,7 @@ class SemanticMatcher:
         
         for key in semantic_keys:
             try:
-                result = self._match_single_key(
-                    key, 
-                    df.columns.tolist(),
-                    normalized_columns,
-                    matched_columns
-                )
+                result = self._match_single_key(key, table, matched_columns)
                 results.append(result)
                 
                 if result.matched and result.column_name:
@@ -356,8 +576,7 @@ class SemanticMatcher:
     def _match_single_key(
         self,
         semantic_key: str,
-        actual_columns: List[str],
-        normalized_columns: Dict[str, str],
+        table: ColumnTable,
         already_matched: Set[str]
     ) -> MatchResult:
         """
@@ -370,26 +589,18 @@ class SemanticMatcher:
         
         Args:
             semantic_key: The semantic key to match
-            actual_columns: List of actual column names in the DataFrame
-            normalized_columns: Mapping of normalized to original names
+            table: Precomputed column table for the DataFrame's header set
             already_matched: Set of columns already matched (to avoid duplicates)
             
         Returns:
             A MatchResult describing what was found
+            
+        Raises:
+            KeyError: If the semantic key is not registered
         """
         result = MatchResult(semantic_key=semantic_key)
-        
-        # Get the definition for this semantic key
-        definition = self.registry.get_definition(semantic_key)
-        
-        # Normalize all aliases for this semantic key
-        normalized_aliases = []
-        for alias in definition.aliases:
-            alternatives = self.normalizer.normalize_with_alternatives(alias)
-            normalized_aliases.extend(alternatives)
-        
-        # Remove duplicates while preserving order
-        normalized_aliases = list(dict.fromkeys(normalized_aliases))
+        normalized_aliases = self.index.aliases_for(semantic_key)
+        normalized_columns = table.normalized_columns
         
         # Strategy 1: Try exact matching
         for norm_alias in normalized_aliases:
@@ -408,11 +619,12 @@ class SemanticMatcher:
         
         # Strategy 2: Try partial matching (if enabled)
         if self.allow_partial:
-            partial_matches = self._find_partial_matches(
-                normalized_aliases,
-                normalized_columns,
-                already_matched
-            )
+            # Scores are precomputed; only drop columns matched in this pass
+            partial_matches = [
+                (norm_col, score)
+                for norm_col, score in table.candidates.get(semantic_key, [])
+                if normalized_columns[norm_col] not in already_matched
+            ]
             
             if partial_matches:
                 # Take the best partial match
@@ -438,53 +650,13 @@ class SemanticMatcher:
         
         return result
     
-    def _find_partial_matches(
-        self,
-        normalized_aliases: List[str],
-        normalized_columns: Dict[str, str],
-        already_matched: Set[str]
-    ) -> List[Tuple[str, float]]:
-        """
-        Find columns that partially match the aliases.
-        
-        Partial matching uses substring containment to find columns that
-        might be variations of the expected names. For example, "casenumber"
-        would partially match "casenumberid" or "caseno".
-        
-        Args:
-            normalized_aliases: List of normalized alias variations
-            normalized_columns: Mapping of normalized to original names
-            already_matched: Columns to exclude
-            
-        Returns:
-            List of (normalized_column, score) tuples, sorted by score descending
-        """
-        matches = []
-        
-        for norm_col, original_col in normalized_columns.items():
-            # Skip already matched columns
-            if original_col in already_matched:
-                continue
-            
-            # Calculate best match score against all aliases
-            best_score = 0.0
-            
-            for alias in normalized_aliases:
-                score = self._calculate_similarity_score(alias, norm_col)
-                best_score = max(best_score, score)
-            
-            if best_score > 0:
-                matches.append((norm_col, best_score))
-        
-        # Sort by score descending
-        matches.sort(key=lambda x: x[1], reverse=True)
-        
-        return matches
-    
     def _calculate_similarity_score(self, alias: str, column: str) -> float:
         """
         Calculate similarity score between an alias and a column name.
         
+        This is the reference scoring rule; CompiledAliasIndex.score_column
+        produces the same scores for all aliases at once.
+        
         Uses substring containment to determine similarity:
         - If one string contains the other: high score
         - If they share a significant prefix: medium score
@@ -529,6 +701,19 @@ class SemanticMatcher:
         return 0.0
 
 
+_DEFAULT_INDEX: Optional[CompiledAliasIndex] = None
+_DEFAULT_INDEX_LOCK = threading.Lock()
+
+
+def _default_index() -> CompiledAliasIndex:
+    """Process-wide index for HVDC_HEADER_REGISTRY with the default normalizer."""
+    global _DEFAULT_INDEX
+    with _DEFAULT_INDEX_LOCK:
+        if _DEFAULT_INDEX is None or _DEFAULT_INDEX.is_stale():
+            _DEFAULT_INDEX = CompiledAliasIndex(HVDC_HEADER_REGISTRY, HeaderNormalizer())
+        return _DEFAULT_INDEX
+
+
 def find_header_by_meaning(
     df: pd.DataFrame,
     semantic_key: str,
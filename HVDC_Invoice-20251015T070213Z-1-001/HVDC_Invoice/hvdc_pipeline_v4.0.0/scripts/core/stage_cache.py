@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Stage Cache Module
+==================
+
+Build-system style result caching for ``run_pipeline.py``.
+
+Each stage gets a fingerprint made of:
+- the content hashes of its input files (or directories)
+- the configuration sections that influence it
+- the source code of the stage package (code version)
+
+After a successful run the fingerprint and the produced outputs are written
+to a JSON manifest. On the next run a stage whose fingerprint is unchanged
+and whose outputs still exist is skipped. When a stage does run, every
+downstream stage entry is dropped so it is recomputed as well.
+
+File hashes are memoized in the manifest by (size, mtime), so unchanged
+multi-megabyte workbooks are not re-read just to prove they are unchanged.
+
+Example:
+    >>> cache = StageCache(Path("data/.pipeline_cache/manifest.json"))
+    >>> fp = cache.fingerprint(inputs=[synced], config=cfg, code=[stage2_dir])
+    >>> if not cache.is_fresh(2, fp):
+    ...     run_stage_2()
+    ...     cache.record(2, fp, outputs=[derived])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+
+
+class StageCache:
+    """
+    Fingerprint manifest for incremental pipeline re-runs.
+
+    Attributes:
+        manifest_path: Location of the JSON manifest
+        enabled: When False every stage is treated as stale
+        executed: Stages executed (not skipped) during this session
+    """
+
+    def __init__(self, manifest_path: Path, enabled: bool = True):
+        self.manifest_path = Path(manifest_path)
+        self.enabled = enabled
+        self.executed: set = set()
+        self._manifest = self._load()
+
+    # ------------------------------------------------------------------
+    # Manifest persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> Dict[str, Any]:
+        empty = {"version": MANIFEST_VERSION, "stages": {}, "files": {}}
+        if not self.manifest_path.exists():
+            return empty
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as err:
+            logger.warning("Stage cache manifest unreadable, starting fresh: %s", err)
+            return empty
+        if data.get("version") != MANIFEST_VERSION:
+            return empty
+        data.setdefault("stages", {})
+        data.setdefault("files", {})
+        return data
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(self._manifest, handle, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.manifest_path)
+
+    # ------------------------------------------------------------------
+    # Fingerprinting
+    # ------------------------------------------------------------------
+    def _hash_file(self, path: Path) -> str:
+        stat = path.stat()
+        key = str(path.resolve())
+        cached = self._manifest["files"].get(key)
+        if (
+            cached
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return cached["sha256"]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()
+        self._manifest["files"][key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": value,
+        }
+        return value
+
+    def _hash_path(self, path: Path, pattern: str = "*") -> str:
+        path = Path(path)
+        if path.is_file():
+            return self._hash_file(path)
+        if path.is_dir():
+            digest = hashlib.sha256()
+            for child in sorted(p for p in path.rglob(pattern) if p.is_file()):
+                if "__pycache__" in child.parts:
+                    continue
+                digest.update(str(child.relative_to(path)).encode("utf-8"))
+                digest.update(self._hash_file(child).encode("ascii"))
+            return digest.hexdigest()
+        return "missing"
+
+    def fingerprint(
+        self,
+        *,
+        inputs: Iterable[Path] = (),
+        config: Any = None,
+        code: Iterable[Path] = (),
+    ) -> str:
+        """
+        Compute a stage fingerprint.
+
+        Args:
+            inputs: Input files or directories (missing paths are allowed)
+            config: JSON-serializable configuration that affects the stage
+            code: Source files or package directories of the stage
+
+        Returns:
+            Hex digest identifying this exact stage invocation
+        """
+        payload = {
+            "inputs": {str(p): self._hash_path(Path(p)) for p in inputs},
+            "config": config,
+            "code": {str(p): self._hash_path(Path(p), "*.py") for p in code},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Stage bookkeeping
+    # ------------------------------------------------------------------
+    def is_fresh(self, stage: int, fingerprint: str) -> bool:
+        """
+        Check whether a stage can be skipped.
+
+        A stage is fresh when caching is enabled, no upstream stage ran in this
+        session, the recorded fingerprint matches and all outputs still exist.
+        """
+        if not self.enabled:
+            return False
+        if any(done < stage for done in self.executed):
+            return False
+        entry = self._manifest["stages"].get(str(stage))
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        return all(Path(p).exists() for p in entry.get("outputs", []))
+
+    def outputs(self, stage: int) -> List[Path]:
+        """Return the outputs recorded for a stage."""
+        entry = self._manifest["stages"].get(str(stage), {})
+        return [Path(p) for p in entry.get("outputs", [])]
+
+    def mark_executed(self, stage: int) -> None:
+        """Note that a stage ran and drop every downstream entry."""
+        self.executed.add(stage)
+        self.invalidate_downstream(stage)
+
+    def invalidate_downstream(self, stage: int) -> None:
+        """Remove manifest entries of all stages after ``stage``."""
+        stages = self._manifest["stages"]
+        for key in [k for k in stages if int(k) > stage]:
+            del stages[key]
+
+    def record(
+        self, stage: int, fingerprint: str, outputs: Iterable[Path], **extra: Any
+    ) -> None:
+        """
+        Record a successful stage run and persist the manifest.
+
+        Args:
+            stage: Stage number
+            fingerprint: Fingerprint the stage ran with
+            outputs: Produced files
+            **extra: Additional metadata (duration etc.)
+        """
+        entry: Dict[str, Any] = {
+            "fingerprint": fingerprint,
+            "outputs": [str(Path(p)) for p in outputs],
+        }
+        entry.update(extra)
+        self._manifest["stages"][str(stage)] = entry
+        if self.enabled:
+            self.save()
+
+    @classmethod
+    def from_config(
+        cls,
+        pipeline_config: Optional[Dict[str, Any]],
+        root: Path,
+        enabled: Optional[bool] = None,
+    ) -> "StageCache":
+        """
+        Build a cache from the ``cache`` section of the pipeline config.
+
+        Args:
+            pipeline_config: Parsed ``pipeline_config.yaml``
+            root: Pipeline root for relative manifest paths
+            enabled: Explicit override (``--no-cache``)
+        """
+        section = (pipeline_config or {}).get("cache") or {}
+        manifest = Path(section.get("manifest", "data/.pipeline_cache/manifest.json"))
+        if not manifest.is_absolute():
+            manifest = root / manifest
+        is_enabled = bool(section.get("enabled", False)) if enabled is None else enabled
+        return cls(manifest, enabled=is_enabled)
@@ -130,6 +130,7 @@ class SyncResult:
     output_path: str
     stats: Dict[str, Any]
     matching_report: Optional[str] = None  # New: matching diagnostics
+    data: Optional[pd.DataFrame] = None  # Synced frame for binary interchange
 
 
 class DataSynchronizerV30:
@@ -745,7 +746,8 @@ class DataSynchronizerV30:
                 "Sync & colorize done.", 
                 out, 
                 stats,
-                matching_report="All headers matched successfully"
+                matching_report="All headers matched successfully",
+                data=updated_w_df,
             )
             
         except Exception as e:
@@ -22,6 +22,7 @@ from copy import copy
 from pathlib import Path
 from typing import Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
 import yaml
 
@@ -34,6 +35,12 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 PIPELINE_CONFIG_PATH = PROJECT_ROOT / "config" / "pipeline_config.yaml"
 STAGE2_CONFIG_PATH = PROJECT_ROOT / "config" / "stage2_derived_config.yaml"
 
+from ..core.interchange import (
+    InterchangeSettings,
+    output_exists,
+    read_stage_frame,
+    write_artifact,
+)
 from .column_definitions import (
     DERIVED_COLUMNS,
     FINAL_HANDLING_COLUMN,
@@ -147,29 +154,50 @@ def resolve_derived_output_path(
 
 
 def _latest_location_and_date(
-    row: pd.Series,
-) -> Tuple[str | None, pd.Timestamp | pd.NaT]:
-    """최근 위치와 날짜를 계산합니다. / Compute the latest location and date."""
-    non_null = row.dropna()
-    if non_null.empty:
-        return None, pd.NaT
-    latest_date = non_null.max()
-    latest_columns = non_null[non_null == latest_date].index
-    return latest_columns[0], latest_date
-
-
-def _classify_storage(location: str | None) -> str:
-    """위치 기반 보관 유형을 분류합니다. / Classify storage based on location."""
-    if location is None or location == "":
-        return ""
-    if location == "Pre Arrival":
-        return "Pre Arrival"
-    lowered = location.lower()
-    if lowered in SITE_COLUMN_LOOKUP:
-        return "site"
-    if lowered in WAREHOUSE_COLUMN_LOOKUP:
-        return "warehouse"
-    return ""
+    frame: pd.DataFrame,
+) -> Tuple[pd.Series, pd.Series]:
+    """최근 위치와 날짜를 벡터로 계산합니다. / Vectorized latest location and date.
+
+    NaT는 int64 최소값으로 마스킹한 뒤 ``argmax``로 행별 최댓값의 첫 번째 컬럼을
+    찾습니다 (기존 행 단위 로직과 동일한 동률 처리). 값이 없는 행은 (None, NaT).
+    """
+    values = frame.to_numpy(dtype="datetime64[ns]")
+    missing = np.isnat(values)
+    ticks = values.view("int64").copy()
+    ticks[missing] = np.iinfo(np.int64).min
+
+    latest_idx = ticks.argmax(axis=1)
+    has_value = ~missing.all(axis=1)
+    rows = np.arange(len(frame))
+
+    columns = np.asarray(frame.columns, dtype=object)
+    locations = np.where(has_value, columns[latest_idx], None)
+    dates = np.where(
+        has_value,
+        values[rows, latest_idx],
+        np.datetime64("NaT", "ns"),
+    )
+    return (
+        pd.Series(locations, index=frame.index, dtype=object),
+        pd.Series(dates, index=frame.index, dtype="datetime64[ns]"),
+    )
+
+
+# 위치 → 보관 유형 매핑 (site가 warehouse보다 우선)
+_STORAGE_BY_LOCATION = {
+    **{col.lower(): "warehouse" for col in WAREHOUSE_COLUMNS},
+    **{col.lower(): "site" for col in SITE_COLUMNS},
+}
+
+
+def _classify_storage(locations: pd.Series) -> pd.Series:
+    """위치 기반 보관 유형을 분류합니다. / Classify storage based on location.
+
+    분류할 수 없는 위치는 빈 문자열을 반환합니다.
+    """
+    storage = locations.str.lower().map(_STORAGE_BY_LOCATION)
+    storage = storage.mask(locations == "Pre Arrival", "Pre Arrival")
+    return storage.fillna("").astype(object)
 
 
 def _to_datetime_columns(df: pd.DataFrame, columns: Iterable[str]) -> None:
@@ -201,39 +229,20 @@ def calculate_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
     else:
         working_df[STATUS_SITE_COLUMN] = ""
 
-    working_df[STATUS_CURRENT_COLUMN] = working_df.apply(
-        lambda row: (
-            "site"
-            if row[STATUS_SITE_COLUMN] == 1
-            else ("warehouse" if row[STATUS_WAREHOUSE_COLUMN] == 1 else "Pre Arrival")
+    working_df[STATUS_CURRENT_COLUMN] = pd.Series(
+        np.select(
+            [
+                working_df[STATUS_SITE_COLUMN].eq(1),
+                working_df[STATUS_WAREHOUSE_COLUMN].eq(1),
+            ],
+            ["site", "warehouse"],
+            default="Pre Arrival",
         ),
-        axis=1,
+        index=working_df.index,
+        dtype=object,
     )
 
-    if st_cols:
-        site_latest = working_df[st_cols].apply(
-            _latest_location_and_date,
-            axis=1,
-            result_type="expand",
-        )
-    else:
-        site_latest = pd.DataFrame(index=working_df.index, columns=[0, 1])
-
-    if wh_cols:
-        warehouse_latest = working_df[wh_cols].apply(
-            _latest_location_and_date,
-            axis=1,
-            result_type="expand",
-        )
-    else:
-        warehouse_latest = pd.DataFrame(index=working_df.index, columns=[0, 1])
-
-    if not site_latest.empty:
-        site_latest.columns = ["location", "date"]
-    if not warehouse_latest.empty:
-        warehouse_latest.columns = ["location", "date"]
-
-    location_series = pd.Series("Pre Arrival", index=working_df.index)
+    location_series = pd.Series("Pre Arrival", index=working_df.index, dtype=object)
     location_date_series = pd.Series(
         pd.NaT,
         index=working_df.index,
@@ -243,36 +252,24 @@ def calculate_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
     site_mask = working_df[STATUS_CURRENT_COLUMN] == "site"
     warehouse_mask = working_df[STATUS_CURRENT_COLUMN] == "warehouse"
 
-    if not site_latest.empty:
-        site_locations = site_latest.loc[site_mask, "location"]
-        site_locations = site_locations.fillna("Pre Arrival")
-        location_series.loc[site_mask] = site_locations
-        site_dates = site_latest.loc[site_mask, "date"]
-        location_date_series.loc[site_mask] = site_dates
-
-    if not warehouse_latest.empty:
-        warehouse_locations = warehouse_latest.loc[
-            warehouse_mask,
-            "location",
-        ]
-        warehouse_locations = warehouse_locations.fillna("Pre Arrival")
-        location_series.loc[warehouse_mask] = warehouse_locations
-        location_date_series.loc[warehouse_mask] = warehouse_latest.loc[
-            warehouse_mask,
-            "date",
-        ]
-
-    location_filled = location_series.replace({None: "Pre Arrival"})
-    working_df[STATUS_LOCATION_COLUMN] = location_filled
+    for columns, mask in ((st_cols, site_mask), (wh_cols, warehouse_mask)):
+        if not columns:
+            continue
+        latest_location, latest_date = _latest_location_and_date(
+            working_df[columns]
+        )
+        location_series = location_series.mask(
+            mask, latest_location.fillna("Pre Arrival")
+        )
+        location_date_series = location_date_series.mask(mask, latest_date)
+
+    working_df[STATUS_LOCATION_COLUMN] = location_series
     working_df[STATUS_LOCATION_DATE_COLUMN] = location_date_series
 
-    storage_series = location_series.apply(_classify_storage)
-    unresolved_storage_mask = storage_series == ""
-    storage_series.loc[unresolved_storage_mask] = working_df.loc[
-        unresolved_storage_mask,
-        STATUS_CURRENT_COLUMN,
-    ]
-    working_df[STATUS_STORAGE_COLUMN] = storage_series
+    storage_series = _classify_storage(location_series)
+    working_df[STATUS_STORAGE_COLUMN] = storage_series.mask(
+        storage_series == "", working_df[STATUS_CURRENT_COLUMN]
+    )
 
     if wh_cols:
         warehouse_handling = working_df[wh_cols].notna().sum(axis=1)
@@ -312,8 +309,14 @@ def process_derived_columns(
     pipeline_config_path: Optional[Path] = None,
     stage2_config_path: Optional[Path] = None,
     project_root: Optional[Path] = None,
+    interchange: Optional[InterchangeSettings] = None,
 ) -> bool:
-    """파생 컬럼을 계산합니다. / Process derived columns."""
+    """파생 컬럼을 계산합니다. / Process derived columns.
+
+    ``interchange``가 활성화되면 Stage 1 바이너리 아티팩트를 우선 읽고
+    결과도 아티팩트로 남깁니다. / When interchange mode is enabled the Stage 1
+    artifact is read first and the result is also written as an artifact.
+    """
     resolved_input_path = (
         resolve_synced_input_path(
             pipeline_config_path=pipeline_config_path,
@@ -328,15 +331,20 @@ def process_derived_columns(
     if not resolved_input_path.is_absolute():
         resolved_input_path = root / resolved_input_path
 
+    if interchange is None:
+        interchange = InterchangeSettings.from_config(
+            _load_yaml_config(pipeline_config_path or PIPELINE_CONFIG_PATH)
+        )
+
     print("=== 파생 컬럼 처리 시작 ===")
     print(f"입력 파일: {resolved_input_path}")
 
     # 파일 존재 확인
-    if not resolved_input_path.exists():
+    if not output_exists(resolved_input_path, interchange):
         raise FileNotFoundError(f"입력 파일을 찾을 수 없습니다: {resolved_input_path}")
 
     # 데이터 로드
-    df = pd.read_excel(resolved_input_path)
+    df = read_stage_frame(resolved_input_path, interchange)
     print(f"원본 데이터 로드 완료: {len(df)}행, {len(df.columns)}컬럼")
 
     df = calculate_derived_columns(df)
@@ -356,8 +364,17 @@ def process_derived_columns(
     output_path = resolve_derived_output_path(
         stage2_config=stage2_config, project_root=root
     )
-    df.to_excel(output_path, index=False)
-    print(f"SUCCESS: 파일 저장 완료: {output_path}")
+    if interchange.writes_intermediate_excel:
+        df.to_excel(output_path, index=False)
+        print(f"SUCCESS: 파일 저장 완료: {output_path}")
+    if interchange.enabled:
+        artifact = write_artifact(df, output_path, interchange.format)
+        if artifact is not None:
+            print(f"SUCCESS: 인터체인지 아티팩트 저장: {artifact}")
+        elif not interchange.writes_intermediate_excel:
+            # 아티팩트를 쓰지 못하면(혼합 타입 컬럼 등) Excel이 유일한 출력
+            df.to_excel(output_path, index=False)
+            print(f"SUCCESS: 파일 저장 완료: {output_path}")
 
     return True
 
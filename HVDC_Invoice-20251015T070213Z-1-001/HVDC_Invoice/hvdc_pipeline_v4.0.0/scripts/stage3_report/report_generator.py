@@ -34,6 +34,12 @@ import yaml
 import warnings
 
 from .utils import normalize_columns, apply_column_synonyms
+from ..core.interchange import (
+    InterchangeSettings,
+    output_exists,
+    read_stage_frame,
+    write_artifact,
+)
 
 warnings.filterwarnings("ignore")
 
@@ -48,6 +54,7 @@ PIPELINE_CONFIG_PATH = PIPELINE_ROOT / "config" / "pipeline_config.yaml"
 STAGE2_CONFIG_PATH = PIPELINE_ROOT / "config" / "stage2_derived_config.yaml"
 DEFAULT_STAGE2_OUTPUT = "data/processed/derived/HVDC_WAREHOUSE_HITACHI_HE_derived.xlsx"
 DEFAULT_REPORTS_DIR = "data/processed/reports"
+COMBINED_SHEET_NAME = "통합_원본데이터_Fixed"
 
 
 def _load_yaml_config(config_path: Path) -> Dict:
@@ -258,6 +265,7 @@ class CorrectedWarehouseIOCalculator:
 
         self.stage2_output_dir = derived_output_path.parent
         self.reports_output_dir = reports_root
+        self.interchange = InterchangeSettings.from_config(pipeline_config)
         self.data_path = self.stage2_output_dir
 
         self.hitachi_file = derived_output_path
@@ -267,7 +275,11 @@ class CorrectedWarehouseIOCalculator:
             self.stage2_output_dir / "HVDC WAREHOUSE_SIMENSE(SIM).xlsx",
         ]
         self.simense_file = next(
-            (candidate for candidate in simense_candidates if candidate.exists()),
+            (
+                candidate
+                for candidate in simense_candidates
+                if output_exists(candidate, self.interchange)
+            ),
             simense_candidates[0],
         )
 
@@ -276,7 +288,11 @@ class CorrectedWarehouseIOCalculator:
             self.stage2_output_dir / "HVDC WAREHOUSE_INVOICE.xlsx",
         ]
         self.invoice_file = next(
-            (candidate for candidate in invoice_candidates if candidate.exists()),
+            (
+                candidate
+                for candidate in invoice_candidates
+                if output_exists(candidate, self.interchange)
+            ),
             invoice_candidates[0],
         )
 
@@ -463,9 +479,11 @@ class CorrectedWarehouseIOCalculator:
 
         try:
             # HITACHI 데이터 로드 (전체)
-            if self.hitachi_file.exists():
+            if output_exists(self.hitachi_file, self.interchange):
                 logger.info(f" HITACHI 데이터 로드: {self.hitachi_file}")
-                hitachi_data = pd.read_excel(self.hitachi_file, engine="openpyxl")
+                hitachi_data = read_stage_frame(
+                    self.hitachi_file, self.interchange, engine="openpyxl"
+                )
                 # [패치] 컬럼명 정규화 및 동의어 매핑
                 hitachi_data.columns = normalize_columns(hitachi_data.columns)
                 hitachi_data = apply_column_synonyms(hitachi_data)
@@ -504,9 +522,11 @@ class CorrectedWarehouseIOCalculator:
                 logger.info(f" HITACHI 데이터 로드 완료: {len(hitachi_data)}건")
 
             # SIMENSE 데이터 로드 (전체)
-            if self.simense_file.exists():
+            if output_exists(self.simense_file, self.interchange):
                 logger.info(f" SIMENSE 데이터 로드: {self.simense_file}")
-                simense_data = pd.read_excel(self.simense_file, engine="openpyxl")
+                simense_data = read_stage_frame(
+                    self.simense_file, self.interchange, engine="openpyxl"
+                )
                 # [패치] 컬럼명 정규화 및 동의어 매핑
                 simense_data.columns = normalize_columns(simense_data.columns)
                 simense_data = apply_column_synonyms(simense_data)
@@ -2358,9 +2378,14 @@ class HVDCExcelReporterFinal:
                 writer, sheet_name="SIEMENS_원본데이터_Fixed", index=False
             )
             combined_original.to_excel(
-                writer, sheet_name="통합_원본데이터_Fixed", index=False
+                writer, sheet_name=COMBINED_SHEET_NAME, index=False
             )
 
+        # Stage 4 입력용 바이너리 아티팩트 (통합 원본 시트) / Stage 4 interchange
+        interchange = self.calculator.interchange
+        if interchange.enabled:
+            write_artifact(combined_original, excel_filename, interchange.format)
+
         # 저장 후 검증
         try:
             _ = pd.read_excel(excel_filename, sheet_name=0)
@@ -15,6 +15,7 @@ HVDC 입출고 이상치 탐지 — Balanced Boost Edition (v4)
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import math
@@ -43,6 +44,13 @@ try:
 except Exception:
     SKLEARN_AVAILABLE = False
 
+try:
+    import joblib
+
+    JOBLIB_AVAILABLE = True
+except Exception:
+    JOBLIB_AVAILABLE = False
+
 try:
     import openpyxl
 
@@ -117,6 +125,12 @@ class DetectorConfig:
     use_pyod_first: bool = True
     contamination: float = 0.02  # 2% 가정(데이터에 따라 조절)
     random_state: int = 42
+    n_estimators: Optional[int] = None  # None이면 백엔드 기본값(PyOD 100, sklearn 256)
+    n_jobs: int = -1  # 학습 병렬도(refit)
+
+    # 모델 영속화: "refit"=재학습 후 저장, "score"=저장 모델로 점수만 계산
+    model_mode: str = "refit"
+    model_dir: Optional[str] = None  # None이면 저장/로드하지 않음
 
     # 가중치
     rule_boost: float = 0.25  # 시간역전 발생 시 ML위험도 가산
@@ -170,6 +184,19 @@ class DetectorConfig:
         if self.site_columns is None:
             self.site_columns = ["AGI", "DAS", "MIR", "SHU"]
 
+    @classmethod
+    def from_model_config(cls, model_cfg: Optional[Dict] = None) -> "DetectorConfig":
+        """stage4.yaml의 model 섹션으로 생성(알 수 없는 키는 무시)"""
+        model_cfg = model_cfg or {}
+        aliases = {"mode": "model_mode"}
+        known = set(cls.__dataclass_fields__)
+        kwargs = {}
+        for key, value in model_cfg.items():
+            key = aliases.get(key, key)
+            if key in known:
+                kwargs[key] = value
+        return cls(**kwargs)
+
 
 # ----- Utilities ---------------------------------------------------------------
 class HeaderNormalizer:
@@ -228,60 +255,116 @@ class DataQualityValidator:
 
 
 # ----- Feature engineering -----------------------------------------------------
+TIMELINE_COLUMNS = ["ROW", "CASE_NO", "LOCATION", "ORDER", "TS"]
+
+
+def _to_timestamps(series: pd.Series) -> pd.Series:
+    """열 단위 날짜 변환(값별 형식 허용, 실패는 NaT)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.astype("datetime64[ns]")
+    return pd.to_datetime(series, errors="coerce", format="mixed").astype(
+        "datetime64[ns]"
+    )
+
+
+def _case_ids(df: pd.DataFrame) -> np.ndarray:
+    if "CASE_NO" in df.columns:
+        return df["CASE_NO"].map(str).to_numpy(dtype=object)
+    return np.full(len(df), "NA", dtype=object)
+
+
+def build_timeline(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    창고/현장 방문 이력을 long format (case, location, timestamp)으로 변환.
+
+    반환 컬럼:
+      - ROW: 원본 행 위치(0..n-1), CASE_NO: 문자열 케이스 ID
+      - LOCATION / ORDER: 위치명과 설정상 열 순서, TS: 방문 시각
+    날짜가 없는 셀은 제외되며 (ROW, ORDER) 순으로 정렬됨.
+    """
+    cols = [c for c in columns if c in df.columns]
+    if not cols or df.empty:
+        return pd.DataFrame(
+            {
+                "ROW": pd.Series(dtype=int),
+                "CASE_NO": pd.Series(dtype=object),
+                "LOCATION": pd.Series(dtype=object),
+                "ORDER": pd.Series(dtype=int),
+                "TS": pd.Series(dtype="datetime64[ns]"),
+            }
+        )
+
+    block = pd.DataFrame(
+        {c: _to_timestamps(df[c]).to_numpy() for c in cols},
+        index=pd.RangeIndex(len(df), name="ROW"),
+    )
+    long = block.melt(
+        var_name="LOCATION", value_name="TS", ignore_index=False
+    ).reset_index()
+    long = long[long["TS"].notna()]
+    long["ORDER"] = long["LOCATION"].map({c: i for i, c in enumerate(cols)})
+    long["CASE_NO"] = _case_ids(df)[long["ROW"].to_numpy()]
+    long = long.sort_values(["ROW", "ORDER"], kind="stable").reset_index(drop=True)
+    return long[TIMELINE_COLUMNS]
+
+
 class FeatureBuilder:
     def __init__(self, cfg: DetectorConfig):
         self.cfg = cfg
 
     def build(
-        self, df: pd.DataFrame
+        self, df: pd.DataFrame, timeline: Optional[pd.DataFrame] = None
     ) -> Tuple[pd.DataFrame, List[Tuple[str, str, int]]]:
         """
         반환:
           - 행 단위 피처(정규화된 CASE_NO index)
           - dwell 목록[(case_id, location, dwell_days)]
+
+        timeline: build_timeline() 결과(재사용 시 전달, 없으면 생성)
         """
-        rows = []
-        dwell_list: List[Tuple[str, str, int]] = []
-
-        for _, row in df.iterrows():
-            case_id = str(row.get("CASE_NO", "NA"))
-            points: List[Tuple[str, pd.Timestamp]] = []
-            for col in self.cfg.warehouse_columns + self.cfg.site_columns:
-                if col in row.index and pd.notna(row[col]):
-                    dt = pd.to_datetime(row[col], errors="coerce")
-                    if pd.notna(dt):
-                        points.append((col, dt))
-
-            points.sort(key=lambda x: x[1])
-            if len(points) >= 2:
-                # dwell(다음 지점까지 체류일)
-                for (loc_a, t_a), (loc_b, t_b) in zip(points[:-1], points[1:]):
-                    dd = int((t_b - t_a).days)
-                    if dd >= 0:
-                        dwell_list.append((case_id, loc_a, dd))
-
-            # 피처(간단형)
-            first_ts = points[0][1] if points else pd.NaT
-            last_ts = points[-1][1] if points else pd.NaT
-            total_days = (
-                int((last_ts - first_ts).days)
-                if (pd.notna(first_ts) and pd.notna(last_ts))
-                else np.nan
+        if timeline is None:
+            timeline = build_timeline(
+                df, self.cfg.warehouse_columns + self.cfg.site_columns
             )
-            rows.append(
-                dict(
-                    CASE_NO=case_id,
-                    TOUCH_COUNT=len(points),
-                    TOTAL_DAYS=total_days,
-                    FIRST_TS=first_ts,
-                    LAST_TS=last_ts,
-                    AMOUNT=pd.to_numeric(row.get("AMOUNT", np.nan), errors="coerce"),
-                    QTY=pd.to_numeric(row.get("QTY", np.nan), errors="coerce"),
-                    PKG=pd.to_numeric(row.get("PKG", np.nan), errors="coerce"),
-                )
+
+        # 시간순 정렬(동시각은 열 순서 유지) 후 다음 지점까지 체류일
+        by_time = timeline.sort_values(["ROW", "TS", "ORDER"], kind="stable")
+        grouped = by_time.groupby("ROW", sort=False)
+        next_ts = grouped["TS"].shift(-1)
+        dwell = (next_ts - by_time["TS"]).dt.days
+        keep = next_ts.notna() & (dwell >= 0)
+        dwell_list: List[Tuple[str, str, int]] = list(
+            zip(
+                by_time.loc[keep, "CASE_NO"],
+                by_time.loc[keep, "LOCATION"],
+                dwell[keep].astype(int).tolist(),
             )
+        )
 
-        feat = pd.DataFrame(rows).set_index("CASE_NO", drop=True)
+        # 피처(간단형)
+        rows = pd.RangeIndex(len(df))
+        stats = grouped["TS"].agg(["size", "min", "max"]).reindex(rows)
+        first_ts = stats["min"].astype("datetime64[ns]")
+        last_ts = stats["max"].astype("datetime64[ns]")
+        total_days = (last_ts - first_ts).dt.days
+
+        def _numeric(col: str) -> np.ndarray:
+            if col not in df.columns:
+                return np.full(len(df), np.nan)
+            return pd.to_numeric(df[col], errors="coerce").to_numpy()
+
+        feat = pd.DataFrame(
+            {
+                "CASE_NO": _case_ids(df),
+                "TOUCH_COUNT": stats["size"].fillna(0).astype(int).to_numpy(),
+                "TOTAL_DAYS": total_days.to_numpy(),
+                "FIRST_TS": first_ts.to_numpy(),
+                "LAST_TS": last_ts.to_numpy(),
+                "AMOUNT": _numeric("AMOUNT"),
+                "QTY": _numeric("QTY"),
+                "PKG": _numeric("PKG"),
+            }
+        ).set_index("CASE_NO", drop=True)
         return feat, dwell_list
 
 
@@ -346,38 +429,44 @@ class RuleDetector:
     def __init__(self, cfg: DetectorConfig):
         self.cfg = cfg
 
-    def time_reversal(self, row: pd.Series) -> Optional[AnomalyRecord]:
-        pts: List[Tuple[str, pd.Timestamp]] = []
-        for col in self.cfg.warehouse_columns + self.cfg.site_columns:
-            if col in row.index and pd.notna(row[col]):
-                ts = pd.to_datetime(row[col], errors="coerce")
-                if pd.notna(ts):
-                    pts.append((col, ts))
-        if len(pts) < 2:
-            return None
+    def time_reversals(
+        self, df: pd.DataFrame, timeline: Optional[pd.DataFrame] = None
+    ) -> List[AnomalyRecord]:
+        """열 순서상 앞 지점이 뒤 지점보다 늦은 케이스(행별 첫 역전 구간만 보고)"""
+        if timeline is None:
+            timeline = build_timeline(
+                df, self.cfg.warehouse_columns + self.cfg.site_columns
+            )
+        prev = timeline.groupby("ROW", sort=False)[["LOCATION", "TS"]].shift(1)
+        reversed_mask = prev["TS"] > timeline["TS"]
+        hits = timeline[reversed_mask].drop_duplicates("ROW", keep="first")
 
-        # 시간 역전이 있는지 확인 (정렬 전후 비교)
-        pts_sorted = sorted(pts, key=lambda x: x[1])
-        is_same_order = all(
-            a[0] == b[0] and a[1] == b[1] for a, b in zip(pts, pts_sorted)
-        )
-        if not is_same_order:
-            # 첫 역전 구간만 설명에 노출
-            for (name_a, t_a), (name_b, t_b) in zip(pts[:-1], pts[1:]):
-                if t_a > t_b:
-                    desc = f"{name_a}({t_a.date()}) → {name_b}({t_b.date()}) 시간 역전"
-                    return AnomalyRecord(
-                        case_id=str(row.get("CASE_NO", "NA")),
-                        anomaly_type=AnomalyType.TIME_REVERSAL,
-                        severity=AnomalySeverity.CRITICAL,
-                        description=desc,
-                        detected_value=None,
-                        expected_range=None,
-                        location=None,
-                        timestamp=datetime.now(),
-                        risk_score=0.999,  # balanced 위험도 기준 상한 근사치
-                    )
-        return None
+        out: List[AnomalyRecord] = []
+        for case_id, name_a, t_a, name_b, t_b in zip(
+            hits["CASE_NO"],
+            prev.loc[hits.index, "LOCATION"],
+            prev.loc[hits.index, "TS"],
+            hits["LOCATION"],
+            hits["TS"],
+        ):
+            out.append(
+                AnomalyRecord(
+                    case_id=case_id,
+                    anomaly_type=AnomalyType.TIME_REVERSAL,
+                    severity=AnomalySeverity.CRITICAL,
+                    description=f"{name_a}({t_a.date()}) → {name_b}({t_b.date()}) 시간 역전",
+                    detected_value=None,
+                    expected_range=None,
+                    location=None,
+                    timestamp=datetime.now(),
+                    risk_score=0.999,  # balanced 위험도 기준 상한 근사치
+                )
+            )
+        return out
+
+    def time_reversal(self, row: pd.Series) -> Optional[AnomalyRecord]:
+        recs = self.time_reversals(row.to_frame().T)
+        return recs[0] if recs else None
 
 
 # ----- Calibration -------------------------------------------------------------
@@ -391,6 +480,7 @@ class ECDFCalibrator:
         self.eps = eps
         self.n: Optional[int] = None
         self.order: Optional[np.ndarray] = None
+        self.reference: Optional[np.ndarray] = None
 
     def fit(self, raw: np.ndarray) -> "ECDFCalibrator":
         raw = np.asarray(raw, dtype=float)
@@ -408,8 +498,20 @@ class ECDFCalibrator:
         # 베타-스무딩
         p = (r + 1.0) / (self.n + 2.0)
         self.order = p
+        self.reference = np.sort(raw)
         return self
 
+    def score(self, raw: np.ndarray) -> np.ndarray:
+        """학습 분포(reference) 기준 ECDF. 학습 표본에 대해서는 fit 결과와 동일."""
+        if self.reference is None:
+            raise RuntimeError("calibrator is not fit")
+        raw = np.asarray(raw, dtype=float)
+        left = np.searchsorted(self.reference, raw, side="left")
+        right = np.searchsorted(self.reference, raw, side="right")
+        r = (left + right + 1) / 2.0  # 동점 평균 순위(1..n)
+        p = (r + 1.0) / (self.n + 2.0)
+        return np.clip(p, 0.001, 0.999)
+
     def transform(self, raw: np.ndarray) -> np.ndarray:
         if self.n is None:
             raise RuntimeError("calibrator is not fit")
@@ -425,38 +527,158 @@ class ECDFCalibrator:
         return p
 
 
+# ----- Model persistence -------------------------------------------------------
+class ModelStore:
+    """
+    학습된 scaler/model/ECDF 보정을 joblib 번들로 저장.
+    키 = 피처 스키마 + 모델 파라미터 + 백엔드(pyod/sklearn) 해시.
+    번들 옆 scores.joblib에 케이스별 원점수 캐시(피처 행 해시 기준)를 유지.
+    점수 캐시는 최근 사용 순으로 max_scores건까지만 보관(오래된 행부터 제거).
+    """
+
+    MAX_SCORES = 200_000
+
+    def __init__(self, root: str | Path, max_scores: int = MAX_SCORES):
+        self.root = Path(root)
+        self.max_scores = max_scores
+
+    @staticmethod
+    def key(columns: Iterable[str], params: Dict) -> str:
+        payload = json.dumps(
+            {"columns": list(columns), "params": params}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _dir(self, key: str) -> Path:
+        return self.root / key
+
+    def load(self, key: str) -> Optional[Dict]:
+        path = self._dir(key) / "model.joblib"
+        if not JOBLIB_AVAILABLE or not path.exists():
+            return None
+        return joblib.load(path)
+
+    def save(self, key: str, bundle: Dict) -> Path:
+        target = self._dir(key)
+        target.mkdir(parents=True, exist_ok=True)
+        joblib.dump(bundle, target / "model.joblib")
+        # 새 모델이면 이전 점수 캐시는 무효
+        (target / "scores.joblib").unlink(missing_ok=True)
+        return target / "model.joblib"
+
+    def load_scores(self, key: str) -> Dict[int, float]:
+        path = self._dir(key) / "scores.joblib"
+        if not JOBLIB_AVAILABLE or not path.exists():
+            return {}
+        return joblib.load(path)
+
+    def save_scores(self, key: str, scores: Dict[int, float]) -> None:
+        """scores는 오래된 → 최근 순서(dict 삽입 순서), 상한 초과분은 앞에서 제거"""
+        overflow = len(scores) - self.max_scores
+        if overflow > 0:
+            scores = dict(list(scores.items())[overflow:])
+        target = self._dir(key)
+        target.mkdir(parents=True, exist_ok=True)
+        joblib.dump(scores, target / "scores.joblib")
+
+
 # ----- ML detector -------------------------------------------------------------
+# 백엔드별 기본 트리 수 (PyOD IForest 기본값 100, 기존 sklearn 경로 256)
+DEFAULT_N_ESTIMATORS = {"pyod": 100, "sklearn": 256}
+
+
 class MLDetector:
     def __init__(
         self,
         contamination: float = 0.02,
         random_state: int = 42,
         use_pyod_first: bool = True,
+        n_estimators: Optional[int] = None,
+        n_jobs: int = -1,
+        mode: str = "refit",
+        model_dir: Optional[str] = None,
     ):
         self.contamination = contamination
         self.random_state = random_state
         self.use_pyod_first = use_pyod_first and PYOD_AVAILABLE
+        self.n_estimators = n_estimators
+        self.n_jobs = n_jobs
+        self.mode = mode
+        self.store = ModelStore(model_dir) if model_dir and JOBLIB_AVAILABLE else None
         self.model = None
         self.scaler = None
         self.calib = ECDFCalibrator()
+        self.last_mode: Optional[str] = None  # 실제 수행된 모드(refit/score)
+
+    @property
+    def backend(self) -> str:
+        return "pyod" if self.use_pyod_first else "sklearn"
+
+    @property
+    def tree_count(self) -> int:
+        """실제 학습 트리 수(미지정 시 백엔드 기본값)"""
+        if self.n_estimators is not None:
+            return int(self.n_estimators)
+        return DEFAULT_N_ESTIMATORS[self.backend]
+
+    def model_key(self, columns: Iterable[str]) -> str:
+        return ModelStore.key(
+            columns,
+            {
+                "backend": self.backend,
+                "contamination": self.contamination,
+                "random_state": self.random_state,
+                "n_estimators": self.tree_count,
+            },
+        )
 
     def fit_predict(self, X: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """return: (y_pred[0/1], risk[0..1])"""
         if X.empty or (not SKLEARN_AVAILABLE and not PYOD_AVAILABLE):
             return np.zeros(len(X), dtype=int), np.zeros(len(X), dtype=float)
 
+        key = self.model_key(X.columns)
+        if self.mode == "score" and self.store is not None:
+            bundle = self.store.load(key)
+            if bundle is not None:
+                return self.score(X, bundle, key)
+            logger.info("저장된 모델 없음(%s) → refit", key)
+
+        y, risk = self._fit(X)
+        if self.store is not None:
+            path = self.store.save(
+                key,
+                {
+                    "backend": self.backend,
+                    "columns": list(X.columns),
+                    "scaler": self.scaler,
+                    "model": self.model,
+                    "calibration": self.calib,
+                    "fitted_at": datetime.now().isoformat(),
+                    "n_samples": len(X),
+                },
+            )
+            logger.info(f"모델 저장: {path}")
+        return y, risk
+
+    def _fit(self, X: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        self.last_mode = "refit"
         self.scaler = StandardScaler() if SKLEARN_AVAILABLE else None
         Xs = self.scaler.fit_transform(X.values) if self.scaler else X.values
 
         if self.use_pyod_first:
             # PyOD IForest
             self.model = PyODIForest(
-                contamination=self.contamination, random_state=self.random_state
+                contamination=self.contamination,
+                random_state=self.random_state,
+                n_estimators=self.tree_count,
+                n_jobs=self.n_jobs,
             )
             self.model.fit(Xs)
             # PyOD의 decision_scores_: 값이 클수록 이상치
             raw = np.asarray(self.model.decision_scores_, dtype=float)
-            risk = ECDFCalibrator().fit(raw).transform(raw)
+            self.calib = ECDFCalibrator().fit(raw)
+            risk = self.calib.transform(raw)
             y = (risk >= (1 - self.contamination)).astype(int)
             return y, risk
 
@@ -464,12 +686,46 @@ class MLDetector:
         self.model = IsolationForest(
             contamination=self.contamination,
             random_state=self.random_state,
-            n_estimators=256,
+            n_estimators=self.tree_count,
+            n_jobs=self.n_jobs,
         )
         self.model.fit(Xs)
         dec = self.model.decision_function(Xs)  # +: 정상, -: 이상
         # 위험도 = 1 - ECDF(dec)
-        risk = 1.0 - ECDFCalibrator().fit(dec).transform(dec)
+        self.calib = ECDFCalibrator().fit(dec)
+        risk = 1.0 - self.calib.transform(dec)
+        y = (risk >= (1 - self.contamination)).astype(int)
+        return y, risk
+
+    def score(
+        self, X: pd.DataFrame, bundle: Dict, key: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """저장된 모델로 배치 점수 계산(변경/신규 케이스만 모델 평가)"""
+        self.last_mode = "score"
+        self.scaler = bundle["scaler"]
+        self.model = bundle["model"]
+        self.calib = bundle["calibration"]
+
+        hashes = pd.util.hash_pandas_object(X, index=True).to_numpy()
+        cache = self.store.load_scores(key) if (self.store and key) else {}
+        raw = np.array([cache.get(h, np.nan) for h in hashes.tolist()], dtype=float)
+        todo = np.isnan(raw)
+        if todo.any():
+            values = X.values[todo]
+            Xs = self.scaler.transform(values) if self.scaler else values
+            raw[todo] = self.model.decision_function(Xs)
+            # 이번 배치 행을 최근 사용으로 이동(상한 초과 시 미사용 행부터 제거)
+            for h in hashes.tolist():
+                cache.pop(h, None)
+            cache.update(zip(hashes.tolist(), raw.tolist()))
+            if self.store and key:
+                self.store.save_scores(key, cache)
+        logger.info(f"ML score-only: {int(todo.sum())}/{len(X)}건 신규 평가")
+
+        if bundle.get("backend") == "pyod":
+            risk = self.calib.score(raw)
+        else:
+            risk = 1.0 - self.calib.score(raw)
         y = (risk >= (1 - self.contamination)).astype(int)
         return y, risk
 
@@ -515,7 +771,15 @@ class HybridAnomalyDetector:
         self.validator = DataQualityValidator()
         self.rule = RuleDetector(cfg)
         self.stat = StatDetector(cfg)
-        self.ml = MLDetector(cfg.contamination, cfg.random_state, cfg.use_pyod_first)
+        self.ml = MLDetector(
+            cfg.contamination,
+            cfg.random_state,
+            cfg.use_pyod_first,
+            n_estimators=cfg.n_estimators,
+            n_jobs=cfg.n_jobs,
+            mode=cfg.model_mode,
+            model_dir=cfg.model_dir,
+        )
         self.comb = BalancedCombiner(cfg)
 
     def run(
@@ -547,14 +811,16 @@ class HybridAnomalyDetector:
                 ]
             )
 
-        # Rule — row-wise
-        for _, row in df.iterrows():
-            ar = self.rule.time_reversal(row)
-            if ar:
-                anomalies.append(ar)
+        # 공통 타임라인(case, location, timestamp) 1회 생성
+        timeline = build_timeline(
+            df, self.cfg.warehouse_columns + self.cfg.site_columns
+        )
+
+        # Rule — 시간 역전
+        anomalies.extend(self.rule.time_reversals(df, timeline))
 
         # Features & Dwell
-        feat, dwell_list = FeatureBuilder(self.cfg).build(df)
+        feat, dwell_list = FeatureBuilder(self.cfg).build(df, timeline)
 
         # Statistical — per location
         stat_recs = self.stat.per_location_outliers(dwell_list)
@@ -710,9 +976,23 @@ def main():
     p.add_argument("--out-xlsx", default="HVDC_anomaly_report_balanced.xlsx")
     p.add_argument("--contamination", type=float, default=0.02)
     p.add_argument("--use-pyod", action="store_true", help="가능하면 PyOD 사용")
+    p.add_argument(
+        "--model-mode",
+        choices=["refit", "score"],
+        default="refit",
+        help="refit=재학습 후 저장, score=저장 모델로 점수만 계산",
+    )
+    p.add_argument("--model-dir", default=None, help="모델 저장 폴더")
+    p.add_argument("--n-jobs", type=int, default=-1, help="refit 병렬도")
     args = p.parse_args()
 
-    cfg = DetectorConfig(contamination=args.contamination, use_pyod_first=args.use_pyod)
+    cfg = DetectorConfig(
+        contamination=args.contamination,
+        use_pyod_first=args.use_pyod,
+        model_mode=args.model_mode,
+        model_dir=args.model_dir,
+        n_jobs=args.n_jobs,
+    )
     df = _load_excel(args.input, args.sheet)
 
     det = HybridAnomalyDetector(cfg)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Stage 4 모델 모드 벤치마크 — refit vs score(저장 모델) vs score(캐시 적중)
+
+사용:
+    python -m scripts.stage4_anomaly.benchmark_model_modes --rows 50000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from .anomaly_detector_balanced import MLDetector
+
+
+def _features(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        rng.normal(size=(rows, 6)),
+        columns=[f"F{i}" for i in range(6)],
+        index=[f"CASE-{i}" for i in range(rows)],
+    )
+
+
+def _timed(detector: MLDetector, X: pd.DataFrame):
+    start = time.perf_counter()
+    y, risk = detector.fit_predict(X)
+    return time.perf_counter() - start, y, risk
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Stage 4 model mode benchmark")
+    p.add_argument("--rows", type=int, default=50000)
+    p.add_argument("--n-jobs", type=int, default=-1)
+    args = p.parse_args()
+
+    X = _features(args.rows)
+    with tempfile.TemporaryDirectory() as model_dir:
+
+        def detector(mode: str) -> MLDetector:
+            return MLDetector(
+                use_pyod_first=False, n_jobs=args.n_jobs, mode=mode, model_dir=model_dir
+            )
+
+        t_refit, y_refit, risk_refit = _timed(detector("refit"), X)
+        t_score, y_score, risk_score = _timed(detector("score"), X)
+        t_cached, _, _ = _timed(detector("score"), X)
+
+    print(f"rows={args.rows:,}")
+    print(f"refit          : {t_refit:8.3f}s")
+    print(f"score (model)  : {t_score:8.3f}s")
+    print(f"score (cached) : {t_cached:8.3f}s")
+    print(
+        "identical      :",
+        bool(np.array_equal(y_refit, y_score) and np.allclose(risk_refit, risk_score)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Test the persisted Stage 4 anomaly model.
+
+Scoring with the stored model must reproduce the refit result on the same
+data, unchanged cases must come from the score cache, and a missing model
+must fall back to a refit.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+
+from scripts.stage4_anomaly.anomaly_detector_balanced import (
+    DetectorConfig,
+    ECDFCalibrator,
+    MLDetector,
+    ModelStore,
+)
+
+
+@pytest.fixture
+def features():
+    rng = np.random.default_rng(7)
+    X = pd.DataFrame(
+        rng.normal(size=(300, 4)),
+        columns=["TOUCH_COUNT", "TOTAL_DAYS", "SITE_TOUCH", "AMOUNT"],
+        index=[f"C-{i}" for i in range(300)],
+    )
+    X.iloc[:5] *= 8  # 명확한 이상치
+    return X
+
+
+def _detector(model_dir, mode):
+    return MLDetector(use_pyod_first=False, n_jobs=1, mode=mode, model_dir=model_dir)
+
+
+def test_ecdf_score_matches_fit_on_training_data():
+    raw = np.array([0.3, 0.1, 0.3, 0.9, -0.2])
+    calib = ECDFCalibrator().fit(raw)
+    np.testing.assert_allclose(calib.score(raw), calib.transform(raw))
+
+
+def test_score_mode_matches_refit(tmp_path, features):
+    y_refit, risk_refit = _detector(tmp_path, "refit").fit_predict(features)
+
+    scorer = _detector(tmp_path, "score")
+    y_score, risk_score = scorer.fit_predict(features)
+    assert scorer.last_mode == "score"
+    np.testing.assert_array_equal(y_score, y_refit)
+    np.testing.assert_allclose(risk_score, risk_refit)
+
+    # 두 번째 호출은 점수 캐시 사용
+    y_cached, risk_cached = _detector(tmp_path, "score").fit_predict(features)
+    np.testing.assert_allclose(risk_cached, risk_refit)
+    assert y_cached[:5].sum() > 0
+
+
+def test_score_mode_without_model_refits(tmp_path, features):
+    detector = _detector(tmp_path / "empty", "score")
+    detector.fit_predict(features)
+    assert detector.last_mode == "refit"
+    assert list((tmp_path / "empty").glob("*/model.joblib"))
+
+
+def test_score_cache_is_capped(tmp_path, features):
+    _detector(tmp_path, "refit").fit_predict(features)
+    scorer = _detector(tmp_path, "score")
+    scorer.store.max_scores = 250
+
+    scorer.fit_predict(features.iloc[:200])
+    shifted = features.iloc[200:] + 1.0  # 신규 행 100건
+    scorer.fit_predict(shifted)
+
+    key = scorer.model_key(features.columns)
+    cached = scorer.store.load_scores(key)
+    assert len(cached) == 250
+    # 최근 배치 행은 모두 유지, 가장 오래된 행부터 제거
+    recent = pd.util.hash_pandas_object(shifted, index=True).tolist()
+    assert set(recent) <= set(cached)
+
+
+def test_pyod_receives_n_estimators():
+    pytest.importorskip("pyod")
+    X = pd.DataFrame(np.random.default_rng(1).normal(size=(50, 2)), columns=["A", "B"])
+    detector = MLDetector(use_pyod_first=True, n_estimators=17, n_jobs=1)
+    detector.fit_predict(X)
+    assert detector.model.n_estimators == 17
+
+
+def test_default_tree_count_per_backend():
+    """미지정 시 기존 동작 유지: PyOD 100, sklearn 256"""
+    assert MLDetector(use_pyod_first=False).tree_count == 256
+    pyod = MLDetector(use_pyod_first=True)
+    assert pyod.tree_count == (100 if pyod.backend == "pyod" else 256)
+    assert DetectorConfig().n_estimators is None
+
+
+def test_save_scores_trims_oldest(tmp_path):
+    store = ModelStore(tmp_path, max_scores=2)
+    store.save_scores("k", {1: 0.1, 2: 0.2, 3: 0.3})
+    assert store.load_scores("k") == {2: 0.2, 3: 0.3}
+
+
+def test_config_from_model_section():
+    cfg = DetectorConfig.from_model_config(
+        {"contamination": 0.05, "mode": "score", "model_dir": "m", "unknown": 1}
+    )
+    assert cfg.model_mode == "score"
+    assert cfg.model_dir == "m"
+    assert cfg.contamination == 0.05
@@ -0,0 +1,62 @@
+"""
+Test the shared long-format timeline used by Stage 4 features and rules.
+"""
+
+import pandas as pd
+
+from scripts.stage4_anomaly.anomaly_detector_balanced import (
+    DetectorConfig,
+    FeatureBuilder,
+    RuleDetector,
+    build_timeline,
+)
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "CASE_NO": ["A", "B", "C"],
+            # 열 순서: DSV_INDOOR → MOSB → MIR
+            "DSV_INDOOR": ["2025-01-01", "2025-03-10", None],
+            "MOSB": ["2025-01-11", "2025-03-01", None],
+            "MIR": ["2025-01-15", None, None],
+            "AMOUNT": [10, "n/a", 5.5],
+        }
+    )
+
+
+def test_timeline_drops_missing_and_keeps_column_order():
+    cfg = DetectorConfig()
+    timeline = build_timeline(_frame(), cfg.warehouse_columns + cfg.site_columns)
+
+    assert timeline["CASE_NO"].tolist() == ["A", "A", "A", "B", "B"]
+    assert timeline["LOCATION"].tolist() == [
+        "DSV_INDOOR",
+        "MOSB",
+        "MIR",
+        "DSV_INDOOR",
+        "MOSB",
+    ]
+
+
+def test_features_and_dwell():
+    feat, dwell = FeatureBuilder(DetectorConfig()).build(_frame())
+
+    assert feat.index.tolist() == ["A", "B", "C"]
+    assert feat["TOUCH_COUNT"].tolist() == [3, 2, 0]
+    assert feat["TOTAL_DAYS"].tolist()[:2] == [14.0, 9.0]
+    assert pd.isna(feat.loc["C", "TOTAL_DAYS"])
+    assert feat["AMOUNT"].isna().tolist() == [False, True, False]
+    # B는 시간순(MOSB → DSV_INDOOR)으로 체류 계산
+    assert dwell == [("A", "DSV_INDOOR", 10), ("A", "MOSB", 4), ("B", "MOSB", 9)]
+
+
+def test_time_reversal_reports_first_reversed_pair():
+    rule = RuleDetector(DetectorConfig())
+    records = rule.time_reversals(_frame())
+
+    assert [r.case_id for r in records] == ["B"]
+    assert records[0].description == (
+        "DSV_INDOOR(2025-03-10) → MOSB(2025-03-01) 시간 역전"
+    )
+    assert rule.time_reversal(_frame().iloc[0]) is None
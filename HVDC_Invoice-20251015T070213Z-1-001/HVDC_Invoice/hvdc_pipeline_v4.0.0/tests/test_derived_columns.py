@@ -0,0 +1,51 @@
+"""
+Test the vectorized Stage 2 status columns.
+
+Covers the status priority (site > warehouse > Pre Arrival), the latest
+location lookup including ties (first column in definition order wins) and
+the storage classification.
+"""
+
+import pandas as pd
+
+from scripts.stage2_derived.derived_columns_processor import calculate_derived_columns
+
+
+def test_status_location_and_storage():
+    df = pd.DataFrame(
+        {
+            "Case No.": ["SITE", "WH_TIE", "PRE", "BOTH"],
+            "DSV Indoor": ["2025-01-05", "2025-02-01", None, "2025-03-01"],
+            "MOSB": [None, "2025-02-01", None, "2025-03-09"],
+            "MIR": ["2025-01-10", None, None, None],
+            "AGI": ["2025-01-08", None, None, "2025-03-02"],
+            "규격": [100.0, 200.0, 50.0, 10.0],
+            "수량": [2, 1, 1, 3],
+        }
+    )
+
+    result = calculate_derived_columns(df)
+
+    assert result["Status_Current"].tolist() == [
+        "site",
+        "warehouse",
+        "Pre Arrival",
+        "site",
+    ]
+    assert result["Status_Location"].tolist() == ["MIR", "DSV Indoor", "Pre Arrival", "AGI"]
+    assert result["Status_Location_Date"].tolist() == [
+        pd.Timestamp("2025-01-10"),
+        pd.Timestamp("2025-02-01"),
+        pd.NaT,
+        pd.Timestamp("2025-03-02"),
+    ]
+    assert result["Status_Storage"].tolist() == [
+        "site",
+        "warehouse",
+        "Pre Arrival",
+        "site",
+    ]
+    assert result["Status_Location_Date"].dtype == "datetime64[ns]"
+    assert result["Status_Current"].dtype == object
+    assert result["wh handling"].tolist() == [1, 2, 0, 2]
+    assert result["site  handling"].tolist() == [2, 0, 0, 1]
@@ -0,0 +1,112 @@
+"""
+Test the binary interchange artifacts shared between pipeline stages.
+
+The artifact must round-trip the frame a stage produced, and a stale artifact
+(older than its Excel companion) must never be preferred over the workbook.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from scripts.core.interchange import (
+    InterchangeSettings,
+    artifact_path,
+    move_artifact,
+    output_exists,
+    read_stage_frame,
+    unsafe_columns,
+    write_artifact,
+)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "Case No.": ["C-1", "C-2", "C-3"],
+            "DSV Indoor": pd.to_datetime(["2025-01-01", None, "2025-02-03"]),
+            "Pkg": [1, 2, 3],
+            "Remark": ["N/A", None, "OK"],
+        }
+    )
+
+
+def test_settings_default_disabled():
+    settings = InterchangeSettings.from_config({})
+    assert settings.enabled is False
+    assert settings.writes_intermediate_excel is True
+
+    enabled = InterchangeSettings.from_config(
+        {"interchange": {"enabled": True, "intermediate_excel": False}}
+    )
+    assert enabled.writes_intermediate_excel is False
+
+
+def test_artifact_round_trip_preferred_when_fresh(tmp_path, frame):
+    excel = tmp_path / "derived.xlsx"
+    frame.to_excel(excel, index=False)
+    settings = InterchangeSettings(enabled=True)
+
+    written = write_artifact(frame, excel, settings.format)
+    assert written == artifact_path(excel)
+
+    loaded = read_stage_frame(excel, settings)
+    pd.testing.assert_frame_equal(loaded, frame)
+
+
+def test_mixed_type_frame_falls_back_to_excel(tmp_path, frame):
+    excel = tmp_path / "derived.xlsx"
+    settings = InterchangeSettings(enabled=True)
+    write_artifact(frame, excel, settings.format)
+
+    mixed = frame.assign(Mixed=[1, "TBD", None])
+    assert unsafe_columns(mixed) == ["Mixed"]
+    mixed.to_excel(excel, index=False)
+
+    # 이전 아티팩트는 제거되고 Excel 값 그대로 읽힘
+    assert write_artifact(mixed, excel, settings.format) is None
+    assert not artifact_path(excel).exists()
+    loaded = read_stage_frame(excel, settings)
+    assert loaded["Mixed"].tolist()[:2] == [1, "TBD"]
+
+
+def test_move_artifact_with_report(tmp_path, frame):
+    source = tmp_path / "report.xlsx"
+    target = tmp_path / "reports" / "report.xlsx"
+    target.parent.mkdir()
+    settings = InterchangeSettings(enabled=True)
+    frame.to_excel(source, index=False)
+    write_artifact(frame, source, settings.format)
+    write_artifact(frame.head(1), target, settings.format)  # 이전 실행의 아티팩트
+
+    source.rename(target)
+    assert move_artifact(source, target, settings.format) == artifact_path(target)
+    assert not artifact_path(source).exists()
+    pd.testing.assert_frame_equal(read_stage_frame(target, settings), frame)
+
+
+def test_stale_artifact_falls_back_to_excel(tmp_path, frame):
+    excel = tmp_path / "derived.xlsx"
+    settings = InterchangeSettings(enabled=True)
+    write_artifact(frame.head(1), excel, settings.format)
+    frame.to_excel(excel, index=False)
+
+    artifact = artifact_path(excel)
+    stamp = excel.stat().st_mtime - 60
+    os.utime(artifact, (stamp, stamp))
+
+    assert len(read_stage_frame(excel, settings)) == len(frame)
+
+
+def test_artifact_only_output_when_excel_skipped(tmp_path, frame):
+    excel = tmp_path / "derived.xlsx"
+    settings = InterchangeSettings(enabled=True, intermediate_excel=False)
+    write_artifact(frame, excel, settings.format)
+
+    assert output_exists(excel, settings)
+    assert not output_exists(excel, InterchangeSettings())
+    assert len(read_stage_frame(excel, settings)) == len(frame)
@@ -0,0 +1,22 @@
+"""
+Test that pipeline entry points import without the heavy stage dependencies.
+
+Stage modules (pandas, sklearn/PyOD, openpyxl) must load only when the stage
+that needs them runs, so ``run_pipeline.py --help`` stays fast.
+"""
+
+from scripts.benchmark_import_time import measure_import
+
+
+def test_entry_points_do_not_import_heavy_modules():
+    for module in ("run_pipeline", "scripts.core", "scripts.core.stage_cache"):
+        _, heavy = measure_import(module)
+        assert heavy == [], (module, heavy)
+
+
+def test_core_exports_resolve_on_first_access():
+    import scripts.core as core
+
+    assert "SemanticMatcher" in dir(core)
+    assert core.SemanticMatcher.__module__ == "scripts.core.semantic_matcher"
+    assert core.HVDC_HEADER_REGISTRY is core.header_registry.HVDC_HEADER_REGISTRY
@@ -0,0 +1,37 @@
+"""
+Test the compiled alias index behind SemanticMatcher.
+
+Index scores must equal the reference _calculate_similarity_score for every
+alias, and repeated header sets must be served from the column-tuple cache.
+"""
+
+import pandas as pd
+
+from scripts.core.semantic_matcher import SemanticMatcher
+
+
+def test_index_scores_match_reference_rule():
+    matcher = SemanticMatcher()
+    index = matcher.index
+    aliases = list(index.alias_keys)
+    columns = ["casenumberid", "case", "etaata", "dhlwarehousecode", "qtyx", "xyz", "ca"]
+
+    for column in columns:
+        scores = index.score_column(column)
+        for alias in aliases:
+            expected = matcher._calculate_similarity_score(alias, column)
+            assert scores.get(alias, 0.0) == expected, (alias, column)
+
+
+def test_header_set_is_cached_and_matched_once_per_column():
+    matcher = SemanticMatcher()
+    df = pd.DataFrame(columns=["Case No.", "Case No. (old)", "ETA/ATA", "Remark"])
+
+    first = matcher.match_dataframe(df, ["case_number", "eta_ata"])
+    table = matcher.index.table(df.columns, None, df)  # cache hit, no normalize
+    second = SemanticMatcher().match_dataframe(df, ["case_number", "eta_ata"])
+
+    assert first.get_column_name("case_number") == "Case No."
+    assert first.get_column_name("eta_ata") == "ETA/ATA"
+    assert table.normalized_columns["casenoold"] == "Case No. (old)"
+    assert repr(first) == repr(second)
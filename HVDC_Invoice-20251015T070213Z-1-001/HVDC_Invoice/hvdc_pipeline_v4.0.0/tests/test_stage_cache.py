@@ -0,0 +1,78 @@
+"""
+Test the stage result cache used by run_pipeline.py.
+
+Unchanged inputs/config/code must be skipped, any change must re-run the
+stage, and a re-run stage must invalidate everything downstream.
+"""
+
+from scripts.core.stage_cache import StageCache
+
+
+def _setup(tmp_path):
+    source = tmp_path / "input.xlsx"
+    source.write_bytes(b"v1")
+    code = tmp_path / "stage_pkg"
+    code.mkdir()
+    (code / "module.py").write_text("X = 1\n")
+    output = tmp_path / "output.xlsx"
+    output.write_bytes(b"out")
+    return source, code, output
+
+
+def test_unchanged_fingerprint_is_fresh(tmp_path):
+    source, code, output = _setup(tmp_path)
+    manifest = tmp_path / "cache" / "manifest.json"
+
+    cache = StageCache(manifest)
+    fp = cache.fingerprint(inputs=[source], config={"threshold": 1}, code=[code])
+    assert not cache.is_fresh(2, fp)
+    cache.record(2, fp, [output])
+
+    reloaded = StageCache(manifest)
+    fp_again = reloaded.fingerprint(
+        inputs=[source], config={"threshold": 1}, code=[code]
+    )
+    assert fp_again == fp
+    assert reloaded.is_fresh(2, fp_again)
+
+
+def test_config_input_and_code_changes_invalidate(tmp_path):
+    source, code, output = _setup(tmp_path)
+    cache = StageCache(tmp_path / "manifest.json")
+    fp = cache.fingerprint(inputs=[source], config={"threshold": 1}, code=[code])
+    cache.record(4, fp, [output])
+
+    assert cache.fingerprint(inputs=[source], config={"threshold": 2}, code=[code]) != fp
+
+    source.write_bytes(b"v2")
+    assert cache.fingerprint(inputs=[source], config={"threshold": 1}, code=[code]) != fp
+    source.write_bytes(b"v1")
+
+    (code / "module.py").write_text("X = 2\n")
+    assert cache.fingerprint(inputs=[source], config={"threshold": 1}, code=[code]) != fp
+
+
+def test_missing_output_or_upstream_run_forces_rerun(tmp_path):
+    source, code, output = _setup(tmp_path)
+    cache = StageCache(tmp_path / "manifest.json")
+    fp = cache.fingerprint(inputs=[source], code=[code])
+    cache.record(3, fp, [output])
+    cache.record(4, fp, [output])
+
+    cache.mark_executed(2)
+    assert not cache.is_fresh(3, fp)
+    assert cache.outputs(4) == []
+
+    fresh = StageCache(tmp_path / "manifest.json")
+    fresh.record(3, fp, [output])
+    output.unlink()
+    assert not fresh.is_fresh(3, fp)
+
+
+def test_disabled_cache_never_skips(tmp_path):
+    source, code, output = _setup(tmp_path)
+    cache = StageCache(tmp_path / "manifest.json", enabled=False)
+    fp = cache.fingerprint(inputs=[source], code=[code])
+    cache.record(1, fp, [output])
+    assert not cache.is_fresh(1, fp)
+    assert not (tmp_path / "manifest.json").exists()
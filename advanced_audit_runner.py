@@ -5,13 +5,16 @@
 """
 
 import pandas as pd
-import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 import warnings
+
+import shared_path  # noqa: F401  (00_Shared 경로 등록)
+from result_stream import ResultStreamWriter, write_json_document
+
 warnings.filterwarnings('ignore')
 
 class AdvancedAuditSystem:
@@ -253,19 +256,23 @@ class AdvancedAuditSystem:
         all_invoice_items = []
         sheet_summaries = {}
         
-        for sheet_name, df in excel_data.items():
-            print(f"📋 시트 '{sheet_name}' 처리 중...")
-            invoice_items = self.extract_invoice_data(df, sheet_name)
-            all_invoice_items.extend(invoice_items)
-            
-            # 시트별 요약
-            sheet_summaries[sheet_name] = {
-                "total_items": len(invoice_items),
-                "pass_items": len([item for item in invoice_items if item["status"] == "PASS"]),
-                "warning_items": len([item for item in invoice_items if item["status"] == "WARNING"]),
-                "fail_items": len([item for item in invoice_items if item["status"] == "FAIL"]),
-                "total_amount": sum(item["amount_usd"] for item in invoice_items)
-            }
+        # 추출된 항목은 시트 단위로 즉시 NDJSON 기록 (실행 중 읽기 가능)
+        items_file = self.output_dir / "audit_items.ndjson"
+        with ResultStreamWriter(items_file, amount_key="amount_usd") as item_stream:
+            for sheet_name, df in excel_data.items():
+                print(f"📋 시트 '{sheet_name}' 처리 중...")
+                invoice_items = self.extract_invoice_data(df, sheet_name)
+                all_invoice_items.extend(invoice_items)
+                item_stream.write_many(invoice_items)
+                
+                # 시트별 요약
+                sheet_summaries[sheet_name] = {
+                    "total_items": len(invoice_items),
+                    "pass_items": len([item for item in invoice_items if item["status"] == "PASS"]),
+                    "warning_items": len([item for item in invoice_items if item["status"] == "WARNING"]),
+                    "fail_items": len([item for item in invoice_items if item["status"] == "FAIL"]),
+                    "total_amount": sum(item["amount_usd"] for item in invoice_items)
+                }
         
         # 전체 요약 계산
         total_items = len(all_invoice_items)
@@ -309,13 +316,12 @@ class AdvancedAuditSystem:
         try:
             # JSON 보고서 저장
             json_file = self.output_dir / "audit_report.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(audit_result, f, indent=2, ensure_ascii=False, default=str)
+            write_json_document(json_file, audit_result, "invoice_items")
             
             # CSV 보고서 저장
             csv_file = self.output_dir / "audit_report.csv"
-            df = pd.DataFrame(audit_result["invoice_items"])
-            df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+            with ResultStreamWriter(csv_file, amount_key="amount_usd") as stream:
+                stream.write_many(audit_result["invoice_items"])
             
             # 요약 보고서 저장
             summary_file = self.output_dir / "audit_summary.txt"
@@ -11,15 +11,49 @@ AUDIT LOGIC.MD의 모든 요구사항을 반영한 완전한 송장 감사 시
 """
 
 import pandas as pd
-import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 import warnings
+
+import shared_path  # noqa: F401  (00_Shared 경로 등록)
+from cost_guard import assign_bands, calculate_delta_percents
+from item_records import ItemRecord
+from result_stream import ResultStreamWriter, write_json_document
+
 warnings.filterwarnings('ignore')
 
+# COST-GUARD 밴드 (cost_guard_bands 상한 순서, 마지막 CRITICAL 초과)
+AUDIT_LOGIC_BANDS = ("PASS", "WARN", "HIGH", "CRITICAL", "AUTOFAIL")
+
+class AuditItem(ItemRecord):
+    """AUDIT LOGIC.MD 준수 감사 항목 (__slots__ 레코드)"""
+    
+    __slots__ = FIELDS = (
+        'sheet_name',
+        'row_number',
+        's_no',
+        'rate_source',
+        'description',
+        'rate_usd',
+        'quantity',
+        'total_usd',
+        'currency',
+        'at_cost',
+        'formula_text',
+        'line_type',
+        'amount_usd',
+        'delta_percent',
+        'cost_guard_band',
+        'status',
+        'risk_tier',
+        'evidence',
+        'remarks',
+        'validation_flags',
+    )
+
 class AuditLogicCompliantSystem:
     """AUDIT LOGIC.MD 완전 준수 송장 감사 시스템"""
     
@@ -83,13 +117,17 @@ class AuditLogicCompliantSystem:
         all_invoice_items = []
         sheet_summaries = {}
         
-        for sheet_name, df in excel_data.items():
-            print(f"📋 시트 '{sheet_name}' 처리 중...")
-            invoice_items = self.extract_invoice_data_with_sno_order(df, sheet_name)
-            all_invoice_items.extend(invoice_items)
-            
-            # 시트별 요약
-            sheet_summaries[sheet_name] = self.calculate_sheet_summary(invoice_items)
+        # 추출된 항목은 시트 단위로 즉시 NDJSON 기록 (실행 중 읽기 가능)
+        items_file = self.output_dir / "audit_logic_compliant_items.ndjson"
+        with ResultStreamWriter(items_file, amount_key="amount_usd") as item_stream:
+            for sheet_name, df in excel_data.items():
+                print(f"📋 시트 '{sheet_name}' 처리 중...")
+                invoice_items = self.extract_invoice_data_with_sno_order(df, sheet_name)
+                all_invoice_items.extend(invoice_items)
+                item_stream.write_many(invoice_items)
+                
+                # 시트별 요약
+                sheet_summaries[sheet_name] = self.calculate_sheet_summary(invoice_items)
         
         # 3. S/No 순서로 정렬 (AUDIT LOGIC.MD 최우선 요구사항)
         all_invoice_items = self.preserve_sno_order(all_invoice_items)
@@ -160,6 +198,11 @@ class AuditLogicCompliantSystem:
                     if item:
                         invoice_items.append(item)
             
+            # 시트 단위 COST-GUARD 일괄 판정 후 상태 결정
+            self.apply_cost_guard_audit_logic(invoice_items)
+            for item in invoice_items:
+                self.finalize_audit_logic_item(item)
+            
             print(f"  ✅ {len(invoice_items)}개 송장 항목 추출 (S/No 순서 보존)")
             return invoice_items
             
@@ -272,30 +315,23 @@ class AuditLogicCompliantSystem:
         """AUDIT LOGIC.MD 준수 송장 항목 생성"""
         try:
             # 기본 정보 추출
-            item = {
-                "sheet_name": sheet_name,
-                "row_number": row_idx + 1,
-                "s_no": self.extract_field_value(row, header_mapping, 's_no'),
-                "rate_source": self.extract_field_value(row, header_mapping, 'rate_source'),
-                "description": self.extract_field_value(row, header_mapping, 'description'),
-                "rate_usd": self.extract_numeric_value(row, header_mapping, 'rate'),
-                "quantity": self.extract_numeric_value(row, header_mapping, 'quantity'),
-                "total_usd": self.extract_numeric_value(row, header_mapping, 'total'),
-                "currency": self.extract_field_value(row, header_mapping, 'currency'),
-                "at_cost": self.extract_numeric_value(row, header_mapping, 'at_cost'),
-                "formula_text": self.extract_field_value(row, header_mapping, 'formula')
-            }
+            item = AuditItem(
+                sheet_name=sheet_name,
+                row_number=row_idx + 1,
+                s_no=self.extract_field_value(row, header_mapping, 's_no'),
+                rate_source=self.extract_field_value(row, header_mapping, 'rate_source'),
+                description=self.extract_field_value(row, header_mapping, 'description'),
+                rate_usd=self.extract_numeric_value(row, header_mapping, 'rate'),
+                quantity=self.extract_numeric_value(row, header_mapping, 'quantity'),
+                total_usd=self.extract_numeric_value(row, header_mapping, 'total'),
+                currency=self.extract_field_value(row, header_mapping, 'currency'),
+                at_cost=self.extract_numeric_value(row, header_mapping, 'at_cost'),
+                formula_text=self.extract_field_value(row, header_mapping, 'formula')
+            )
             
             # AUDIT LOGIC.MD 기반 계산
             item["line_type"] = self.determine_line_type(item)
             item["amount_usd"] = self.calculate_amount_usd_audit_logic(item)
-            item["delta_percent"] = self.calculate_delta_percent_audit_logic(item)
-            item["cost_guard_band"] = self.determine_cost_guard_band_audit_logic(item["delta_percent"])
-            item["status"] = self.determine_status_audit_logic(item)
-            item["risk_tier"] = self.determine_risk_tier(item)
-            item["evidence"] = self.generate_evidence_link(item)
-            item["remarks"] = self.generate_remarks(item)
-            item["validation_flags"] = self.generate_validation_flags_audit_logic(item)
             
             return item
             
@@ -324,34 +360,52 @@ class AuditLogicCompliantSystem:
             # Contract: Draft USD가 기준
             return item["total_usd"]
     
+    def calculate_delta_percents_audit_logic(self, items: List[Dict]) -> List[float]:
+        """AUDIT LOGIC.MD 기반 Delta % 일괄 계산 (cost_guard 공용 로직)"""
+        fx_rate = self.audit_rules["fx_rates"]["AED_USD"]
+        # At-Cost: (DraftTotal_USD - Doc_USD) / Doc_USD * 100
+        # Contract: 0으로 설정 (실제로는 Ref JSON 필요), Doc_USD = 0도 0.0
+        doc_usd = [
+            round(item["at_cost"] * fx_rate, 2)
+            if item["line_type"] == "At-Cost" and item["at_cost"] > 0 else None
+            for item in items
+        ]
+        deltas = calculate_delta_percents(
+            [item["total_usd"] for item in items], doc_usd, zero_ref=0.0
+        )
+        return [0.0 if ref is None else float(delta) for ref, delta in zip(doc_usd, deltas)]
+    
     def calculate_delta_percent_audit_logic(self, item: Dict) -> float:
         """AUDIT LOGIC.MD 기반 Delta % 계산"""
-        if item["line_type"] == "At-Cost" and item["at_cost"] > 0:
-            # At-Cost: (DraftTotal_USD - Doc_USD) / Doc_USD * 100
-            doc_usd = round(item["at_cost"] * self.audit_rules["fx_rates"]["AED_USD"], 2)
-            if doc_usd > 0:
-                return round(((item["total_usd"] - doc_usd) / doc_usd) * 100, 2)
-        elif item["line_type"] == "Contract":
-            # Contract: (DraftRate_USD - RefRate_USD) / RefRate_USD * 100
-            # 여기서는 단순히 0으로 설정 (실제로는 Ref JSON 필요)
-            return 0.0
-        
-        return 0.0
+        return self.calculate_delta_percents_audit_logic([item])[0]
+    
+    def determine_cost_guard_bands_audit_logic(self, delta_percents: List[float]) -> List[str]:
+        """AUDIT LOGIC.MD 기반 COST-GUARD 밴드 일괄 결정"""
+        limits = self.audit_rules["cost_guard_bands"]
+        thresholds = [limits[band] for band in AUDIT_LOGIC_BANDS[:-1]]
+        return assign_bands(
+            delta_percents, thresholds, AUDIT_LOGIC_BANDS, na_band="AUTOFAIL"
+        ).tolist()
     
     def determine_cost_guard_band_audit_logic(self, delta_percent: float) -> str:
         """AUDIT LOGIC.MD 기반 COST-GUARD 밴드 결정"""
-        abs_delta = abs(delta_percent)
-        
-        if abs_delta <= self.audit_rules["cost_guard_bands"]["PASS"]:
-            return "PASS"
-        elif abs_delta <= self.audit_rules["cost_guard_bands"]["WARN"]:
-            return "WARN"
-        elif abs_delta <= self.audit_rules["cost_guard_bands"]["HIGH"]:
-            return "HIGH"
-        elif abs_delta <= self.audit_rules["cost_guard_bands"]["CRITICAL"]:
-            return "CRITICAL"
-        else:
-            return "AUTOFAIL"
+        return self.determine_cost_guard_bands_audit_logic([delta_percent])[0]
+    
+    def apply_cost_guard_audit_logic(self, items: List[Dict]) -> None:
+        """시트 단위 Delta % / COST-GUARD 밴드 일괄 판정"""
+        deltas = self.calculate_delta_percents_audit_logic(items)
+        bands = self.determine_cost_guard_bands_audit_logic(deltas)
+        for item, delta, band in zip(items, deltas, bands):
+            item["delta_percent"] = delta
+            item["cost_guard_band"] = band
+    
+    def finalize_audit_logic_item(self, item: Dict) -> None:
+        """COST-GUARD 밴드 기반 상태/리스크/비고/플래그 결정"""
+        item["status"] = self.determine_status_audit_logic(item)
+        item["risk_tier"] = self.determine_risk_tier(item)
+        item["evidence"] = self.generate_evidence_link(item)
+        item["remarks"] = self.generate_remarks(item)
+        item["validation_flags"] = self.generate_validation_flags_audit_logic(item)
     
     def determine_status_audit_logic(self, item: Dict) -> str:
         """AUDIT LOGIC.MD 기반 상태 결정"""
@@ -528,13 +582,12 @@ class AuditLogicCompliantSystem:
         try:
             # JSON 보고서 저장
             json_file = self.output_dir / "audit_logic_compliant_report.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(audit_result, f, indent=2, ensure_ascii=False, default=str)
+            write_json_document(json_file, audit_result, "invoice_items")
             
             # CSV 보고서 저장 (AUDIT LOGIC.MD 스키마)
             csv_file = self.output_dir / "audit_logic_compliant_report.csv"
-            df = pd.DataFrame(audit_result["invoice_items"])
-            df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+            with ResultStreamWriter(csv_file, fieldnames=AuditItem.FIELDS, amount_key="amount_usd") as stream:
+                stream.write_many(audit_result["invoice_items"])
             
             # 상세 요약 보고서 저장
             summary_file = self.output_dir / "audit_logic_compliant_summary.txt"
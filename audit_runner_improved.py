@@ -14,13 +14,16 @@ import json
 import pathlib
 import logging
 import argparse
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 
 from joiners import canon_dest, unit_key, port_hint
 from rules import FIXED_FX, LAYER1_TOL, AUTOFAIL, cg_band
 
+import shared_path  # noqa: F401  (00_Shared 경로 등록)
+from result_stream import ResultStreamWriter
+
 # 프로젝트 루트 경로 설정
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 IO = ROOT / "io"
@@ -88,6 +91,14 @@ class AuditResult:
     key: str
 
 
+# 감사 결과 CSV 컬럼 (AuditRunner.result_to_row)
+RESULT_FIELDNAMES = [
+    "SNo", "RateSource", "Description", "DraftRate_USD", "Qty",
+    "DraftTotal_USD", "Port(Join)", "Destination(Join)", "CargoType",
+    "Unit", "Ref_Rate_USD", "Delta_%", "CG_Band", "Status", "Flag", "Key"
+]
+
+
 class InvoiceAuditError(Exception):
     """송장 감사 시스템 기본 예외 클래스"""
     pass
@@ -363,59 +374,77 @@ class AuditRunner:
                 key="ERROR"
             )
     
-    def save_audit_results(self, results: List[AuditResult], output_path: pathlib.Path) -> None:
+    def save_audit_results(self, results: Iterable[AuditResult], output_path: pathlib.Path) -> Dict[str, Any]:
         """
-        감사 결과를 CSV 파일로 저장
+        감사 결과를 CSV 파일로 저장 (1건씩 스트리밍 기록)
         
         Args:
-            results: 감사 결과 리스트
+            results: 감사 결과 (리스트 또는 제너레이터)
             output_path: 출력 파일 경로
             
+        Returns:
+            Dict: 요약 (item_count, status_counts, <파일명>.summary.json에도 기록)
+            
         Raises:
             IOError: 파일 저장 실패 시
         """
         try:
-            # 출력 디렉토리 생성
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # CSV 파일 작성
-            with open(output_path, "w", encoding="utf-8", newline="") as f:
-                if results:
-                    fieldnames = [
-                        "SNo", "RateSource", "Description", "DraftRate_USD", "Qty",
-                        "DraftTotal_USD", "Port(Join)", "Destination(Join)", "CargoType",
-                        "Unit", "Ref_Rate_USD", "Delta_%", "CG_Band", "Status", "Flag", "Key"
-                    ]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for result in results:
-                        writer.writerow({
-                            "SNo": result.sno,
-                            "RateSource": result.rate_source,
-                            "Description": result.description,
-                            "DraftRate_USD": result.draft_rate_usd,
-                            "Qty": result.qty,
-                            "DraftTotal_USD": result.draft_total_usd,
-                            "Port(Join)": result.port_join,
-                            "Destination(Join)": result.destination_join,
-                            "CargoType": result.cargo_type,
-                            "Unit": result.unit,
-                            "Ref_Rate_USD": result.ref_rate_usd,
-                            "Delta_%": result.delta_percent,
-                            "CG_Band": result.cg_band,
-                            "Status": result.status,
-                            "Flag": result.flag,
-                            "Key": result.key
-                        })
+            with ResultStreamWriter(
+                output_path,
+                fieldnames=RESULT_FIELDNAMES,
+                expand=self.result_to_row,
+                status_key="Status",
+                encoding="utf-8",
+            ) as stream:
+                stream.write_many(results)
             
             logger.info(f"감사 결과 저장 완료: {output_path}")
             print(f"감사 결과가 저장되었습니다: {output_path}")
+            return stream.summary
             
         except Exception as e:
             logger.error(f"감사 결과 저장 실패: {output_path}, 오류: {e}")
             raise IOError(f"감사 결과 저장 실패: {e}")
     
+    @staticmethod
+    def result_to_row(result: AuditResult) -> Dict[str, str]:
+        """AuditResult → CSV 행"""
+        return {
+            "SNo": result.sno,
+            "RateSource": result.rate_source,
+            "Description": result.description,
+            "DraftRate_USD": result.draft_rate_usd,
+            "Qty": result.qty,
+            "DraftTotal_USD": result.draft_total_usd,
+            "Port(Join)": result.port_join,
+            "Destination(Join)": result.destination_join,
+            "CargoType": result.cargo_type,
+            "Unit": result.unit,
+            "Ref_Rate_USD": result.ref_rate_usd,
+            "Delta_%": result.delta_percent,
+            "CG_Band": result.cg_band,
+            "Status": result.status,
+            "Flag": result.flag,
+            "Key": result.key
+        }
+    
+    def iter_audit_results(self, input_file: pathlib.Path) -> Iterator[AuditResult]:
+        """
+        송장 CSV를 행 단위로 읽어 감사 결과 생성 (전체 결과를 메모리에 두지 않음)
+        
+        Args:
+            input_file: 송장 항목 CSV 경로
+        """
+        with open(input_file, "r", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            
+            for row_number, row in enumerate(reader, start=1):
+                try:
+                    yield self.process_invoice_row(row, row_number)
+                except Exception as e:
+                    logger.error(f"행 처리 실패: {row_number}, 오류: {e}")
+                    continue
+    
     def run_audit(self) -> None:
         """
         송장 감사 실행
@@ -438,25 +467,11 @@ class AuditRunner:
             # 참조 데이터 병합
             self.merge_reference_data()
             
-            # 송장 데이터 처리
-            audit_results = []
-            
-            with open(input_file, "r", encoding="utf-8-sig") as f:
-                reader = csv.DictReader(f)
-                
-                for row_number, row in enumerate(reader, start=1):
-                    try:
-                        result = self.process_invoice_row(row, row_number)
-                        audit_results.append(result)
-                    except Exception as e:
-                        logger.error(f"행 처리 실패: {row_number}, 오류: {e}")
-                        continue
-            
-            # 감사 결과 저장
-            self.save_audit_results(audit_results, output_file)
+            # 송장 데이터 처리 및 감사 결과 저장 (행 단위 스트리밍)
+            summary = self.save_audit_results(self.iter_audit_results(input_file), output_file)
             
             # 감사 통계 출력
-            self.print_audit_summary(audit_results)
+            self.print_audit_summary(summary)
             
             logger.info(f"송장 감사 완료: {self.shipment_id}")
             
@@ -464,18 +479,19 @@ class AuditRunner:
             logger.error(f"송장 감사 실패: {self.shipment_id}, 오류: {e}")
             raise
     
-    def print_audit_summary(self, results: List[AuditResult]) -> None:
+    def print_audit_summary(self, summary: Dict[str, Any]) -> None:
         """
         감사 결과 요약 출력
         
         Args:
-            results: 감사 결과 리스트
+            summary: save_audit_results 요약 (item_count, status_counts)
         """
-        total_items = len(results)
-        verified_count = sum(1 for r in results if r.status == AuditStatus.VERIFIED.value)
-        pending_count = sum(1 for r in results if r.status == AuditStatus.PENDING_REVIEW.value)
-        missing_count = sum(1 for r in results if r.status == AuditStatus.REFERENCE_MISSING.value)
-        fail_count = sum(1 for r in results if r.status == AuditStatus.COST_GUARD_FAIL.value)
+        total_items = summary["item_count"]
+        status_counts = summary["status_counts"]
+        verified_count = status_counts.get(AuditStatus.VERIFIED.value, 0)
+        pending_count = status_counts.get(AuditStatus.PENDING_REVIEW.value, 0)
+        missing_count = status_counts.get(AuditStatus.REFERENCE_MISSING.value, 0)
+        fail_count = status_counts.get(AuditStatus.COST_GUARD_FAIL.value, 0)
         
         print(f"\n=== 감사 결과 요약 ===")
         print(f"총 처리 항목: {total_items}")
@@ -9,15 +9,50 @@ AUDIT LOGIC.MD + 실제 증빙문서를 완전 통합한 최종 송장 감사 
 """
 
 import pandas as pd
-import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 import warnings
+
+import shared_path  # noqa: F401  (00_Shared 경로 등록)
+from cost_guard import assign_bands, calculate_delta_percents
+from item_records import ItemRecord
+from result_stream import ResultStreamWriter, write_json_document
+
 warnings.filterwarnings('ignore')
 
+# COST-GUARD 밴드 (cost_guard_bands 상한 순서, 마지막 CRITICAL 초과)
+AUDIT_LOGIC_BANDS = ("PASS", "WARN", "HIGH", "CRITICAL", "AUTOFAIL")
+
+class AuditItem(ItemRecord):
+    """최종 통합 감사 항목 (__slots__ 레코드)"""
+    
+    __slots__ = FIELDS = (
+        'sheet_name',
+        'row_number',
+        's_no',
+        'rate_source',
+        'description',
+        'rate_usd',
+        'quantity',
+        'total_usd',
+        'currency',
+        'at_cost',
+        'formula_text',
+        'supporting_documents',
+        'evidence_links',
+        'line_type',
+        'amount_usd',
+        'delta_percent',
+        'cost_guard_band',
+        'status',
+        'risk_tier',
+        'remarks',
+        'validation_flags',
+    )
+
 class FinalIntegratedAuditSystem:
     """최종 증빙문서 통합 송장 감사 시스템"""
     
@@ -70,6 +105,9 @@ class FinalIntegratedAuditSystem:
             'Currency', 'Curr', 'CCY',
             'At Cost', 'At-Cost', 'Cost'
         ]
+        
+        # 관련 증빙문서/Evidence 링크 캐시 (같은 매칭 키의 항목은 같은 리스트 공유)
+        self._related_docs_cache = {}
     
     def run_final_integrated_audit(self) -> Dict:
         """최종 증빙문서 통합 감사 실행"""
@@ -88,13 +126,17 @@ class FinalIntegratedAuditSystem:
         all_invoice_items = []
         sheet_summaries = {}
         
-        for sheet_name, df in excel_data.items():
-            print(f"📋 시트 '{sheet_name}' 처리 중...")
-            invoice_items = self.extract_invoice_data_with_evidence_robust(df, sheet_name, supporting_docs)
-            all_invoice_items.extend(invoice_items)
-            
-            # 시트별 요약
-            sheet_summaries[sheet_name] = self.calculate_sheet_summary(invoice_items)
+        # 추출된 항목은 시트 단위로 즉시 NDJSON 기록 (실행 중 읽기 가능)
+        items_file = self.output_dir / "final_integrated_audit_items.ndjson"
+        with ResultStreamWriter(items_file, amount_key="amount_usd") as item_stream:
+            for sheet_name, df in excel_data.items():
+                print(f"📋 시트 '{sheet_name}' 처리 중...")
+                invoice_items = self.extract_invoice_data_with_evidence_robust(df, sheet_name, supporting_docs)
+                all_invoice_items.extend(invoice_items)
+                item_stream.write_many(invoice_items)
+                
+                # 시트별 요약
+                sheet_summaries[sheet_name] = self.calculate_sheet_summary(invoice_items)
         
         # 4. S/No 순서로 정렬
         all_invoice_items = self.preserve_sno_order(all_invoice_items)
@@ -291,6 +333,11 @@ class FinalIntegratedAuditSystem:
                     if item:
                         invoice_items.append(item)
             
+            # 시트 단위 COST-GUARD 일괄 판정 후 상태 결정
+            self.apply_cost_guard_audit_logic(invoice_items)
+            for item in invoice_items:
+                self.finalize_audit_logic_item(item)
+            
             print(f"  ✅ {len(invoice_items)}개 송장 항목 추출 (증빙문서 {len(shipment_docs)}개 연결)")
             return invoice_items
             
@@ -420,33 +467,28 @@ class FinalIntegratedAuditSystem:
         """최종 통합 감사 항목 생성"""
         try:
             # 기본 정보 추출
-            item = {
-                "sheet_name": sheet_name,
-                "row_number": row_idx + 1,
-                "s_no": self.extract_field_value(row, header_mapping, 's_no'),
-                "rate_source": self.extract_field_value(row, header_mapping, 'rate_source'),
-                "description": self.extract_field_value(row, header_mapping, 'description'),
-                "rate_usd": self.extract_numeric_value(row, header_mapping, 'rate'),
-                "quantity": self.extract_numeric_value(row, header_mapping, 'quantity'),
-                "total_usd": self.extract_numeric_value(row, header_mapping, 'total'),
-                "currency": self.extract_field_value(row, header_mapping, 'currency'),
-                "at_cost": self.extract_numeric_value(row, header_mapping, 'at_cost'),
-                "formula_text": self.extract_field_value(row, header_mapping, 'formula')
-            }
-            
-            # 증빙문서 연결
-            item["supporting_documents"] = self.find_related_documents_robust(item, shipment_docs)
-            item["evidence_links"] = self.generate_evidence_links_robust(item["supporting_documents"])
+            item = AuditItem(
+                sheet_name=sheet_name,
+                row_number=row_idx + 1,
+                s_no=self.extract_field_value(row, header_mapping, 's_no'),
+                rate_source=self.extract_field_value(row, header_mapping, 'rate_source'),
+                description=self.extract_field_value(row, header_mapping, 'description'),
+                rate_usd=self.extract_numeric_value(row, header_mapping, 'rate'),
+                quantity=self.extract_numeric_value(row, header_mapping, 'quantity'),
+                total_usd=self.extract_numeric_value(row, header_mapping, 'total'),
+                currency=self.extract_field_value(row, header_mapping, 'currency'),
+                at_cost=self.extract_numeric_value(row, header_mapping, 'at_cost'),
+                formula_text=self.extract_field_value(row, header_mapping, 'formula')
+            )
+            
+            # 증빙문서 연결 (Shipment 문서 dict는 복사하지 않고 공유 리스트로 참조)
+            item["supporting_documents"], item["evidence_links"] = self.get_related_documents_cached(
+                item, shipment_docs
+            )
             
             # AUDIT LOGIC.MD 기반 계산
             item["line_type"] = self.determine_line_type(item)
             item["amount_usd"] = self.calculate_amount_usd_audit_logic(item)
-            item["delta_percent"] = self.calculate_delta_percent_audit_logic(item)
-            item["cost_guard_band"] = self.determine_cost_guard_band_audit_logic(item["delta_percent"])
-            item["status"] = self.determine_status_audit_logic(item)
-            item["risk_tier"] = self.determine_risk_tier(item)
-            item["remarks"] = self.generate_remarks(item)
-            item["validation_flags"] = self.generate_validation_flags_audit_logic(item)
             
             return item
             
@@ -480,6 +522,18 @@ class FinalIntegratedAuditSystem:
         
         return related_docs
     
+    def get_related_documents_cached(self, item: Dict, shipment_docs: List[Dict]) -> Tuple[List[Dict], List[str]]:
+        """관련 증빙문서 + Evidence 링크 (Shipment·Rate Source·키워드 조합별 1회 계산, 반환 리스트는 항목 간 공유)"""
+        keywords = tuple(self.extract_keywords_from_description(item["description"])) if item["description"] else ()
+        key = (id(shipment_docs), item["rate_source"].upper(), keywords)
+        cached = self._related_docs_cache.get(key)
+        # shipment_docs 참조를 함께 보관 → id 재사용 없음
+        if cached is None or cached[0] is not shipment_docs:
+            related_docs = self.find_related_documents_robust(item, shipment_docs)
+            cached = (shipment_docs, related_docs, self.generate_evidence_links_robust(related_docs))
+            self._related_docs_cache[key] = cached
+        return cached[1], cached[2]
+    
     def extract_keywords_from_description(self, description: str) -> List[str]:
         """Description에서 키워드 추출"""
         keywords = []
@@ -535,34 +589,51 @@ class FinalIntegratedAuditSystem:
             # Contract: Draft USD가 기준
             return item["total_usd"]
     
+    def calculate_delta_percents_audit_logic(self, items: List[Dict]) -> List[float]:
+        """AUDIT LOGIC.MD 기반 Delta % 일괄 계산 (cost_guard 공용 로직)"""
+        fx_rate = self.audit_rules["fx_rates"]["AED_USD"]
+        # At-Cost: (DraftTotal_USD - Doc_USD) / Doc_USD * 100
+        # Contract: 0으로 설정 (실제로는 Ref JSON 필요), Doc_USD = 0도 0.0
+        doc_usd = [
+            round(item["at_cost"] * fx_rate, 2)
+            if item["line_type"] == "At-Cost" and item["at_cost"] > 0 else None
+            for item in items
+        ]
+        deltas = calculate_delta_percents(
+            [item["total_usd"] for item in items], doc_usd, zero_ref=0.0
+        )
+        return [0.0 if ref is None else float(delta) for ref, delta in zip(doc_usd, deltas)]
+    
     def calculate_delta_percent_audit_logic(self, item: Dict) -> float:
         """AUDIT LOGIC.MD 기반 Delta % 계산"""
-        if item["line_type"] == "At-Cost" and item["at_cost"] > 0:
-            # At-Cost: (DraftTotal_USD - Doc_USD) / Doc_USD * 100
-            doc_usd = round(item["at_cost"] * self.audit_rules["fx_rates"]["AED_USD"], 2)
-            if doc_usd > 0:
-                return round(((item["total_usd"] - doc_usd) / doc_usd) * 100, 2)
-        elif item["line_type"] == "Contract":
-            # Contract: (DraftRate_USD - RefRate_USD) / RefRate_USD * 100
-            # 여기서는 단순히 0으로 설정 (실제로는 Ref JSON 필요)
-            return 0.0
-        
-        return 0.0
+        return self.calculate_delta_percents_audit_logic([item])[0]
+    
+    def determine_cost_guard_bands_audit_logic(self, delta_percents: List[float]) -> List[str]:
+        """AUDIT LOGIC.MD 기반 COST-GUARD 밴드 일괄 결정"""
+        limits = self.audit_rules["cost_guard_bands"]
+        thresholds = [limits[band] for band in AUDIT_LOGIC_BANDS[:-1]]
+        return assign_bands(
+            delta_percents, thresholds, AUDIT_LOGIC_BANDS, na_band="AUTOFAIL"
+        ).tolist()
     
     def determine_cost_guard_band_audit_logic(self, delta_percent: float) -> str:
         """AUDIT LOGIC.MD 기반 COST-GUARD 밴드 결정"""
-        abs_delta = abs(delta_percent)
-        
-        if abs_delta <= self.audit_rules["cost_guard_bands"]["PASS"]:
-            return "PASS"
-        elif abs_delta <= self.audit_rules["cost_guard_bands"]["WARN"]:
-            return "WARN"
-        elif abs_delta <= self.audit_rules["cost_guard_bands"]["HIGH"]:
-            return "HIGH"
-        elif abs_delta <= self.audit_rules["cost_guard_bands"]["CRITICAL"]:
-            return "CRITICAL"
-        else:
-            return "AUTOFAIL"
+        return self.determine_cost_guard_bands_audit_logic([delta_percent])[0]
+    
+    def apply_cost_guard_audit_logic(self, items: List[Dict]) -> None:
+        """시트 단위 Delta % / COST-GUARD 밴드 일괄 판정"""
+        deltas = self.calculate_delta_percents_audit_logic(items)
+        bands = self.determine_cost_guard_bands_audit_logic(deltas)
+        for item, delta, band in zip(items, deltas, bands):
+            item["delta_percent"] = delta
+            item["cost_guard_band"] = band
+    
+    def finalize_audit_logic_item(self, item: Dict) -> None:
+        """COST-GUARD 밴드 기반 상태/리스크/비고/플래그 결정"""
+        item["status"] = self.determine_status_audit_logic(item)
+        item["risk_tier"] = self.determine_risk_tier(item)
+        item["remarks"] = self.generate_remarks(item)
+        item["validation_flags"] = self.generate_validation_flags_audit_logic(item)
     
     def determine_status_audit_logic(self, item: Dict) -> str:
         """AUDIT LOGIC.MD 기반 상태 결정"""
@@ -746,13 +817,12 @@ class FinalIntegratedAuditSystem:
         try:
             # JSON 보고서 저장
             json_file = self.output_dir / "final_integrated_audit_report.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(audit_result, f, indent=2, ensure_ascii=False, default=str)
+            write_json_document(json_file, audit_result, "invoice_items")
             
             # CSV 보고서 저장
             csv_file = self.output_dir / "final_integrated_audit_report.csv"
-            df = pd.DataFrame(audit_result["invoice_items"])
-            df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+            with ResultStreamWriter(csv_file, fieldnames=AuditItem.FIELDS, amount_key="amount_usd") as stream:
+                stream.write_many(audit_result["invoice_items"])
             
             # 상세 요약 보고서 저장
             summary_file = self.output_dir / "final_integrated_audit_summary.txt"
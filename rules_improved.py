@@ -13,6 +13,9 @@ from typing import Dict, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+import shared_path  # noqa: F401  (00_Shared 경로 등록)
+from cost_guard import assign_bands
+
 
 class CostGuardBand(Enum):
     """비용 가드 밴드 열거형"""
@@ -87,14 +90,12 @@ def cg_band(delta_abs: float) -> str:
     if not isinstance(delta_abs, (int, float)):
         return CostGuardBand.CRITICAL.value
     
-    if delta_abs < 0:
-        delta_abs = abs(delta_abs)
-    
-    for band, threshold in CG_BAND_THRESHOLDS.items():
-        if delta_abs <= threshold:
-            return band.value
-    
-    return CostGuardBand.CRITICAL.value
+    # 00_Shared cost_guard 밴드 판정 공유 (NaN → CRITICAL)
+    bands = [band.value for band in CG_BAND_THRESHOLDS]
+    thresholds = list(CG_BAND_THRESHOLDS.values())[:-1]
+    return assign_bands(
+        [delta_abs], thresholds, bands, na_band=CostGuardBand.CRITICAL.value
+    )[0]
 
 
 def calculate_delta_percentage(actual_rate: float, reference_rate: float) -> float:
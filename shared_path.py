@@ -0,0 +1,24 @@
+"""
+00_Shared 공용 모듈 경로 등록
+
+루트 스크립트가 감사 엔진과 같은 공용 모듈(cost_guard 등)을 사용하도록
+00_Shared 폴더를 sys.path 끝에 추가합니다. (같은 이름의 루트 모듈이 우선)
+
+사용:
+    import shared_path  # noqa: F401
+    from cost_guard import assign_bands
+"""
+
+import sys
+from pathlib import Path
+
+SHARED_DIR = (
+    Path(__file__).resolve().parent
+    / "HVDC_Invoice-20251015T070213Z-1-001"
+    / "HVDC_Invoice"
+    / "HVDC_Invoice_Audit"
+    / "00_Shared"
+)
+
+if str(SHARED_DIR) not in sys.path:
+    sys.path.append(str(SHARED_DIR))
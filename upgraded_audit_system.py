@@ -9,15 +9,45 @@
 """
 
 import pandas as pd
-import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 import warnings
+
+import shared_path  # noqa: F401  (00_Shared 경로 등록)
+from cost_guard import assign_bands, calculate_delta_percents
+from item_records import ItemRecord
+from result_stream import ResultStreamWriter, write_json_document
+
 warnings.filterwarnings('ignore')
 
+# COST-GUARD 밴드 (cost_guard_bands 상한 순서, 마지막 CRITICAL 초과)
+COST_GUARD_BANDS = ("PASS", "WARN", "HIGH", "CRITICAL", "COST_GUARD_FAIL")
+
+class InvoiceItem(ItemRecord):
+    """고급 송장 항목 (__slots__ 레코드)"""
+    
+    __slots__ = FIELDS = (
+        'sheet_name',
+        'row_number',
+        's_no',
+        'rate_source',
+        'description',
+        'rate',
+        'quantity',
+        'total_usd',
+        'currency',
+        'at_cost',
+        'formula',
+        'amount_usd',
+        'delta_percent',
+        'cost_guard_band',
+        'status',
+        'validation_flags',
+    )
+
 class UpgradedAuditSystem:
     """개선된 송장 감사 시스템"""
     
@@ -74,13 +104,17 @@ class UpgradedAuditSystem:
         all_invoice_items = []
         sheet_summaries = {}
         
-        for sheet_name, df in excel_data.items():
-            print(f"📋 시트 '{sheet_name}' 처리 중...")
-            invoice_items = self.extract_invoice_data_advanced(df, sheet_name)
-            all_invoice_items.extend(invoice_items)
-            
-            # 시트별 요약
-            sheet_summaries[sheet_name] = self.calculate_sheet_summary(invoice_items)
+        # 추출된 항목은 시트 단위로 즉시 NDJSON 기록 (실행 중 읽기 가능)
+        items_file = self.output_dir / "upgraded_audit_items.ndjson"
+        with ResultStreamWriter(items_file, amount_key="amount_usd") as item_stream:
+            for sheet_name, df in excel_data.items():
+                print(f"📋 시트 '{sheet_name}' 처리 중...")
+                invoice_items = self.extract_invoice_data_advanced(df, sheet_name)
+                all_invoice_items.extend(invoice_items)
+                item_stream.write_many(invoice_items)
+                
+                # 시트별 요약
+                sheet_summaries[sheet_name] = self.calculate_sheet_summary(invoice_items)
         
         # 3. 전체 요약 계산
         total_summary = self.calculate_total_summary(all_invoice_items)
@@ -146,6 +180,9 @@ class UpgradedAuditSystem:
                     if item:
                         invoice_items.append(item)
             
+            # 시트 단위 COST-GUARD 일괄 판정
+            self.apply_cost_guard(invoice_items)
+            
             print(f"  ✅ {len(invoice_items)}개 송장 항목 추출")
             return invoice_items
             
@@ -258,26 +295,22 @@ class UpgradedAuditSystem:
         """고급 송장 항목 생성"""
         try:
             # 기본 정보 추출
-            item = {
-                "sheet_name": sheet_name,
-                "row_number": row_idx + 1,
-                "s_no": self.extract_field_value(row, header_mapping, 's_no'),
-                "rate_source": self.extract_field_value(row, header_mapping, 'rate_source'),
-                "description": self.extract_field_value(row, header_mapping, 'description'),
-                "rate": self.extract_numeric_value(row, header_mapping, 'rate'),
-                "quantity": self.extract_numeric_value(row, header_mapping, 'quantity'),
-                "total_usd": self.extract_numeric_value(row, header_mapping, 'total'),
-                "currency": self.extract_field_value(row, header_mapping, 'currency'),
-                "at_cost": self.extract_numeric_value(row, header_mapping, 'at_cost'),
-                "formula": self.extract_field_value(row, header_mapping, 'formula')
-            }
+            item = InvoiceItem(
+                sheet_name=sheet_name,
+                row_number=row_idx + 1,
+                s_no=self.extract_field_value(row, header_mapping, 's_no'),
+                rate_source=self.extract_field_value(row, header_mapping, 'rate_source'),
+                description=self.extract_field_value(row, header_mapping, 'description'),
+                rate=self.extract_numeric_value(row, header_mapping, 'rate'),
+                quantity=self.extract_numeric_value(row, header_mapping, 'quantity'),
+                total_usd=self.extract_numeric_value(row, header_mapping, 'total'),
+                currency=self.extract_field_value(row, header_mapping, 'currency'),
+                at_cost=self.extract_numeric_value(row, header_mapping, 'at_cost'),
+                formula=self.extract_field_value(row, header_mapping, 'formula')
+            )
             
             # 계산된 필드
             item["amount_usd"] = self.calculate_amount_usd(item)
-            item["delta_percent"] = self.calculate_delta_percent(item)
-            item["cost_guard_band"] = self.determine_cost_guard_band(item["delta_percent"])
-            item["status"] = self.determine_status_advanced(item)
-            item["validation_flags"] = self.generate_validation_flags(item)
             
             return item
             
@@ -313,26 +346,42 @@ class UpgradedAuditSystem:
         else:
             return item["total_usd"]
     
+    def calculate_delta_percents(self, items: List[Dict]) -> List[float]:
+        """Delta % 일괄 계산 (cost_guard 공용 로직, 반올림 없음)"""
+        at_cost = [
+            item["at_cost"] if item["at_cost"] > 0 and item["amount_usd"] > 0 else None
+            for item in items
+        ]
+        deltas = calculate_delta_percents(
+            [item["amount_usd"] for item in items], at_cost, decimals=None
+        )
+        return [0.0 if ref is None else float(delta) for ref, delta in zip(at_cost, deltas)]
+    
     def calculate_delta_percent(self, item: Dict) -> float:
         """Delta % 계산"""
-        if item["at_cost"] > 0 and item["amount_usd"] > 0:
-            return ((item["amount_usd"] - item["at_cost"]) / item["at_cost"]) * 100
-        return 0.0
+        return self.calculate_delta_percents([item])[0]
+    
+    def determine_cost_guard_bands(self, delta_percents: List[float]) -> List[str]:
+        """COST-GUARD 밴드 일괄 결정"""
+        limits = self.validation_rules["cost_guard_bands"]
+        thresholds = [limits[band] for band in COST_GUARD_BANDS[:-1]]
+        return assign_bands(
+            delta_percents, thresholds, COST_GUARD_BANDS, na_band="COST_GUARD_FAIL"
+        ).tolist()
     
     def determine_cost_guard_band(self, delta_percent: float) -> str:
         """COST-GUARD 밴드 결정"""
-        abs_delta = abs(delta_percent)
-        
-        if abs_delta <= self.validation_rules["cost_guard_bands"]["PASS"]:
-            return "PASS"
-        elif abs_delta <= self.validation_rules["cost_guard_bands"]["WARN"]:
-            return "WARN"
-        elif abs_delta <= self.validation_rules["cost_guard_bands"]["HIGH"]:
-            return "HIGH"
-        elif abs_delta <= self.validation_rules["cost_guard_bands"]["CRITICAL"]:
-            return "CRITICAL"
-        else:
-            return "COST_GUARD_FAIL"
+        return self.determine_cost_guard_bands([delta_percent])[0]
+    
+    def apply_cost_guard(self, items: List[Dict]) -> None:
+        """시트 단위 Delta % / COST-GUARD 밴드 일괄 판정 후 상태 결정"""
+        deltas = self.calculate_delta_percents(items)
+        bands = self.determine_cost_guard_bands(deltas)
+        for item, delta, band in zip(items, deltas, bands):
+            item["delta_percent"] = delta
+            item["cost_guard_band"] = band
+            item["status"] = self.determine_status_advanced(item)
+            item["validation_flags"] = self.generate_validation_flags(item)
     
     def determine_status_advanced(self, item: Dict) -> str:
         """고급 상태 결정"""
@@ -431,13 +480,12 @@ class UpgradedAuditSystem:
         try:
             # JSON 보고서 저장
             json_file = self.output_dir / "upgraded_audit_report.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(audit_result, f, indent=2, ensure_ascii=False, default=str)
+            write_json_document(json_file, audit_result, "invoice_items")
             
             # CSV 보고서 저장
             csv_file = self.output_dir / "upgraded_audit_report.csv"
-            df = pd.DataFrame(audit_result["invoice_items"])
-            df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+            with ResultStreamWriter(csv_file, fieldnames=InvoiceItem.FIELDS, amount_key="amount_usd") as stream:
+                stream.write_many(audit_result["invoice_items"])
             
             # 상세 요약 보고서 저장
             summary_file = self.output_dir / "upgraded_audit_summary.txt"